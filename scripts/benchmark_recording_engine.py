@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark del motor de grabación multi-cámara.
+Compara un thread bloqueante por cámara contra PyAvRecordingEngine a medida que crece la
+cantidad de cámaras, reportando paquetes/segundo totales y por core (paquetes / segundo de CPU).
+
+Cada "cámara" lee un archivo H.264 sintético a máxima velocidad, por lo que el resultado mide
+el costo de demux + remux y de la planificación, no la latencia de red.
+
+Uso: python scripts/benchmark_recording_engine.py [--cameras=1,8,32,128] [--workers=4]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import (  # noqa
+    OutputPath,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (  # noqa
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingEngine import (  # noqa
+    PyAvRecordingEngine,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (  # noqa
+    PyAvRecordingJob,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface  # noqa
+
+
+class SilentLogger(LoggerInterface):
+    def debug(self, message: str) -> None:
+        pass
+
+    def info(self, message: str) -> None:
+        pass
+
+    def warn(self, message: str) -> None:
+        pass
+
+    def error(self, message: str) -> None:
+        print(f"❌ {message}")
+
+
+def create_source(path: Path, seconds: int, fps: int = 25) -> None:
+    """Genera un stream MPEG-TS H.264 sintético con un keyframe por segundo"""
+    output = av.open(str(path), mode="w")
+    stream = output.add_stream("libx264", rate=fps)
+    stream.width, stream.height, stream.pix_fmt = 320, 240, "yuv420p"
+    stream.codec_context.gop_size = fps
+    stream.codec_context.time_base = Fraction(1, fps)
+    stream.options = {"preset": "ultrafast", "tune": "zerolatency"}
+    for index in range(seconds * fps):
+        image = np.full((240, 320, 3), index % 255, dtype=np.uint8)
+        frame = av.VideoFrame.from_ndarray(image, format="rgb24")
+        frame.pts = index
+        output.mux(stream.encode(frame))
+    output.mux(stream.encode(None))
+    output.close()
+
+
+def create_jobs(source: Path, cameras: int, output_dir: Path, logger: LoggerInterface):
+    jobs = []
+    for camera in range(cameras):
+        counter = itertools.count()
+        jobs.append(
+            PyAvRecordingJob(
+                source=str(source),
+                segment_duration=RecordingSessionDuration(2),
+                output_path_factory=lambda camera=camera, counter=counter: OutputPath(
+                    str(output_dir / f"camera{camera}_{next(counter)}.mkv")
+                ),
+                on_segment_finished=None,
+                logger=logger,
+                continuous=True,
+            )
+        )
+    return jobs
+
+
+def run_with_threads(jobs) -> None:
+    threads = [threading.Thread(target=job.run) for job in jobs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_with_engine(jobs, workers: int, logger: LoggerInterface) -> None:
+    engine = PyAvRecordingEngine(logger, workers=workers)
+    for job in jobs:
+        job.open()
+        engine.submit(job)
+    while sum(engine.jobs_per_worker()) > 0:
+        time.sleep(0.01)
+    engine.stop()
+
+
+def measure(mode: str, source: Path, cameras: int, workers: int, logger: LoggerInterface):
+    with tempfile.TemporaryDirectory() as output_dir:
+        jobs = create_jobs(source, cameras, Path(output_dir), logger)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if mode == "threads":
+            run_with_threads(jobs)
+        else:
+            run_with_engine(jobs, workers, logger)
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    packets = sum(job.packets_processed for job in jobs)
+    return packets, wall, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del motor de grabación multi-cámara")
+    parser.add_argument("--cameras", default="1,8,32,128", help="Cantidades de cámaras a medir")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seconds", type=int, default=10, help="Duración del stream sintético")
+    args = parser.parse_args()
+
+    logger = SilentLogger()
+    with tempfile.TemporaryDirectory() as source_dir:
+        source = Path(source_dir) / "source.ts"
+        create_source(source, args.seconds)
+
+        print(f"🔧 workers del motor: {args.workers}, cores: {os.cpu_count()}")
+        print(f"{'modo':<8} {'cámaras':>8} {'paquetes':>10} {'pkt/s':>10} {'pkt/s/core':>11}")
+        for cameras in [int(value) for value in args.cameras.split(",")]:
+            for mode in ("threads", "engine"):
+                packets, wall, cpu = measure(mode, source, cameras, args.workers, logger)
+                print(
+                    f"{mode:<8} {cameras:>8} {packets:>10} {packets / wall:>10.0f} "
+                    f"{packets / max(cpu, 1e-9):>11.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark del costo de la instrumentación por paquete (PyAvStreamMetrics).
+Graba un stream sintético parecido al de una cámara (720p a 4 Mbps, ~20 KB por paquete) con
+y sin métricas alternando corridas cortas y reporta la mediana de la diferencia de tiempo de
+CPU por paquete entre corridas consecutivas: en máquinas compartidas la velocidad varía más
+que el costo que se quiere medir, y comparar corridas vecinas cancela esa variación.
+
+El objetivo es que el sobrecosto se mantenga por debajo del 1%.
+
+Uso: python scripts/benchmark_stream_metrics.py [--seconds=20] [--repetitions=101]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_recording_engine import SilentLogger  # noqa
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import (  # noqa
+    OutputPath,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (  # noqa
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (  # noqa
+    PyAvRecordingJob,
+)
+
+
+def create_camera_like_source(path: Path, seconds: int, fps: int = 25) -> None:
+    """Genera un stream MPEG-TS H.264 720p a ~4 Mbps con un keyframe cada dos segundos"""
+    output = av.open(str(path), mode="w")
+    stream = output.add_stream("libx264", rate=fps)
+    stream.width, stream.height, stream.pix_fmt = 1280, 720, "yuv420p"
+    stream.codec_context.gop_size = fps * 2
+    stream.codec_context.time_base = Fraction(1, fps)
+    stream.options = {
+        "preset": "ultrafast",
+        "tune": "zerolatency",
+        "x264-params": "bitrate=4000:vbv-maxrate=4000:vbv-bufsize=4000",
+    }
+    # Textura que se desplaza para que cada frame tenga contenido nuevo que codificar
+    texture = np.random.default_rng(0).integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    for index in range(seconds * fps):
+        frame = av.VideoFrame.from_ndarray(np.roll(texture, index * 4, axis=1), format="rgb24")
+        frame.pts = index
+        output.mux(stream.encode(frame))
+    output.mux(stream.encode(None))
+    output.close()
+
+
+def record(source: Path, seconds: int, collect_metrics: bool, logger) -> float:
+    """Devuelve los segundos de CPU por paquete de una grabación completa"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        job = PyAvRecordingJob(
+            source=str(source),
+            segment_duration=RecordingSessionDuration(seconds),
+            output_path_factory=lambda: OutputPath(str(Path(output_dir) / "session.mkv")),
+            on_segment_finished=None,
+            logger=logger,
+            collect_metrics=collect_metrics,
+        )
+        cpu_start = time.process_time()
+        job.run()
+        cpu = time.process_time() - cpu_start
+    return cpu / job.packets_processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la instrumentación por paquete")
+    parser.add_argument("--seconds", type=int, default=20, help="Duración del stream sintético")
+    parser.add_argument("--repetitions", type=int, default=101)
+    args = parser.parse_args()
+
+    logger = SilentLogger()
+    with tempfile.TemporaryDirectory() as source_dir:
+        source = Path(source_dir) / "source.ts"
+        create_camera_like_source(source, args.seconds)
+
+        without_metrics, differences = [], []
+        for repetition in range(args.repetitions):
+            # Se alterna el orden para no favorecer a ninguna de las dos variantes
+            first_with_metrics = repetition % 2 == 1
+            first = record(source, args.seconds, first_with_metrics, logger)
+            second = record(source, args.seconds, not first_with_metrics, logger)
+            baseline, instrumented = (second, first) if first_with_metrics else (first, second)
+            without_metrics.append(baseline)
+            differences.append(instrumented - baseline)
+        baseline = statistics.median(without_metrics)
+        overhead = statistics.median(differences)
+
+    print(f"sin métricas:  {baseline * 1e6:8.2f} µs de CPU por paquete (mediana)")
+    print(f"sobrecosto:    {overhead * 1e9:8.0f} ns por paquete ({overhead / baseline:.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark del throughput de movimiento de videos según la cantidad de workers.
+Encola segmentos sintéticos en una SqliteMoveJobQueue y los mueve con MoveVideoWorkerPool a
+un destino local que imita una conexión remota: cada subida copia el archivo a un
+directorio limitando su ancho de banda (`--connection-mbps`), como una conexión TCP a un
+almacenamiento de objetos. El throughput total debería crecer con los workers hasta
+saturar el disco o el límite por destino.
+
+Uso: python scripts/benchmark_video_moves.py [--videos=64] [--size-mb=8]
+     [--connection-mbps=200] [--workers=1,2,4,8,16] [--per-destination=16]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmark_recording_engine import SilentLogger  # noqa
+
+from src.Contexts.Recording.Videos.Application.UseCases.MoveVideoUseCase import (  # noqa
+    MoveVideoUseCase,
+)
+from src.Contexts.Recording.Videos.Domain.Contracts.VideoUploader import VideoUploader  # noqa
+from src.Contexts.Recording.Videos.Domain.Entities.Video import Video  # noqa
+from src.Contexts.Recording.Videos.Domain.Services.VideoEnsurer import VideoEnsurer  # noqa
+from src.Contexts.Recording.Videos.Domain.Services.VideoMover import VideoMover  # noqa
+from src.Contexts.Recording.Videos.Infrastructure.Services.ConcurrencyLimitedVideoUploader import (  # noqa
+    ConcurrencyLimitedVideoUploader,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.LocalVideoFileManager import (  # noqa
+    LocalVideoFileManager,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.LocalVideoRepository import (  # noqa
+    LocalVideoRepository,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.MoveVideoWorkerPool import (  # noqa
+    MoveVideoWorkerPool,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.SqliteMoveJobQueue import (  # noqa
+    SqliteMoveJobQueue,
+)
+from src.Contexts.SharedKernel.Domain.Configuration import Configuration  # noqa
+from src.Contexts.SharedKernel.Domain.EventBusInterface import EventBusInterface  # noqa
+from src.Contexts.SharedKernel.Domain.UuidGenerator import UuidGenerator  # noqa
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ThrottledDirectoryUploader(VideoUploader):
+    """Copia cada video a un directorio a `bytes_per_second` como máximo por subida"""
+
+    def __init__(self, bytes_per_second: float):
+        self.__bytes_per_second = bytes_per_second
+
+    def upload_overwrite(self, video: Video, destination_path: str) -> str:
+        started = time.monotonic()
+        copied = 0
+        with open(video.path.value, "rb") as source, open(destination_path, "wb") as target:
+            while chunk := source.read(CHUNK_SIZE):
+                target.write(chunk)
+                copied += len(chunk)
+                ahead = copied / self.__bytes_per_second - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+        return destination_path
+
+
+class StaticConfiguration(Configuration):
+    def __init__(self, storage_path: str):
+        self.__storage_path = storage_path
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return default
+
+    def get_string(self, key: str, default: Optional[str] = None) -> str:
+        return self.__storage_path if key == "video_storage_base_path" else default or ""
+
+    def get_int(self, key: str, default: Optional[int] = None) -> int:
+        return default or 0
+
+    def get_bool(self, key: str, default: Optional[bool] = None) -> bool:
+        return bool(default)
+
+    def get_float(self, key: str, default: Optional[float] = None) -> float:
+        return default or 0.0
+
+
+class NullEventBus(EventBusInterface):
+    def publish(self, events: list) -> None:
+        pass
+
+
+class RandomUuidGenerator(UuidGenerator):
+    def generate(self) -> str:
+        return str(uuid.uuid4())
+
+
+def create_videos(directory: Path, count: int, size: int) -> List[str]:
+    content = os.urandom(size)
+    paths = []
+    for index in range(count):
+        path = directory / f"camera__{index:05d}.mkv"
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+
+def move_all(args, workers: int) -> float:
+    """Devuelve los segundos que tarda en moverse todo el lote"""
+    logger = SilentLogger()
+    with tempfile.TemporaryDirectory() as work_dir:
+        recordings, storage = Path(work_dir) / "recordings", Path(work_dir) / "storage"
+        recordings.mkdir()
+        storage.mkdir()
+        paths = create_videos(recordings, args.videos, args.size_mb * 1024 * 1024)
+        uploader = ConcurrencyLimitedVideoUploader(
+            ThrottledDirectoryUploader(args.connection_mbps * 1e6 / 8),
+            max_uploads=max(workers, args.per_destination),
+            max_uploads_per_destination=args.per_destination,
+        )
+        move_video_use_case = MoveVideoUseCase(
+            video_mover=VideoMover(LocalVideoFileManager(logger), uploader, logger),
+            video_ensurer=VideoEnsurer(LocalVideoRepository(RandomUuidGenerator())),
+            logger=logger,
+            event_bus=NullEventBus(),
+            configuration=StaticConfiguration(str(storage)),
+        )
+        queue = SqliteMoveJobQueue(str(Path(work_dir) / "moves.db"))
+        pool = MoveVideoWorkerPool(queue, move_video_use_case, logger, workers=workers)
+        queue.enqueue(paths)
+
+        started = time.monotonic()
+        pool.start()
+        while pool.metrics().queue.depth > 0:
+            time.sleep(0.01)
+        elapsed = time.monotonic() - started
+        pool.stop()
+        queue.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del movimiento de videos")
+    parser.add_argument("--videos", type=int, default=64)
+    parser.add_argument("--size-mb", type=int, default=8)
+    parser.add_argument("--connection-mbps", type=float, default=200.0)
+    parser.add_argument("--workers", default="1,2,4,8,16")
+    parser.add_argument("--per-destination", type=int, default=16)
+    args = parser.parse_args()
+
+    total_mb = args.videos * args.size_mb
+    baseline = None
+    for workers in [int(value) for value in args.workers.split(",")]:
+        elapsed = move_all(args, workers)
+        throughput = total_mb / elapsed
+        baseline = baseline or throughput
+        print(
+            f"{workers:3d} workers: {elapsed:6.2f} s, {throughput:8.1f} MB/s "
+            f"({throughput / baseline:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
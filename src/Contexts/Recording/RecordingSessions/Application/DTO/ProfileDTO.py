@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -8,3 +9,10 @@ class ProfileDTO:
     uri: str
     duration_seconds: int
     folder_path: str
+    recording_mode: str = "session"
+    connection_timeout_seconds: int = 30
+    stream_selection: str = "video"
+    analysis_uri: Optional[str] = None
+    motion_pre_roll_seconds: int = 5
+    motion_post_roll_seconds: int = 10
+    motion_min_changed_fraction: float = 0.01
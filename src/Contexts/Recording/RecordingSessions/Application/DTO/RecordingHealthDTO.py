@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RecordingHealthDTO:
+    source: str
+    last_packet_age_seconds: float
+    packets_per_second: float
+    bytes_per_second: float
+    is_stalled: bool
+    is_reconnecting: bool
+    restarts: int
@@ -0,0 +1,5 @@
+from src.Contexts.SharedKernel.Domain.MessageBus.Query import Query
+
+
+class GetRecordingHealthQuery(Query):
+    pass
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import List
+
+from src.Contexts.SharedKernel.Domain.MessageBus.QueryResponse import QueryResponse
+from ..DTO.RecordingHealthDTO import RecordingHealthDTO
+
+
+@dataclass(frozen=True)
+class GetRecordingHealthQueryResponse(QueryResponse):
+    recordings: List[RecordingHealthDTO]
+
+    @property
+    def stalled(self) -> List[RecordingHealthDTO]:
+        return [recording for recording in self.recordings if recording.is_stalled]
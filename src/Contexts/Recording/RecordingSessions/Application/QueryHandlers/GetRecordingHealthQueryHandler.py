@@ -0,0 +1,22 @@
+from dataclasses import asdict
+
+from src.Contexts.SharedKernel.Domain.MessageBus.QueryHandler import QueryHandler
+from ..DTO.RecordingHealthDTO import RecordingHealthDTO
+from ..Queries.GetRecordingHealthQuery import GetRecordingHealthQuery
+from ..Queries.GetRecordingHealthQueryResponse import GetRecordingHealthQueryResponse
+from ..UseCases.GetRecordingHealthUseCase import GetRecordingHealthUseCase
+
+
+class GetRecordingHealthQueryHandler(
+    QueryHandler[GetRecordingHealthQuery, GetRecordingHealthQueryResponse]
+):
+    """Responde el estado actual de las grabaciones activas"""
+
+    def __init__(self, get_recording_health_use_case: GetRecordingHealthUseCase):
+        self._get_recording_health_use_case = get_recording_health_use_case
+
+    def handle(self, query: GetRecordingHealthQuery) -> GetRecordingHealthQueryResponse:
+        recordings = self._get_recording_health_use_case.execute()
+        return GetRecordingHealthQueryResponse(
+            recordings=[RecordingHealthDTO(**asdict(health)) for health in recordings]
+        )
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Iterator, List
+
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Contracts.ClipExtractor import ClipExtractor
+from ...Domain.Contracts.RecordingSegmentRepository import RecordingSegmentRepository
+from ...Domain.Exceptions.ClipNotAvailableException import ClipNotAvailableException
+from ...Domain.ValueObjects.ClipRange import ClipRange
+from ...Domain.ValueObjects.ExtractedClip import ExtractedClip
+from ...Domain.ValueObjects.ProfileName import ProfileName
+from ...Domain.ValueObjects.RecordingSegment import RecordingSegment
+
+
+class ExtractClipUseCase:
+    """
+    Extrae el clip de una cámara entre dos fechas y horas, aunque abarque varias grabaciones,
+    copiando los paquetes sin recodificar (ver ClipExtractor)
+    """
+
+    def __init__(
+        self,
+        segment_repository: RecordingSegmentRepository,
+        clip_extractor: ClipExtractor,
+        logger: LoggerInterface,
+    ):
+        self._segment_repository = segment_repository
+        self._clip_extractor = clip_extractor
+        self._logger = logger
+
+    def execute(
+        self,
+        profile_name: str,
+        start: datetime,
+        end: datetime,
+        output_path: str,
+    ) -> ExtractedClip:
+        """
+        Escribe el clip en un archivo
+
+        Args:
+            profile_name: Nombre del perfil (cámara)
+            start: Inicio del clip
+            end: Fin del clip
+            output_path: Ruta del archivo de salida
+
+        Raises:
+            ClipNotAvailableException: Si no hay grabaciones en el intervalo
+        """
+        clip_range = ClipRange(start=start, end=end)
+        segments = self.__find_segments(profile_name, clip_range)
+        clip = self._clip_extractor.extract(segments, clip_range, output_path)
+        self._logger.info(
+            f"Clip de {profile_name} extraído en {clip.output_path} "
+            f"({clip.media_duration_seconds:.1f}s de {len(clip.segment_paths)} grabaciones)"
+        )
+        return clip
+
+    def stream(self, profile_name: str, start: datetime, end: datetime) -> Iterator[bytes]:
+        """
+        Igual que `execute`, pero entrega el clip en Matroska de a bloques de bytes.
+        Las grabaciones se buscan antes de devolver el generador, por lo que
+        ClipNotAvailableException se lanza al invocarlo
+        """
+        clip_range = ClipRange(start=start, end=end)
+        segments = self.__find_segments(profile_name, clip_range)
+        return self._clip_extractor.stream(segments, clip_range)
+
+    def __find_segments(self, profile_name: str, clip_range: ClipRange) -> List[RecordingSegment]:
+        segments = self._segment_repository.find_overlapping(ProfileName(profile_name), clip_range)
+        if not segments:
+            raise ClipNotAvailableException(
+                profile_name, clip_range.start.isoformat(), clip_range.end.isoformat()
+            )
+        self._logger.debug(f"Clip de {profile_name}: {len(segments)} grabaciones en el intervalo")
+        return segments
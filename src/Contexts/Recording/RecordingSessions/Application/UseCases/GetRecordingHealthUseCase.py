@@ -0,0 +1,20 @@
+from typing import List
+
+from ...Domain.Contracts.RecordingHealthMonitor import RecordingHealthMonitor
+from ...Domain.ValueObjects.RecordingHealth import RecordingHealth
+
+
+class GetRecordingHealthUseCase:
+    """Obtiene el estado actual de las grabaciones activas (ver RecordingHealthMonitor)"""
+
+    def __init__(self, health_monitor: RecordingHealthMonitor):
+        self._health_monitor = health_monitor
+
+    def execute(self) -> List[RecordingHealth]:
+        """
+        Devuelve el estado de cada grabación activa
+
+        Returns:
+            Último paquete, tasas de paquetes y bytes y estado de cada grabación
+        """
+        return self._health_monitor.health()
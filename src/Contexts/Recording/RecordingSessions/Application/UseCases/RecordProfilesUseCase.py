@@ -47,10 +47,28 @@ class RecordProfilesUseCase:
     def __start_profile_recording(self, profile: Profile) -> None:
         """Inicia la grabación de un perfil específico"""
         self._logger.debug(f"Iniciando grabación del perfil: {profile.name.value}")
+        if profile.recording_mode.is_continuous() or profile.recording_mode.is_motion():
+            self._recording_service.start_continuous_recording(
+                uri=profile.uri,
+                segment_duration=profile.duration,
+                profile_name=profile.name,
+                profile_id=profile.id,
+                profile_folder_path=profile.folder_path,
+                connection_timeout=profile.connection_timeout,
+                stream_selection=profile.stream_selection,
+                analysis_uri=profile.analysis_uri,
+                motion_trigger=(
+                    profile.motion_trigger if profile.recording_mode.is_motion() else None
+                ),
+            )
+            return
         self._recording_service.start_recording_session(
             uri=profile.uri,
             duration_seconds=profile.duration,
             profile_name=profile.name,
             profile_id=profile.id,
             profile_folder_path=profile.folder_path,
+            connection_timeout=profile.connection_timeout,
+            stream_selection=profile.stream_selection,
+            analysis_uri=profile.analysis_uri,
         )
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Sequence
+
+from ..ValueObjects.ClipRange import ClipRange
+from ..ValueObjects.ExtractedClip import ExtractedClip
+from ..ValueObjects.RecordingSegment import RecordingSegment
+
+
+class ClipExtractor(ABC):
+    @abstractmethod
+    def extract(
+        self, segments: Sequence[RecordingSegment], clip_range: ClipRange, output_path: str
+    ) -> ExtractedClip:
+        """
+        Copia en un único archivo los paquetes de las grabaciones dentro del intervalo, sin
+        recodificar. El clip comienza en el keyframe anterior al inicio del intervalo
+
+        Args:
+            segments: Grabaciones que cubren el intervalo, ordenadas por inicio
+            clip_range: Intervalo de tiempo de reloj del clip
+            output_path: Ruta del archivo de salida
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self, segments: Sequence[RecordingSegment], clip_range: ClipRange
+    ) -> Iterator[bytes]:
+        """
+        Igual que `extract`, pero entrega el contenedor de salida de a bloques de bytes a medida
+        que se genera (por ejemplo, para enviarlo en una respuesta HTTP)
+        """
+        pass
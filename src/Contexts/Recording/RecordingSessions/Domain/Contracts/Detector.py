@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+from ..ValueObjects.Detection import Detection
+
+
+class Detector(ABC):
+    @abstractmethod
+    def detect(self, frames: np.ndarray) -> List[List[Detection]]:
+        """
+        Detecta objetos en un lote de frames con una única invocación del modelo
+
+        Args:
+            frames: Lote de frames de forma (B, H, W, C) en uint8. Puede ser una vista sobre un
+                    buffer reutilizado: no debe conservarse después de la llamada
+
+        Returns:
+            Las detecciones de cada frame, en el mismo orden del lote
+        """
+        pass
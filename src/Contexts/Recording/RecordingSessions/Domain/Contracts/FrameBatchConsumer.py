@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from ..ValueObjects.FrameBatch import FrameBatch
+
+
+class FrameBatchConsumer(ABC):
+    @abstractmethod
+    def consume(self, batch: FrameBatch) -> None:
+        """
+        Procesa un lote de frames muestreados (por ejemplo, para inferencia)
+
+        Args:
+            batch: Lote de frames. Su buffer se reutiliza al retornar, por lo que los frames
+                   deben copiarse si se necesitan después de la llamada
+        """
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from ..ValueObjects.RecordingHealth import RecordingHealth
+
+
+class RecordingHealthMonitor(ABC):
+    @abstractmethod
+    def health(self) -> List[RecordingHealth]:
+        """
+        Devuelve el estado de todas las grabaciones activas
+
+        Returns:
+            Último paquete, tasas de paquetes y bytes y estado de cada grabación
+        """
+        pass
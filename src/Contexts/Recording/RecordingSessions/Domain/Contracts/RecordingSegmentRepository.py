@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from ..ValueObjects.ClipRange import ClipRange
+from ..ValueObjects.ProfileName import ProfileName
+from ..ValueObjects.RecordingSegment import RecordingSegment
+
+
+class RecordingSegmentRepository(ABC):
+    @abstractmethod
+    def find_overlapping(
+        self, profile_name: ProfileName, clip_range: ClipRange
+    ) -> List[RecordingSegment]:
+        """
+        Busca las grabaciones del perfil que cubren parte del intervalo, ordenadas por inicio
+
+        Args:
+            profile_name: Perfil cuyas grabaciones se buscan
+            clip_range: Intervalo de tiempo de reloj del clip
+        """
+        pass
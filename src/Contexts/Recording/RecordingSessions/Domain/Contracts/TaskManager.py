@@ -1,8 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Any, Callable, Optional
+
+Emit = Callable[[Any], None]
 
 
 class TaskManager(ABC):
     @abstractmethod
     def fire_and_forget(self, callback: Callable[[], None]) -> None:
         pass
+
+    @abstractmethod
+    def run_sharded(
+        self,
+        shard_key: str,
+        task: Callable[[Emit], None],
+        on_result: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Ejecuta una tarea en segundo plano, siempre en el mismo worker para un mismo `shard_key`
+
+        Args:
+            shard_key: Clave estable de la tarea (por ejemplo la URI de la cámara)
+            task: Tarea a ejecutar. Recibe una función `emit` para reportar resultados parciales.
+                  Puede ejecutarse en otro proceso, por lo que debe poder serializarse con pickle
+                  (funciones de módulo o `functools.partial`, no lambdas ni closures)
+            on_result: Callback opcional que recibe, en el proceso que envió la tarea, cada valor
+                       emitido por la tarea
+        """
+        pass
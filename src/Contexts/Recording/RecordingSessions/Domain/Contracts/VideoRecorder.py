@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
 
+from ..ValueObjects.ConnectionTimeout import ConnectionTimeout
+from ..ValueObjects.MotionTrigger import MotionTrigger
 from ..ValueObjects.Uri import Uri
 from ..ValueObjects.OutputPath import OutputPath
 from ..ValueObjects.RecordingSessionDuration import RecordingSessionDuration
+from ..ValueObjects.RecordingResult import RecordingResult
+from ..ValueObjects.StreamSelection import StreamSelection
 
 
 class VideoRecorder(ABC):
@@ -13,7 +17,10 @@ class VideoRecorder(ABC):
         uri: Uri,
         output_path: OutputPath,
         duration_seconds: RecordingSessionDuration,
-        on_finished: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[RecordingResult], None]] = None,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
     ) -> None:
         """
         Graba video desde una URI por una duración específica
@@ -23,6 +30,74 @@ class VideoRecorder(ABC):
             output_path: Ruta donde guardar el video grabado
             duration_seconds: Duración de la grabación en segundos
             on_finished: Callback opcional que se ejecuta cuando termina la grabación
-                        Recibe como parámetro la ruta del archivo grabado
+                        Recibe como parámetro el resultado de la grabación (rutas, duraciones
+                        y cortes por reconexión)
+            connection_timeout: Tiempo sin respuesta de la cámara antes de reconectar.
+                                Si no se indica, se usa el de la implementación
+            stream_selection: Streams de la cámara a grabar (video, audio, pistas secundarias).
+                              Si no se indica, solo se graba el video principal
+            analysis_uri: URI opcional de un stream de menor resolución de la misma cámara
+                          (sub-stream) que se decodifica para análisis mientras se graba
+        """
+        pass
+
+    @abstractmethod
+    def record_continuous(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]] = None,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+    ) -> None:
+        """
+        Graba video desde una URI de forma continua, manteniendo una única conexión
+        y rotando el archivo de salida en un keyframe cada `segment_duration` segundos
+
+        Args:
+            uri: URI del video a grabar
+            segment_duration: Duración de cada segmento en segundos
+            output_path_factory: Función que devuelve la ruta del próximo segmento.
+                                 Se invoca cada vez que se abre un segmento nuevo
+            on_segment_finished: Callback opcional que se ejecuta por cada segmento cerrado
+                                 Recibe como parámetro el resultado del segmento grabado
+            connection_timeout: Tiempo sin respuesta de la cámara antes de reconectar.
+                                Si no se indica, se usa el de la implementación
+            stream_selection: Streams de la cámara a grabar (video, audio, pistas secundarias).
+                              Si no se indica, solo se graba el video principal
+            analysis_uri: URI opcional de un stream de menor resolución de la misma cámara
+                          (sub-stream) que se decodifica para análisis mientras se graba
+        """
+        pass
+
+    @abstractmethod
+    def record_on_motion(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]],
+        motion_trigger: MotionTrigger,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+    ) -> None:
+        """
+        Mantiene la conexión con la cámara y graba solo mientras hay movimiento: cada evento
+        de movimiento abre un segmento que incluye el pre-roll y se cierra tras el post-roll.
+        Un movimiento más largo que `segment_duration` se divide en varios segmentos
+
+        Args:
+            uri: URI del video a grabar
+            segment_duration: Duración máxima de cada segmento en segundos
+            output_path_factory: Función que devuelve la ruta del próximo segmento
+            on_segment_finished: Callback opcional que se ejecuta por cada segmento cerrado
+            motion_trigger: Pre-roll, post-roll y sensibilidad de la detección de movimiento
+            connection_timeout: Tiempo sin respuesta de la cámara antes de reconectar
+            stream_selection: Streams de la cámara a grabar
+            analysis_uri: Sub-stream en el que se detecta el movimiento. Si no se indica, se
+                          analizan solo los keyframes del stream principal
         """
         pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from .VideoRecorder import VideoRecorder
+
+
+class VideoRecorderFactory(ABC):
+    @abstractmethod
+    def create(self) -> VideoRecorder:
+        """
+        Construye (o reutiliza) el VideoRecorder del proceso actual. La fábrica debe poder
+        serializarse con pickle: el TaskManager puede enviarla a otro proceso junto con la
+        tarea, y el grabador se construye allí
+
+        Returns:
+            El VideoRecorder que ejecuta las grabaciones en este proceso
+        """
+        pass
@@ -1,11 +1,16 @@
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from typing import Optional
 
 from ..ValueObjects.ProfileId import ProfileId
 from ..ValueObjects.ProfileName import ProfileName
 from ..ValueObjects.Uri import Uri
 from ..ValueObjects.RecordingSessionDuration import RecordingSessionDuration
 from ..ValueObjects.ProfileFolderPath import ProfileFolderPath
+from ..ValueObjects.RecordingMode import RecordingMode
+from ..ValueObjects.ConnectionTimeout import ConnectionTimeout
+from ..ValueObjects.StreamSelection import StreamSelection
+from ..ValueObjects.MotionTrigger import MotionTrigger
 
 
 @dataclass
@@ -17,12 +22,28 @@ class Profile:
         uri: str,
         duration_seconds: int,
         folder_path: str,
+        recording_mode: str = RecordingMode.SESSION,
+        connection_timeout_seconds: int = ConnectionTimeout.DEFAULT_SECONDS,
+        stream_selection: str = StreamSelection.VIDEO,
+        analysis_uri: Optional[str] = None,
+        motion_pre_roll_seconds: int = MotionTrigger.DEFAULT_PRE_ROLL_SECONDS,
+        motion_post_roll_seconds: int = MotionTrigger.DEFAULT_POST_ROLL_SECONDS,
+        motion_min_changed_fraction: float = MotionTrigger.DEFAULT_MIN_CHANGED_FRACTION,
     ):
         self._id = ProfileId(profile_id)
         self._name = ProfileName(profile_name)
         self._uri = Uri(uri)
         self._duration = RecordingSessionDuration(duration_seconds)
         self._folder_path = ProfileFolderPath(folder_path)
+        self._recording_mode = RecordingMode(recording_mode)
+        self._connection_timeout = ConnectionTimeout(connection_timeout_seconds)
+        self._stream_selection = StreamSelection(stream_selection)
+        self._analysis_uri = Uri(analysis_uri) if analysis_uri else None
+        self._motion_trigger = MotionTrigger(
+            pre_roll_seconds=motion_pre_roll_seconds,
+            post_roll_seconds=motion_post_roll_seconds,
+            min_changed_fraction=motion_min_changed_fraction,
+        )
         self._created_at = datetime.now()
 
     @classmethod
@@ -34,6 +55,21 @@ class Profile:
             uri=profile_data["uri"],
             duration_seconds=profile_data["duration_seconds"],
             folder_path=profile_data["folder_path"],
+            recording_mode=profile_data.get("recording_mode", RecordingMode.SESSION),
+            connection_timeout_seconds=profile_data.get(
+                "connection_timeout_seconds", ConnectionTimeout.DEFAULT_SECONDS
+            ),
+            stream_selection=profile_data.get("stream_selection", StreamSelection.VIDEO),
+            analysis_uri=profile_data.get("analysis_uri"),
+            motion_pre_roll_seconds=profile_data.get(
+                "motion_pre_roll_seconds", MotionTrigger.DEFAULT_PRE_ROLL_SECONDS
+            ),
+            motion_post_roll_seconds=profile_data.get(
+                "motion_post_roll_seconds", MotionTrigger.DEFAULT_POST_ROLL_SECONDS
+            ),
+            motion_min_changed_fraction=profile_data.get(
+                "motion_min_changed_fraction", MotionTrigger.DEFAULT_MIN_CHANGED_FRACTION
+            ),
         )
 
     def to_dict(self) -> dict:
@@ -60,3 +96,25 @@ class Profile:
     @property
     def folder_path(self) -> ProfileFolderPath:
         return self._folder_path
+
+    @property
+    def recording_mode(self) -> RecordingMode:
+        return self._recording_mode
+
+    @property
+    def connection_timeout(self) -> ConnectionTimeout:
+        return self._connection_timeout
+
+    @property
+    def stream_selection(self) -> StreamSelection:
+        return self._stream_selection
+
+    @property
+    def analysis_uri(self) -> Optional[Uri]:
+        """Sub-stream de la cámara que se decodifica para análisis, si está configurado"""
+        return self._analysis_uri
+
+    @property
+    def motion_trigger(self) -> MotionTrigger:
+        """Pre-roll, post-roll y sensibilidad del modo de grabación por movimiento"""
+        return self._motion_trigger
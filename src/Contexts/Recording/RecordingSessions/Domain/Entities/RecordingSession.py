@@ -4,6 +4,7 @@ from src.Contexts.SharedKernel.Domain.AggregateRoot import AggregateRoot
 
 from ..Events.CreatedRecordingSessionDomainEvent import CreatedRecordingSessionDomainEvent
 from ..Events.FinishedRecordingSessionDomainEvent import FinishedRecordingSessionDomainEvent
+from ..ValueObjects.RecordingResult import RecordingResult
 from ..ValueObjects.RecordingSessionId import RecordingSessionId
 from ..ValueObjects.StartDate import StartDate
 from .Profile import Profile
@@ -53,7 +54,7 @@ class RecordingSession(AggregateRoot):
 
         return recording_session
 
-    def finish(self, output_path: str) -> None:
+    def finish(self, result: RecordingResult) -> None:
         """Marca la sesión de grabación como finalizada y dispara el evento correspondiente"""
         end_date = datetime.now()
 
@@ -64,7 +65,12 @@ class RecordingSession(AggregateRoot):
             start_date=self._start_date.value,
             end_date=end_date,
             duration_seconds=self._profile.duration.value,
-            output_path=output_path,
+            output_path=result.output_path,
+            media_duration_seconds=result.media_duration_seconds,
+            clock_drift_seconds=result.clock_drift_seconds,
+            part_paths=result.all_paths,
+            gap_seconds=result.gap_seconds,
+            content_hashes=result.content_hashes,
         )
         self.record_domain_event(event)
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Tuple
 
 from src.Contexts.SharedKernel.Domain.DomainEvent import DomainEvent
 
@@ -13,6 +14,11 @@ class FinishedRecordingSessionDomainEvent(DomainEvent):
     end_date: datetime
     duration_seconds: int
     output_path: str
+    media_duration_seconds: float
+    clock_drift_seconds: float
+    part_paths: Tuple[str, ...] = ()  # todos los archivos de la sesión, en orden
+    gap_seconds: float = 0.0  # tiempo sin grabar por desconexiones de la cámara
+    content_hashes: Tuple[str, ...] = ()  # hash de cada archivo de part_paths, si se calculó
 
     @property
     def event_name(self) -> str:
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from src.Contexts.SharedKernel.Domain.DomainEvent import DomainEvent
+
+from ..ValueObjects.Detection import Detection
+
+
+@dataclass(frozen=True)
+class ObjectsDetectedDomainEvent(DomainEvent):
+    source: str  # origen del stream de análisis, sin credenciales
+    timestamp_seconds: float  # segundos de media del frame en su stream
+    detections: Tuple[Detection, ...]
+
+    @property
+    def event_name(self) -> str:
+        return "recording_session.objects_detected"
@@ -0,0 +1,4 @@
+class ClipNotAvailableException(Exception):
+    def __init__(self, profile_name: str, start: str, end: str):
+        super().__init__(f"No hay grabaciones del perfil '{profile_name}' entre {start} y {end}.")
+        self.profile_name = profile_name
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ..Contracts.PathEnsurer import PathEnsurer
+from ..Contracts.TaskManager import Emit
+from ..Contracts.VideoRecorderFactory import VideoRecorderFactory
+from ..ValueObjects.ConnectionTimeout import ConnectionTimeout
+from ..ValueObjects.MotionTrigger import MotionTrigger
+from ..ValueObjects.OutputPath import OutputPath
+from ..ValueObjects.ProfileFolderPath import ProfileFolderPath
+from ..ValueObjects.ProfileName import ProfileName
+from ..ValueObjects.RecordingSessionDuration import RecordingSessionDuration
+from ..ValueObjects.StreamSelection import StreamSelection
+from ..ValueObjects.Uri import Uri
+
+
+@dataclass(frozen=True)
+class ContinuousRecordingTask:
+    """
+    Tarea de grabación continua serializable, para que el TaskManager pueda ejecutarla en otro
+    proceso: el grabador se construye con `video_recorder_factory` en el proceso que la
+    ejecuta. Emite la OutputPath de cada segmento que se abre y el RecordingResult de cada
+    segmento que se cierra; RecordingService mantiene las sesiones en el proceso que la envió.
+    Con `motion_trigger` solo se graban segmentos mientras hay movimiento.
+    """
+
+    video_recorder_factory: VideoRecorderFactory
+    path_ensurer: PathEnsurer
+    uri: Uri
+    segment_duration: RecordingSessionDuration
+    profile_name: ProfileName
+    profile_folder_path: ProfileFolderPath
+    connection_timeout: Optional[ConnectionTimeout] = None
+    stream_selection: Optional[StreamSelection] = None
+    analysis_uri: Optional[Uri] = None
+    motion_trigger: Optional[MotionTrigger] = None
+
+    def __call__(self, emit: Emit) -> None:
+        def next_output_path() -> OutputPath:
+            output_path = OutputPath.for_profile(self.profile_name, self.profile_folder_path)
+            self.path_ensurer.ensure_path(output_path)
+            emit(output_path)
+            return output_path
+
+        video_recorder = self.video_recorder_factory.create()
+        if self.motion_trigger is not None:
+            video_recorder.record_on_motion(
+                self.uri,
+                self.segment_duration,
+                next_output_path,
+                emit,
+                self.motion_trigger,
+                connection_timeout=self.connection_timeout,
+                stream_selection=self.stream_selection,
+                analysis_uri=self.analysis_uri,
+            )
+            return
+        video_recorder.record_continuous(
+            self.uri,
+            self.segment_duration,
+            next_output_path,
+            emit,
+            connection_timeout=self.connection_timeout,
+            stream_selection=self.stream_selection,
+            analysis_uri=self.analysis_uri,
+        )
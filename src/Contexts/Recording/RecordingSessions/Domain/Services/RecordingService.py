@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Dict, List, Optional, Union
 from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
 from src.Contexts.SharedKernel.Domain.UuidGenerator import UuidGenerator
 from src.Contexts.SharedKernel.Domain.EventBusInterface import EventBusInterface
 from ..Contracts.TaskManager import TaskManager
-from ..Contracts.VideoRecorder import VideoRecorder
+from ..Contracts.VideoRecorderFactory import VideoRecorderFactory
+from ..ValueObjects.ConnectionTimeout import ConnectionTimeout
+from ..ValueObjects.MotionTrigger import MotionTrigger
 from ..ValueObjects.OutputPath import OutputPath
+from ..ValueObjects.RecordingResult import RecordingResult
 from ..Contracts.PathEnsurer import PathEnsurer
 from ..ValueObjects.Uri import Uri
 from ..ValueObjects.RecordingSessionDuration import RecordingSessionDuration
+from ..ValueObjects.StreamSelection import StreamSelection
 from ..ValueObjects.ProfileId import ProfileId
 from ..ValueObjects.ProfileName import ProfileName
 from ..ValueObjects.ProfileFolderPath import ProfileFolderPath
@@ -18,76 +23,190 @@ from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessi
     RecordingSessionId,
 )
 from ..Entities.Profile import Profile
+from .ContinuousRecordingTask import ContinuousRecordingTask
+from .RecordingSessionTask import RecordingSessionTask
 
 
 class RecordingService:
     def __init__(
         self,
         task_manager: TaskManager,
-        video_recorder: VideoRecorder,
+        video_recorder_factory: VideoRecorderFactory,
         path_ensurer: PathEnsurer,
         logger: LoggerInterface,
         uuid_generator: UuidGenerator,
         event_bus: EventBusInterface,
     ):
         self._task_manager = task_manager
-        self._video_recorder = video_recorder
+        self._video_recorder_factory = video_recorder_factory
         self._path_ensurer = path_ensurer
         self._logger = logger
         self._uuid_generator = uuid_generator
         self._event_bus = event_bus
 
-    def __get_output_path(
-        self, profile_name: ProfileName, profile_folder_path: ProfileFolderPath
-    ) -> OutputPath:
-        return OutputPath(
-            f"{profile_folder_path.value}/{profile_name.value}__{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.mkv"
-        )
-
-    def start_recording_session(
+    def __build_profile(
         self,
         uri: Uri,
         duration_seconds: RecordingSessionDuration,
         profile_name: ProfileName,
         profile_id: ProfileId,
         profile_folder_path: ProfileFolderPath,
-    ) -> RecordingSession:
-        self._logger.debug(f"Starting recording session for profile {profile_name.value}")
-        output_path = self.__get_output_path(profile_name, profile_folder_path)
-
-        self._logger.debug(f"Ensuring path {output_path.value}")
-        self._path_ensurer.ensure_path(output_path)
-
-        profile = Profile(
+    ) -> Profile:
+        return Profile(
             profile_id=profile_id.value,
             profile_name=profile_name.value,
             uri=uri.value,
             duration_seconds=duration_seconds.value,
             folder_path=profile_folder_path.value,
         )
-        recording_session = RecordingSession.create(
+
+    def __create_recording_session(self, profile: Profile) -> RecordingSession:
+        return RecordingSession.create(
             recording_session_id=self._uuid_generator.generate(),
             profile=profile,
             start_date=datetime.now(),
         )
 
-        # Callback que se ejecuta cuando termina la grabación
-        def on_recording_finished(output_file_path: str) -> None:
+    def start_recording_session(
+        self,
+        uri: Uri,
+        duration_seconds: RecordingSessionDuration,
+        profile_name: ProfileName,
+        profile_id: ProfileId,
+        profile_folder_path: ProfileFolderPath,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+    ) -> RecordingSession:
+        self._logger.debug(f"Starting recording session for profile {profile_name.value}")
+        profile = self.__build_profile(
+            uri, duration_seconds, profile_name, profile_id, profile_folder_path
+        )
+        recording_session = self.__create_recording_session(profile)
+        attempt_paths: List[str] = []
+
+        # Cada ejecución de la tarea informa su archivo; el RecordingResult cierra la sesión
+        def on_recording_event(event: Union[OutputPath, RecordingResult]) -> None:
+            if isinstance(event, OutputPath):
+                self._logger.debug(f"Recording session {recording_session.id.value} to {event}")
+                attempt_paths.append(event.value)
+                return
             self._logger.debug(f"Recording finished for session {recording_session.id.value}")
-            recording_session.finish(output_file_path)
+            recording_session.finish(self.__with_restarted_attempts(event, attempt_paths[:-1]))
             self._event_bus.publish(recording_session.pull_domain_events())
 
         self._logger.debug(
             f"Recording profile {profile_name.value} for {duration_seconds.value} seconds"
         )
-        self._task_manager.fire_and_forget(
-            lambda: self._video_recorder.record(
-                uri, output_path, duration_seconds, on_recording_finished
-            )
+        # La tarea debe ser serializable: el TaskManager puede ejecutarla en otro proceso
+        task = RecordingSessionTask(
+            video_recorder_factory=self._video_recorder_factory,
+            path_ensurer=self._path_ensurer,
+            uri=uri,
+            profile_name=profile_name,
+            profile_folder_path=profile_folder_path,
+            duration_seconds=duration_seconds,
+            connection_timeout=connection_timeout,
+            stream_selection=stream_selection,
+            analysis_uri=analysis_uri,
         )
+        self._task_manager.run_sharded(uri.value, task, on_recording_event)
 
         self._logger.debug(
             f"Recording session created for profile {profile_name.value}. Estimated end time: {recording_session.get_end_datetime()}"
         )
 
         return recording_session
+
+    def __with_restarted_attempts(
+        self, result: RecordingResult, restarted_paths: List[str]
+    ) -> RecordingResult:
+        # Los archivos parciales de ejecuciones que se reiniciaron (el proceso que grababa
+        # murió) se conservan como primeras partes de la sesión. Su duración no se conoce
+        if not restarted_paths:
+            return result
+        self._logger.warn(
+            f"Recording {result.output_path} was restarted: keeping "
+            f"{', '.join(restarted_paths)} as its first parts"
+        )
+        return RecordingResult(
+            output_path=restarted_paths[0],
+            media_duration_seconds=result.media_duration_seconds,
+            wall_clock_duration_seconds=result.wall_clock_duration_seconds,
+            part_paths=tuple(restarted_paths[1:]) + result.all_paths,
+            gaps=result.gaps,
+        )
+
+    def start_continuous_recording(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        profile_name: ProfileName,
+        profile_id: ProfileId,
+        profile_folder_path: ProfileFolderPath,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+        motion_trigger: Optional[MotionTrigger] = None,
+    ) -> None:
+        """
+        Inicia una grabación continua segmentada: se mantiene una única conexión con la cámara
+        y cada segmento cerrado finaliza su propia RecordingSession, publicando sus eventos.
+        Con `motion_trigger` solo se abren segmentos (y sesiones) mientras hay movimiento.
+        """
+        self._logger.debug(f"Starting continuous recording for profile {profile_name.value}")
+        profile = self.__build_profile(
+            uri, segment_duration, profile_name, profile_id, profile_folder_path
+        )
+        open_sessions: Dict[str, RecordingSession] = {}
+
+        # Cada segmento abierto crea su sesión; cada segmento cerrado la finaliza
+        def on_segment_event(event: Union[OutputPath, RecordingResult]) -> None:
+            if isinstance(event, OutputPath):
+                self.__finish_orphaned_sessions(open_sessions, profile_name)
+                open_sessions[event.value] = self.__create_recording_session(profile)
+                return
+            recording_session = open_sessions.pop(event.output_path, None)
+            if recording_session is None:
+                return
+            self._logger.debug(f"Segment finished for session {recording_session.id.value}")
+            recording_session.finish(event)
+            self._event_bus.publish(recording_session.pull_domain_events())
+
+        task = ContinuousRecordingTask(
+            video_recorder_factory=self._video_recorder_factory,
+            path_ensurer=self._path_ensurer,
+            uri=uri,
+            segment_duration=segment_duration,
+            profile_name=profile_name,
+            profile_folder_path=profile_folder_path,
+            connection_timeout=connection_timeout,
+            stream_selection=stream_selection,
+            analysis_uri=analysis_uri,
+            motion_trigger=motion_trigger,
+        )
+        self._task_manager.run_sharded(uri.value, task, on_segment_event)
+
+    def __finish_orphaned_sessions(
+        self, open_sessions: Dict[str, RecordingSession], profile_name: ProfileName
+    ) -> None:
+        # La grabación cierra cada segmento antes de abrir el siguiente: si al abrir uno queda
+        # otro abierto, el proceso que lo grababa murió y la tarea se reinició sin cerrarlo.
+        # El archivo parcial se conserva: se finaliza su sesión con la duración según el reloj
+        for output_path in list(open_sessions):
+            recording_session = open_sessions.pop(output_path)
+            self._logger.warn(
+                f"Segment {output_path} of profile {profile_name.value} was never "
+                "finished: its recording was restarted"
+            )
+            elapsed_seconds = max(
+                0.0, (datetime.now() - recording_session.start_date.value).total_seconds()
+            )
+            recording_session.finish(
+                RecordingResult(
+                    output_path=output_path,
+                    media_duration_seconds=elapsed_seconds,
+                    wall_clock_duration_seconds=elapsed_seconds,
+                )
+            )
+            self._event_bus.publish(recording_session.pull_domain_events())
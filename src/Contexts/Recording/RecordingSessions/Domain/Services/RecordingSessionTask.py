@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ..Contracts.PathEnsurer import PathEnsurer
+from ..Contracts.TaskManager import Emit
+from ..Contracts.VideoRecorderFactory import VideoRecorderFactory
+from ..ValueObjects.ConnectionTimeout import ConnectionTimeout
+from ..ValueObjects.OutputPath import OutputPath
+from ..ValueObjects.ProfileFolderPath import ProfileFolderPath
+from ..ValueObjects.ProfileName import ProfileName
+from ..ValueObjects.RecordingSessionDuration import RecordingSessionDuration
+from ..ValueObjects.StreamSelection import StreamSelection
+from ..ValueObjects.Uri import Uri
+
+
+@dataclass(frozen=True)
+class RecordingSessionTask:
+    """
+    Tarea de grabación de una sesión serializable, para que el TaskManager pueda ejecutarla en
+    otro proceso: lleva la fábrica del grabador y no el grabador, que se construye en el
+    proceso que la ejecuta. Emite la OutputPath en la que empieza a grabar y el RecordingResult
+    de la sesión al terminar. Cada ejecución graba en un archivo nuevo: si el worker muere y la
+    tarea se reinicia, el archivo parcial de la ejecución anterior se conserva.
+    """
+
+    video_recorder_factory: VideoRecorderFactory
+    path_ensurer: PathEnsurer
+    uri: Uri
+    profile_name: ProfileName
+    profile_folder_path: ProfileFolderPath
+    duration_seconds: RecordingSessionDuration
+    connection_timeout: Optional[ConnectionTimeout] = None
+    stream_selection: Optional[StreamSelection] = None
+    analysis_uri: Optional[Uri] = None
+
+    def __call__(self, emit: Emit) -> None:
+        output_path = OutputPath.for_profile(self.profile_name, self.profile_folder_path)
+        self.path_ensurer.ensure_path(output_path)
+        emit(output_path)
+        self.video_recorder_factory.create().record(
+            self.uri,
+            output_path,
+            self.duration_seconds,
+            emit,
+            connection_timeout=self.connection_timeout,
+            stream_selection=self.stream_selection,
+            analysis_uri=self.analysis_uri,
+        )
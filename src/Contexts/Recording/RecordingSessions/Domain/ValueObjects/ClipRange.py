@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True)
+class ClipRange:
+    """Intervalo de tiempo de reloj de un clip a extraer de las grabaciones de una cámara"""
+
+    start: datetime
+    end: datetime
+
+    MAX_DURATION = timedelta(hours=24)
+
+    def __post_init__(self):
+        self.__ensure_end_is_after_start()
+        self.__ensure_duration_is_reasonable()
+
+    def __ensure_end_is_after_start(self) -> None:
+        if self.end <= self.start:
+            raise ValueError("El fin del clip debe ser posterior a su inicio")
+
+    def __ensure_duration_is_reasonable(self) -> None:
+        if self.end - self.start > self.MAX_DURATION:
+            raise ValueError(f"Un clip no puede durar más de {self.MAX_DURATION}")
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end - self.start).total_seconds()
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConnectionTimeout:
+    value: int  # segundos sin respuesta de la cámara antes de considerar la conexión perdida
+
+    DEFAULT_SECONDS = 30
+    MAX_SECONDS = 300
+
+    def __post_init__(self):
+        self.__ensure_is_positive(self.value)
+        self.__ensure_is_reasonable_timeout(self.value)
+
+    def __ensure_is_positive(self, value: int):
+        if value <= 0:
+            raise ValueError("El timeout de conexión debe ser mayor a 0 segundos")
+
+    def __ensure_is_reasonable_timeout(self, value: int):
+        if value > self.MAX_SECONDS:
+            raise ValueError(f"El timeout de conexión no puede exceder {self.MAX_SECONDS} segundos")
+
+    @property
+    def microseconds(self) -> int:
+        return self.value * 1000000
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Detection:
+    """Objeto detectado en un frame; la caja se expresa en fracciones del ancho y alto del frame"""
+
+    label: str
+    confidence: float
+    x: float  # borde izquierdo
+    y: float  # borde superior
+    width: float
+    height: float
+
+    def __post_init__(self):
+        self.__ensure_confidence_is_a_probability()
+        self.__ensure_box_is_inside_frame()
+
+    def __ensure_confidence_is_a_probability(self) -> None:
+        if not 0 <= self.confidence <= 1:
+            raise ValueError("La confianza de una detección debe estar entre 0 y 1")
+
+    def __ensure_box_is_inside_frame(self) -> None:
+        if self.x < 0 or self.y < 0 or self.width < 0 or self.height < 0:
+            raise ValueError("La caja de una detección no puede tener valores negativos")
+        # Tolerancia para errores de redondeo del modelo
+        if self.x + self.width > 1.001 or self.y + self.height > 1.001:
+            raise ValueError("La caja de una detección debe estar dentro del frame")
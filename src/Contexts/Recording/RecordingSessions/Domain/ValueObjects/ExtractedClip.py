@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ExtractedClip:
+    """Resultado de extraer un clip de las grabaciones de una cámara"""
+
+    output_path: str
+    media_duration_seconds: float
+    segment_paths: Tuple[str, ...]  # grabaciones de las que se copiaron paquetes
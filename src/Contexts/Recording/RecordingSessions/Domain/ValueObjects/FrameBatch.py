@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class FrameBatch:
+    """
+    Lote de frames muestreados de una o varias cámaras, todos con el mismo tamaño.
+    `frames` tiene forma (B, H, W, C) y es una vista sobre un buffer que se reutiliza: solo es
+    válido durante la llamada al consumidor, que debe copiarlo si necesita conservarlo.
+    """
+
+    frames: np.ndarray
+    sources: Tuple[str, ...]  # origen de cada frame, sin credenciales
+    timestamps: Tuple[float, ...]  # segundos de media de cada frame en su stream
+
+    def __post_init__(self):
+        self.__ensure_metadata_matches_frames()
+
+    def __ensure_metadata_matches_frames(self) -> None:
+        if not len(self.frames) == len(self.sources) == len(self.timestamps):
+            raise ValueError("Cada frame del lote debe tener su origen y su timestamp")
+
+    def __len__(self) -> int:
+        return len(self.frames)
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MotionTrigger:
+    """Configuración de la grabación por movimiento de un perfil"""
+
+    pre_roll_seconds: int  # segundos previos al movimiento que se incluyen en la grabación
+    post_roll_seconds: int  # segundos sin movimiento antes de cerrar la grabación
+    min_changed_fraction: float  # fracción de píxeles que deben cambiar para detectar movimiento
+
+    DEFAULT_PRE_ROLL_SECONDS = 5
+    DEFAULT_POST_ROLL_SECONDS = 10
+    DEFAULT_MIN_CHANGED_FRACTION = 0.01
+    MAX_ROLL_SECONDS = 60
+
+    def __post_init__(self):
+        self.__ensure_roll_is_reasonable("pre-roll", self.pre_roll_seconds)
+        self.__ensure_roll_is_reasonable("post-roll", self.post_roll_seconds)
+        self.__ensure_fraction_is_valid(self.min_changed_fraction)
+
+    def __ensure_roll_is_reasonable(self, name: str, seconds: int) -> None:
+        if seconds < 0:
+            raise ValueError(f"El {name} no puede ser negativo")
+        if seconds > self.MAX_ROLL_SECONDS:
+            raise ValueError(f"El {name} no puede exceder {self.MAX_ROLL_SECONDS} segundos")
+
+    def __ensure_fraction_is_valid(self, fraction: float) -> None:
+        if not 0 < fraction <= 1:
+            raise ValueError(
+                "La fracción de píxeles para detectar movimiento debe estar entre 0 y 1"
+            )
@@ -1,11 +1,23 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileFolderPath import (
+    ProfileFolderPath,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileName import ProfileName
+
 
 @dataclass(frozen=True)
 class OutputPath:
     value: str
 
+    # Fecha y hora de inicio con la que se nombran las grabaciones de un perfil. Incluye los
+    # microsegundos: una rotación o un reinicio dentro del mismo segundo no reutiliza el nombre
+    DATE_FORMAT = "%Y-%m-%d_%H-%M-%S-%f"
+
     def __post_init__(self):
         self.__ensure_has_valid_extension(self.value)
 
@@ -18,5 +30,13 @@ class OutputPath:
                 f"Extensión de archivo no válida. Extensiones permitidas: {', '.join(allowed_extensions)}"
             )
 
+    @classmethod
+    def for_profile(
+        cls, profile_name: ProfileName, profile_folder_path: ProfileFolderPath
+    ) -> OutputPath:
+        """Ruta de una grabación nueva del perfil, nombrada con la fecha y hora actuales"""
+        started = datetime.now().strftime(cls.DATE_FORMAT)
+        return cls(f"{profile_folder_path.value}/{profile_name.value}__{started}.mkv")
+
     def __str__(self):
         return self.value
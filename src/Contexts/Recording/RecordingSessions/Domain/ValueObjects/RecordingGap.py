@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RecordingGap:
+    """Intervalo sin grabación por una desconexión de la cámara"""
+
+    offset_seconds: float  # desde el inicio de la grabación
+    duration_seconds: float
+    reason: str
+
+    def __post_init__(self):
+        self.__ensure_times_are_not_negative()
+
+    def __ensure_times_are_not_negative(self) -> None:
+        if self.offset_seconds < 0 or self.duration_seconds < 0:
+            raise ValueError("El inicio y la duración de un corte no pueden ser negativos")
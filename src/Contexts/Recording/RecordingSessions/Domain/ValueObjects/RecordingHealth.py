@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RecordingHealth:
+    """Estado de una grabación activa en un instante dado"""
+
+    source: str  # origen sin credenciales
+    last_packet_age_seconds: float
+    packets_per_second: float
+    bytes_per_second: float
+    is_stalled: bool
+    is_reconnecting: bool
+    restarts: int
+
+    @property
+    def is_healthy(self) -> bool:
+        return not self.is_stalled and not self.is_reconnecting
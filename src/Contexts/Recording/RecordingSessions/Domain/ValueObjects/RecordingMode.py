@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from src.Contexts.SharedKernel.Domain.ValueObjects.StringValueObject import StringValueObject
+
+
+@dataclass(frozen=True)
+class RecordingMode(StringValueObject):
+    SESSION = "session"
+    CONTINUOUS = "continuous"
+    MOTION = "motion"
+
+    def __ensure_is_supported_mode(self) -> None:
+        if self.value not in (self.SESSION, self.CONTINUOUS, self.MOTION):
+            raise ValueError(
+                f"Modo de grabación no válido: {self.value}. "
+                f"Modos permitidos: {self.SESSION}, {self.CONTINUOUS}, {self.MOTION}"
+            )
+
+    def __post_init__(self):
+        self.__ensure_is_supported_mode()
+
+    def is_continuous(self) -> bool:
+        return self.value == self.CONTINUOUS
+
+    def is_motion(self) -> bool:
+        return self.value == self.MOTION
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingGap import RecordingGap
+
+
+@dataclass(frozen=True)
+class RecordingResult:
+    output_path: str
+    media_duration_seconds: float  # según los timestamps del stream
+    wall_clock_duration_seconds: float  # según el reloj del sistema, sin contar los cortes
+    part_paths: Tuple[str, ...] = ()  # archivos grabados tras cada reconexión
+    gaps: Tuple[RecordingGap, ...] = ()
+    content_hashes: Tuple[str, ...] = ()  # hash de cada archivo de all_paths, si se calculó
+
+    def __post_init__(self):
+        self.__ensure_durations_are_not_negative()
+        self.__ensure_content_hashes_match_paths()
+
+    def __ensure_durations_are_not_negative(self) -> None:
+        if self.media_duration_seconds < 0 or self.wall_clock_duration_seconds < 0:
+            raise ValueError("Las duraciones de la grabación no pueden ser negativas")
+
+    def __ensure_content_hashes_match_paths(self) -> None:
+        if self.content_hashes and len(self.content_hashes) != len(self.all_paths):
+            raise ValueError("Debe haber un hash de contenido por cada archivo de la grabación")
+
+    @property
+    def clock_drift_seconds(self) -> float:
+        """Diferencia entre el reloj del sistema y el reloj del stream durante la grabación"""
+        return self.wall_clock_duration_seconds - self.media_duration_seconds
+
+    @property
+    def all_paths(self) -> Tuple[str, ...]:
+        """Todos los archivos de la grabación, en orden"""
+        return (self.output_path,) + self.part_paths
+
+    @property
+    def gap_seconds(self) -> float:
+        return sum(gap.duration_seconds for gap in self.gaps)
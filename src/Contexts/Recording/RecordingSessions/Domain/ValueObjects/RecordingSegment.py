@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class RecordingSegment:
+    """Archivo grabado de un perfil y la fecha y hora en que comenzó su grabación"""
+
+    path: str
+    start_date: datetime
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SeekIndexEntry:
+    """Paquete del video principal de una grabación registrado en su índice de búsqueda"""
+
+    pts: int  # en el time base del índice, desde el inicio de la grabación
+    seconds: float  # pts convertido a segundos
+    is_keyframe: bool
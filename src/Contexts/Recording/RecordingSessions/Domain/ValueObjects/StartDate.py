@@ -1,11 +1,14 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 @dataclass(frozen=True)
 class StartDate:
     value: datetime
 
+    # Margen para fechas tomadas con datetime.now() justo antes de construir el value object
+    PAST_TOLERANCE = timedelta(seconds=1)
+
     def __post_init__(self):
         self.__ensure_is_valid_datetime(self.value)
         self.__ensure_is_not_in_past(self.value)
@@ -25,7 +28,7 @@ class StartDate:
             raise ValueError("La fecha de inicio no puede ser más de 10 años en el futuro")
 
     def __ensure_is_not_in_past(self, value: datetime):
-        if value < datetime.now():
+        if value < datetime.now() - self.PAST_TOLERANCE:
             raise ValueError("La fecha de inicio no puede estar en el pasado")
 
     def __str__(self):
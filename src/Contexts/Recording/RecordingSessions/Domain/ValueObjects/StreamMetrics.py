@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class StreamMetrics:
+    """Contadores acumulados de una grabación desde que comenzó"""
+
+    source: str  # origen sin credenciales
+    packets_per_stream: Tuple[Tuple[int, int], ...]  # (índice del stream, paquetes)
+    bytes_per_stream: Tuple[Tuple[int, int], ...]  # (índice del stream, bytes)
+    keyframes: int
+    mean_keyframe_interval_seconds: float
+    dts_gap_frames: int  # frames faltantes según el avance del DTS (paquetes perdidos)
+    out_of_order_packets: int  # DTS menor al del paquete anterior
+    mux_latency_buckets: Tuple[Tuple[float, int], ...]  # (límite en segundos, cantidad)
+    mux_latency_sum_seconds: float
+    mux_latency_count: int
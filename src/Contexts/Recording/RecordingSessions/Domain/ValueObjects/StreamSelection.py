@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from src.Contexts.SharedKernel.Domain.ValueObjects.StringValueObject import StringValueObject
+
+
+@dataclass(frozen=True)
+class StreamSelection(StringValueObject):
+    """
+    Streams de la cámara que se guardan en cada grabación:
+    - video: solo el stream de video principal
+    - video_audio: el video principal y todas las pistas de audio
+    - all: todas las pistas de video y de audio
+    """
+
+    VIDEO = "video"
+    VIDEO_AUDIO = "video_audio"
+    ALL = "all"
+
+    def __ensure_is_supported_selection(self) -> None:
+        if self.value not in (self.VIDEO, self.VIDEO_AUDIO, self.ALL):
+            raise ValueError(
+                f"Selección de streams no válida: {self.value}. "
+                f"Selecciones permitidas: {self.VIDEO}, {self.VIDEO_AUDIO}, {self.ALL}"
+            )
+
+    def __post_init__(self):
+        self.__ensure_is_supported_selection()
+
+    def includes_audio(self) -> bool:
+        return self.value in (self.VIDEO_AUDIO, self.ALL)
+
+    def includes_secondary_video(self) -> bool:
+        return self.value == self.ALL
@@ -0,0 +1,31 @@
+from typing import List
+
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.RecordingSegmentRepository import (
+    RecordingSegmentRepository,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ClipRange import ClipRange
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileName import ProfileName
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSegment import (
+    RecordingSegment,
+)
+from src.Contexts.Recording.Videos.Domain.Contracts.RecordingCatalog import RecordingCatalog
+
+
+class CatalogRecordingSegmentRepository(RecordingSegmentRepository):
+    """
+    Busca las grabaciones de un perfil en el catálogo de grabaciones (ver RecordingCatalog):
+    una consulta por intervalo sobre un índice, sin listar la carpeta del perfil. Las
+    grabaciones que ya se movieron se encuentran en su nueva ruta.
+    """
+
+    def __init__(self, catalog: RecordingCatalog):
+        self._catalog = catalog
+
+    @override
+    def find_overlapping(
+        self, profile_name: ProfileName, clip_range: ClipRange
+    ) -> List[RecordingSegment]:
+        entries = self._catalog.find_between(profile_name.value, clip_range.start, clip_range.end)
+        return [RecordingSegment(path=entry.path, start_date=entry.start_date) for entry in entries]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+
+class ExponentialBackoff:
+    """
+    Espera entre reintentos de conexión que se duplica en cada intento hasta `max_delay_seconds`.
+    Se aplica jitter ("equal jitter": entre la mitad y el total de la espera) para que muchas
+    cámaras que se cortan a la vez no reconecten todas en el mismo instante.
+    """
+
+    def __init__(
+        self,
+        base_delay_seconds: float = 1.0,
+        max_delay_seconds: float = 30.0,
+        max_attempts: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.__ensure_delays_are_valid(base_delay_seconds, max_delay_seconds)
+        self.__base_delay_seconds = base_delay_seconds
+        self.__max_delay_seconds = max_delay_seconds
+        self.__max_attempts = max_attempts
+        self.__rng = rng or random.Random()
+
+    def __ensure_delays_are_valid(self, base_delay_seconds: float, max_delay_seconds: float):
+        if base_delay_seconds <= 0 or max_delay_seconds < base_delay_seconds:
+            raise ValueError(
+                "La espera base debe ser mayor a 0 y no puede superar a la espera máxima"
+            )
+
+    def allows(self, attempt: int) -> bool:
+        """Indica si se puede realizar el intento número `attempt` (empezando en 0)"""
+        return self.__max_attempts is None or attempt < self.__max_attempts
+
+    def delay_for(self, attempt: int) -> float:
+        """Segundos a esperar antes del intento número `attempt` (empezando en 0)"""
+        cap = min(self.__max_delay_seconds, self.__base_delay_seconds * 2 ** min(attempt, 32))
+        return cap / 2 + self.__rng.uniform(0, cap / 2)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from typing import Any, Dict, Optional, Set
+
+from src.Contexts.SharedKernel.Infrastructure.Services.ChunkedContentHasher import (
+    ChunkedContentHasher,
+)
+
+
+class HashingOutputFile(io.RawIOBase):
+    """
+    Archivo de salida que calcula el ChunkedContentHasher de su contenido a medida que se
+    escribe, para no tener que releer la grabación completa al cerrarla.
+
+    Las escrituras al final del archivo se hashean al pasar. Los muxers, al cerrar,
+    reescriben algunos bytes ya escritos (en Matroska, la cabecera con la duración y el
+    índice); esos bloques se marcan y al cerrar se vuelven a leer solo ellos, normalmente
+    desde la caché de páginas. Si se escribe dejando un hueco, el hash se calcula releyendo
+    el archivo completo.
+    """
+
+    def __init__(self, path: str):
+        self.name = path
+        self.__file = open(path, "wb", buffering=0)
+        self.__chunk_size = ChunkedContentHasher.CHUNK_SIZE
+        self.__digests: Dict[int, bytes] = {}
+        self.__chunk = hashlib.blake2b(digest_size=ChunkedContentHasher.DIGEST_SIZE)
+        self.__hashed_size = 0
+        self.__dirty_chunks: Set[int] = set()
+        self.__has_gap = False
+        self.__content_hash: Optional[str] = None
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """Hash del contenido, disponible una vez cerrado el archivo"""
+        return self.__content_hash
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        position = self.__file.tell()
+        count = self.__file.write(data) or 0
+        view = memoryview(data)[:count]
+        if position == self.__hashed_size:
+            self.__hash_appended(view)
+        elif position + count <= self.__hashed_size:
+            first = position // self.__chunk_size
+            last = (position + count - 1) // self.__chunk_size
+            self.__dirty_chunks.update(range(first, last + 1))
+        else:
+            self.__has_gap = True
+        return count
+
+    def __hash_appended(self, view: memoryview) -> None:
+        while len(view):
+            used = self.__hashed_size % self.__chunk_size
+            count = min(len(view), self.__chunk_size - used)
+            self.__chunk.update(view[:count])
+            self.__hashed_size += count
+            view = view[count:]
+            if self.__hashed_size % self.__chunk_size == 0:
+                self.__digests[self.__hashed_size // self.__chunk_size - 1] = self.__chunk.digest()
+                self.__chunk = hashlib.blake2b(digest_size=ChunkedContentHasher.DIGEST_SIZE)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.__file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.__file.tell()
+
+    def flush(self) -> None:
+        self.__file.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        size = self.__file.seek(0, io.SEEK_END)
+        super().close()
+        self.__file.close()
+        if self.__has_gap or size != self.__hashed_size:
+            self.__content_hash = ChunkedContentHasher.hash_file(self.name)
+            return
+        if self.__hashed_size % self.__chunk_size:
+            self.__digests[self.__hashed_size // self.__chunk_size] = self.__chunk.digest()
+        self.__rehash_dirty_chunks()
+        self.__content_hash = ChunkedContentHasher.combine(
+            self.__digests[index] for index in sorted(self.__digests)
+        )
+
+    def __rehash_dirty_chunks(self) -> None:
+        if not self.__dirty_chunks:
+            return
+        with open(self.name, "rb", buffering=0) as file:
+            for index in sorted(self.__dirty_chunks):
+                file.seek(index * self.__chunk_size)
+                self.__digests[index] = ChunkedContentHasher.chunk_digest(
+                    file.read(self.__chunk_size)
+                )
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.Detector import Detector
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.FrameBatchConsumer import (
+    FrameBatchConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.Events.ObjectsDetectedDomainEvent import (
+    ObjectsDetectedDomainEvent,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.FrameBatch import FrameBatch
+from src.Contexts.SharedKernel.Domain.DomainEvent import DomainEvent
+from src.Contexts.SharedKernel.Domain.EventBusInterface import EventBusInterface
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class _InferenceBuffer:
+    """Buffer preasignado con los frames de una invocación del detector"""
+
+    def __init__(self, max_batch_size: int, frame_shape: tuple):
+        self.frames = np.empty((max_batch_size, *frame_shape), dtype=np.uint8)
+        self.sources: List[str] = []
+        self.timestamps: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    @property
+    def space(self) -> int:
+        return len(self.frames) - len(self.sources)
+
+    def clear(self) -> None:
+        self.sources.clear()
+        self.timestamps.clear()
+
+
+class MicroBatchingDetectionScheduler(FrameBatchConsumer):
+    """
+    Agrupa los frames muestreados de muchas cámaras en una única invocación del detector.
+    En CPU el rendimiento depende de amortizar el costo fijo de cada invocación, lo que no se
+    logra infiriendo un frame por cámara.
+
+    Un lote se infiere al juntar `max_batch_size` frames o cuando su frame más viejo espera
+    `max_wait_seconds`, lo que ocurra primero. Mientras el detector procesa un lote, el
+    siguiente se carga en un segundo buffer. Si ambos están ocupados, `consume` espera: la
+    presión se traslada a la cola acotada de PyAvFrameSampler, que descarta frames en lugar de
+    frenar la decodificación.
+
+    Cada frame con detecciones se publica como un ObjectsDetectedDomainEvent.
+    """
+
+    def __init__(
+        self,
+        detector: Detector,
+        event_bus: EventBusInterface,
+        logger: LoggerInterface,
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.05,
+    ):
+        self.__ensure_positive("max_batch_size", max_batch_size)
+        self.__ensure_positive("max_wait_seconds", max_wait_seconds)
+        self.__detector = detector
+        self.__event_bus = event_bus
+        self.__logger = logger
+        self.__max_batch_size = max_batch_size
+        self.__max_wait_seconds = max_wait_seconds
+        self.__pending: Optional[_InferenceBuffer] = None
+        self.__spare: Optional[_InferenceBuffer] = None
+        self.__pending_since = 0.0
+        self.__batches_inferred = 0
+        self.__frames_inferred = 0
+        self.__condition = threading.Condition()
+        self.__stopped = False
+        self.__thread: Optional[threading.Thread] = None
+
+    def __ensure_positive(self, name: str, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del scheduler de inferencia debe ser mayor a 0")
+
+    @property
+    def batches_inferred(self) -> int:
+        return self.__batches_inferred
+
+    @property
+    def frames_inferred(self) -> int:
+        return self.__frames_inferred
+
+    @override
+    def consume(self, batch: FrameBatch) -> None:
+        self.start()
+        frame_shape = batch.frames.shape[1:]
+        offset = 0
+        with self.__condition:
+            self.__ensure_buffers(frame_shape)
+            while offset < len(batch):
+                # Con ambos buffers ocupados se espera a que el detector libere uno
+                while self.__pending is None or self.__pending.space == 0:
+                    self.__condition.wait()
+                pending = self.__pending
+                count = min(pending.space, len(batch) - offset)
+                start = len(pending)
+                if start == 0:
+                    self.__pending_since = time.monotonic()
+                pending.frames[start : start + count] = batch.frames[offset : offset + count]
+                pending.sources.extend(batch.sources[offset : offset + count])
+                pending.timestamps.extend(batch.timestamps[offset : offset + count])
+                offset += count
+                self.__condition.notify_all()
+
+    def __ensure_buffers(self, frame_shape: tuple) -> None:
+        if self.__pending is None and self.__spare is None:
+            self.__pending = _InferenceBuffer(self.__max_batch_size, frame_shape)
+            self.__spare = _InferenceBuffer(self.__max_batch_size, frame_shape)
+            return
+        buffer = self.__pending if self.__pending is not None else self.__spare
+        assert buffer is not None
+        if buffer.frames.shape[1:] != frame_shape:
+            raise ValueError(
+                f"Los frames deben tener la forma {buffer.frames.shape[1:]}, "
+                f"se recibió {frame_shape}: los muestreadores deben usar el mismo tamaño"
+            )
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+        with self.__condition:
+            if self.__thread is not None:
+                return
+            self.__stopped = False
+            self.__thread = threading.Thread(
+                target=self.__run, name="micro-batching-detection", daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """Infiere los frames pendientes y detiene el thread de inferencia"""
+        with self.__condition:
+            thread, self.__thread = self.__thread, None
+            self.__stopped = True
+            self.__condition.notify_all()
+        if thread is not None:
+            thread.join()
+
+    def __run(self) -> None:
+        while True:
+            buffer = self.__next_batch()
+            if buffer is None:
+                return
+            try:
+                self.__infer(buffer)
+            except Exception as e:
+                self.__logger.error(f"Error al inferir un lote de {len(buffer)} frames: {e}")
+            finally:
+                buffer.clear()
+                with self.__condition:
+                    self.__spare = buffer
+                    self.__condition.notify_all()
+
+    def __next_batch(self) -> Optional[_InferenceBuffer]:
+        with self.__condition:
+            while True:
+                pending = self.__pending
+                size = len(pending) if pending is not None else 0
+                if size == self.__max_batch_size or (size > 0 and self.__stopped):
+                    break
+                if size == 0 and self.__stopped:
+                    return None
+                timeout = None
+                if size > 0:
+                    timeout = self.__pending_since + self.__max_wait_seconds - time.monotonic()
+                    if timeout <= 0:
+                        break
+                self.__condition.wait(timeout)
+            # El buffer de reserva pasa a recibir frames mientras se infiere este
+            self.__pending, self.__spare = self.__spare, None
+            self.__condition.notify_all()
+            return pending
+
+    def __infer(self, buffer: _InferenceBuffer) -> None:
+        size = len(buffer)
+        detections = self.__detector.detect(buffer.frames[:size])
+        self.__batches_inferred += 1
+        self.__frames_inferred += size
+        events: List[DomainEvent] = [
+            ObjectsDetectedDomainEvent(
+                source=source, timestamp_seconds=timestamp, detections=tuple(frame_detections)
+            )
+            for source, timestamp, frame_detections in zip(
+                buffer.sources, buffer.timestamps, detections
+            )
+            if frame_detections
+        ]
+        if events:
+            self.__event_bus.publish(events)
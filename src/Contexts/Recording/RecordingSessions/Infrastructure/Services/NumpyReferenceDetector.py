@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.Detector import Detector
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.Detection import Detection
+
+
+class NumpyReferenceDetector(Detector):
+    """
+    Detector de referencia en NumPy puro, sin dependencias de un runtime de inferencia.
+    Informa la caja que contiene a los píxeles con brillo promedio mayor a `threshold` si
+    ocupan al menos `min_area_fraction` del frame. Procesa el lote completo con operaciones
+    vectorizadas, por lo que sirve para tests y para medir el scheduler sin un modelo real.
+    """
+
+    LABEL = "bright_region"
+
+    def __init__(self, threshold: int = 200, min_area_fraction: float = 0.001):
+        self.__threshold = threshold
+        self.__min_area_fraction = min_area_fraction
+
+    @override
+    def detect(self, frames: np.ndarray) -> List[List[Detection]]:
+        batch, height, width, channels = frames.shape
+        # Suma entera de los canales: evita convertir el lote a punto flotante
+        mask = frames.sum(axis=3, dtype=np.uint16) >= self.__threshold * channels
+        rows = mask.any(axis=2)
+        columns = mask.any(axis=1)
+        area_fractions = mask.mean(axis=(1, 2))
+        tops = rows.argmax(axis=1)
+        bottoms = height - rows[:, ::-1].argmax(axis=1)
+        lefts = columns.argmax(axis=1)
+        rights = width - columns[:, ::-1].argmax(axis=1)
+
+        detections: List[List[Detection]] = []
+        for index in range(batch):
+            if area_fractions[index] < self.__min_area_fraction:
+                detections.append([])
+                continue
+            box_height = (bottoms[index] - tops[index]) / height
+            box_width = (rights[index] - lefts[index]) / width
+            detections.append(
+                [
+                    Detection(
+                        label=self.LABEL,
+                        # Proporción de la caja ocupada por píxeles brillantes
+                        confidence=min(
+                            1.0, float(area_fractions[index] / (box_width * box_height))
+                        ),
+                        x=lefts[index] / width,
+                        y=tops[index] / height,
+                        width=box_width,
+                        height=box_height,
+                    )
+                ]
+            )
+        return detections
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.Detector import Detector
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.Detection import Detection
+
+
+class OnnxRuntimeDetector(Detector):
+    """
+    Detector que ejecuta un modelo ONNX en CPU con onnxruntime (dependencia opcional, grupo
+    `inference`).
+
+    El modelo debe recibir un tensor float32 (B, C, H, W) con valores entre 0 y 1 y devolver
+    como primera salida un tensor (B, N, 6) con [x1, y1, x2, y2, confianza, clase] por
+    detección, con coordenadas normalizadas al tamaño del frame. Las filas con confianza menor
+    a `min_confidence` se descartan (también el relleno que usan los modelos con N fijo).
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        labels: Sequence[str],
+        min_confidence: float = 0.5,
+        intra_op_threads: int = 0,
+    ):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError(
+                "OnnxRuntimeDetector requiere onnxruntime: pip install neuralcam[inference]"
+            ) from e
+        options = onnxruntime.SessionOptions()
+        # 0 deja que onnxruntime use todos los núcleos para cada lote
+        options.intra_op_num_threads = intra_op_threads
+        self.__session = onnxruntime.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.__input_name = self.__session.get_inputs()[0].name
+        self.__labels = tuple(labels)
+        self.__min_confidence = min_confidence
+
+    @override
+    def detect(self, frames: np.ndarray) -> List[List[Detection]]:
+        tensor = np.ascontiguousarray(frames.transpose(0, 3, 1, 2), dtype=np.float32)
+        tensor *= 1 / 255
+        outputs = np.asarray(self.__session.run(None, {self.__input_name: tensor})[0])
+        return [self.__to_detections(rows) for rows in outputs]
+
+    def __to_detections(self, rows: np.ndarray) -> List[Detection]:
+        detections = []
+        for x1, y1, x2, y2, confidence, label_index in rows[rows[:, 4] >= self.__min_confidence]:
+            x1, y1 = max(0.0, float(x1)), max(0.0, float(y1))
+            x2, y2 = min(1.0, float(x2)), min(1.0, float(y2))
+            if x2 <= x1 or y2 <= y1:
+                continue
+            detections.append(
+                Detection(
+                    label=self.__label(int(label_index)),
+                    confidence=min(1.0, float(confidence)),
+                    x=x1,
+                    y=y1,
+                    width=x2 - x1,
+                    height=y2 - y1,
+                )
+            )
+        return detections
+
+    def __label(self, index: int) -> str:
+        return self.__labels[index] if 0 <= index < len(self.__labels) else str(index)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingEngine import (
+    PyAvRecordingEngine,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class PrometheusMetricsExporter:
+    """
+    Expone las métricas de PyAvRecordingEngine en el formato de texto de Prometheus.
+    Las métricas se calculan al momento de cada scrape, por lo que no agregan trabajo
+    al loop de paquetes. `start` sirve `/metrics` por HTTP en un thread propio.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        engine: PyAvRecordingEngine,
+        logger: LoggerInterface,
+        host: str = "0.0.0.0",
+        port: int = 9464,
+    ):
+        self.__engine = engine
+        self.__logger = logger
+        self.__host = host
+        self.__port = port
+        self.__server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def port(self) -> int:
+        """Puerto en el que se sirve; si se pidió el 0, el asignado por el sistema"""
+        if self.__server is None:
+            return self.__port
+        return self.__server.server_address[1]
+
+    def render(self) -> str:
+        """Devuelve todas las métricas en formato de texto de Prometheus"""
+        metrics = self.__engine.metrics()
+        lines: List[str] = []
+        self.__render_counter(
+            lines,
+            "neuralcam_recording_packets_total",
+            "Paquetes demuxados por stream",
+            [
+                (self.__labels(worker, stream, stream_index=index), packets)
+                for worker, stream in self.__streams(metrics)
+                for index, packets in stream.packets_per_stream
+            ],
+        )
+        self.__render_counter(
+            lines,
+            "neuralcam_recording_bytes_total",
+            "Bytes demuxados por stream",
+            [
+                (self.__labels(worker, stream, stream_index=index), size)
+                for worker, stream in self.__streams(metrics)
+                for index, size in stream.bytes_per_stream
+            ],
+        )
+        self.__render_counter(
+            lines,
+            "neuralcam_recording_keyframes_total",
+            "Keyframes recibidos en el stream de video",
+            [
+                (self.__labels(worker, stream), stream.keyframes)
+                for worker, stream in self.__streams(metrics)
+            ],
+        )
+        self.__render_gauge(
+            lines,
+            "neuralcam_recording_keyframe_interval_seconds",
+            "Intervalo promedio entre keyframes",
+            [
+                (self.__labels(worker, stream), stream.mean_keyframe_interval_seconds)
+                for worker, stream in self.__streams(metrics)
+            ],
+        )
+        self.__render_counter(
+            lines,
+            "neuralcam_recording_dts_gap_frames_total",
+            "Frames faltantes según el avance del DTS",
+            [
+                (self.__labels(worker, stream), stream.dts_gap_frames)
+                for worker, stream in self.__streams(metrics)
+            ],
+        )
+        self.__render_counter(
+            lines,
+            "neuralcam_recording_out_of_order_packets_total",
+            "Paquetes con DTS menor al del paquete anterior",
+            [
+                (self.__labels(worker, stream), stream.out_of_order_packets)
+                for worker, stream in self.__streams(metrics)
+            ],
+        )
+        self.__render_mux_latency(lines, metrics)
+        return "\n".join(lines) + "\n"
+
+    def __streams(self, metrics: Dict[int, List[StreamMetrics]]):
+        return [(worker, stream) for worker, streams in metrics.items() for stream in streams]
+
+    def __labels(self, worker: int, stream: StreamMetrics, **extra) -> str:
+        labels = {"worker": str(worker), "source": stream.source}
+        labels.update({name: str(value) for name, value in extra.items()})
+        return ",".join(f'{name}="{self.__escape(value)}"' for name, value in labels.items())
+
+    def __escape(self, value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def __render_counter(self, lines: List[str], name: str, help: str, samples) -> None:
+        self.__render_samples(lines, name, help, "counter", samples)
+
+    def __render_gauge(self, lines: List[str], name: str, help: str, samples) -> None:
+        self.__render_samples(lines, name, help, "gauge", samples)
+
+    def __render_samples(self, lines: List[str], name: str, help: str, kind: str, samples):
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{name}{{{labels}}} {value}")
+
+    def __render_mux_latency(self, lines: List[str], metrics: Dict[int, List[StreamMetrics]]):
+        name = "neuralcam_recording_mux_latency_seconds"
+        lines.append(f"# HELP {name} Latencia de mux de un paquete (uno por turno)")
+        lines.append(f"# TYPE {name} histogram")
+        for worker, stream in self.__streams(metrics):
+            labels = self.__labels(worker, stream)
+            cumulative = 0
+            for bound, count in stream.mux_latency_buckets:
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {stream.mux_latency_sum_seconds}")
+            lines.append(f"{name}_count{{{labels}}} {stream.mux_latency_count}")
+
+    def start(self) -> None:
+        """Sirve `/metrics` por HTTP en un thread daemon"""
+        if self.__server is not None:
+            return
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", exporter.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.__server = ThreadingHTTPServer((self.__host, self.__port), MetricsHandler)
+        threading.Thread(
+            target=self.__server.serve_forever, name="prometheus-metrics-exporter", daemon=True
+        ).start()
+        self.__logger.info(f"Métricas de grabación en http://{self.__host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        server, self.__server = self.__server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import time
+from fractions import Fraction
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import av
+from av.container.input import InputContainer
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvJob import PyAvJob
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMediaClock import (
+    PyAvMediaClock,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class PyAvAnalysisJob(PyAvJob):
+    """
+    Decodifica el stream de análisis de una cámara (normalmente el sub-stream de baja
+    resolución) y entrega cada frame a un PyAvFrameConsumer. La grabación remuxa el stream
+    principal sin decodificarlo, por lo que el costo de decodificación depende de la
+    resolución del sub-stream y no de la de grabación.
+
+    Termina cuando `stop_when` devuelve True (por ejemplo, al finalizar la grabación asociada)
+    o cuando el stream se cierra. Ante cortes reconecta respetando `backoff`; los frames que no
+    se reciben mientras tanto simplemente no se analizan. Con `stop_when` el análisis debe
+    durar tanto como la grabación: un error al abrir o el cierre del stream también se tratan
+    como un corte y se reintentan.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        consumer: PyAvFrameConsumer,
+        logger: LoggerInterface,
+        stop_when: Optional[Callable[[], bool]] = None,
+        input_format: Optional[str] = None,
+        input_options: Optional[Dict[str, str]] = None,
+        backoff: Optional[ExponentialBackoff] = None,
+        timeout: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    ):
+        self.__source = source
+        self.__consumer = consumer
+        self.__logger = logger
+        self.__stop_when = stop_when
+        self.__input_format = input_format
+        self.__input_options = input_options or {}
+        self.__backoff = backoff or ExponentialBackoff()
+        self.__timeout = timeout
+        self.__input: Optional[InputContainer] = None
+        self.__packets: Optional[Iterator[av.Packet]] = None
+        self.__clock = PyAvMediaClock(None)
+        self.__turn_ticks: Dict[int, int] = {}
+        self.__frames_decoded = 0
+        self.__is_opened = False
+        self.__is_finished = False
+        self.__reconnect_attempt = 0
+        self.__reconnect_at: Optional[float] = None
+        # Se calcula una vez: se pasa al consumidor en cada frame
+        self.__consumer_source = self.display_source
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    @property
+    def frames_decoded(self) -> int:
+        return self.__frames_decoded
+
+    @property
+    def is_finished(self) -> bool:
+        return self.__is_finished
+
+    @property
+    def is_reconnecting(self) -> bool:
+        return self.__reconnect_at is not None
+
+    def seconds_until_ready(self) -> float:
+        if self.__reconnect_at is None:
+            return 0.0
+        return max(0.0, self.__reconnect_at - time.monotonic())
+
+    def needs_connection(self) -> bool:
+        return self.is_reconnecting and not self.__is_finished
+
+    def reconnect(self) -> None:
+        if self.needs_connection():
+            self.__try_reconnect()
+
+    def open(self) -> None:
+        """Abre la conexión con el stream de análisis. Puede bloquear hasta el timeout"""
+        self.__is_opened = True
+        try:
+            self.__connect()
+        except Exception as e:
+            self.__logger.error(f"Error al abrir el stream de análisis {self.display_source}: {e}")
+            if self.__stop_when is None:
+                self.finish()
+                raise e
+            self.__close_input()
+            self.__reconnect_attempt = 0
+            self.__schedule_reconnect()
+
+    def __connect(self) -> None:
+        self.__input = av.open(
+            self.__source,
+            format=self.__input_format,
+            options=self.__input_options,
+            timeout=self.__timeout,
+        )
+        in_stream = self.__input.streams.video[0]
+        self.__consumer.prepare(in_stream)
+        self.__clock = PyAvMediaClock(in_stream.time_base)
+        self.__turn_ticks = {}
+        self.__packets = self.__input.demux(in_stream)
+
+    def step(self, max_packets: int, max_milliseconds: Optional[int] = None) -> bool:
+        if self.__is_finished:
+            return False
+        if self.__stop_when is not None and self.__stop_when():
+            self.finish()
+            return False
+        if self.is_reconnecting:
+            return self.__try_reconnect()
+        if self.__packets is None:
+            return False
+        turn_end_ticks = None
+        if max_milliseconds is not None:
+            turn_end_ticks = self.__clock.position_ticks + self.__ticks_for_turn(max_milliseconds)
+        try:
+            for _ in range(max_packets):
+                packet = next(self.__packets, None)
+                if packet is None:
+                    return self.__handle_end_of_stream()
+                self.__decode(packet)
+                if turn_end_ticks is not None and self.__clock.position_ticks >= turn_end_ticks:
+                    break
+            return True
+        except Exception as e:
+            self.__logger.error(f"Error en el stream de análisis {self.display_source}: {e}")
+            self.__close_input()
+            self.__reconnect_attempt = 0
+            self.__schedule_reconnect()
+            return True
+
+    def __handle_end_of_stream(self) -> bool:
+        if self.__stop_when is None:
+            self.finish()
+            return False
+        self.__logger.warn(f"El stream de análisis {self.display_source} se cerró, reconectando")
+        self.__close_input()
+        self.__reconnect_attempt = 0
+        self.__schedule_reconnect()
+        return not self.__is_finished
+
+    def __decode(self, packet: av.Packet) -> None:
+        # Los paquetes de "flushing" que genera `demux` no avanzan el reloj, pero se decodifican
+        # para vaciar los frames que retiene el decodificador
+        if packet.dts is not None:
+            self.__clock.update(packet.dts)
+        for frame in packet.decode():
+            self.__frames_decoded += 1
+            self.__consumer.consume(self.__consumer_source, frame)
+
+    def __ticks_for_turn(self, milliseconds: int) -> int:
+        if milliseconds not in self.__turn_ticks:
+            seconds = Fraction(milliseconds, 1000)
+            self.__turn_ticks[milliseconds] = self.__clock.ticks_for_seconds(seconds)
+        return self.__turn_ticks[milliseconds]
+
+    def __schedule_reconnect(self) -> None:
+        if not self.__backoff.allows(self.__reconnect_attempt):
+            self.finish()
+            return
+        self.__reconnect_at = time.monotonic() + self.__backoff.delay_for(self.__reconnect_attempt)
+
+    def __try_reconnect(self) -> bool:
+        if self.seconds_until_ready() > 0:
+            return True
+        try:
+            self.__connect()
+        except Exception as e:
+            self.__logger.error(
+                f"Error al reconectar el stream de análisis {self.display_source}: {e}"
+            )
+            self.__close_input()
+            self.__reconnect_attempt += 1
+            self.__schedule_reconnect()
+            return not self.__is_finished
+        self.__reconnect_at = None
+        self.__logger.info(f"Stream de análisis reconectado: {self.display_source}")
+        return True
+
+    def run(self) -> None:
+        """Decodifica en el thread actual hasta que el job termine"""
+        if not self.__is_opened:
+            self.open()
+        while self.step(max_packets=64):
+            time.sleep(self.seconds_until_ready())
+
+    def finish(self) -> None:
+        self.__close_input()
+        self.__reconnect_at = None
+        self.__is_finished = True
+
+    def __close_input(self) -> None:
+        self.__packets = None
+        input, self.__input = self.__input, None
+        if input is None:
+            return
+        try:
+            input.close()
+        except Exception as e:
+            self.__logger.debug(f"Error al cerrar el stream de análisis {self.display_source}: {e}")
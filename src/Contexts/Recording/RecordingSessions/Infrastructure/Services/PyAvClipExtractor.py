@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import av
+from av.container.output import OutputContainer
+from av.error import FFmpegError
+from av.stream import Stream
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.ClipExtractor import ClipExtractor
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ClipRange import ClipRange
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ExtractedClip import (
+    ExtractedClip,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSegment import (
+    RecordingSegment,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SeekIndex import SeekIndex
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class _ChunkSink:
+    """Destino de escritura del muxer que acumula los bloques hasta que se entregan"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> List[bytes]:
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+
+class _ClipTimeline:
+    """Estado de la línea de tiempo de salida mientras se copian las grabaciones del clip"""
+
+    def __init__(self, output: OutputContainer):
+        self.output = output
+        self.out_streams: Dict[int, Stream] = {}
+        # Códec de cada stream en la primera grabación, para mapear los de las siguientes
+        self.codec_names: Dict[int, str] = {}
+        self.origin_wall_seconds: Optional[float] = None
+        self.last_seconds: Dict[int, float] = {}
+        self.video_seconds = 0.0
+        self.segment_paths: List[str] = []
+
+
+class PyAvClipExtractor(ClipExtractor):
+    """
+    Extrae clips remuxando paquetes de las grabaciones (sin decodificar ni recodificar).
+
+    En la primera grabación se busca con su SeekIndex el keyframe anterior al inicio del clip
+    y se posiciona el demuxer directamente en él (si la grabación no tiene sidecar, se usa la
+    búsqueda del contenedor). Las grabaciones siguientes se leen desde el inicio, y la lectura
+    termina en el primer paquete de video posterior al fin del clip, por lo que el costo es
+    proporcional a la duración del clip y no al tamaño ni a la cantidad de grabaciones.
+
+    Los timestamps se trasladan a una única línea de tiempo según el inicio de cada grabación,
+    de modo que los cortes entre grabaciones se conservan; si los nombres (con precisión de un
+    segundo) solaparan dos grabaciones, la siguiente se desplaza para que los timestamps sigan
+    creciendo. Las streams se toman de la primera grabación.
+    """
+
+    def __init__(self, logger: LoggerInterface):
+        self.__logger = logger
+
+    @override
+    def extract(
+        self, segments: Sequence[RecordingSegment], clip_range: ClipRange, output_path: str
+    ) -> ExtractedClip:
+        output = av.open(output_path, mode="w")
+        timeline = _ClipTimeline(output)
+        try:
+            for _ in self.__copy(segments, clip_range, timeline):
+                pass
+        finally:
+            output.close()
+        return self.__result(output_path, timeline)
+
+    @override
+    def stream(
+        self, segments: Sequence[RecordingSegment], clip_range: ClipRange
+    ) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        # Sin `seek` en el destino el muxer escribe Matroska en modo streaming (sin índice final)
+        output = av.open(sink, mode="w", format="matroska")
+        timeline = _ClipTimeline(output)
+        try:
+            for _ in self.__copy(segments, clip_range, timeline):
+                yield from sink.drain()
+        finally:
+            output.close()
+        yield from sink.drain()
+
+    def __result(self, output_path: str, timeline: _ClipTimeline) -> ExtractedClip:
+        return ExtractedClip(
+            output_path=output_path,
+            media_duration_seconds=timeline.video_seconds,
+            segment_paths=tuple(timeline.segment_paths),
+        )
+
+    def __copy(
+        self, segments: Sequence[RecordingSegment], clip_range: ClipRange, timeline: _ClipTimeline
+    ) -> Iterator[None]:
+        """Copia los paquetes del clip; cede el control después de cada paquete escrito"""
+        for segment in segments:
+            try:
+                input = av.open(segment.path)
+            except (FFmpegError, OSError) as e:
+                self.__logger.warn(f"No se pudo abrir la grabación {segment.path}: {e}")
+                continue
+            try:
+                yield from self.__copy_segment(input, segment, clip_range, timeline)
+            finally:
+                input.close()
+
+    def __copy_segment(
+        self, input, segment: RecordingSegment, clip_range: ClipRange, timeline: _ClipTimeline
+    ) -> Iterator[None]:
+        video = input.streams.video[0]
+        start_seconds = (clip_range.start - segment.start_date).total_seconds()
+        end_seconds = (clip_range.end - segment.start_date).total_seconds()
+        if timeline.origin_wall_seconds is None and start_seconds > 0:
+            self.__seek(input, video, segment.path, start_seconds)
+        segment_wall_seconds = segment.start_date.timestamp()
+        offset_seconds: Optional[float] = None
+        for packet in self.__with_dts(input.demux()):
+            is_video = packet.stream_index == video.index
+            assert packet.dts is not None
+            seconds = float(packet.dts * packet.time_base)
+            if is_video and seconds >= end_seconds:
+                return
+            if timeline.origin_wall_seconds is None:
+                # El clip empieza en un keyframe del video
+                if not (is_video and packet.is_keyframe):
+                    continue
+                timeline.origin_wall_seconds = segment_wall_seconds + seconds
+                self.__open_streams(input, timeline)
+            if offset_seconds is None:
+                offset_seconds = self.__segment_offset(segment_wall_seconds, seconds, timeline)
+                timeline.segment_paths.append(segment.path)
+            out_stream = timeline.out_streams.get(packet.stream_index)
+            codec_name = timeline.codec_names.get(packet.stream_index)
+            if out_stream is None or codec_name != packet.stream.codec_context.name:
+                continue
+            if self.__write(packet, out_stream, offset_seconds, timeline) and is_video:
+                timeline.video_seconds = offset_seconds + seconds
+            yield
+
+    def __with_dts(self, packets: Iterator[av.Packet]) -> Iterator[av.Packet]:
+        """
+        Completa el DTS de los paquetes que no lo tienen. El demuxer de Matroska no conoce el
+        DTS de los primeros paquetes de un stream con B-frames (el formato solo guarda el PTS),
+        y el muxer necesita DTS crecientes: se asignan ticks consecutivos previos al primer DTS
+        conocido, lo que no altera el archivo de salida porque Matroska tampoco lo guarda
+        """
+        pending: Dict[int, List[av.Packet]] = {}
+        for packet in packets:
+            # Se descartan los paquetes de "flushing" que genera `demux`
+            if packet.size == 0:
+                continue
+            stream_index = packet.stream_index
+            if packet.dts is None:
+                pending.setdefault(stream_index, []).append(packet)
+                continue
+            waiting = pending.pop(stream_index, None)
+            if waiting:
+                for position, waiting_packet in enumerate(waiting):
+                    waiting_packet.dts = packet.dts - len(waiting) + position
+                    yield waiting_packet
+            yield packet
+        for waiting in pending.values():
+            for waiting_packet in waiting:
+                if waiting_packet.pts is not None:
+                    waiting_packet.dts = waiting_packet.pts
+                    yield waiting_packet
+
+    def __seek(self, input, video, path: str, start_seconds: float) -> None:
+        target_seconds = start_seconds
+        try:
+            entry = SeekIndex.for_video(path).keyframe_before(start_seconds)
+            if entry is not None:
+                target_seconds = entry.seconds
+        except (OSError, ValueError):
+            # Sin sidecar se usa el índice del contenedor (cues de Matroska)
+            pass
+        input.seek(round(target_seconds / video.time_base), stream=video)
+
+    def __open_streams(self, input, timeline: _ClipTimeline) -> None:
+        output = timeline.output
+        for in_stream in input.streams:
+            if in_stream.type not in ("video", "audio"):
+                continue
+            if in_stream.codec_context.name not in output.supported_codecs:
+                continue
+            timeline.out_streams[in_stream.index] = output.add_stream_from_template(in_stream)
+            timeline.codec_names[in_stream.index] = in_stream.codec_context.name
+
+    def __segment_offset(
+        self, segment_wall_seconds: float, first_seconds: float, timeline: _ClipTimeline
+    ) -> float:
+        assert timeline.origin_wall_seconds is not None
+        offset_seconds = segment_wall_seconds - timeline.origin_wall_seconds
+        if timeline.last_seconds:
+            # Los nombres tienen precisión de un segundo: se evita solapar la grabación anterior
+            last_seconds = max(timeline.last_seconds.values())
+            offset_seconds = max(offset_seconds, last_seconds + 0.001 - first_seconds)
+        return offset_seconds
+
+    def __write(
+        self, packet: av.Packet, out_stream: Stream, offset_seconds: float, timeline: _ClipTimeline
+    ) -> bool:
+        assert packet.dts is not None
+        offset = round(offset_seconds / packet.time_base)
+        dts = packet.dts + offset
+        out_seconds = float(dts * packet.time_base)
+        last_seconds = timeline.last_seconds.get(out_stream.index)
+        # Paquetes de otros streams anteriores al keyframe inicial, o fuera de orden
+        if out_seconds < 0 or (last_seconds is not None and out_seconds <= last_seconds):
+            return False
+        packet.dts = dts
+        if packet.pts is not None:
+            packet.pts += offset
+        packet.stream = out_stream
+        timeline.output.mux(packet)
+        timeline.last_seconds[out_stream.index] = out_seconds
+        return True
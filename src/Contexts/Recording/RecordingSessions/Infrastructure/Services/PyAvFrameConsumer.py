@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+import av
+
+
+class PyAvFrameConsumer(ABC):
+    def prepare(self, stream: av.VideoStream) -> None:
+        """
+        Se invoca al conectar con el stream de análisis, antes de decodificar. Permite
+        configurar el decodificador (por ejemplo, decodificar solo keyframes)
+        """
+        pass
+
+    @abstractmethod
+    def consume(self, source: str, frame: av.VideoFrame) -> None:
+        """
+        Recibe un frame decodificado del stream de análisis de una cámara
+
+        Args:
+            source: Origen del stream, sin credenciales
+            frame: Frame decodificado. Se invoca en el thread que avanza la decodificación,
+                   por lo que no debe bloquear
+        """
+        pass
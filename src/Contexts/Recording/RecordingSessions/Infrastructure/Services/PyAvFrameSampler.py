@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+import av
+import numpy as np
+from av.video.reformatter import Interpolation, VideoReformatter
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.FrameBatchConsumer import (
+    FrameBatchConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.FrameBatch import FrameBatch
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class _Batch:
+    """Buffer preasignado de un lote y los metadatos de los frames cargados"""
+
+    def __init__(self, batch_size: int, height: int, width: int, channels: int):
+        self.frames = np.empty((batch_size, height, width, channels), dtype=np.uint8)
+        self.sources: List[str] = []
+        self.timestamps: List[float] = []
+        self.started_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def clear(self) -> None:
+        self.sources.clear()
+        self.timestamps.clear()
+
+
+class _SourceSampling:
+    """Estado del muestreo de una cámara"""
+
+    def __init__(self):
+        self.frames_seen = 0
+        self.next_sample_seconds: Optional[float] = None
+        self.reformatter = VideoReformatter()
+
+
+class PyAvFrameSampler(PyAvFrameConsumer):
+    """
+    Muestrea los frames decodificados de los streams de análisis y los entrega a un
+    FrameBatchConsumer en lotes de NumPy de forma (B, H, W, C).
+
+    - Con `keyframes_only` el decodificador descarta los frames que no son keyframe, de modo
+      que solo se decodifica un frame por GOP.
+    - `every_nth` y `target_fps` descartan frames antes de convertirlos, que es la parte
+      costosa después de decodificar.
+    - El escalado y la conversión de formato se hacen en libswscale, con un contexto reutilizado
+      por cámara, y cada frame se copia una sola vez al lote.
+
+    Los lotes son buffers preasignados que se reutilizan. Se entregan desde un thread propio a
+    través de una cola acotada a `queue_size` lotes: si el consumidor no da abasto se descarta
+    el lote más viejo de la cola, por lo que la decodificación (y el muxer que comparte el
+    thread con ella) nunca se bloquea. Un lote incompleto se entrega tras
+    `max_batch_wait_seconds` para acotar la latencia con frame rates bajos.
+
+    Puede compartirse entre cámaras: cada lote puede mezclar frames de distintos orígenes.
+    """
+
+    CHANNELS = {"rgb24": 3, "bgr24": 3, "gray": 1}
+
+    def __init__(
+        self,
+        consumer: FrameBatchConsumer,
+        logger: LoggerInterface,
+        width: int = 320,
+        height: int = 180,
+        pixel_format: str = "rgb24",
+        batch_size: int = 8,
+        keyframes_only: bool = False,
+        every_nth: int = 1,
+        target_fps: Optional[float] = None,
+        queue_size: int = 2,
+        max_batch_wait_seconds: float = 0.5,
+    ):
+        self.__ensure_positive("width", width)
+        self.__ensure_positive("height", height)
+        self.__ensure_positive("batch_size", batch_size)
+        self.__ensure_positive("every_nth", every_nth)
+        self.__ensure_positive("queue_size", queue_size)
+        self.__ensure_positive("max_batch_wait_seconds", max_batch_wait_seconds)
+        if target_fps is not None:
+            self.__ensure_positive("target_fps", target_fps)
+        self.__ensure_supported_format(pixel_format)
+        self.__consumer = consumer
+        self.__logger = logger
+        self.__width = width
+        self.__height = height
+        self.__pixel_format = pixel_format
+        self.__keyframes_only = keyframes_only
+        self.__every_nth = every_nth
+        self.__sample_period_seconds = 1 / target_fps if target_fps is not None else None
+        self.__max_batch_wait_seconds = max_batch_wait_seconds
+        channels = self.CHANNELS[pixel_format]
+        # Un lote en carga, uno en el consumidor y los de la cola
+        self.__free_batches: queue.SimpleQueue[_Batch] = queue.SimpleQueue()
+        for _ in range(queue_size + 2):
+            self.__free_batches.put(_Batch(batch_size, height, width, channels))
+        self.__ready_batches: queue.Queue[_Batch] = queue.Queue(maxsize=queue_size)
+        self.__batch: Optional[_Batch] = None
+        self.__sources: Dict[str, _SourceSampling] = {}
+        self.__dropped_frames = 0
+        self.__delivered_frames = 0
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __ensure_positive(self, name: str, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del muestreo de frames debe ser mayor a 0")
+
+    def __ensure_supported_format(self, pixel_format: str) -> None:
+        if pixel_format not in self.CHANNELS:
+            raise ValueError(
+                f"Formato de píxel no soportado: {pixel_format}. "
+                f"Formatos permitidos: {', '.join(self.CHANNELS)}"
+            )
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames muestreados que se descartaron porque el consumidor no daba abasto"""
+        return self.__dropped_frames
+
+    @property
+    def delivered_frames(self) -> int:
+        return self.__delivered_frames
+
+    def prepare(self, stream: av.VideoStream) -> None:
+        if self.__keyframes_only:
+            stream.codec_context.skip_frame = "NONKEY"
+
+    def consume(self, source: str, frame: av.VideoFrame) -> None:
+        self.start()
+        # Cada cámara se decodifica en un solo thread a la vez: su estado no requiere lock
+        sampling = self.__sources.get(source) or self.__sources.setdefault(
+            source, _SourceSampling()
+        )
+        if not self.__should_sample(sampling, frame):
+            return
+        # El escalado se hace fuera del lock para no serializar a las cámaras entre sí
+        scaled = sampling.reformatter.reformat(
+            frame,
+            width=self.__width,
+            height=self.__height,
+            format=self.__pixel_format,
+            interpolation=Interpolation.BILINEAR,
+        )
+        with self.__lock:
+            batch = self.__current_batch()
+            if batch is None:
+                self.__dropped_frames += 1
+                return
+            self.__load(batch, scaled, source, frame.time)
+            if len(batch) == len(batch.frames):
+                self.__enqueue_current_batch()
+
+    def __should_sample(self, sampling: _SourceSampling, frame: av.VideoFrame) -> bool:
+        sampling.frames_seen += 1
+        if (sampling.frames_seen - 1) % self.__every_nth != 0:
+            return False
+        period, seconds = self.__sample_period_seconds, frame.time
+        if period is None or seconds is None:
+            return True
+        next_sample = sampling.next_sample_seconds
+        if next_sample is not None and next_sample - period <= seconds < next_sample:
+            return False
+        if next_sample is not None and next_sample <= seconds < next_sample + period:
+            sampling.next_sample_seconds = next_sample + period
+        else:
+            # Primer frame, salto hacia adelante o reinicio del stream tras reconectar
+            sampling.next_sample_seconds = seconds + period
+        return True
+
+    def __current_batch(self) -> Optional[_Batch]:
+        if self.__batch is None:
+            try:
+                self.__batch = self.__free_batches.get_nowait()
+            except queue.Empty:
+                return None
+            self.__batch.started_at = time.monotonic()
+        return self.__batch
+
+    def __load(
+        self, batch: _Batch, scaled: av.VideoFrame, source: str, timestamp: Optional[float]
+    ) -> None:
+        plane = scaled.planes[0]
+        # El plano puede tener padding al final de cada línea
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(self.__height, plane.line_size)
+        slot = batch.frames[len(batch)]
+        slot[...] = rows[:, : slot.shape[1] * slot.shape[2]].reshape(slot.shape)
+        batch.sources.append(source)
+        batch.timestamps.append(timestamp if timestamp is not None else 0.0)
+
+    def __enqueue_current_batch(self) -> None:
+        batch, self.__batch = self.__batch, None
+        if batch is None or len(batch) == 0:
+            if batch is not None:
+                self.__free_batches.put(batch)
+            return
+        try:
+            self.__ready_batches.put_nowait(batch)
+            return
+        except queue.Full:
+            pass
+        # Se descarta el lote más viejo: para análisis en vivo importan los frames recientes
+        try:
+            oldest = self.__ready_batches.get_nowait()
+            self.__dropped_frames += len(oldest)
+            oldest.clear()
+            self.__free_batches.put(oldest)
+        except queue.Empty:
+            pass
+        self.__ready_batches.put_nowait(batch)
+
+    def __flush_if_stale(self) -> None:
+        with self.__lock:
+            batch = self.__batch
+            if batch is None or len(batch) == 0:
+                return
+            if time.monotonic() - batch.started_at >= self.__max_batch_wait_seconds:
+                self.__enqueue_current_batch()
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__stopped.clear()
+            self.__thread = threading.Thread(
+                target=self.__deliver, name="pyav-frame-sampler", daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """Entrega el lote en curso y los encolados, y detiene el thread de entrega"""
+        with self.__lock:
+            self.__enqueue_current_batch()
+            thread, self.__thread = self.__thread, None
+        self.__stopped.set()
+        if thread is not None:
+            thread.join()
+
+    def __deliver(self) -> None:
+        while True:
+            try:
+                batch = self.__ready_batches.get(timeout=self.__max_batch_wait_seconds / 2)
+            except queue.Empty:
+                if self.__stopped.is_set():
+                    return
+                self.__flush_if_stale()
+                continue
+            try:
+                self.__consumer.consume(
+                    FrameBatch(
+                        frames=batch.frames[: len(batch)],
+                        sources=tuple(batch.sources),
+                        timestamps=tuple(batch.timestamps),
+                    )
+                )
+                self.__delivered_frames += len(batch)
+            except Exception as e:
+                self.__logger.error(f"Error al procesar un lote de frames: {e}")
+            finally:
+                batch.clear()
+                self.__free_batches.put(batch)
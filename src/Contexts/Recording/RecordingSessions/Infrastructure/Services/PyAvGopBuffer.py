@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import deque
+from fractions import Fraction
+from typing import Any, Deque, Iterator, List
+
+import av
+
+
+class PyAvGopBuffer:
+    """
+    Buffer acotado en bytes con los paquetes del GOP actual (desde el último keyframe).
+    Permite iniciar un segmento nuevo en un keyframe sin esperar al próximo IDR.
+    Si el GOP supera `max_bytes` se descarta completo hasta el siguiente keyframe,
+    de modo que la memoria se mantiene constante aunque la cámara use GOPs muy largos.
+    Los paquetes de otros streams (audio, video secundario) se guardan junto al GOP del video
+    principal, pero nunca abren uno nuevo.
+
+    Solo debe contener paquetes que todavía no se muxearon: el muxer reescribe su stream y sus
+    timestamps, por lo que cada paquete se reproduce una única vez antes de `clear`.
+
+    Con `pre_roll_seconds` funciona como ring buffer: conserva los GOPs necesarios para que el
+    primer keyframe quede al menos `pre_roll_seconds` antes del último keyframe recibido, y
+    descarta los GOPs más viejos si se supera `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int, pre_roll_seconds: float = 0):
+        self.__ensure_max_bytes_is_positive(max_bytes)
+        self.__ensure_pre_roll_is_not_negative(pre_roll_seconds)
+        self.__max_bytes = max_bytes
+        self.__pre_roll_seconds = pre_roll_seconds
+        self.__packets: Deque[av.Packet] = deque()
+        # Por GOP: [segundos de su keyframe, paquetes, bytes]
+        self.__gops: Deque[List[Any]] = deque()
+        self.__size_bytes = 0
+
+    def __ensure_max_bytes_is_positive(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError("El tamaño máximo del buffer de GOP debe ser mayor a 0 bytes")
+
+    def __ensure_pre_roll_is_not_negative(self, pre_roll_seconds: float) -> None:
+        if pre_roll_seconds < 0:
+            raise ValueError("El pre-roll del buffer de GOP no puede ser negativo")
+
+    @property
+    def size_bytes(self) -> int:
+        return self.__size_bytes
+
+    def __len__(self) -> int:
+        return len(self.__packets)
+
+    def push(self, packet: av.Packet, is_video: bool = True) -> None:
+        """
+        Agrega un paquete al GOP actual. El paquete no debe muxearse mientras siga en el
+        buffer, ya que el muxer reescribe su stream y sus timestamps a los de salida.
+
+        Args:
+            packet: Paquete demuxado
+            is_video: Indica si el paquete es del video principal; solo sus keyframes
+                      inician un GOP (los paquetes de audio suelen marcarse todos como keyframe)
+        """
+        if is_video and packet.is_keyframe:
+            self.__start_gop(packet)
+        elif not self.__gops:
+            # Sin keyframe inicial (o tras descartar un GOP excedido) no es decodificable
+            return
+
+        self.__packets.append(packet)
+        gop = self.__gops[-1]
+        gop[1] += 1
+        gop[2] += packet.size
+        self.__size_bytes += packet.size
+        while self.__size_bytes > self.__max_bytes and len(self.__gops) > 1:
+            self.__drop_oldest_gop()
+        if self.__size_bytes > self.__max_bytes:
+            self.clear()
+
+    def __start_gop(self, packet: av.Packet) -> None:
+        if self.__pre_roll_seconds == 0:
+            self.clear()
+            self.__gops.append([Fraction(0), 0, 0])
+            return
+        # Se compara en fracciones exactas: solo se calcula una vez por keyframe
+        seconds = packet.dts * packet.time_base if packet.dts is not None else Fraction(0)
+        self.__gops.append([seconds, 0, 0])
+        # Se descarta el GOP más viejo si el siguiente ya cubre el pre-roll
+        while len(self.__gops) > 1 and self.__gops[1][0] <= seconds - self.__pre_roll_seconds:
+            self.__drop_oldest_gop()
+
+    def __drop_oldest_gop(self) -> None:
+        _, packets, size_bytes = self.__gops.popleft()
+        for _ in range(packets):
+            self.__packets.popleft()
+        self.__size_bytes -= size_bytes
+
+    def has_complete_gop(self) -> bool:
+        """Indica si el buffer contiene un GOP que comienza en un keyframe"""
+        return bool(self.__packets)
+
+    def replay(self) -> Iterator[av.Packet]:
+        """Devuelve los paquetes del buffer en el orden en que se recibieron"""
+        yield from list(self.__packets)
+
+    def clear(self) -> None:
+        self.__packets.clear()
+        self.__gops.clear()
+        self.__size_bytes = 0
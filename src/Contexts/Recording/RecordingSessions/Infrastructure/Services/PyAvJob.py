@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.CredentialsRedactor import (
+    CredentialsRedactor,
+)
+
+
+class PyAvJob(ABC):
+    """
+    Trabajo sobre una conexión de cámara que avanza de a turnos, para que PyAvRecordingEngine
+    pueda intercalar muchos en pocos threads (grabaciones y decodificación para análisis).
+    """
+
+    @property
+    @abstractmethod
+    def source(self) -> str:
+        pass
+
+    @property
+    def display_source(self) -> str:
+        """Origen sin credenciales, para logs y métricas"""
+        return CredentialsRedactor.redact(self.source)
+
+    @abstractmethod
+    def seconds_until_ready(self) -> float:
+        """Segundos hasta que el job pueda avanzar (0 salvo mientras espera para reconectar)"""
+        pass
+
+    def needs_connection(self) -> bool:
+        """True cuando el próximo turno es una reconexión, que puede bloquear"""
+        return False
+
+    def reconnect(self) -> None:
+        """
+        Intenta reconectar; si falla, programa el próximo intento o finaliza el job. Bloquea
+        hasta el timeout de conexión, por lo que el engine la ejecuta fuera de sus workers
+        """
+        pass
+
+    @abstractmethod
+    def step(self, max_packets: int, max_milliseconds: Optional[int] = None) -> bool:
+        """
+        Procesa un turno: hasta `max_packets` paquetes o hasta que el stream avance
+        `max_milliseconds` de tiempo de media, lo que ocurra primero.
+        Devuelve False cuando el job terminó.
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> None:
+        """Cierra la conexión y los recursos del job"""
+        pass
+
+    def metrics_snapshot(self) -> Optional[StreamMetrics]:
+        """Métricas acumuladas del job, o None si no se recolectan"""
+        return None
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from fractions import Fraction
+from typing import Optional, Union
+
+
+class PyAvMediaClock:
+    """
+    Mide el tiempo transcurrido de un stream en ticks enteros de su time base, tomando como
+    origen el primer DTS recibido y corrigiendo el wraparound de los timestamps.
+    `update` se llama por paquete y solo usa aritmética entera; las conversiones a segundos
+    se hacen únicamente al medir un segmento.
+
+    Un salto hacia atrás de más de `MAX_REORDER_SECONDS` que no es un wraparound (por ejemplo,
+    el encoder de la cámara se reinició sin cortar la conexión) es una discontinuidad: el reloj
+    se re-origina para que el tiempo transcurrido siga desde donde estaba y no retroceda.
+    """
+
+    MIN_WRAP_BITS = 32
+    MAX_REORDER_SECONDS = 1
+
+    def __init__(self, time_base: Optional[Fraction]):
+        time_base = time_base or Fraction(1, 1000)
+        self.__numerator = time_base.numerator
+        self.__denominator = time_base.denominator
+        self.__origin_ticks: Optional[int] = None
+        self.__last_dts = 0
+        self.__offset_ticks = 0  # wraparounds y discontinuidades corregidos
+        self.__elapsed_ticks = 0
+        self.__wall_clock_origin = 0.0
+        self.__out_of_order_packets = 0
+        self.__discontinuities = 0
+        self.__max_reorder_ticks = self.ticks_for_seconds(self.MAX_REORDER_SECONDS)
+
+    def ticks_for_seconds(self, seconds: Union[int, Fraction]) -> int:
+        """Convierte segundos a ticks del time base, redondeando hacia arriba"""
+        return int(-(-seconds * self.__denominator // self.__numerator))
+
+    @property
+    def has_started(self) -> bool:
+        """Indica si ya se registró el primer paquete"""
+        return self.__origin_ticks is not None
+
+    @property
+    def out_of_order_packets(self) -> int:
+        """Paquetes con DTS menor al anterior que no se explican por un wraparound"""
+        return self.__out_of_order_packets
+
+    @property
+    def discontinuities(self) -> int:
+        """Saltos de DTS hacia atrás que no son wraparound ni paquetes desordenados"""
+        return self.__discontinuities
+
+    @property
+    def position_ticks(self) -> int:
+        """Último DTS registrado, con el wraparound corregido (no se reinicia con `restart`)"""
+        return self.__last_dts + self.__offset_ticks
+
+    def update(self, dts: int) -> int:
+        """
+        Registra el DTS de un paquete y devuelve los ticks transcurridos desde el origen
+
+        Args:
+            dts: DTS del paquete en el time base del stream de entrada
+        """
+        if self.__origin_ticks is None:
+            self.__origin_ticks = dts
+            self.__last_dts = dts
+            self.__wall_clock_origin = time.monotonic()
+            return 0
+        if dts < self.__last_dts:
+            self.__unwrap(dts)
+        self.__last_dts = dts
+        # Un paquete desordenado justo después de un corte no puede dar un tiempo negativo
+        self.__elapsed_ticks = max(0, dts + self.__offset_ticks - self.__origin_ticks)
+        return self.__elapsed_ticks
+
+    def __unwrap(self, dts: int) -> None:
+        # El módulo del contador se deduce del último valor: 2^32 en RTP, 2^33 en MPEG-TS
+        modulus = 1 << max(self.__last_dts.bit_length(), self.MIN_WRAP_BITS)
+        backward_ticks = self.__last_dts - dts
+        if backward_ticks > modulus // 2:
+            self.__offset_ticks += modulus
+        elif backward_ticks > self.__max_reorder_ticks:
+            # El nuevo DTS continúa la posición del anterior
+            self.__offset_ticks += backward_ticks
+            self.__discontinuities += 1
+        else:
+            self.__out_of_order_packets += 1
+
+    def restart(self) -> None:
+        """Mueve el origen al último paquete registrado (inicio de un segmento nuevo)"""
+        if self.__origin_ticks is None:
+            return
+        self.__origin_ticks += self.__elapsed_ticks
+        self.__elapsed_ticks = 0
+        self.__wall_clock_origin = time.monotonic()
+
+    def media_seconds(self) -> float:
+        return self.__elapsed_ticks * self.__numerator / self.__denominator
+
+    def wall_clock_seconds(self) -> float:
+        if self.__origin_ticks is None:
+            return 0.0
+        return time.monotonic() - self.__wall_clock_origin
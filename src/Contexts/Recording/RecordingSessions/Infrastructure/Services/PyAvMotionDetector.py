@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import av
+import numpy as np
+from av.video.reformatter import Interpolation, VideoReformatter
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+
+
+class PyAvMotionDetector(PyAvFrameConsumer):
+    """
+    Detecta movimiento por diferencia de frames sobre una versión diminuta en escala de grises
+    de cada frame decodificado (por defecto 64x36), lo que cuesta una fracción de la
+    decodificación misma.
+
+    Un píxel cambió si su diferencia absoluta con el frame anterior supera `pixel_threshold`;
+    hay movimiento si cambió al menos `min_changed_fraction` de los píxeles. Los buffers de la
+    diferencia se asignan una vez y se reutilizan en cada frame.
+
+    Con `keyframes_only` el decodificador descarta los frames que no son keyframe: sirve para
+    analizar el stream principal cuando la cámara no tiene sub-stream, a costa de comparar
+    frames separados por un GOP.
+
+    Se usa una instancia por cámara: `seconds_since_motion` se consulta desde el job de
+    grabación para abrir y cerrar segmentos.
+    """
+
+    def __init__(
+        self,
+        min_changed_fraction: float,
+        width: int = 64,
+        height: int = 36,
+        pixel_threshold: int = 25,
+        keyframes_only: bool = False,
+    ):
+        self.__ensure_positive("width", width)
+        self.__ensure_positive("height", height)
+        self.__ensure_positive("pixel_threshold", pixel_threshold)
+        if not 0 < min_changed_fraction <= 1:
+            raise ValueError(
+                "La fracción de píxeles para detectar movimiento debe estar entre 0 y 1"
+            )
+        self.__width = width
+        self.__height = height
+        self.__pixel_threshold = pixel_threshold
+        self.__min_changed_pixels = max(1, round(min_changed_fraction * width * height))
+        self.__keyframes_only = keyframes_only
+        self.__reformatter = VideoReformatter()
+        self.__previous = np.empty((height, width), dtype=np.uint8)
+        self.__current = np.empty((height, width), dtype=np.uint8)
+        self.__minimum = np.empty((height, width), dtype=np.uint8)
+        self.__difference = np.empty((height, width), dtype=np.uint8)
+        self.__changed = np.empty((height, width), dtype=np.bool_)
+        self.__has_previous = False
+        self.__last_motion_at: Optional[float] = None
+
+    def __ensure_positive(self, name: str, value: int) -> None:
+        if value <= 0:
+            raise ValueError(
+                f"El parámetro {name} de la detección de movimiento debe ser mayor a 0"
+            )
+
+    @property
+    def last_motion_at(self) -> Optional[float]:
+        """Instante (time.monotonic) del último frame con movimiento"""
+        return self.__last_motion_at
+
+    def seconds_since_motion(self) -> float:
+        """Segundos desde el último movimiento, o infinito si todavía no hubo"""
+        if self.__last_motion_at is None:
+            return float("inf")
+        return time.monotonic() - self.__last_motion_at
+
+    def prepare(self, stream: av.VideoStream) -> None:
+        if self.__keyframes_only:
+            stream.codec_context.skip_frame = "NONKEY"
+        # Tras reconectar no se compara contra un frame del stream anterior
+        self.__has_previous = False
+
+    def consume(self, source: str, frame: av.VideoFrame) -> None:
+        scaled = self.__reformatter.reformat(
+            frame,
+            width=self.__width,
+            height=self.__height,
+            format="gray",
+            interpolation=Interpolation.BILINEAR,
+        )
+        plane = scaled.planes[0]
+        # El plano puede tener padding al final de cada línea
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(self.__height, plane.line_size)
+        self.__current[...] = rows[:, : self.__width]
+        if self.__has_previous and self.__changed_pixels() >= self.__min_changed_pixels:
+            self.__last_motion_at = time.monotonic()
+        self.__previous, self.__current = self.__current, self.__previous
+        self.__has_previous = True
+
+    def __changed_pixels(self) -> int:
+        # |a - b| en uint8 sin desbordar ni asignar arrays intermedios
+        np.maximum(self.__current, self.__previous, out=self.__difference)
+        np.minimum(self.__current, self.__previous, out=self.__minimum)
+        np.subtract(self.__difference, self.__minimum, out=self.__difference)
+        np.greater(self.__difference, self.__pixel_threshold, out=self.__changed)
+        return int(np.count_nonzero(self.__changed))
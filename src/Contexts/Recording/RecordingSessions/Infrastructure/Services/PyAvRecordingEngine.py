@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Union
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvJob import PyAvJob
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+_STOP = object()
+
+
+class PyAvRecordingEngine:
+    """
+    Motor que multiplexa muchas grabaciones en un pool fijo de threads, en lugar de un thread
+    bloqueado en `demux` por cámara.
+
+    Cada cámara se asigna a un worker según un hash estable de su origen (sharding) y cada
+    worker atiende a sus cámaras en round-robin. En cada turno una cámara avanza como máximo
+    `packets_per_turn` paquetes o `turn_milliseconds` de tiempo de media, de modo que las
+    cámaras con mayor frame rate no acaparan el worker ni acumulan atraso respecto al resto.
+    PyAV libera el GIL mientras lee de la red, por lo que pocos workers alcanzan para
+    cientos de cámaras. Las cámaras que esperan para reconectar no consumen turnos, y la
+    reconexión (que bloquea hasta el timeout de conexión) se ejecuta en un pool aparte de
+    `connect_workers` threads: mientras tanto la cámara queda fuera de la ronda de su worker y
+    al reconectar vuelve a él.
+
+    Además de grabaciones acepta cualquier PyAvJob, como la decodificación del sub-stream de
+    análisis (PyAvAnalysisJob), que comparte el pool con las grabaciones.
+
+    Cada worker publica sus grabaciones en un registro que solo él modifica, de modo que
+    `metrics` puede leerlas desde otro thread sin tomar locks en el loop de paquetes.
+
+    La lectura de paquetes bloquea (PyAV no permite leer sin bloquear): una cámara lenta o que
+    dejó de enviar datos retiene a su worker hasta recibir el paquete o hasta el timeout de
+    lectura del job. Para que no frene al resto de su worker, una cámara cuyo turno tarda más
+    de `slow_turn_seconds` pasa al carril lento, un thread aparte que solo atiende cámaras
+    lentas. El límite que queda es ese primer turno lento: las cámaras de su worker esperan a
+    lo sumo una vez, hasta el timeout de lectura.
+    """
+
+    MAX_IDLE_WAIT_SECONDS = 0.1
+
+    def __init__(
+        self,
+        logger: LoggerInterface,
+        workers: Optional[int] = None,
+        packets_per_turn: int = 64,
+        turn_milliseconds: int = 200,
+        slow_turn_seconds: float = 1.0,
+        connect_workers: int = 2,
+    ):
+        self.__ensure_positive("workers", workers or 1)
+        self.__ensure_positive("packets_per_turn", packets_per_turn)
+        self.__ensure_positive("turn_milliseconds", turn_milliseconds)
+        self.__ensure_positive("slow_turn_seconds", slow_turn_seconds)
+        self.__ensure_positive("connect_workers", connect_workers)
+        self.__logger = logger
+        self.__workers = workers or os.cpu_count() or 1
+        self.__packets_per_turn = packets_per_turn
+        self.__turn_milliseconds = turn_milliseconds
+        self.__slow_turn_seconds = slow_turn_seconds
+        self.__connect_workers = connect_workers
+        self.__connector: Optional[ThreadPoolExecutor] = None
+        # El último inbox y registro son los del carril lento
+        self.__slow_lane = self.__workers
+        self.__inboxes: List[queue.SimpleQueue[Union[PyAvJob, object]]] = [
+            queue.SimpleQueue() for _ in range(self.__workers + 1)
+        ]
+        self.__jobs_per_worker = [0] * self.__workers
+        self.__slow_lane_jobs = 0
+        self.__worker_jobs: List[Dict[int, PyAvJob]] = [{} for _ in range(self.__workers + 1)]
+        self.__threads: List[threading.Thread] = []
+        self.__is_stopping = False
+        self.__lock = threading.Lock()
+
+    def __ensure_positive(self, name: str, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del motor de grabación debe ser mayor a 0")
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    def jobs_per_worker(self) -> List[int]:
+        """
+        Cantidad de grabaciones activas asignadas a cada worker, incluidas las que atiende el
+        carril lento
+        """
+        with self.__lock:
+            return list(self.__jobs_per_worker)
+
+    def slow_lane_jobs(self) -> int:
+        """Cantidad de grabaciones que atiende el carril lento"""
+        with self.__lock:
+            return self.__slow_lane_jobs
+
+    def metrics(self) -> Dict[int, List[StreamMetrics]]:
+        """
+        Métricas de las grabaciones activas, agrupadas por el worker asignado (también las del
+        carril lento, para que cada cámara conserve sus series)
+        """
+        metrics: Dict[int, List[StreamMetrics]] = {index: [] for index in range(self.__workers)}
+        for registry in self.__worker_jobs:
+            for job in list(registry.values()):
+                snapshot = job.metrics_snapshot()
+                if snapshot is not None:
+                    metrics[self.shard_for(job.source)].append(snapshot)
+        return metrics
+
+    def shard_for(self, source: str) -> int:
+        """Índice del worker que atiende a un origen; estable entre reinicios del proceso"""
+        return zlib.crc32(source.encode()) % self.__workers
+
+    def submit(self, job: PyAvJob) -> None:
+        """
+        Agrega una grabación al worker de su shard. El job debe estar abierto: la conexión
+        se establece en el thread que llama, para no frenar al resto de las cámaras del worker.
+        Si sus turnos tardan más de `slow_turn_seconds` (lecturas que bloquean esperando a la
+        cámara), pasa al carril lento.
+        """
+        self.start()
+        shard = self.shard_for(job.source)
+        with self.__lock:
+            self.__jobs_per_worker[shard] += 1
+        self.__inboxes[shard].put(job)
+
+    def start(self) -> None:
+        with self.__lock:
+            if self.__threads:
+                return
+            self.__is_stopping = False
+            self.__connector = ThreadPoolExecutor(
+                self.__connect_workers, thread_name_prefix="pyav-recording-connect"
+            )
+            for index, inbox in enumerate(self.__inboxes):
+                name = "slow-lane" if index == self.__slow_lane else f"worker-{index}"
+                thread = threading.Thread(
+                    target=self.__run_worker,
+                    args=(index, inbox),
+                    name=f"pyav-recording-{name}",
+                    daemon=True,
+                )
+                thread.start()
+                self.__threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Finaliza todas las grabaciones, cerrando y notificando sus segmentos en curso. Las que
+        están reconectando se finalizan al terminar el intento en curso
+        """
+        with self.__lock:
+            threads, self.__threads = self.__threads, []
+            connector, self.__connector = self.__connector, None
+            # Desde acá ninguna grabación cambia de thread: cada una termina en el suyo
+            self.__is_stopping = True
+            for inbox in self.__inboxes:
+                inbox.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+        if connector is not None:
+            connector.shutdown(wait=True)
+
+    def __run_worker(self, index: int, inbox: queue.SimpleQueue) -> None:
+        jobs: Deque[PyAvJob] = deque()
+        while True:
+            # Sin cámaras asignadas el worker se bloquea hasta recibir una
+            item = inbox.get() if not jobs else self.__next_or_none(inbox)
+            while item is not None:
+                if item is _STOP:
+                    self.__finish_all(index, jobs)
+                    return
+                jobs.append(item)
+                self.__worker_jobs[index][id(item)] = item
+                item = self.__next_or_none(inbox)
+
+            job = jobs.popleft()
+            if job.seconds_until_ready() > 0:
+                # Cámara esperando para reconectar: no consume turno
+                jobs.append(job)
+                self.__wait_if_all_jobs_are_waiting(jobs)
+                continue
+            if job.needs_connection() and self.__park(index, job):
+                continue
+            started_at = time.monotonic()
+            if not self.__step(job):
+                self.__release(index, job)
+            elif not self.__is_slow(index, started_at) or not self.__move_to_slow_lane(index, job):
+                jobs.append(job)
+
+    def __is_slow(self, index: int, started_at: float) -> bool:
+        if index == self.__slow_lane:
+            return False
+        return time.monotonic() - started_at > self.__slow_turn_seconds
+
+    def __move_to_slow_lane(self, index: int, job: PyAvJob) -> bool:
+        with self.__lock:
+            if self.__is_stopping:
+                return False
+            self.__slow_lane_jobs += 1
+            self.__worker_jobs[index].pop(id(job), None)
+            self.__inboxes[self.__slow_lane].put(job)
+        self.__logger.warn(
+            f"Grabación de {job.display_source} movida al carril lento: su turno tardó más de "
+            f"{self.__slow_turn_seconds:.1f}s"
+        )
+        return True
+
+    def __park(self, index: int, job: PyAvJob) -> bool:
+        # La cámara sigue en el registro del worker (y en sus métricas) mientras reconecta
+        with self.__lock:
+            if self.__is_stopping or self.__connector is None:
+                return False
+            self.__connector.submit(self.__reconnect, index, job)
+        return True
+
+    def __reconnect(self, index: int, job: PyAvJob) -> None:
+        try:
+            job.reconnect()
+        except Exception as e:
+            self.__logger.error(f"Grabación de {job.source} finalizada por error: {e}")
+        with self.__lock:
+            if not self.__is_stopping:
+                # El worker la retoma, o la libera si el job terminó al reconectar
+                self.__inboxes[index].put(job)
+                return
+        self.__finish(index, job)
+
+    def __wait_if_all_jobs_are_waiting(self, jobs: Deque[PyAvJob]) -> None:
+        wait_seconds = min(job.seconds_until_ready() for job in jobs)
+        if wait_seconds > 0:
+            # Espera acotada para atender pronto a las cámaras nuevas que lleguen al inbox
+            time.sleep(min(wait_seconds, self.MAX_IDLE_WAIT_SECONDS))
+
+    def __next_or_none(self, inbox: queue.SimpleQueue):
+        try:
+            return inbox.get_nowait()
+        except queue.Empty:
+            return None
+
+    def __step(self, job: PyAvJob) -> bool:
+        try:
+            return job.step(self.__packets_per_turn, self.__turn_milliseconds)
+        except Exception as e:
+            # El job ya registró el error y cerró sus recursos
+            self.__logger.error(f"Grabación de {job.source} finalizada por error: {e}")
+            return False
+
+    def __release(self, index: int, job: PyAvJob) -> None:
+        self.__worker_jobs[index].pop(id(job), None)
+        with self.__lock:
+            self.__jobs_per_worker[self.shard_for(job.source)] -= 1
+            if index == self.__slow_lane:
+                self.__slow_lane_jobs -= 1
+
+    def __finish_all(self, index: int, jobs: Deque[PyAvJob]) -> None:
+        while jobs:
+            self.__finish(index, jobs.popleft())
+
+    def __finish(self, index: int, job: PyAvJob) -> None:
+        try:
+            job.finish()
+        except Exception as e:
+            self.__logger.error(f"Error al finalizar la grabación de {job.source}: {e}")
+        self.__release(index, job)
@@ -0,0 +1,663 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import av
+from av.container.input import InputContainer
+from av.error import HTTPBadRequestError, HTTPNotFoundError
+from av.stream import Stream
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingGap import RecordingGap
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingResult import (
+    RecordingResult,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamSelection import (
+    StreamSelection,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvGopBuffer import (
+    PyAvGopBuffer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvJob import PyAvJob
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMediaClock import (
+    PyAvMediaClock,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvSegmentWriter import (
+    PyAvSegmentWriter,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvStreamMetrics import (
+    PyAvStreamMetrics,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+
+class PyAvRecordingJob(PyAvJob):
+    """
+    Grabación de una cámara expresada como una máquina de estados que avanza de a turnos.
+    `run` la ejecuta de forma bloqueante; `PyAvRecordingEngine` intercala muchas en pocos threads.
+
+    En modo sesión se graba un único archivo de `segment_duration` segundos; en modo continuo
+    se rota el archivo en un keyframe cada `segment_duration` segundos hasta que el stream termine.
+
+    Si la conexión se pierde, el job reconecta respetando `backoff` sin bloquear el thread
+    mientras espera. En modo sesión la grabación sigue en un archivo `__partN` nuevo hasta
+    completar la duración de la sesión; en modo continuo se cierra el segmento en curso y el
+    siguiente informa el corte. Los cortes se reportan en el RecordingResult. Ante un error que
+    no se resuelve reconectando, lo ya grabado se cierra y se notifica antes de propagarlo.
+
+    `timeout` se pasa a `av.open` como (timeout de apertura, timeout de lectura): si la cámara
+    deja de enviar datos sin cerrar el socket, FFmpeg interrumpe la lectura y el job reconecta.
+    Un watchdog también puede pedir el reinicio con `request_restart`, que se atiende en el
+    próximo paquete leído (por ejemplo, si solo llegan paquetes de audio).
+
+    `stream_selection` indica qué streams de la conexión se remuxan junto al video principal
+    (audio, pistas de video secundarias). Todos se leen del mismo demux, por lo que no se abre
+    una conexión extra por pista; el segmento y el reloj de media siguen al video principal.
+
+    Con `collect_metrics` el job instrumenta su loop de paquetes en un PyAvStreamMetrics propio.
+
+    En modo continuo los segmentos se cortan siempre en un keyframe del video principal: cada
+    archivo comienza decodificable y ningún paquete se escribe en dos segmentos.
+
+    Con `is_motion_active` el modo continuo solo graba mientras la función devuelve True: al
+    volverse False el segmento en curso se cierra en el próximo keyframe y los paquetes que
+    no se graban se acumulan en un buffer de `pre_roll_seconds`. Cada segmento nuevo comienza
+    con ese pre-roll, cuya duración no se incluye en la duración de media informada.
+
+    Con `keyframe_consumer` cada keyframe del video principal se decodifica desde el mismo
+    demux (antes de remuxarlo) y se entrega al consumidor, por ejemplo a un PyAvMotionDetector
+    cuando la cámara no tiene sub-stream: así no se abre una segunda conexión al stream
+    principal. Solo se decodifica un frame por GOP, en el thread que avanza la grabación.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]],
+        logger: LoggerInterface,
+        continuous: bool = False,
+        input_format: Optional[str] = None,
+        input_options: Optional[Dict[str, str]] = None,
+        gop_buffer_max_bytes: int = 16 * 1024 * 1024,
+        backoff: Optional[ExponentialBackoff] = None,
+        timeout: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        collect_metrics: bool = True,
+        stream_selection: Optional[StreamSelection] = None,
+        is_motion_active: Optional[Callable[[], bool]] = None,
+        pre_roll_seconds: float = 0,
+        keyframe_consumer: Optional[PyAvFrameConsumer] = None,
+    ):
+        self.__source = source
+        self.__segment_duration = segment_duration
+        self.__output_path_factory = output_path_factory
+        self.__on_segment_finished = on_segment_finished
+        self.__logger = logger
+        self.__continuous = continuous
+        self.__input_format = input_format
+        self.__input_options = input_options or {}
+        self.__gop_buffer = (
+            PyAvGopBuffer(gop_buffer_max_bytes, pre_roll_seconds) if continuous else None
+        )
+        self.__is_motion_active = is_motion_active
+        self.__keyframe_consumer = keyframe_consumer
+        self.__backoff = backoff or ExponentialBackoff()
+        self.__timeout = timeout
+        self.__stream_selection = stream_selection or StreamSelection(StreamSelection.VIDEO)
+        self.__metrics = PyAvStreamMetrics(self.display_source) if collect_metrics else None
+        self.__video_index = 0
+        self.__time_next_mux = False
+        self.__input: Optional[InputContainer] = None
+        self.__in_stream: Optional[av.VideoStream] = None
+        self.__in_streams: List[Stream] = []
+        self.__secondary_indexes: FrozenSet[int] = frozenset()
+        self.__dropped_codecs_logged = False
+        self.__packets: Optional[Iterator[av.Packet]] = None
+        self.__clock = PyAvMediaClock(None)
+        self.__segment_ticks = 0
+        self.__turn_ticks: Dict[int, int] = {}
+        self.__writer: Optional[PyAvSegmentWriter] = None
+        self.__packets_processed = 0
+        self.__bytes_processed = 0
+        self.__last_packet_at = 0.0
+        self.__restart_reason: Optional[str] = None
+        self.__stop_requested = threading.Event()
+        self.__restarts = 0
+        self.__is_opened = False
+        self.__is_finished = False
+        self.__finished = threading.Event()
+        self.__started_at = 0.0
+        # Estado de reconexión
+        self.__gap_started_at: Optional[float] = None
+        self.__gap_reason = ""
+        self.__reconnect_attempt = 0
+        self.__reconnect_at = 0.0
+        self.__gaps: List[RecordingGap] = []
+        # Partes ya cerradas de la sesión (solo modo sesión)
+        self.__part_paths: List[str] = []
+        self.__part_hashes: List[Optional[str]] = []
+        self.__closed_media_seconds = 0.0
+        self.__closed_wall_clock_seconds = 0.0
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    def metrics_snapshot(self) -> Optional[StreamMetrics]:
+        """Métricas acumuladas de la grabación, o None si no se recolectan"""
+        if self.__metrics is None:
+            return None
+        return self.__metrics.snapshot(
+            self.__video_index, self.__packets_processed, self.__bytes_processed
+        )
+
+    @property
+    def packets_processed(self) -> int:
+        return self.__packets_processed
+
+    @property
+    def bytes_processed(self) -> int:
+        return self.__bytes_processed
+
+    @property
+    def last_packet_at(self) -> float:
+        """Instante (time.monotonic) del último paquete de video, o de la última conexión"""
+        return self.__last_packet_at
+
+    @property
+    def restarts(self) -> int:
+        """Cantidad de veces que se perdió la conexión y se inició una reconexión"""
+        return self.__restarts
+
+    @property
+    def is_finished(self) -> bool:
+        return self.__is_finished
+
+    @property
+    def is_reconnecting(self) -> bool:
+        return self.__gap_started_at is not None
+
+    def wait_until_finished(self, timeout: Optional[float] = None) -> bool:
+        """Bloquea hasta que la grabación termine; devuelve False si se agota `timeout`"""
+        return self.__finished.wait(timeout)
+
+    def seconds_until_ready(self) -> float:
+        """Segundos hasta que el job pueda avanzar (0 salvo mientras espera para reconectar)"""
+        if not self.is_reconnecting:
+            return 0.0
+        return max(0.0, self.__reconnect_at - time.monotonic())
+
+    def needs_connection(self) -> bool:
+        return self.is_reconnecting and not self.__is_finished
+
+    def reconnect(self) -> None:
+        if self.needs_connection():
+            self.__try_reconnect()
+
+    def request_restart(self, reason: str) -> None:
+        """Pide cerrar la conexión y reconectar. Se puede invocar desde otro thread"""
+        self.__restart_reason = reason
+
+    def request_stop(self) -> None:
+        """
+        Pide finalizar la grabación, cerrando y notificando el segmento en curso en el próximo
+        turno. Se puede invocar desde otro thread
+        """
+        self.__stop_requested.set()
+
+    def open(self) -> None:
+        """Abre la conexión con la cámara. Puede bloquear hasta el timeout de conexión"""
+        self.__is_opened = True
+        try:
+            self.__started_at = time.monotonic()
+            self.__connect()
+            self.__segment_ticks = self.__clock.ticks_for_seconds(self.__segment_duration.value)
+            if not self.__continuous:
+                self.__writer = self.__create_writer(self.__output_path_factory())
+        except Exception as e:
+            self.__log_recording_error(e)
+            self.abort()
+            raise e
+
+    def __connect(self) -> None:
+        self.__input = av.open(
+            self.__source,
+            format=self.__input_format,
+            options=self.__input_options,
+            timeout=self.__timeout,
+        )
+        self.__in_stream = self.__input.streams.video[0]
+        self.__video_index = self.__in_stream.index
+        self.__in_streams = self.__select_streams(self.__input)
+        self.__secondary_indexes = frozenset(stream.index for stream in self.__in_streams[1:])
+        self.__dropped_codecs_logged = False
+        self.__clock = PyAvMediaClock(self.__in_stream.time_base)
+        if self.__keyframe_consumer is not None:
+            self.__keyframe_consumer.prepare(self.__in_stream)
+        if self.__metrics is not None:
+            self.__metrics.reset_stream(self.__in_stream.time_base, self.__in_stream.average_rate)
+        self.__turn_ticks = {}
+        self.__last_packet_at = time.monotonic()
+        self.__restart_reason = None
+        # Se leen todos los streams para recuperar el control aunque no lleguen paquetes de video
+        self.__packets = self.__input.demux()
+
+    def __select_streams(self, input: InputContainer) -> List[Stream]:
+        assert self.__in_stream is not None
+        streams: List[Stream] = [self.__in_stream]
+        if self.__stream_selection.includes_secondary_video():
+            streams += [stream for stream in input.streams.video if stream is not self.__in_stream]
+        if self.__stream_selection.includes_audio():
+            streams += list(input.streams.audio)
+        return streams
+
+    def __create_writer(self, output_path: OutputPath) -> PyAvSegmentWriter:
+        writer = PyAvSegmentWriter(output_path, self.__in_streams)
+        if writer.dropped_codecs and not self.__dropped_codecs_logged:
+            # Se informa una vez por conexión y no en cada segmento
+            self.__dropped_codecs_logged = True
+            self.__logger.warn(
+                f"Streams de {self.display_source} sin grabar por no ser soportados por el "
+                f"contenedor: {', '.join(writer.dropped_codecs)}"
+            )
+        return writer
+
+    def step(self, max_packets: int, max_milliseconds: Optional[int] = None) -> bool:
+        """
+        Procesa un turno: hasta `max_packets` paquetes o hasta que el stream avance
+        `max_milliseconds` de tiempo de media, lo que ocurra primero.
+        Devuelve False cuando la grabación terminó.
+        """
+        if self.__is_finished:
+            return False
+        if self.__stop_requested.is_set():
+            self.finish()
+            return False
+        if self.is_reconnecting:
+            return self.__try_reconnect()
+        if self.__packets is None:
+            return False
+        turn_end_ticks = None
+        if max_milliseconds is not None:
+            turn_end_ticks = self.__clock.position_ticks + self.__ticks_for_turn(max_milliseconds)
+        turn = self.__begin_turn()
+        try:
+            for _ in range(max_packets):
+                if self.__restart_reason is not None:
+                    self.__logger.warn(f"Reiniciando {self.__source}: {self.__restart_reason}")
+                    self.__begin_gap(self.__restart_reason)
+                    return True
+                packet = next(self.__packets, None)
+                if packet is None or not self.__process(packet):
+                    self.finish()
+                    return False
+                if turn_end_ticks is not None and self.__clock.position_ticks >= turn_end_ticks:
+                    break
+            return True
+        except Exception as e:
+            self.__log_recording_error(e)
+            if not self.__is_recoverable(e):
+                self.__finish_after_error()
+                raise e
+            self.__begin_gap(str(e))
+            return True
+        finally:
+            self.__end_turn(turn)
+
+    def __begin_turn(self) -> Optional[Tuple[bool, int, int, int]]:
+        if self.__metrics is None:
+            return None
+        self.__time_next_mux = True
+        clock = self.__clock
+        return (
+            clock.has_started,
+            clock.position_ticks,
+            self.__packets_processed,
+            clock.out_of_order_packets,
+        )
+
+    def __end_turn(self, turn: Optional[Tuple[bool, int, int, int]]) -> None:
+        if turn is None:
+            return
+        assert self.__metrics is not None
+        had_started, position_ticks, packets_processed, out_of_order_packets = turn
+        # En el turno que recibe el primer paquete no hay un DTS previo con el cual comparar
+        packets = self.__packets_processed - packets_processed if had_started else 0
+        self.__metrics.observe_turn(
+            packets,
+            self.__clock.position_ticks - position_ticks,
+            self.__clock.out_of_order_packets - out_of_order_packets,
+        )
+
+    def __ticks_for_turn(self, milliseconds: int) -> int:
+        # Se cachea para no convertir fracciones en cada turno
+        if milliseconds not in self.__turn_ticks:
+            seconds = Fraction(milliseconds, 1000)
+            self.__turn_ticks[milliseconds] = self.__clock.ticks_for_seconds(seconds)
+        return self.__turn_ticks[milliseconds]
+
+    def run(self) -> None:
+        """Ejecuta la grabación completa en el thread actual, abriendo la conexión si hace falta"""
+        if not self.__is_opened:
+            self.open()
+        # Turnos cortos: la latencia de mux se muestrea una vez por turno
+        while self.step(max_packets=64):
+            # La espera para reconectar se interrumpe si se pide finalizar
+            self.__stop_requested.wait(self.seconds_until_ready())
+
+    def finish(self) -> None:
+        """Cierra la conexión y el segmento en curso, notificando su resultado"""
+        if self.is_reconnecting:
+            self.__record_gap()
+        self.__close_input()
+        if self.__continuous:
+            writer, self.__writer = self.__writer, None
+            self.__close_segment(writer)
+        else:
+            self.__close_session_part()
+            self.__notify_session()
+        self.__is_finished = True
+        self.__finished.set()
+
+    def __finish_after_error(self) -> None:
+        # Lo grabado hasta el error se notifica igual, para que se catalogue y se mueva
+        try:
+            self.finish()
+        except Exception as e:
+            self.__logger.error(f"Error al cerrar la grabación de {self.__source}: {e}")
+            self.abort()
+
+    def abort(self) -> None:
+        """Cierra la conexión y el segmento en curso sin notificar (ante errores)"""
+        self.__close_input()
+        writer, self.__writer = self.__writer, None
+        if writer is not None:
+            writer.close()
+        self.__gap_started_at = None
+        self.__is_finished = True
+        self.__finished.set()
+
+    def __close_input(self) -> None:
+        self.__packets = None
+        input, self.__input = self.__input, None
+        if input is None:
+            return
+        try:
+            input.close()
+        except Exception as e:
+            # La conexión puede estar rota: no impide cerrar el segmento
+            self.__logger.debug(f"Error al cerrar la conexión con {self.__source}: {e}")
+
+    def __is_recoverable(self, error: Exception) -> bool:
+        # Credenciales o rutas inválidas no se resuelven reconectando
+        return not isinstance(error, (HTTPBadRequestError, HTTPNotFoundError))
+
+    def __begin_gap(self, reason: str) -> None:
+        self.__close_input()
+        if self.__continuous:
+            writer, self.__writer = self.__writer, None
+            self.__close_segment(writer)
+            assert self.__gop_buffer is not None
+            self.__gop_buffer.clear()
+        else:
+            self.__close_session_part()
+        self.__gap_started_at = time.monotonic()
+        self.__gap_reason = reason
+        self.__restart_reason = None
+        self.__restarts += 1
+        self.__reconnect_attempt = 0
+        self.__schedule_reconnect()
+
+    def __schedule_reconnect(self) -> None:
+        delay = self.__backoff.delay_for(self.__reconnect_attempt)
+        self.__reconnect_at = time.monotonic() + delay
+        self.__logger.warn(
+            f"Conexión perdida con {self.__source}, reintento "
+            f"{self.__reconnect_attempt + 1} en {delay:.1f}s"
+        )
+
+    def __try_reconnect(self) -> bool:
+        if time.monotonic() < self.__reconnect_at:
+            return True
+        if self.__session_time_is_over() or not self.__backoff.allows(self.__reconnect_attempt):
+            self.finish()
+            return False
+        try:
+            self.__connect()
+        except Exception as e:
+            self.__log_recording_error(e)
+            self.__close_input()
+            if not self.__is_recoverable(e):
+                self.__finish_after_error()
+                raise e
+            self.__reconnect_attempt += 1
+            self.__schedule_reconnect()
+            return True
+        self.__record_gap()
+        self.__logger.info(f"Reconectado con {self.__source}")
+        if self.__continuous:
+            self.__segment_ticks = self.__clock.ticks_for_seconds(self.__segment_duration.value)
+        else:
+            self.__open_session_part()
+        return True
+
+    def __record_gap(self) -> None:
+        assert self.__gap_started_at is not None
+        now = time.monotonic()
+        self.__gaps.append(
+            RecordingGap(
+                offset_seconds=self.__gap_started_at - self.__started_at,
+                duration_seconds=now - self.__gap_started_at,
+                reason=self.__gap_reason,
+            )
+        )
+        self.__gap_started_at = None
+
+    def __elapsed_session_seconds(self) -> float:
+        gap_seconds = sum(gap.duration_seconds for gap in self.__gaps)
+        if self.__gap_started_at is not None:
+            gap_seconds += time.monotonic() - self.__gap_started_at
+        return self.__closed_wall_clock_seconds + gap_seconds
+
+    def __session_time_is_over(self) -> bool:
+        if self.__continuous:
+            return False
+        return self.__elapsed_session_seconds() >= self.__segment_duration.value
+
+    def __open_session_part(self) -> None:
+        assert self.__in_stream is not None
+        # La parte nueva solo cubre lo que resta de la sesión
+        remaining_seconds = self.__segment_duration.value - self.__elapsed_session_seconds()
+        self.__segment_ticks = self.__clock.ticks_for_seconds(max(1, math.ceil(remaining_seconds)))
+        first_path = Path(self.__part_paths[0])
+        part_path = first_path.with_name(
+            f"{first_path.stem}__part{len(self.__part_paths) + 1}{first_path.suffix}"
+        )
+        self.__writer = self.__create_writer(OutputPath(str(part_path)))
+
+    def __close_session_part(self) -> None:
+        writer, self.__writer = self.__writer, None
+        if writer is None:
+            return
+        writer.close()
+        self.__part_paths.append(writer.output_path.value)
+        self.__part_hashes.append(writer.content_hash)
+        self.__closed_media_seconds += self.__clock.media_seconds()
+        self.__closed_wall_clock_seconds += self.__clock.wall_clock_seconds()
+
+    def __notify_session(self) -> None:
+        if not self.__part_paths:
+            return
+        result = RecordingResult(
+            output_path=self.__part_paths[0],
+            media_duration_seconds=self.__closed_media_seconds,
+            wall_clock_duration_seconds=self.__closed_wall_clock_seconds,
+            part_paths=tuple(self.__part_paths[1:]),
+            gaps=tuple(self.__gaps),
+            content_hashes=self.__content_hashes(self.__part_hashes),
+        )
+        if result.gaps:
+            self.__logger.warn(
+                f"Sesión {result.output_path} grabada en {len(result.all_paths)} partes, "
+                f"{result.gap_seconds:.1f}s sin grabar"
+            )
+        if self.__on_segment_finished:
+            self.__on_segment_finished(result)
+
+    def __process(self, packet: av.Packet) -> bool:
+        dts = packet.dts
+        # We need to skip the "flushing" packets that `demux` generates.
+        if dts is None:
+            return True
+        size = packet.size
+        metrics = self.__metrics
+        stream_index = packet.stream_index
+        if stream_index != self.__video_index:
+            if metrics is not None:
+                metrics.observe_other_packet(stream_index, size)
+            if stream_index in self.__secondary_indexes:
+                self.__process_secondary_packet(packet)
+            return True
+        if metrics is not None and packet.is_keyframe:
+            metrics.observe_keyframe(dts)
+        if self.__keyframe_consumer is not None and packet.is_keyframe:
+            self.__consume_keyframe(packet)
+        self.__packets_processed += 1
+        self.__bytes_processed += size
+        self.__last_packet_at = time.monotonic()
+        if self.__continuous:
+            self.__process_continuous_packet(packet, dts)
+            return True
+        return self.__process_session_packet(packet, dts)
+
+    def __consume_keyframe(self, packet: av.Packet) -> None:
+        assert self.__keyframe_consumer is not None
+        assert self.__in_stream is not None
+        codec_context = self.__in_stream.codec_context
+        # Se decodifica antes de remuxar: el writer reasigna el stream del paquete. Cada
+        # keyframe se decodifica aislado, vaciando el decodificador para no esperar a que el
+        # reordenamiento de frames B lo entregue varios GOP después
+        try:
+            frames = codec_context.decode(packet) + codec_context.decode(None)
+            codec_context.flush_buffers()
+            for frame in frames:
+                self.__keyframe_consumer.consume(self.display_source, frame)
+        except Exception as e:
+            # Un keyframe que no se puede analizar no afecta a la grabación
+            self.__logger.debug(f"No se pudo analizar un keyframe de {self.display_source}: {e}")
+
+    def __process_secondary_packet(self, packet: av.Packet) -> None:
+        # Se escriben en el segmento del video principal; el writer descarta los anteriores a él
+        if self.__writer is not None:
+            self.__writer.write(packet)
+        elif self.__continuous:
+            assert self.__gop_buffer is not None
+            self.__gop_buffer.push(packet, is_video=False)
+
+    def __process_session_packet(self, packet: av.Packet, dts: int) -> bool:
+        assert self.__writer is not None
+        # La grabación comienza en un keyframe para evitar frames grises al inicio
+        if self.__writer.is_empty and not packet.is_keyframe:
+            return True
+        if self.__clock.update(dts) >= self.__segment_ticks:
+            return False
+        self.__write(self.__writer, packet)
+        return True
+
+    def __process_continuous_packet(self, packet: av.Packet, dts: int) -> None:
+        assert self.__gop_buffer is not None
+        elapsed_ticks = self.__clock.update(dts)
+        if self.__writer is not None:
+            if not self.__should_close_segment(packet, elapsed_ticks):
+                self.__write(self.__writer, packet)
+                return
+            writer, self.__writer = self.__writer, None
+            self.__close_segment(writer)
+        if self.__is_motion_active is not None and not self.__is_motion_active():
+            # Sin movimiento solo se acumula el pre-roll del próximo segmento
+            self.__gop_buffer.push(packet)
+            return
+        # El segmento arranca en un keyframe: el del paquete o el más viejo del pre-roll
+        if not packet.is_keyframe and not self.__gop_buffer.has_complete_gop():
+            return
+        self.__writer = self.__open_segment()
+        self.__clock.restart()
+        self.__write(self.__writer, packet)
+
+    def __should_close_segment(self, packet: av.Packet, elapsed_ticks: int) -> bool:
+        # Solo se corta en un keyframe, para no repetir paquetes ya escritos en el segmento
+        if not packet.is_keyframe:
+            return False
+        if elapsed_ticks >= self.__segment_ticks:
+            return True
+        return self.__is_motion_active is not None and not self.__is_motion_active()
+
+    def __open_segment(self) -> PyAvSegmentWriter:
+        assert self.__gop_buffer is not None
+        writer = self.__create_writer(self.__output_path_factory())
+        # El buffer solo guarda paquetes que no se grabaron: el pre-roll del segmento
+        for buffered_packet in self.__gop_buffer.replay():
+            writer.write(buffered_packet)
+        self.__gop_buffer.clear()
+        return writer
+
+    def __write(self, writer: PyAvSegmentWriter, packet: av.Packet) -> None:
+        if not self.__time_next_mux:
+            writer.write(packet)
+            return
+        # Solo se mide el primer paquete de cada turno
+        self.__time_next_mux = False
+        started_at = time.perf_counter_ns()
+        writer.write(packet)
+        assert self.__metrics is not None
+        self.__metrics.observe_mux(time.perf_counter_ns() - started_at)
+
+    def __close_segment(self, writer: Optional[PyAvSegmentWriter]) -> None:
+        if writer is None:
+            return
+        writer.close()
+        # Los cortes previos al segmento se informan con el primer segmento que se cierra
+        gaps, self.__gaps = tuple(self.__gaps), []
+        result = RecordingResult(
+            output_path=writer.output_path.value,
+            media_duration_seconds=self.__clock.media_seconds(),
+            wall_clock_duration_seconds=self.__clock.wall_clock_seconds(),
+            gaps=gaps,
+            content_hashes=self.__content_hashes([writer.content_hash]),
+        )
+        self.__logger.debug(
+            f"Segmento cerrado: {result.output_path} (drift {result.clock_drift_seconds:.3f}s)"
+        )
+        if self.__on_segment_finished:
+            self.__on_segment_finished(result)
+
+    def __content_hashes(self, hashes: List[Optional[str]]) -> Tuple[str, ...]:
+        # Se informan solo si se conocen los de todos los archivos, para que sigan alineados
+        known = tuple(content_hash for content_hash in hashes if content_hash is not None)
+        return known if len(known) == len(hashes) else ()
+
+    def __log_recording_error(self, error: Exception) -> None:
+        if isinstance(error, HTTPBadRequestError):
+            self.__logger.error(f"Error de autenticación: {error}")
+        elif isinstance(error, HTTPNotFoundError):
+            self.__logger.error(f"Stream no encontrado: {error}")
+        else:
+            self.__logger.error(f"Error durante la grabación: {error}")
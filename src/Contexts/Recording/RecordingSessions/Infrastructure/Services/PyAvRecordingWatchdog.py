@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.RecordingHealthMonitor import (
+    RecordingHealthMonitor,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingHealth import (
+    RecordingHealth,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+# (instante, paquetes procesados, bytes procesados)
+_Sample = Tuple[float, int, int]
+
+
+class PyAvRecordingWatchdog(RecordingHealthMonitor):
+    """
+    Supervisa las grabaciones activas desde un thread propio. Cada `check_interval_seconds`
+    registra el último paquete de video y las tasas de paquetes y bytes por segundo (sobre
+    los últimos `rate_window_seconds`) de cada job.
+
+    Una grabación sin paquetes de video durante `stall_timeout_seconds` se marca como trabada
+    y se le pide reiniciar la conexión. El último paquete se actualiza con cada frame, no con
+    cada keyframe, por lo que el umbral solo debe superar el intervalo entre frames y su
+    jitter: el valor por defecto (0.5 s) sirve para cámaras de 4 fps o más. El reinicio se
+    atiende en el próximo paquete leído; si el demux está bloqueado esperando datos, lo
+    interrumpe el timeout de lectura, que PyAvVideoRecorder iguala por defecto a este umbral.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerInterface,
+        stall_timeout_seconds: float = 0.5,
+        check_interval_seconds: float = 0.1,
+        rate_window_seconds: float = 5.0,
+    ):
+        self.__ensure_positive("stall_timeout_seconds", stall_timeout_seconds)
+        self.__ensure_positive("check_interval_seconds", check_interval_seconds)
+        self.__ensure_positive("rate_window_seconds", rate_window_seconds)
+        self.__logger = logger
+        self.__stall_timeout_seconds = stall_timeout_seconds
+        self.__check_interval_seconds = check_interval_seconds
+        self.__rate_window_seconds = rate_window_seconds
+        self.__jobs: Dict[int, PyAvRecordingJob] = {}
+        self.__samples: Dict[int, Deque[_Sample]] = {}
+        self.__health: Dict[int, RecordingHealth] = {}
+        self.__lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __ensure_positive(self, name: str, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del watchdog debe ser mayor a 0")
+
+    @property
+    def stall_timeout_seconds(self) -> float:
+        return self.__stall_timeout_seconds
+
+    def watch(self, job: PyAvRecordingJob) -> None:
+        """Empieza a supervisar una grabación; se deja de supervisar cuando termina"""
+        self.start()
+        with self.__lock:
+            self.__jobs[id(job)] = job
+            self.__samples[id(job)] = deque()
+
+    def start(self) -> None:
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__stopped.clear()
+            self.__thread = threading.Thread(
+                target=self.__run, name="pyav-recording-watchdog", daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self) -> None:
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        self.__stopped.set()
+        if thread is not None:
+            thread.join()
+
+    def health(self) -> List[RecordingHealth]:
+        with self.__lock:
+            return list(self.__health.values())
+
+    def __run(self) -> None:
+        while not self.__stopped.wait(self.__check_interval_seconds):
+            try:
+                self.__check()
+            except Exception as e:
+                self.__logger.error(f"Error en el watchdog de grabaciones: {e}")
+
+    def __check(self) -> None:
+        now = time.monotonic()
+        with self.__lock:
+            jobs = list(self.__jobs.items())
+        health: Dict[int, RecordingHealth] = {}
+        for key, job in jobs:
+            if job.is_finished:
+                self.__forget(key)
+                continue
+            health[key] = self.__inspect(key, job, now)
+        with self.__lock:
+            self.__health = health
+
+    def __forget(self, key: int) -> None:
+        with self.__lock:
+            self.__jobs.pop(key, None)
+            self.__samples.pop(key, None)
+
+    def __inspect(self, key: int, job: PyAvRecordingJob, now: float) -> RecordingHealth:
+        samples = self.__samples[key]
+        samples.append((now, job.packets_processed, job.bytes_processed))
+        while now - samples[0][0] > self.__rate_window_seconds:
+            samples.popleft()
+        last_packet_age_seconds = now - job.last_packet_at
+        is_reconnecting = job.is_reconnecting
+        is_stalled = not is_reconnecting and last_packet_age_seconds >= self.__stall_timeout_seconds
+        # Solo se avisa al detectar el corte; el job atiende el pedido al recuperar el control
+        if is_stalled and not self.__was_stalled(key):
+            self.__logger.warn(
+                f"Grabación de {job.display_source} sin paquetes hace "
+                f"{last_packet_age_seconds:.1f}s, reiniciando"
+            )
+            job.request_restart(f"Sin paquetes de video hace {last_packet_age_seconds:.1f}s")
+        packets_per_second, bytes_per_second = self.__rates(samples)
+        return RecordingHealth(
+            source=job.display_source,
+            last_packet_age_seconds=last_packet_age_seconds,
+            packets_per_second=packets_per_second,
+            bytes_per_second=bytes_per_second,
+            is_stalled=is_stalled,
+            is_reconnecting=is_reconnecting,
+            restarts=job.restarts,
+        )
+
+    def __was_stalled(self, key: int) -> bool:
+        with self.__lock:
+            previous = self.__health.get(key)
+        return previous is not None and previous.is_stalled
+
+    def __rates(self, samples: Deque[_Sample]) -> Tuple[float, float]:
+        (first_at, first_packets, first_bytes), (last_at, last_packets, last_bytes) = (
+            samples[0],
+            samples[-1],
+        )
+        elapsed = last_at - first_at
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return (last_packets - first_packets) / elapsed, (last_bytes - first_bytes) / elapsed
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Dict, Optional, Sequence, Tuple
+
+import av
+from av.container.output import OutputContainer
+from av.stream import Stream
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.HashingOutputFile import (
+    HashingOutputFile,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SeekIndexWriter import (
+    SeekIndexWriter,
+)
+
+
+class PyAvSegmentWriter:
+    """
+    Escribe un segmento remuxando paquetes (sin decodificar) en un contenedor de salida.
+
+    El primer stream de `in_streams` es el de referencia (el video principal): el segmento
+    comienza con su primer paquete y los timestamps de todos los streams se desplazan para que
+    ese instante sea el cero, convirtiendo el origen al time base de cada stream. Los paquetes
+    de los demás streams anteriores al origen se descartan. El muxer intercala los paquetes de
+    los distintos streams según su DTS.
+
+    Los streams con códecs que el contenedor de salida no soporta (por ejemplo audio G.711 en
+    Matroska) no se graban; se informan en `dropped_codecs`.
+
+    Con `write_seek_index` cada paquete del stream de referencia se registra en el sidecar
+    SeekIndex del segmento a medida que se escribe (ver SeekIndexWriter).
+
+    Con `compute_content_hash` el contenedor escribe a través de un HashingOutputFile, que
+    calcula el hash del archivo con los bytes que produce el muxer; queda en `content_hash`
+    al cerrar el segmento, sin volver a leerlo del disco.
+    """
+
+    def __init__(
+        self,
+        output_path: OutputPath,
+        in_streams: Sequence[Stream],
+        write_seek_index: bool = True,
+        compute_content_hash: bool = True,
+    ):
+        self.__output_path = output_path
+        self.__output_file: Optional[HashingOutputFile] = None
+        if compute_content_hash:
+            self.__output_file = HashingOutputFile(output_path.value)
+            self.__output: OutputContainer = av.open(self.__output_file, mode="w")
+        else:
+            self.__output = av.open(output_path.value, mode="w")
+        self.__reference_index = in_streams[0].index
+        self.__out_streams: Dict[int, Stream] = {}
+        dropped_codecs = []
+        for in_stream in in_streams:
+            if in_stream is in_streams[0] or self.__supports(in_stream):
+                self.__out_streams[in_stream.index] = self.__output.add_stream_from_template(
+                    in_stream
+                )
+            else:
+                dropped_codecs.append(in_stream.codec_context.name)
+        self.__dropped_codecs = tuple(dropped_codecs)
+        self.__origin_seconds: Optional[Fraction] = None
+        self.__timestamp_offsets: Dict[int, int] = {}
+        self.__seek_index: Optional[SeekIndexWriter] = None
+        if write_seek_index:
+            time_base = in_streams[0].time_base
+            assert time_base is not None
+            self.__seek_index = SeekIndexWriter(output_path.value, time_base)
+
+    def __supports(self, in_stream: Stream) -> bool:
+        return in_stream.codec_context.name in self.__output.supported_codecs
+
+    @property
+    def output_path(self) -> OutputPath:
+        return self.__output_path
+
+    @property
+    def dropped_codecs(self) -> Tuple[str, ...]:
+        """Códecs de los streams seleccionados que no se graban por no ser soportados"""
+        return self.__dropped_codecs
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """Hash del contenido del segmento (ver ChunkedContentHasher), una vez cerrado"""
+        if self.__output_file is None:
+            return None
+        return self.__output_file.content_hash
+
+    @property
+    def is_empty(self) -> bool:
+        """Indica si todavía no se escribió ningún paquete en el segmento"""
+        return self.__origin_seconds is None
+
+    def write(self, packet: av.Packet) -> None:
+        """
+        Remuxa un paquete de la entrada en el segmento. Los paquetes de streams no
+        seleccionados se ignoran.
+
+        Args:
+            packet: Paquete demuxado, con timestamps en el time base de su stream de entrada
+        """
+        # We need to skip the "flushing" packets that `demux` generates.
+        dts = packet.dts
+        if dts is None:
+            return
+        stream_index = packet.stream_index
+        out_stream = self.__out_streams.get(stream_index)
+        if out_stream is None:
+            return
+        offset = self.__timestamp_offsets.get(stream_index)
+        if offset is None:
+            offset = self.__start_stream(stream_index, packet, dts)
+            if offset is None:
+                return
+        if dts < offset:
+            return
+        packet.dts = dts - offset
+        if packet.pts is not None:
+            packet.pts -= offset
+        if self.__seek_index is not None and stream_index == self.__reference_index:
+            pts = packet.pts if packet.pts is not None else packet.dts
+            self.__seek_index.add(pts, packet.is_keyframe)
+        packet.stream = out_stream
+        self.__output.mux(packet)
+
+    def __start_stream(self, stream_index: int, packet: av.Packet, dts: int) -> Optional[int]:
+        if stream_index == self.__reference_index:
+            # El offset del stream de referencia es exacto: su primer DTS
+            self.__origin_seconds = dts * packet.time_base
+            offset = dts
+        elif self.__origin_seconds is None:
+            return None
+        else:
+            offset = round(self.__origin_seconds / packet.time_base)
+        self.__timestamp_offsets[stream_index] = offset
+        return offset
+
+    def close(self) -> None:
+        self.__output.close()
+        if self.__output_file is not None:
+            self.__output_file.close()
+        if self.__seek_index is not None:
+            self.__seek_index.close()
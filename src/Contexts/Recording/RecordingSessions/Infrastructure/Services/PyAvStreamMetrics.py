@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from fractions import Fraction
+from typing import Dict, List, Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+
+
+class PyAvStreamMetrics:
+    """
+    Instrumentación del loop de paquetes de una grabación. Solo escribe el thread que avanza
+    el job, por lo que no usa locks: `snapshot` puede leerse desde otro thread y a lo sumo
+    mezcla contadores de paquetes consecutivos.
+
+    Para mantener el sobrecosto por debajo del 1% (ver scripts/benchmark_stream_metrics.py)
+    el job no la invoca por cada paquete de video: los saltos de DTS se estiman una vez por
+    turno comparando el avance del DTS con los paquetes recibidos, el desorden lo cuenta
+    PyAvMediaClock y la latencia de `mux` se mide en el primer paquete de cada turno. Los
+    paquetes y bytes de video los cuenta el propio job y se pasan a `snapshot`.
+    """
+
+    MUX_LATENCY_BUCKETS_SECONDS = (
+        0.00001,
+        0.000025,
+        0.00005,
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+    )
+
+    def __init__(self, source: str):
+        self.__source = source
+        self.__other_packets: Dict[int, int] = {}
+        self.__other_bytes: Dict[int, int] = {}
+        self.__keyframes = 0
+        self.__keyframe_intervals = 0
+        self.__keyframe_interval_seconds_sum = 0.0
+        self.__dts_gap_frames = 0
+        self.__out_of_order_packets = 0
+        self.__seconds_per_tick: Optional[float] = None
+        self.__frame_ticks: Optional[float] = None
+        self.__last_keyframe_dts: Optional[int] = None
+        self.__mux_bounds_ns = [int(bound * 1e9) for bound in self.MUX_LATENCY_BUCKETS_SECONDS]
+        self.__mux_buckets: List[int] = [0] * (len(self.__mux_bounds_ns) + 1)
+        self.__mux_sum_ns = 0
+
+    def reset_stream(self, time_base: Optional[Fraction], frame_rate: Optional[Fraction]):
+        """Se invoca en cada conexión: los timestamps de una conexión nueva no son comparables"""
+        # Se convierte una vez: la aritmética con Fraction es costosa para el loop de paquetes
+        self.__seconds_per_tick = float(time_base) if time_base else None
+        self.__frame_ticks = (
+            float(1 / (time_base * frame_rate)) if time_base and frame_rate else None
+        )
+        self.__last_keyframe_dts = None
+
+    def observe_other_packet(self, stream_index: int, size: int) -> None:
+        """Cuenta un paquete de un stream que no es el de video grabado"""
+        self.__other_packets[stream_index] = self.__other_packets.get(stream_index, 0) + 1
+        self.__other_bytes[stream_index] = self.__other_bytes.get(stream_index, 0) + size
+
+    def observe_keyframe(self, dts: int) -> None:
+        self.__keyframes += 1
+        if self.__last_keyframe_dts is not None and self.__seconds_per_tick is not None:
+            self.__keyframe_intervals += 1
+            self.__keyframe_interval_seconds_sum += (
+                dts - self.__last_keyframe_dts
+            ) * self.__seconds_per_tick
+        self.__last_keyframe_dts = dts
+
+    def observe_turn(self, packets: int, dts_advance_ticks: int, out_of_order: int) -> None:
+        """
+        Registra un turno del job: paquetes de video recibidos y avance del DTS desde el último
+        paquete del turno anterior. Si el DTS avanzó más frames de los recibidos, la diferencia
+        se cuenta como frames faltantes (estimada con el frame rate declarado por el stream).
+        """
+        self.__out_of_order_packets += out_of_order
+        if self.__frame_ticks is None or packets <= 0:
+            return
+        missing_frames = round(dts_advance_ticks / self.__frame_ticks) - packets
+        if missing_frames > 0:
+            self.__dts_gap_frames += missing_frames
+
+    def observe_mux(self, nanoseconds: int) -> None:
+        self.__mux_buckets[bisect_left(self.__mux_bounds_ns, nanoseconds)] += 1
+        self.__mux_sum_ns += nanoseconds
+
+    def snapshot(self, video_index: int, video_packets: int, video_bytes: int) -> StreamMetrics:
+        packets = dict(self.__other_packets)
+        packets[video_index] = video_packets
+        sizes = dict(self.__other_bytes)
+        sizes[video_index] = video_bytes
+        buckets = list(self.__mux_buckets)
+        return StreamMetrics(
+            source=self.__source,
+            packets_per_stream=tuple(sorted(packets.items())),
+            bytes_per_stream=tuple(sorted(sizes.items())),
+            keyframes=self.__keyframes,
+            mean_keyframe_interval_seconds=(
+                self.__keyframe_interval_seconds_sum / self.__keyframe_intervals
+                if self.__keyframe_intervals
+                else 0.0
+            ),
+            dts_gap_frames=self.__dts_gap_frames,
+            out_of_order_packets=self.__out_of_order_packets,
+            mux_latency_buckets=tuple(zip(self.MUX_LATENCY_BUCKETS_SECONDS + (math.inf,), buckets)),
+            mux_latency_sum_seconds=self.__mux_sum_ns / 1e9,
+            mux_latency_count=sum(buckets),
+        )
@@ -1,45 +1,206 @@
 from __future__ import annotations
 
-import time
-from datetime import datetime
-from pathlib import Path
-from typing import Callable, Optional
-import av.logging
+import threading
+import weakref
+from typing import Callable, Optional, Tuple
 from typing_extensions import override
 
-import av
-from av.container.output import OutputContainer
 from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
     RecordingSessionDuration,
 )
 from src.Contexts.Recording.RecordingSessions.Domain.Contracts.VideoRecorder import VideoRecorder
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ConnectionTimeout import (
+    ConnectionTimeout,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.MotionTrigger import (
+    MotionTrigger,
+)
 from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingResult import (
+    RecordingResult,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamSelection import (
+    StreamSelection,
+)
 from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.Uri import Uri
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvAnalysisJob import (
+    PyAvAnalysisJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMotionDetector import (
+    PyAvMotionDetector,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingEngine import (
+    PyAvRecordingEngine,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingWatchdog import (
+    PyAvRecordingWatchdog,
+)
 from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
 
 
 class PyAvVideoRecorder(VideoRecorder):
+    """
+    Graba cámaras RTSP remuxando paquetes con PyAV.
+    Sin `engine` cada grabación bloquea el thread que la invoca; con un `PyAvRecordingEngine`
+    la conexión se abre en el thread que invoca y el demux continúa en el pool del motor. Con
+    `wait_for_recordings` el thread que invoca espera igual a que la grabación termine, para
+    que la tarea que la ejecuta dure lo mismo que ella (ver PyAvVideoRecorderFactory).
+    Todos los streams seleccionados (audio, pistas secundarias) se remuxan desde la misma
+    conexión RTSP. Ante cortes, cada grabación reconecta según `backoff` (ver PyAvRecordingJob).
+    Una lectura sin datos se interrumpe tras `read_timeout_seconds` y la grabación reconecta.
+    Con un `watchdog` las grabaciones además se supervisan y las que no reciben video durante
+    su `stall_timeout_seconds` se reinician; por defecto la lectura se interrumpe tras ese
+    mismo umbral, para que el reinicio no espere a que el demux bloqueado devuelva el
+    control. Sin watchdog, el timeout de lectura por defecto es el de conexión.
 
-    def __init__(self, logger: LoggerInterface):
-        self.__logger = logger
+    Si la grabación tiene una URI de análisis y hay un `frame_consumer`, el sub-stream se
+    decodifica en un PyAvAnalysisJob mientras dure la grabación: solo se decodifica el stream
+    de baja resolución y el principal se graba por remux. Un error en el stream de análisis
+    no detiene la grabación: el análisis reconecta con el mismo `backoff` mientras ella dure,
+    también si el sub-stream no se pudo abrir o se cerró.
 
-    def __get_input_options(self):
-        timeout_microseconds = 30 * 1000000  # TODO: read from env
-        return {"rtsp_transport": "tcp", "timeout": str(timeout_microseconds)}
+    La grabación por movimiento decodifica el sub-stream en un PyAvMotionDetector propio de la
+    cámara, independiente de `frame_consumer`, y graba solo mientras hubo movimiento dentro del
+    post-roll. Sin sub-stream, el detector analiza los keyframes que ya lee la grabación, sin
+    abrir otra conexión al stream principal.
+    """
 
-    def __handle_packet(
-        self, packet: av.Packet, out_stream: av.VideoStream, output: OutputContainer
+    def __init__(
+        self,
+        logger: LoggerInterface,
+        gop_buffer_max_bytes: int = 16 * 1024 * 1024,
+        engine: Optional[PyAvRecordingEngine] = None,
+        backoff: Optional[ExponentialBackoff] = None,
+        default_connection_timeout: ConnectionTimeout = ConnectionTimeout(
+            ConnectionTimeout.DEFAULT_SECONDS
+        ),
+        watchdog: Optional[PyAvRecordingWatchdog] = None,
+        frame_consumer: Optional[PyAvFrameConsumer] = None,
+        wait_for_recordings: bool = False,
+        read_timeout_seconds: Optional[float] = None,
     ):
-        # We need to skip the "flushing" packets that `demux` generates.
-        if packet.dts is None:
+        self.__logger = logger
+        self.__gop_buffer_max_bytes = gop_buffer_max_bytes
+        self.__engine = engine
+        self.__backoff = backoff or ExponentialBackoff()
+        self.__default_connection_timeout = default_connection_timeout
+        self.__watchdog = watchdog
+        self.__frame_consumer = frame_consumer
+        self.__wait_for_recordings = wait_for_recordings
+        self.__read_timeout_seconds = read_timeout_seconds
+        self.__jobs: weakref.WeakSet[PyAvRecordingJob] = weakref.WeakSet()
+
+    def __get_input_options(self, connection_timeout: ConnectionTimeout):
+        return {"rtsp_transport": "tcp", "timeout": str(connection_timeout.microseconds)}
+
+    def __get_timeout(self, connection_timeout: ConnectionTimeout) -> Tuple[float, float]:
+        # (apertura, lectura): la lectura se interrumpe si la cámara deja de enviar datos
+        if self.__read_timeout_seconds is not None:
+            return connection_timeout.value, self.__read_timeout_seconds
+        if self.__watchdog is not None:
+            return connection_timeout.value, self.__watchdog.stall_timeout_seconds
+        return connection_timeout.value, connection_timeout.value
+
+    def __create_job(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]],
+        continuous: bool,
+        connection_timeout: Optional[ConnectionTimeout],
+        stream_selection: Optional[StreamSelection],
+        is_motion_active: Optional[Callable[[], bool]] = None,
+        pre_roll_seconds: float = 0,
+        keyframe_consumer: Optional[PyAvFrameConsumer] = None,
+    ) -> PyAvRecordingJob:
+        connection_timeout = connection_timeout or self.__default_connection_timeout
+        return PyAvRecordingJob(
+            source=uri.value,
+            segment_duration=segment_duration,
+            output_path_factory=output_path_factory,
+            on_segment_finished=on_segment_finished,
+            logger=self.__logger,
+            continuous=continuous,
+            input_format="rtsp",
+            input_options=self.__get_input_options(connection_timeout),
+            gop_buffer_max_bytes=self.__gop_buffer_max_bytes,
+            backoff=self.__backoff,
+            timeout=self.__get_timeout(connection_timeout),
+            stream_selection=stream_selection,
+            is_motion_active=is_motion_active,
+            pre_roll_seconds=pre_roll_seconds,
+            keyframe_consumer=keyframe_consumer,
+        )
+
+    def __create_analysis_job(
+        self,
+        analysis_uri: Optional[Uri],
+        recording_job: PyAvRecordingJob,
+        connection_timeout: Optional[ConnectionTimeout],
+        consumer: Optional[PyAvFrameConsumer] = None,
+    ) -> Optional[PyAvAnalysisJob]:
+        consumer = consumer or self.__frame_consumer
+        if analysis_uri is None or consumer is None:
+            return None
+        connection_timeout = connection_timeout or self.__default_connection_timeout
+        return PyAvAnalysisJob(
+            source=analysis_uri.value,
+            consumer=consumer,
+            logger=self.__logger,
+            stop_when=lambda: recording_job.is_finished,
+            input_format="rtsp",
+            input_options=self.__get_input_options(connection_timeout),
+            backoff=self.__backoff,
+            timeout=self.__get_timeout(connection_timeout),
+        )
+
+    def stop_all(self) -> None:
+        """
+        Pide finalizar todas las grabaciones en curso, que cierran y notifican su segmento en
+        el próximo turno (por ejemplo al detener el proceso, ver AsyncioTaskRunner)
+        """
+        for job in list(self.__jobs):
+            job.request_stop()
+
+    def __execute(self, job: PyAvRecordingJob, analysis_job: Optional[PyAvAnalysisJob]) -> None:
+        self.__jobs.add(job)
+        job.open()
+        self.__watch(job)
+        self.__start_analysis(analysis_job)
+        if self.__engine is None:
+            job.run()
+            return
+        self.__engine.submit(job)
+        if self.__wait_for_recordings:
+            job.wait_until_finished()
+
+    def __start_analysis(self, analysis_job: Optional[PyAvAnalysisJob]) -> None:
+        if analysis_job is None:
+            return
+        # Si no se puede abrir, el job ya registró el error y queda esperando para reconectar
+        analysis_job.open()
+        if self.__engine is not None:
+            self.__engine.submit(analysis_job)
             return
-        packet.stream = out_stream
-        output.mux(packet)
+        threading.Thread(
+            target=analysis_job.run,
+            name=f"pyav-analysis-{analysis_job.display_source}",
+            daemon=True,
+        ).start()
 
-    def __duration_reached(self, dts: int | None, recording_seconds: int):
-        if dts is None:
-            return False
-        return int(dts / 1000) >= recording_seconds
+    def __watch(self, job: PyAvRecordingJob) -> None:
+        if self.__watchdog is not None:
+            self.__watchdog.watch(job)
 
     @override
     def record(
@@ -47,31 +208,74 @@ class PyAvVideoRecorder(VideoRecorder):
         uri: Uri,
         output_path: OutputPath,
         duration_seconds: RecordingSessionDuration,
-        on_finished: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[RecordingResult], None]] = None,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
     ):
-        input = av.open(uri.value, format="rtsp", options=self.__get_input_options())
-        output = av.open(output_path.value, mode="w")
-        try:
-            in_stream = input.streams.video[0]
-            out_stream: av.VideoStream = output.add_stream_from_template(in_stream)
-            for packet in input.demux(in_stream):
-                self.__handle_packet(packet, out_stream, output)
-                if self.__duration_reached(packet.dts, duration_seconds.value):
-                    break
-
-        except av.HTTPBadRequestError as e:
-            self.__logger.error(f"Error de autenticación: {e}")
-            raise e
-        except av.HTTPNotFoundError as e:
-            self.__logger.error(f"Stream no encontrado: {e}")
-            raise e
-        except Exception as e:
-            self.__logger.error(f"Error durante la grabación: {e}")
-            raise e
-        finally:
-            input.close()
-            output.close()
-
-        # Notificar que la grabación terminó
-        if on_finished:
-            on_finished(output_path.value)
+        job = self.__create_job(
+            uri,
+            duration_seconds,
+            lambda: output_path,
+            on_finished,
+            continuous=False,
+            connection_timeout=connection_timeout,
+            stream_selection=stream_selection,
+        )
+        self.__execute(job, self.__create_analysis_job(analysis_uri, job, connection_timeout))
+
+    @override
+    def record_continuous(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]] = None,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+    ) -> None:
+        job = self.__create_job(
+            uri,
+            segment_duration,
+            output_path_factory,
+            on_segment_finished,
+            continuous=True,
+            connection_timeout=connection_timeout,
+            stream_selection=stream_selection,
+        )
+        self.__execute(job, self.__create_analysis_job(analysis_uri, job, connection_timeout))
+
+    @override
+    def record_on_motion(
+        self,
+        uri: Uri,
+        segment_duration: RecordingSessionDuration,
+        output_path_factory: Callable[[], OutputPath],
+        on_segment_finished: Optional[Callable[[RecordingResult], None]],
+        motion_trigger: MotionTrigger,
+        connection_timeout: Optional[ConnectionTimeout] = None,
+        stream_selection: Optional[StreamSelection] = None,
+        analysis_uri: Optional[Uri] = None,
+    ) -> None:
+        detector = PyAvMotionDetector(
+            min_changed_fraction=motion_trigger.min_changed_fraction,
+            keyframes_only=analysis_uri is None,
+        )
+        post_roll_seconds = motion_trigger.post_roll_seconds
+        job = self.__create_job(
+            uri,
+            segment_duration,
+            output_path_factory,
+            on_segment_finished,
+            continuous=True,
+            connection_timeout=connection_timeout,
+            stream_selection=stream_selection,
+            is_motion_active=lambda: detector.seconds_since_motion() <= post_roll_seconds,
+            pre_roll_seconds=motion_trigger.pre_roll_seconds,
+            keyframe_consumer=detector if analysis_uri is None else None,
+        )
+        analysis_job = self.__create_analysis_job(
+            analysis_uri, job, connection_timeout, consumer=detector
+        )
+        self.__execute(job, analysis_job)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from typing_extensions import override
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.VideoRecorder import VideoRecorder
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.VideoRecorderFactory import (
+    VideoRecorderFactory,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ConnectionTimeout import (
+    ConnectionTimeout,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingEngine import (
+    PyAvRecordingEngine,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingWatchdog import (
+    PyAvRecordingWatchdog,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvVideoRecorder import (
+    PyAvVideoRecorder,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.AsyncioTaskRunner import AsyncioTaskRunner
+from src.Contexts.SharedKernel.Infrastructure.Services.ConsoleLogger import ConsoleLogger
+
+# Un grabador (con su motor y su watchdog) por proceso y por configuración
+_recorders: Dict[Tuple[int, PyAvVideoRecorderFactory], PyAvVideoRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PyAvVideoRecorderFactory(VideoRecorderFactory):
+    """
+    Configuración serializable de un PyAvVideoRecorder. Se envía con cada tarea de grabación
+    en lugar del grabador, que no se puede serializar (threads del motor y del watchdog), y
+    en cada proceso se construye un único grabador por configuración que comparten todas sus
+    grabaciones.
+
+    Con `engine_workers` las grabaciones del proceso se multiplexan en un PyAvRecordingEngine
+    de ese tamaño (0 usa un worker por core); sin él, cada grabación ocupa su thread. Con
+    `stall_timeout_seconds` se supervisan con un PyAvRecordingWatchdog; `read_timeout_seconds`
+    acota cada lectura del demux (por defecto, el umbral del watchdog o, sin él, el timeout
+    de conexión). Con o sin motor, cada
+    grabación bloquea a quien la inicia hasta terminar, para que la tarea dure lo mismo que la
+    grabación y el TaskManager pueda reiniciarla si el proceso muere. Si el proceso tiene un
+    AsyncioTaskRunner, el grabador registra `stop_all` como hook de su shutdown, para que las
+    grabaciones cierren su segmento antes de que el runner deje de esperarlas.
+    """
+
+    engine_workers: Optional[int] = None
+    stall_timeout_seconds: Optional[float] = None
+    read_timeout_seconds: Optional[float] = None
+    connection_timeout_seconds: int = ConnectionTimeout.DEFAULT_SECONDS
+    gop_buffer_max_bytes: int = 16 * 1024 * 1024
+
+    @override
+    def create(self) -> VideoRecorder:
+        # El pid forma parte de la clave: un proceso creado con fork no hereda threads vivos
+        key = (os.getpid(), self)
+        with _recorders_lock:
+            if key not in _recorders:
+                _recorders[key] = self.__build()
+                runner = AsyncioTaskRunner.of_current_process()
+                if runner is not None:
+                    runner.add_shutdown_hook(_recorders[key].stop_all)
+            return _recorders[key]
+
+    def __build(self) -> PyAvVideoRecorder:
+        logger = ConsoleLogger()
+        engine = None
+        if self.engine_workers is not None:
+            engine = PyAvRecordingEngine(logger, workers=self.engine_workers or None)
+        watchdog = None
+        if self.stall_timeout_seconds is not None:
+            watchdog = PyAvRecordingWatchdog(
+                logger, stall_timeout_seconds=self.stall_timeout_seconds
+            )
+        return PyAvVideoRecorder(
+            logger,
+            gop_buffer_max_bytes=self.gop_buffer_max_bytes,
+            engine=engine,
+            default_connection_timeout=ConnectionTimeout(self.connection_timeout_seconds),
+            watchdog=watchdog,
+            wait_for_recordings=True,
+            read_timeout_seconds=self.read_timeout_seconds,
+        )
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import struct
+from fractions import Fraction
+from typing import Optional
+
+import numpy as np
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.SeekIndexEntry import (
+    SeekIndexEntry,
+)
+
+
+class SeekIndex:
+    """
+    Índice de búsqueda de una grabación, leído de su archivo sidecar (`<video>.idx`), que
+    SeekIndexWriter escribe mientras se graba.
+
+    Formato del sidecar (little endian):
+    - Cabecera: MAGIC (8 bytes), numerador y denominador del time base (int64 cada uno).
+    - Un registro empaquetado de 9 bytes por paquete del video principal: pts (int64) y si es
+      keyframe (uint8).
+
+    El índice no guarda posiciones en el archivo: el muxer escribe a través de su propio
+    buffer, por lo que no se conocen mientras se graba. La búsqueda se hace por timestamp.
+
+    Un registro incompleto al final (por ejemplo, si el proceso terminó durante la grabación)
+    se ignora. Los pts de los keyframes son crecientes, por lo que la búsqueda es binaria.
+    """
+
+    MAGIC = b"NCSEEK02"
+    HEADER = struct.Struct("<8sqq")
+    RECORD = np.dtype([("pts", "<i8"), ("is_keyframe", "u1")])
+    EXTENSION = ".idx"
+
+    def __init__(self, time_base: Fraction, records: np.ndarray):
+        self.__time_base = time_base
+        self.__records = records
+        keyframes = records[records["is_keyframe"] != 0]
+        self.__keyframe_pts = np.ascontiguousarray(keyframes["pts"])
+        self.__keyframes = keyframes
+
+    @classmethod
+    def sidecar_path(cls, video_path: str) -> str:
+        return video_path + cls.EXTENSION
+
+    @classmethod
+    def for_video(cls, video_path: str) -> SeekIndex:
+        """Carga el índice de una grabación. Lanza FileNotFoundError si no tiene sidecar"""
+        return cls.load(cls.sidecar_path(video_path))
+
+    @classmethod
+    def load(cls, path: str) -> SeekIndex:
+        with open(path, "rb") as file:
+            header = file.read(cls.HEADER.size)
+            if len(header) < cls.HEADER.size:
+                raise ValueError(f"El índice de búsqueda {path} está incompleto")
+            magic, numerator, denominator = cls.HEADER.unpack(header)
+            if magic != cls.MAGIC or numerator <= 0 or denominator <= 0:
+                raise ValueError(f"El archivo {path} no es un índice de búsqueda válido")
+            count = (os.fstat(file.fileno()).st_size - cls.HEADER.size) // cls.RECORD.itemsize
+            records = np.fromfile(file, dtype=cls.RECORD, count=count)
+        return cls(Fraction(numerator, denominator), records)
+
+    @property
+    def time_base(self) -> Fraction:
+        return self.__time_base
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    @property
+    def keyframe_count(self) -> int:
+        return len(self.__keyframes)
+
+    def keyframe_before(self, seconds: float) -> Optional[SeekIndexEntry]:
+        """
+        Devuelve el último keyframe con timestamp menor o igual a `seconds`, desde el que se
+        puede decodificar sin leer la grabación desde el inicio. None si es anterior al primero
+        """
+        pts = int(Fraction(seconds) / self.__time_base)
+        position = int(np.searchsorted(self.__keyframe_pts, pts, side="right")) - 1
+        if position < 0:
+            return None
+        record = self.__keyframes[position]
+        return self.__entry(record)
+
+    def entry(self, position: int) -> SeekIndexEntry:
+        return self.__entry(self.__records[position])
+
+    def __entry(self, record: np.void) -> SeekIndexEntry:
+        pts = int(record["pts"])
+        return SeekIndexEntry(
+            pts=pts,
+            seconds=float(pts * self.__time_base),
+            is_keyframe=bool(record["is_keyframe"]),
+        )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from fractions import Fraction
+
+import numpy as np
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SeekIndex import SeekIndex
+
+
+class SeekIndexWriter:
+    """
+    Escribe el sidecar de SeekIndex de una grabación de forma incremental, mientras se muxean
+    sus paquetes, en lugar de recorrer el archivo al terminar.
+
+    Los registros se acumulan en un buffer preasignado y se escriben al sidecar de a
+    `flush_every` registros.
+    """
+
+    def __init__(self, video_path: str, time_base: Fraction, flush_every: int = 256):
+        if flush_every <= 0:
+            raise ValueError("La cantidad de registros por escritura del índice debe ser mayor a 0")
+        self.__file = open(SeekIndex.sidecar_path(video_path), "wb")
+        self.__file.write(
+            SeekIndex.HEADER.pack(SeekIndex.MAGIC, time_base.numerator, time_base.denominator)
+        )
+        self.__buffer = np.zeros(flush_every, dtype=SeekIndex.RECORD)
+        self.__buffered = 0
+
+    @property
+    def path(self) -> str:
+        return self.__file.name
+
+    def add(self, pts: int, is_keyframe: bool) -> None:
+        """
+        Registra un paquete del video principal antes de muxearlo
+
+        Args:
+            pts: Timestamp del paquete en el time base del índice, desde el inicio del archivo
+            is_keyframe: Indica si el paquete es un keyframe
+        """
+        self.__buffer[self.__buffered] = (pts, is_keyframe)
+        self.__buffered += 1
+        if self.__buffered == len(self.__buffer):
+            self.__flush()
+
+    def __flush(self) -> None:
+        self.__file.write(self.__buffer[: self.__buffered].tobytes())
+        self.__buffered = 0
+
+    def close(self) -> None:
+        self.__flush()
+        self.__file.close()
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class SharedMemoryFrame:
+    """
+    Frame leído de un SharedMemoryFrameRing. `pixels` es una vista de solo lectura sobre la
+    memoria compartida, sin copia: el escritor puede sobrescribirla en cualquier momento, por
+    lo que el lector debe confirmar con `SharedMemoryFrameReader.is_valid` que el resultado de
+    procesarla corresponde a este frame, o copiarla si necesita conservarla.
+    """
+
+    sequence: int  # número de frame publicado, consecutivo desde 1
+    timestamp: float  # segundos de media del frame en su stream
+    pixels: np.ndarray  # forma (H, W, C), uint8
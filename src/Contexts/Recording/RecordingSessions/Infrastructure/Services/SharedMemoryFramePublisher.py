@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Dict
+
+import av
+import numpy as np
+from av.video.reformatter import Interpolation, VideoReformatter
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameSampler import (
+    PyAvFrameSampler,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SharedMemoryFrameRing import (
+    SharedMemoryFrameRing,
+)
+
+
+class _SourceRing:
+    """Ring y contexto de escalado de una cámara"""
+
+    def __init__(self, ring: SharedMemoryFrameRing):
+        self.ring = ring
+        self.reformatter = VideoReformatter()
+
+
+class SharedMemoryFramePublisher(PyAvFrameConsumer):
+    """
+    Publica los frames decodificados de cada cámara en un SharedMemoryFrameRing propio, para
+    que procesos de análisis los lean con SharedMemoryFrameReader sin copias ni pipes.
+
+    Cada frame se escala y convierte en libswscale y se copia una única vez, directamente al
+    slot del ring. El escritor nunca espera a los lectores: los lentos detectan el overrun y
+    saltan al frame más reciente.
+
+    El nombre del segmento de cada cámara se deriva de `name_prefix` y del origen sin
+    credenciales (ver `segment_name`), de modo que los lectores lo conocen sin coordinación.
+    """
+
+    def __init__(
+        self,
+        name_prefix: str = "neuralcam",
+        width: int = 320,
+        height: int = 180,
+        pixel_format: str = "rgb24",
+        slot_count: int = 8,
+    ):
+        if width <= 0 or height <= 0:
+            raise ValueError("Las dimensiones de los frames publicados deben ser mayores a 0")
+        if pixel_format not in PyAvFrameSampler.CHANNELS:
+            raise ValueError(
+                f"Formato de píxel no soportado: {pixel_format}. "
+                f"Formatos permitidos: {', '.join(PyAvFrameSampler.CHANNELS)}"
+            )
+        if slot_count < 2:
+            raise ValueError("El ring buffer de frames necesita al menos 2 slots")
+        self.__name_prefix = name_prefix
+        self.__width = width
+        self.__height = height
+        self.__pixel_format = pixel_format
+        self.__channels = PyAvFrameSampler.CHANNELS[pixel_format]
+        self.__slot_count = slot_count
+        self.__sources: Dict[str, _SourceRing] = {}
+
+    @staticmethod
+    def segment_name(name_prefix: str, source: str) -> str:
+        """Nombre del segmento de memoria compartida de una cámara"""
+        # Acotado: algunos sistemas limitan los nombres de memoria compartida a 31 caracteres
+        return f"{name_prefix}_{hashlib.sha1(source.encode()).hexdigest()[:16]}"
+
+    def consume(self, source: str, frame: av.VideoFrame) -> None:
+        # Cada cámara se decodifica en un solo thread a la vez: su ring no requiere lock
+        source_ring = self.__sources.get(source) or self.__open(source)
+        scaled = source_ring.reformatter.reformat(
+            frame,
+            width=self.__width,
+            height=self.__height,
+            format=self.__pixel_format,
+            interpolation=Interpolation.BILINEAR,
+        )
+        plane = scaled.planes[0]
+        # El plano puede tener padding al final de cada línea
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(self.__height, plane.line_size)
+        sequence, slot = source_ring.ring.begin_write()
+        slot[...] = rows[:, : self.__width * self.__channels].reshape(slot.shape)
+        source_ring.ring.end_write(sequence, frame.time if frame.time is not None else 0.0)
+
+    def __open(self, source: str) -> _SourceRing:
+        ring = SharedMemoryFrameRing.create(
+            self.segment_name(self.__name_prefix, source),
+            slot_count=self.__slot_count,
+            height=self.__height,
+            width=self.__width,
+            channels=self.__channels,
+        )
+        return self.__sources.setdefault(source, _SourceRing(ring))
+
+    def close(self) -> None:
+        """Elimina los segmentos de memoria compartida de todas las cámaras"""
+        sources, self.__sources = self.__sources, {}
+        for source_ring in sources.values():
+            source_ring.ring.close()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SharedMemoryFrame import (
+    SharedMemoryFrame,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SharedMemoryFrameRing import (
+    SharedMemoryFrameRing,
+)
+
+
+class SharedMemoryFrameReader:
+    """
+    Lee desde otro proceso los frames que publica un SharedMemoryFramePublisher, sin copiarlos.
+    Cada lector lleva su propia posición, por lo que pueden leer el mismo ring cualquier cantidad
+    de procesos sin coordinarse entre sí ni con el escritor.
+
+    El lector empieza en el frame más reciente. Si se atrasa más de lo que el ring conserva
+    (overrun), salta al último frame publicado en lugar de procesar frames viejos: los frames
+    salteados se informan en `skipped_frames`.
+    """
+
+    def __init__(self, name: str, poll_interval_seconds: float = 0.002):
+        if poll_interval_seconds <= 0:
+            raise ValueError("El intervalo de consulta del lector de frames debe ser mayor a 0")
+        self.__ring = SharedMemoryFrameRing.attach(name)
+        self.__poll_interval_seconds = poll_interval_seconds
+        self.__next_sequence = max(1, self.__ring.latest_sequence)
+        self.__overruns = 0
+        self.__skipped_frames = 0
+
+    @property
+    def overruns(self) -> int:
+        """Veces que el lector se atrasó más de lo que conserva el ring"""
+        return self.__overruns
+
+    @property
+    def skipped_frames(self) -> int:
+        return self.__skipped_frames
+
+    def read(self, timeout_seconds: Optional[float] = None) -> Optional[SharedMemoryFrame]:
+        """
+        Devuelve el próximo frame, esperando hasta `timeout_seconds` (indefinidamente si es
+        None) a que el escritor lo publique. Devuelve None si se cumple el timeout
+        """
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        while True:
+            latest = self.__ring.latest_sequence
+            if latest >= self.__next_sequence:
+                frame = self.__try_read(latest)
+                if frame is not None:
+                    return frame
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(self.__poll_interval_seconds)
+
+    def __try_read(self, latest: int) -> Optional[SharedMemoryFrame]:
+        # El slot posterior al último frame puede estar escribiéndose: el ring solo garantiza
+        # los últimos `slot_count - 1` frames
+        if latest - self.__next_sequence >= self.__ring.slot_count - 1:
+            self.__skip_to(latest)
+        sequence = self.__next_sequence
+        pixels = self.__ring.frame(sequence)
+        timestamp = self.__ring.timestamp(sequence)
+        if not self.__ring.holds(sequence):
+            # El escritor dio la vuelta al ring entre la consulta y la lectura
+            self.__skip_to(self.__ring.latest_sequence)
+            return None
+        self.__next_sequence = sequence + 1
+        return SharedMemoryFrame(sequence=sequence, timestamp=timestamp, pixels=pixels)
+
+    def __skip_to(self, sequence: int) -> None:
+        self.__overruns += 1
+        self.__skipped_frames += sequence - self.__next_sequence
+        self.__next_sequence = sequence
+
+    def is_valid(self, frame: SharedMemoryFrame) -> bool:
+        """
+        Indica si los píxeles del frame todavía no se sobrescribieron. Se consulta después de
+        procesarlos: si devuelve False, el resultado puede mezclar dos frames y se descarta
+        """
+        return self.__ring.holds(frame.sequence)
+
+    def close(self) -> None:
+        """Cierra la vista del segmento. Los frames leídos deben liberarse antes"""
+        self.__ring.close()
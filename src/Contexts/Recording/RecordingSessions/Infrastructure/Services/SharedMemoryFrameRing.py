@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Set, Tuple
+
+import numpy as np
+
+
+class SharedMemoryFrameRing:
+    """
+    Ring buffer de frames de tamaño fijo sobre un segmento de `multiprocessing.shared_memory`.
+    Lo crea un único proceso escritor y cualquier cantidad de procesos lo abren con `attach`
+    para leer los frames sin copiarlos.
+
+    Disposición del segmento (todo alineado a 64 bytes):
+    - Cabecera int64: [MAGIC, cantidad de slots, alto, ancho, canales, última secuencia].
+    - Por slot, int64: [secuencia de inicio de escritura, secuencia de fin de escritura].
+    - Por slot, float64: timestamp del frame.
+    - Los píxeles de cada slot, de forma (H, W, C) en uint8.
+
+    Cada slot funciona como un seqlock: el escritor marca el inicio con la secuencia nueva,
+    copia el frame y marca el fin. Un lector valida que ambas marcas coincidan con la secuencia
+    que espera antes y después de usar el frame; si no, el escritor lo sobrescribió. Las
+    secuencias empiezan en 1 (0 indica un slot vacío).
+    """
+
+    MAGIC = 0x4E43414D4652414D  # "NCAMFRAM"
+    ALIGNMENT = 64
+    __HEADER_FIELDS = 8
+    __MAGIC_INDEX, __SLOTS_INDEX, __HEIGHT_INDEX, __WIDTH_INDEX = 0, 1, 2, 3
+    __CHANNELS_INDEX, __SEQUENCE_INDEX = 4, 5
+    # Segmentos creados por este proceso (ya registrados en su resource tracker)
+    __created_names: Set[str] = set()
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self.__memory = memory
+        self.__owner = owner
+        buffer = memory.buf
+        assert buffer is not None
+        self.__header = np.ndarray((self.__HEADER_FIELDS,), dtype=np.int64, buffer=buffer)
+        if self.__header[self.__MAGIC_INDEX] != self.MAGIC:
+            raise ValueError(f"El segmento {memory.name} no es un ring buffer de frames")
+        slot_count = int(self.__header[self.__SLOTS_INDEX])
+        shape = (
+            int(self.__header[self.__HEIGHT_INDEX]),
+            int(self.__header[self.__WIDTH_INDEX]),
+            int(self.__header[self.__CHANNELS_INDEX]),
+        )
+        marks_offset, timestamps_offset, frames_offset, _ = self.__layout(slot_count, shape)
+        self.__marks = np.ndarray(
+            (slot_count, 2), dtype=np.int64, buffer=buffer, offset=marks_offset
+        )
+        self.__timestamps = np.ndarray(
+            (slot_count,), dtype=np.float64, buffer=buffer, offset=timestamps_offset
+        )
+        self.__frames = np.ndarray(
+            (slot_count, *shape), dtype=np.uint8, buffer=buffer, offset=frames_offset
+        )
+        self.__frames.flags.writeable = owner
+
+    @classmethod
+    def create(
+        cls, name: str, slot_count: int, height: int, width: int, channels: int
+    ) -> SharedMemoryFrameRing:
+        """
+        Crea el segmento. Si quedó uno con el mismo nombre de una ejecución previa, se reemplaza
+        """
+        if slot_count < 2:
+            raise ValueError("El ring buffer de frames necesita al menos 2 slots")
+        if min(height, width, channels) <= 0:
+            raise ValueError("Las dimensiones de los frames deben ser mayores a 0")
+        *_, size = cls.__layout(slot_count, (height, width, channels))
+        try:
+            memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        cls.__created_names.add(memory.name)
+        assert memory.buf is not None
+        header = np.ndarray((cls.__HEADER_FIELDS,), dtype=np.int64, buffer=memory.buf)
+        header[:] = 0
+        header[cls.__SLOTS_INDEX : cls.__SEQUENCE_INDEX] = (slot_count, height, width, channels)
+        # La marca se escribe al final: un lector que abre el segmento antes no lo acepta
+        header[cls.__MAGIC_INDEX] = cls.MAGIC
+        ring = cls(memory, owner=True)
+        ring.__marks[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str) -> SharedMemoryFrameRing:
+        """Abre un segmento existente para leer. Lanza FileNotFoundError si no existe"""
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            if memory.name not in cls.__created_names:
+                # El resource tracker eliminaría el segmento al terminar el proceso lector
+                resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore
+        try:
+            return cls(memory, owner=False)
+        except Exception:
+            memory.close()
+            raise
+
+    @classmethod
+    def __layout(cls, slot_count: int, shape: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
+        marks_offset = cls.__align(cls.__HEADER_FIELDS * 8)
+        timestamps_offset = cls.__align(marks_offset + slot_count * 2 * 8)
+        frames_offset = cls.__align(timestamps_offset + slot_count * 8)
+        size = frames_offset + slot_count * shape[0] * shape[1] * shape[2]
+        return marks_offset, timestamps_offset, frames_offset, size
+
+    @classmethod
+    def __align(cls, offset: int) -> int:
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def slot_count(self) -> int:
+        return len(self.__frames)
+
+    @property
+    def frame_shape(self) -> Tuple[int, int, int]:
+        return self.__frames.shape[1:]
+
+    @property
+    def latest_sequence(self) -> int:
+        """Secuencia del último frame publicado completo, o 0 si todavía no hay"""
+        return int(self.__header[self.__SEQUENCE_INDEX])
+
+    def begin_write(self) -> Tuple[int, np.ndarray]:
+        """
+        Reserva el slot del próximo frame y devuelve su secuencia y la vista de sus píxeles,
+        en la que el escritor copia el frame antes de llamar a `end_write`
+        """
+        sequence = self.latest_sequence + 1
+        slot = sequence % len(self.__frames)
+        self.__marks[slot, 0] = sequence
+        return sequence, self.__frames[slot]
+
+    def end_write(self, sequence: int, timestamp: float) -> None:
+        slot = sequence % len(self.__frames)
+        self.__timestamps[slot] = timestamp
+        self.__marks[slot, 1] = sequence
+        self.__header[self.__SEQUENCE_INDEX] = sequence
+
+    def frame(self, sequence: int) -> np.ndarray:
+        """Vista de solo lectura de los píxeles del slot de `sequence`"""
+        return self.__frames[sequence % len(self.__frames)]
+
+    def timestamp(self, sequence: int) -> float:
+        return float(self.__timestamps[sequence % len(self.__frames)])
+
+    def holds(self, sequence: int) -> bool:
+        """Indica si el slot tiene el frame completo de `sequence` y no empezó a sobrescribirse"""
+        marks = self.__marks[sequence % len(self.__frames)]
+        return int(marks[1]) == sequence and int(marks[0]) == sequence
+
+    def close(self) -> None:
+        """
+        Libera las vistas del proceso; el escritor además elimina el segmento. Las vistas de
+        frames entregadas deben liberarse antes: mientras existan el segmento no se puede cerrar
+        """
+        del self.__header, self.__marks, self.__timestamps, self.__frames
+        self.__memory.close()
+        if self.__owner:
+            self.__memory.unlink()
+            self.__created_names.discard(self.__memory.name)
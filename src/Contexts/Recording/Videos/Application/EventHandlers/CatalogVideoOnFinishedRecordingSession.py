@@ -0,0 +1,33 @@
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Events.FinishedRecordingSessionIntegrationEvent import (
+    FinishedRecordingSessionIntegrationEvent,
+)
+from ..UseCases.CatalogRecordingUseCase import CatalogRecordingUseCase
+
+
+class CatalogVideoOnFinishedRecordingSession:
+    """
+    Event handler que registra en el catálogo los videos de una sesión de grabación finalizada.
+    Con catálogo, el movimiento de los videos se encola de RecordingsCatalogedDomainEvent
+    (ver MoveVideoOnRecordingsCataloged) y no de la sesión finalizada, para que siempre
+    ocurra después del registro.
+    """
+
+    def __init__(
+        self, catalog_recording_use_case: CatalogRecordingUseCase, logger: LoggerInterface
+    ):
+        self._catalog_recording_use_case = catalog_recording_use_case
+        self._logger = logger
+
+    def handle(self, event: FinishedRecordingSessionIntegrationEvent) -> None:
+        """
+        Maneja el evento de sesión de grabación finalizada registrando sus videos
+
+        Args:
+            event: Evento de sesión de grabación finalizada
+        """
+        paths = event.part_paths or (event.output_path,)
+        self._logger.debug(f"Manejando evento de sesión finalizada para catalogar videos: {paths}")
+        self._catalog_recording_use_case.execute(
+            event.profile_name, event.start_date, event.end_date, paths, event.content_hashes
+        )
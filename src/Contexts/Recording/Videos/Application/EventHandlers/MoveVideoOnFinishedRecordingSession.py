@@ -2,28 +2,34 @@ from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
 from ...Domain.Events.FinishedRecordingSessionIntegrationEvent import (
     FinishedRecordingSessionIntegrationEvent,
 )
-from ..UseCases.MoveVideoUseCase import MoveVideoUseCase
+from ..UseCases.EnqueueVideoMoveUseCase import EnqueueVideoMoveUseCase
 
 
 class MoveVideoOnFinishedRecordingSession:
-    """Event handler que mueve videos cuando termina una sesión de grabación"""
+    """
+    Event handler que encola el movimiento de videos cuando termina una sesión de grabación.
+    El evento se publica desde el thread del grabador: la subida la realizan los workers de
+    la cola para no demorar la próxima sesión de la cámara.
+
+    Sin catálogo de grabaciones; con catálogo se usa MoveVideoOnRecordingsCataloged.
+    """
 
     def __init__(
         self,
-        move_video_use_case: MoveVideoUseCase,
+        enqueue_video_move_use_case: EnqueueVideoMoveUseCase,
         logger: LoggerInterface,
     ):
-        self._move_video_use_case = move_video_use_case
+        self._enqueue_video_move_use_case = enqueue_video_move_use_case
         self._logger = logger
 
     def handle(self, event: FinishedRecordingSessionIntegrationEvent) -> None:
         """
-        Maneja el evento de sesión de grabación finalizada moviendo el video
+        Maneja el evento de sesión de grabación finalizada encolando el movimiento del video.
+        Si la sesión se grabó en varias partes por reconexiones, se encolan todas.
 
         Args:
             event: Evento de sesión de grabación finalizada
         """
-        self._logger.debug(
-            f"Manejando evento de sesión finalizada para mover video: {event.output_path}"
-        )
-        self._move_video_use_case.execute(event.output_path)
+        paths = event.part_paths or (event.output_path,)
+        self._logger.debug(f"Manejando evento de sesión finalizada para mover videos: {paths}")
+        self._enqueue_video_move_use_case.execute(paths, event.content_hashes)
@@ -0,0 +1,31 @@
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Events.RecordingsCatalogedDomainEvent import RecordingsCatalogedDomainEvent
+from ..UseCases.EnqueueVideoMoveUseCase import EnqueueVideoMoveUseCase
+
+
+class MoveVideoOnRecordingsCataloged:
+    """
+    Event handler que encola el movimiento de videos una vez registrados en el catálogo.
+    Reemplaza a MoveVideoOnFinishedRecordingSession cuando se usa el catálogo, de modo que
+    el movimiento nunca se adelante al registro que luego actualiza.
+    """
+
+    def __init__(
+        self,
+        enqueue_video_move_use_case: EnqueueVideoMoveUseCase,
+        logger: LoggerInterface,
+    ):
+        self._enqueue_video_move_use_case = enqueue_video_move_use_case
+        self._logger = logger
+
+    def handle(self, event: RecordingsCatalogedDomainEvent) -> None:
+        """
+        Maneja el evento de videos catalogados encolando su movimiento
+
+        Args:
+            event: Evento de videos catalogados
+        """
+        self._logger.debug(
+            f"Manejando evento de videos catalogados para moverlos: {event.video_paths}"
+        )
+        self._enqueue_video_move_use_case.execute(event.video_paths, event.content_hashes)
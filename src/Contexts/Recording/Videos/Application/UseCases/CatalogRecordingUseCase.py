@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Sequence
+
+from src.Contexts.SharedKernel.Domain.EventBusInterface import EventBusInterface
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Contracts.RecordingCatalog import RecordingCatalog
+from ...Domain.Events.RecordingsCatalogedDomainEvent import RecordingsCatalogedDomainEvent
+from ...Domain.ValueObjects.RecordingCatalogEntry import RecordingCatalogEntry
+from ...Domain.ValueObjects.StorageLocation import StorageLocation
+from ...Domain.ValueObjects.VideoPath import VideoPath
+
+
+class CatalogRecordingUseCase:
+    """
+    Caso de uso para registrar en el catálogo los videos de una sesión de grabación.
+    Al terminar publica RecordingsCatalogedDomainEvent, del que se encola el movimiento de
+    los videos: así el tamaño se lee del archivo local y el movimiento siempre encuentra el
+    registro que debe actualizar.
+    """
+
+    def __init__(
+        self,
+        recording_catalog: RecordingCatalog,
+        event_bus: EventBusInterface,
+        logger: LoggerInterface,
+    ):
+        self._recording_catalog = recording_catalog
+        self._event_bus = event_bus
+        self._logger = logger
+
+    def execute(
+        self,
+        profile_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        video_paths: Sequence[str],
+        content_hashes: Sequence[str] = (),
+    ) -> None:
+        """
+        Registra los videos de la sesión. Las partes de una sesión con reconexiones no guardan
+        su propio inicio, por lo que se registran con el intervalo de la sesión completa.
+
+        Args:
+            profile_name: Perfil que grabó la sesión
+            start_date: Inicio de la sesión
+            end_date: Fin de la sesión
+            video_paths: Rutas locales de los videos de la sesión, en orden
+            content_hashes: Hash del contenido de cada video, en el mismo orden, si se conocen
+        """
+        try:
+            self.__add_to_catalog(profile_name, start_date, end_date, video_paths)
+        except Exception as e:
+            # Sin registro los videos se mueven igual: el catálogo no debe frenar el movimiento
+            self._logger.error(f"Error al registrar en el catálogo videos de {profile_name}: {e}")
+        self._event_bus.publish(
+            [
+                RecordingsCatalogedDomainEvent(
+                    profile_name=profile_name,
+                    video_paths=tuple(video_paths),
+                    content_hashes=tuple(content_hashes),
+                )
+            ]
+        )
+
+    def __add_to_catalog(
+        self,
+        profile_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        video_paths: Sequence[str],
+    ) -> None:
+        self._recording_catalog.add(
+            RecordingCatalogEntry(
+                profile_name=profile_name,
+                start_date=start_date,
+                end_date=max(start_date, end_date),
+                size_bytes=VideoPath(path).file_size(),
+                path=path,
+                location=StorageLocation(StorageLocation.LOCAL),
+            )
+            for path in video_paths
+        )
+        self._logger.debug(f"{len(video_paths)} video(s) de {profile_name} en el catálogo")
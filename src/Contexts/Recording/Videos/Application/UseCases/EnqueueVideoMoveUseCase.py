@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Contracts.MoveJobQueue import MoveJobQueue
+
+
+class EnqueueVideoMoveUseCase:
+    """Caso de uso para encolar el movimiento de videos, que los workers realizan luego"""
+
+    def __init__(self, move_job_queue: MoveJobQueue, logger: LoggerInterface):
+        self._move_job_queue = move_job_queue
+        self._logger = logger
+
+    def execute(self, video_paths: Sequence[str], content_hashes: Sequence[str] = ()) -> None:
+        """
+        Encola el movimiento de los videos
+
+        Args:
+            video_paths: Rutas de los videos a mover
+            content_hashes: Hash del contenido de cada video, en el mismo orden, si se conocen
+        """
+        hashes = dict(zip(video_paths, content_hashes)) if content_hashes else None
+        self._move_job_queue.enqueue(video_paths, hashes)
+        self._logger.debug(f"Movimiento encolado para {len(video_paths)} video(s)")
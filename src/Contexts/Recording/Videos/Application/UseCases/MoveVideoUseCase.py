@@ -1,8 +1,12 @@
+from typing import Optional
+
 from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
 from src.Contexts.SharedKernel.Domain.EventBusInterface import EventBusInterface
 from src.Contexts.SharedKernel.Domain.Configuration import Configuration
 from ...Domain.Services.VideoMover import VideoMover
 from ...Domain.Services.VideoEnsurer import VideoEnsurer
+from ...Domain.Contracts.RecordingCatalog import RecordingCatalog
+from ...Domain.ValueObjects.StorageLocation import StorageLocation
 
 
 class MoveVideoUseCase:
@@ -15,30 +19,52 @@ class MoveVideoUseCase:
         logger: LoggerInterface,
         event_bus: EventBusInterface,
         configuration: Configuration,
+        recording_catalog: Optional[RecordingCatalog] = None,
     ):
         self._video_mover = video_mover
         self._video_ensurer = video_ensurer
         self._logger = logger
         self._event_bus = event_bus
         self._configuration = configuration
+        self._recording_catalog = recording_catalog
 
-    def execute(self, video_path: str) -> None:
+    def execute(self, video_path: str, content_hash: Optional[str] = None) -> None:
         """
         Ejecuta el proceso de mover un video específico
 
         Args:
             video_path: Ruta del video a mover
+            content_hash: Hash del contenido calculado al grabar, para verificar la subida
         """
         self._logger.info(f"Iniciando proceso de mover video: {video_path}")
         video = self._video_ensurer.ensure_video(video_path)
         self._logger.info(f"Procesando video: {video.path.value}")
 
         destination_path = self.__build_destination_path(video_path)
-        self._video_mover.move(video, destination_path)
+        upload_result = self._video_mover.move(video, destination_path, content_hash)
+        self.__relocate_in_catalog(video_path, upload_result)
 
         self._event_bus.publish(video.pull_domain_events())
         self._logger.info(f"Video movido exitosamente: {video.path.value}")
 
+    def __relocate_in_catalog(self, video_path: str, upload_result: str) -> None:
+        """
+        Registra en el catálogo que el video ahora está en el almacenamiento externo.
+        Un error del catálogo no revierte el movimiento, que ya se completó
+
+        Args:
+            video_path: Ruta local del video movido
+            upload_result: URL o identificador del video subido
+        """
+        if self._recording_catalog is None:
+            return
+        try:
+            location = StorageLocation(StorageLocation.REMOTE)
+            if not self._recording_catalog.relocate(video_path, upload_result, location):
+                self._logger.debug(f"El video no estaba registrado en el catálogo: {video_path}")
+        except Exception as e:
+            self._logger.error(f"Error al actualizar el catálogo para {video_path}: {str(e)}")
+
     def __build_destination_path(self, video_path: str) -> str:
         """
         Construye la ruta de destino usando Configuration
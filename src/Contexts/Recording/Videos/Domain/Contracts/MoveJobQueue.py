@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Mapping, Optional
+
+from ..ValueObjects.MoveJob import MoveJob
+from ..ValueObjects.MoveJobQueueStats import MoveJobQueueStats
+
+
+class MoveJobQueue(ABC):
+    """
+    Contrato de la cola persistente de videos a mover. La entrega es "al menos una vez": un
+    movimiento tomado con `claim` que no se confirma con `complete` vuelve a la cola
+    """
+
+    @abstractmethod
+    def enqueue(
+        self, video_paths: Iterable[str], content_hashes: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """
+        Encola el movimiento de videos. Un video que ya está en la cola no se repite
+
+        Args:
+            video_paths: Rutas de los videos a mover
+            content_hashes: Hash del contenido de cada video, por ruta, si se conoce
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, timeout_seconds: float) -> Optional[MoveJob]:
+        """
+        Toma el próximo movimiento disponible, esperando hasta `timeout_seconds` si no hay
+
+        Returns:
+            Movimiento tomado o None si no hubo ninguno disponible a tiempo
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job: MoveJob) -> None:
+        """Confirma que el movimiento terminó y lo quita de la cola"""
+        pass
+
+    @abstractmethod
+    def retry(self, job: MoveJob, delay_seconds: float, error: str) -> None:
+        """Devuelve el movimiento a la cola para reintentarlo tras `delay_seconds`"""
+        pass
+
+    @abstractmethod
+    def postpone(self, job: MoveJob, delay_seconds: float) -> None:
+        """
+        Devuelve el movimiento a la cola sin haberlo intentado, por ejemplo porque su destino
+        está saturado, para retomarlo tras `delay_seconds` sin consumir uno de sus intentos
+        """
+        pass
+
+    @abstractmethod
+    def abandon(self, job: MoveJob, error: str) -> None:
+        """Deja de reintentar el movimiento; queda registrado como fallido"""
+        pass
+
+    @abstractmethod
+    def recover(self) -> int:
+        """
+        Devuelve a la cola los movimientos que quedaron tomados por un proceso que ya no los
+        está realizando, por ejemplo porque terminó mientras se subían. Los que otro proceso
+        vivo tiene tomados no se tocan. Se llama al iniciar, antes de que los workers tomen
+        trabajo
+
+        Returns:
+            Cantidad de movimientos recuperados
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> MoveJobQueueStats:
+        """Cantidad de movimientos por estado y antigüedad del más viejo sin terminar"""
+        pass
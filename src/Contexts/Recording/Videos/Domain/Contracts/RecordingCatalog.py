@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, List
+
+from ..ValueObjects.RecordingCatalogEntry import RecordingCatalogEntry
+from ..ValueObjects.StorageLocation import StorageLocation
+
+
+class RecordingCatalog(ABC):
+    """Contrato del índice persistente de los segmentos grabados"""
+
+    @abstractmethod
+    def add(self, entries: Iterable[RecordingCatalogEntry]) -> None:
+        """
+        Registra segmentos grabados. Un segmento ya registrado con la misma ruta se reemplaza
+
+        Args:
+            entries: Segmentos a registrar
+        """
+        pass
+
+    @abstractmethod
+    def find_between(
+        self, profile_name: str, start: datetime, end: datetime
+    ) -> List[RecordingCatalogEntry]:
+        """
+        Busca los segmentos del perfil que cubren parte del intervalo [start, end)
+
+        Args:
+            profile_name: Perfil cuyos segmentos se buscan
+            start: Inicio del intervalo
+            end: Fin del intervalo
+
+        Returns:
+            Segmentos encontrados, ordenados por inicio
+        """
+        pass
+
+    @abstractmethod
+    def relocate(self, path: str, new_path: str, location: StorageLocation) -> bool:
+        """
+        Actualiza la ruta y la ubicación de un segmento que se movió
+
+        Args:
+            path: Ruta registrada del segmento
+            new_path: Nueva ruta o identificador del segmento
+            location: Nueva ubicación del segmento
+
+        Returns:
+            True si el segmento estaba registrado, False en caso contrario
+        """
+        pass
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from ..Entities.Video import Video
 
 
@@ -18,3 +20,17 @@ class VideoUploader(ABC):
             URL o identificador del video subido
         """
         pass
+
+    def content_hash(self, upload_result: str) -> Optional[str]:
+        """
+        Calcula el hash del contenido de un video ya subido (ver ChunkedContentHasher), para
+        verificarlo contra el calculado al grabarlo. Los almacenamientos que no permiten
+        leerlo devuelven None y la subida no se verifica
+
+        Args:
+            upload_result: URL o identificador devuelto por `upload_overwrite`
+
+        Returns:
+            Hash del contenido o None si no puede calcularse
+        """
+        return None
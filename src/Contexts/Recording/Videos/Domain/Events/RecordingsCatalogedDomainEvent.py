@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from src.Contexts.SharedKernel.Domain.DomainEvent import DomainEvent
+
+
+@dataclass(frozen=True)
+class RecordingsCatalogedDomainEvent(DomainEvent):
+    """Evento de dominio para cuando los videos de una sesión se registran en el catálogo"""
+
+    profile_name: str
+    video_paths: Tuple[str, ...]
+    content_hashes: Tuple[str, ...] = ()  # hash de cada video de video_paths, si se calculó
+
+    @property
+    def event_name(self) -> str:
+        return "recording_catalog.cataloged"
@@ -0,0 +1,7 @@
+class VideoUploadBusyException(Exception):
+    """Excepción lanzada cuando el destino de una subida no admite más subidas por ahora"""
+
+    def __init__(self, destination: str):
+        self.destination = destination
+        self.message = f"El destino {destination} alcanzó su límite de subidas simultáneas"
+        super().__init__(self.message)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
 from ..Entities.Video import Video
 from ..Contracts.VideoFileManager import VideoFileManager
@@ -5,6 +7,7 @@ from ..Contracts.VideoUploader import VideoUploader
 from ..Exceptions.VideoUploadFailedException import VideoUploadFailedException
 from ..Exceptions.VideoFileOperationException import VideoFileOperationException
 from ..Exceptions.VideoNotFoundException import VideoNotFoundException
+from ..Exceptions.VideoUploadBusyException import VideoUploadBusyException
 
 
 class VideoMover:
@@ -20,20 +23,23 @@ class VideoMover:
         self._video_uploader = video_uploader
         self._logger = logger
 
-    def move(self, video: Video, destination_path: str) -> str:
+    def move(self, video: Video, destination_path: str, content_hash: Optional[str] = None) -> str:
         """
-        Mueve un video completamente: sube al almacenamiento y elimina el original
+        Mueve un video completamente: sube al almacenamiento y elimina el original.
+        Con `content_hash`, el original solo se elimina si el destino tiene el mismo contenido
 
         Args:
             video: Video a mover
             destination_path: Ruta de destino en el almacenamiento
+            content_hash: Hash del contenido calculado al grabar el video, si se conoce
 
         Returns:
             URL o identificador del video subido
 
         Raises:
             VideoNotFoundException: Si el archivo de video no existe
-            VideoUploadFailedException: Si falla la subida
+            VideoUploadBusyException: Si el destino no admite más subidas por ahora
+            VideoUploadFailedException: Si falla la subida o el destino no coincide
             VideoFileOperationException: Si falla la operación de archivos
         """
         try:
@@ -43,6 +49,7 @@ class VideoMover:
 
             # Subir el video
             upload_result = self._video_uploader.upload_overwrite(video, destination_path)
+            self.__ensure_upload_matches(video, upload_result, content_hash)
             video.mark_as_uploaded(upload_result)
 
             # Eliminar archivo original
@@ -52,13 +59,35 @@ class VideoMover:
             self._logger.info(f"Video movido completamente: {video.path.value}")
             return upload_result
 
-        except VideoNotFoundException:
+        except (VideoNotFoundException, VideoUploadBusyException):
             # Re-lanzar la excepción de dominio tal como está
             raise
         except Exception as e:
             self._logger.error(f"Error al mover video {video.path.value}: {str(e)}")
             raise VideoFileOperationException(f"Error al mover video: {str(e)}", e)
 
+    def __ensure_upload_matches(
+        self, video: Video, upload_result: str, content_hash: Optional[str]
+    ) -> None:
+        """
+        Compara el hash calculado al grabar con el del archivo subido. El original no se
+        vuelve a leer: el hash de la grabación ya describe su contenido
+
+        Raises:
+            VideoUploadFailedException: Si el contenido subido no coincide con el grabado
+        """
+        if content_hash is None:
+            return
+        uploaded_hash = self._video_uploader.content_hash(upload_result)
+        if uploaded_hash is None:
+            self._logger.debug(f"El destino no permite verificar el contenido: {upload_result}")
+            return
+        if uploaded_hash != content_hash:
+            raise VideoUploadFailedException(
+                f"El contenido subido a {upload_result} no coincide con el grabado "
+                f"({uploaded_hash} en lugar de {content_hash})"
+            )
+
     def __ensure_video_exists(self, video: Video) -> None:
         """
         Verifica que el archivo de video exista antes de intentar subirlo
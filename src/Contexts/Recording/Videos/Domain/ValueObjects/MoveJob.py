@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class MoveJob:
+    """Movimiento pendiente de un video tomado de la cola por un worker"""
+
+    job_id: int
+    video_path: str
+    attempts: int  # intentos realizados, incluido el actual
+    content_hash: Optional[str] = None  # hash calculado al grabar, para verificar la subida
+
+    def __post_init__(self):
+        self.__ensure_attempts_are_positive()
+
+    def __ensure_attempts_are_positive(self) -> None:
+        if self.attempts <= 0:
+            raise ValueError("Un movimiento tomado de la cola debe tener al menos un intento")
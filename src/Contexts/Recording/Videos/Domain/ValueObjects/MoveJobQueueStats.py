@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MoveJobQueueStats:
+    """Estado de la cola de movimientos en un instante dado"""
+
+    pending: int
+    running: int
+    failed: int
+    oldest_job_age_seconds: float  # desde que se encoló el movimiento sin terminar más viejo
+
+    @property
+    def depth(self) -> int:
+        """Movimientos sin terminar: esperando o en curso"""
+        return self.pending + self.running
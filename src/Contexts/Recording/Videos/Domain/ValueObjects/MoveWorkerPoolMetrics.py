@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from .MoveJobQueueStats import MoveJobQueueStats
+
+
+@dataclass(frozen=True)
+class MoveWorkerPoolMetrics:
+    """Métricas del pool de workers de movimientos y de su cola"""
+
+    queue: MoveJobQueueStats
+    workers: int
+    busy_workers: int
+    completed: int  # desde que arrancó el pool
+    retried: int
+    abandoned: int
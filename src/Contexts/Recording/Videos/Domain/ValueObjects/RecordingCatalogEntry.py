@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from .StorageLocation import StorageLocation
+
+
+@dataclass(frozen=True)
+class RecordingCatalogEntry:
+    """Segmento grabado de un perfil registrado en el catálogo de grabaciones"""
+
+    profile_name: str
+    start_date: datetime
+    end_date: datetime
+    size_bytes: int
+    path: str
+    location: StorageLocation
+
+    def __ensure_is_valid(self) -> None:
+        if not self.profile_name:
+            raise ValueError("El perfil de la grabación no puede estar vacío")
+        if not self.path:
+            raise ValueError("La ruta de la grabación no puede estar vacía")
+        if self.end_date < self.start_date:
+            raise ValueError("El fin de la grabación no puede ser anterior a su inicio")
+        if self.size_bytes < 0:
+            raise ValueError("El tamaño de la grabación no puede ser negativo")
+
+    def __post_init__(self):
+        self.__ensure_is_valid()
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_date - self.start_date).total_seconds()
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Indica si la grabación cubre parte del intervalo [start, end)"""
+        return self.start_date < end and self.end_date > start
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from src.Contexts.SharedKernel.Domain.ValueObjects.StringValueObject import StringValueObject
+
+
+@dataclass(frozen=True)
+class StorageLocation(StringValueObject):
+    """
+    Dónde está guardada una grabación:
+    - local: en el disco donde se grabó
+    - remote: en el almacenamiento externo al que se movió
+    """
+
+    LOCAL = "local"
+    REMOTE = "remote"
+
+    def __ensure_is_supported_location(self) -> None:
+        if self.value not in (self.LOCAL, self.REMOTE):
+            raise ValueError(
+                f"Ubicación de almacenamiento no válida: {self.value}. "
+                f"Ubicaciones permitidas: {self.LOCAL}, {self.REMOTE}"
+            )
+
+    def __post_init__(self):
+        self.__ensure_is_supported_location()
+
+    def is_local(self) -> bool:
+        return self.value == self.LOCAL
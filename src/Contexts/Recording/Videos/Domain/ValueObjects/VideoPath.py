@@ -1,11 +1,15 @@
 import os
 from pathlib import Path
+from typing import List
 from src.Contexts.SharedKernel.Domain.ValueObjects.RequiredStringValueObject import RequiredStringValueObject
 
 
 class VideoPath(RequiredStringValueObject):
     """Ruta completa del archivo de video"""
-    
+
+    # Archivos auxiliares que el grabador escribe junto a cada video (índice de búsqueda)
+    SIDECAR_EXTENSIONS = (".idx",)
+
     def __init__(self, value: str):
         super().__init__(value)
         self._ensure_path_is_valid()
@@ -47,4 +51,12 @@ class VideoPath(RequiredStringValueObject):
         """Retorna el tamaño del archivo en bytes"""
         if not self.exists():
             return 0
-        return Path(self.value).stat().st_size 
\ No newline at end of file
+        return Path(self.value).stat().st_size
+
+    def sidecar_paths(self) -> List[str]:
+        """Retorna las rutas de los archivos auxiliares del video que existen"""
+        return [
+            self.value + extension
+            for extension in self.SIDECAR_EXTENSIONS
+            if os.path.isfile(self.value + extension)
+        ]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from typing_extensions import override
+
+from ...Domain.Contracts.VideoUploader import VideoUploader
+from ...Domain.Entities.Video import Video
+from ...Domain.Exceptions.VideoUploadBusyException import VideoUploadBusyException
+
+
+class ConcurrencyLimitedVideoUploader(VideoUploader):
+    """
+    Decorador de un VideoUploader que limita cuántas subidas se realizan a la vez, en total y
+    por destino. Así un pool con muchos workers satura el enlace de cada destino sin que uno
+    lento acapare todos los workers ni se abran más conexiones de las que tolera.
+
+    El destino de una subida es `esquema://host` para URLs (por ejemplo `s3://bucket`) y el
+    punto de montaje para rutas locales, de modo que dos carpetas del mismo disco comparten
+    límite. `destination_limits` fija el límite de destinos puntuales; el resto usa
+    `max_uploads_per_destination`.
+
+    Una subida que excede algún límite no espera: lanza VideoUploadBusyException y el worker
+    devuelve el movimiento a la cola por un momento (ver MoveJobQueue.postpone). Así un
+    worker nunca queda bloqueado por un destino saturado mientras hay movimientos hacia
+    otros destinos esperando.
+    """
+
+    def __init__(
+        self,
+        video_uploader: VideoUploader,
+        max_uploads: int = 16,
+        max_uploads_per_destination: int = 4,
+        destination_limits: Optional[Mapping[str, int]] = None,
+    ):
+        self.__ensure_positive("max_uploads", max_uploads)
+        self.__ensure_positive("max_uploads_per_destination", max_uploads_per_destination)
+        for destination, limit in (destination_limits or {}).items():
+            self.__ensure_positive(f"destination_limits[{destination}]", limit)
+        self.__video_uploader = video_uploader
+        self.__uploads = threading.BoundedSemaphore(max_uploads)
+        self.__max_uploads_per_destination = max_uploads_per_destination
+        self.__destination_limits = dict(destination_limits or {})
+        self.__destination_uploads: Dict[str, threading.BoundedSemaphore] = {}
+        self.__in_flight: Dict[str, int] = {}
+        self.__mount_points: Dict[str, str] = {}
+        self.__lock = threading.Lock()
+
+    def __ensure_positive(self, name: str, value: int) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del límite de subidas debe ser mayor a 0")
+
+    @override
+    def upload_overwrite(self, video: Video, destination_path: str) -> str:
+        destination = self.destination_of(destination_path)
+        destination_uploads = self.__semaphore_for(destination)
+        if not destination_uploads.acquire(blocking=False):
+            raise VideoUploadBusyException(destination)
+        try:
+            if not self.__uploads.acquire(blocking=False):
+                raise VideoUploadBusyException(destination)
+            try:
+                self.__count_in_flight(destination, 1)
+                try:
+                    return self.__video_uploader.upload_overwrite(video, destination_path)
+                finally:
+                    self.__count_in_flight(destination, -1)
+            finally:
+                self.__uploads.release()
+        finally:
+            destination_uploads.release()
+
+    @override
+    def content_hash(self, upload_result: str) -> Optional[str]:
+        return self.__video_uploader.content_hash(upload_result)
+
+    def in_flight(self) -> Dict[str, int]:
+        """Subidas en curso por destino"""
+        with self.__lock:
+            return {destination: count for destination, count in self.__in_flight.items() if count}
+
+    def destination_of(self, destination_path: str) -> str:
+        url = urlparse(destination_path)
+        # Una letra de unidad de Windows no es un esquema
+        if url.scheme and len(url.scheme) > 1:
+            return f"{url.scheme}://{url.netloc}"
+        directory = os.path.dirname(os.path.abspath(destination_path))
+        with self.__lock:
+            mount_point = self.__mount_points.get(directory)
+        if mount_point is None:
+            mount_point = self.__find_mount_point(directory)
+            with self.__lock:
+                self.__mount_points[directory] = mount_point
+        return mount_point
+
+    def __find_mount_point(self, directory: str) -> str:
+        path = directory
+        while not os.path.ismount(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
+
+    def __semaphore_for(self, destination: str) -> threading.BoundedSemaphore:
+        with self.__lock:
+            semaphore = self.__destination_uploads.get(destination)
+            if semaphore is None:
+                limit = self.__destination_limits.get(
+                    destination, self.__max_uploads_per_destination
+                )
+                semaphore = threading.BoundedSemaphore(limit)
+                self.__destination_uploads[destination] = semaphore
+            return semaphore
+
+    def __count_in_flight(self, destination: str, delta: int) -> None:
+        with self.__lock:
+            self.__in_flight[destination] = self.__in_flight.get(destination, 0) + delta
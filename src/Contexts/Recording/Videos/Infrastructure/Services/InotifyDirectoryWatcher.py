@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class InotifyDirectoryWatcher:
+    """
+    Observa directorios con inotify (Linux) a través de libc, sin dependencias externas.
+    No bloquea: `read_changes` devuelve los cambios acumulados desde la llamada anterior.
+
+    Cada cambio es (directorio, nombre, existe). Los directorios eliminados, movidos o cuyos
+    eventos se perdieron porque la cola del kernel se llenó se devuelven aparte como
+    invalidados: quien mantiene un listado de ellos debe volver a leerlo.
+    """
+
+    __IN_MOVED_FROM = 0x00000040
+    __IN_MOVED_TO = 0x00000080
+    __IN_CREATE = 0x00000100
+    __IN_DELETE = 0x00000200
+    __IN_DELETE_SELF = 0x00000400
+    __IN_MOVE_SELF = 0x00000800
+    __IN_Q_OVERFLOW = 0x00004000
+    __IN_IGNORED = 0x00008000
+    __IN_ONLYDIR = 0x01000000
+    __IN_ISDIR = 0x40000000
+    __IN_NONBLOCK = 0o4000
+    __IN_CLOEXEC = 0o2000000
+    __WATCH_MASK = (
+        __IN_CREATE
+        | __IN_DELETE
+        | __IN_MOVED_FROM
+        | __IN_MOVED_TO
+        | __IN_DELETE_SELF
+        | __IN_MOVE_SELF
+        | __IN_ONLYDIR
+    )
+    __EVENT_HEADER = struct.Struct("iIII")
+    __READ_SIZE = 64 * 1024
+
+    def __init__(self):
+        libc = self.__load_libc()
+        if libc is None:
+            raise OSError("inotify no está disponible en este sistema")
+        self.__libc: ctypes.CDLL = libc
+        fd = self.__libc.inotify_init1(self.__IN_NONBLOCK | self.__IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "No se pudo inicializar inotify")
+        self.__fd: Optional[int] = fd
+        self.__directories: Dict[int, str] = {}
+        self.__descriptors: Dict[str, int] = {}
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return cls.__load_libc() is not None
+
+    @staticmethod
+    def __load_libc() -> Optional[ctypes.CDLL]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1
+            libc.inotify_add_watch
+            libc.inotify_rm_watch
+        except (OSError, AttributeError):
+            return None
+        return libc
+
+    def watch(self, directory: str) -> bool:
+        """
+        Empieza a observar el directorio. Devuelve False si no se pudo (por ejemplo, al
+        alcanzar el límite `fs.inotify.max_user_watches`)
+        """
+        if directory in self.__descriptors:
+            return True
+        if self.__fd is None:
+            return False
+        descriptor = self.__libc.inotify_add_watch(
+            self.__fd, os.fsencode(directory), self.__WATCH_MASK
+        )
+        if descriptor < 0:
+            return False
+        self.__directories[descriptor] = directory
+        self.__descriptors[directory] = descriptor
+        return True
+
+    def is_watching(self, directory: str) -> bool:
+        return directory in self.__descriptors
+
+    def unwatch(self, directory: str) -> None:
+        descriptor = self.__descriptors.pop(directory, None)
+        if descriptor is None:
+            return
+        self.__directories.pop(descriptor, None)
+        if self.__fd is not None:
+            self.__libc.inotify_rm_watch(self.__fd, descriptor)
+
+    def read_changes(self) -> Tuple[List[Tuple[str, str, bool]], Set[str]]:
+        """Devuelve los archivos creados o eliminados y los directorios invalidados"""
+        changes: List[Tuple[str, str, bool]] = []
+        invalidated: Set[str] = set()
+        while self.__fd is not None:
+            try:
+                data = os.read(self.__fd, self.__READ_SIZE)
+            except BlockingIOError:
+                break
+            self.__parse(data, changes, invalidated)
+        for directory in invalidated:
+            self.__forget(directory)
+        return changes, invalidated
+
+    def __parse(
+        self, data: bytes, changes: List[Tuple[str, str, bool]], invalidated: Set[str]
+    ) -> None:
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, _, length = self.__EVENT_HEADER.unpack_from(data, offset)
+            offset += self.__EVENT_HEADER.size
+            raw_name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & self.__IN_Q_OVERFLOW:
+                invalidated.update(self.__descriptors)
+                continue
+            directory = self.__directories.get(descriptor)
+            if directory is None:
+                continue
+            if mask & (self.__IN_DELETE_SELF | self.__IN_MOVE_SELF | self.__IN_IGNORED):
+                invalidated.add(directory)
+                continue
+            if mask & self.__IN_ISDIR or not raw_name:
+                continue
+            name = os.fsdecode(raw_name)
+            changes.append((directory, name, bool(mask & (self.__IN_CREATE | self.__IN_MOVED_TO))))
+
+    def __forget(self, directory: str) -> None:
+        # El watch de un directorio invalidado se quita para volver a crearlo al releerlo
+        self.unwatch(directory)
+
+    def close(self) -> None:
+        fd, self.__fd = self.__fd, None
+        self.__directories.clear()
+        self.__descriptors.clear()
+        if fd is not None:
+            os.close(fd)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from typing_extensions import override
+
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from src.Contexts.SharedKernel.Infrastructure.Services.ChunkedContentHasher import (
+    ChunkedContentHasher,
+)
+from ...Domain.Contracts.VideoUploader import VideoUploader
+from ...Domain.Entities.Video import Video
+
+
+class LocalFileVideoUploader(VideoUploader):
+    """
+    VideoUploader hacia un sistema de archivos local o montado (NFS, SMB), sin pasar los
+    bytes por Python.
+
+    Si el destino está en el mismo sistema de archivos, el video se enlaza con un hard link:
+    es una operación de metadatos sin importar su tamaño. Se usa un enlace y no `os.rename`
+    porque la subida no consume el original: VideoMover lo elimina luego junto con sus
+    archivos auxiliares.
+
+    Entre sistemas de archivos distintos se copia dentro del kernel con `os.copy_file_range`
+    (que en NFS 4.2 y otros puede delegarse al servidor) o `os.sendfile`, en bloques
+    grandes; si ninguno está disponible se copia con `shutil`. La copia se escribe en un
+    archivo temporal del directorio de destino, se sincroniza con fsync y se renombra sobre
+    el destino, por lo que nunca queda un video a medio escribir con el nombre final.
+
+    Los archivos auxiliares del video (ver VideoPath.SIDECAR_EXTENSIONS) se suben igual,
+    junto al destino y con la misma extensión agregada.
+
+    `content_hash` lee el destino para verificarlo contra el hash calculado al grabar, solo
+    si se copió: un destino enlazado es el mismo inodo que el original (se comprueba con
+    `os.path.samestat`), no hay copia que verificar y devuelve None.
+    """
+
+    CHUNK_SIZE = 64 * 1024 * 1024
+    TEMPORARY_SUFFIX = ".part"
+    # Videos enlazados que se recuerdan para no hashearlos; los más viejos se olvidan
+    MAX_REMEMBERED_LINKS = 1024
+    # Errores que indican que el sistema de archivos no admite la operación, no un fallo de E/S
+    __UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.ENOSYS, errno.EINVAL}
+
+    def __init__(self, logger: LoggerInterface):
+        self._logger = logger
+        self.__linked_sources: OrderedDict[str, os.stat_result] = OrderedDict()
+        self.__linked_lock = threading.Lock()
+
+    @override
+    def upload_overwrite(self, video: Video, destination_path: str) -> str:
+        source_path = video.path.value
+        directory = os.path.dirname(os.path.abspath(destination_path))
+        os.makedirs(directory, exist_ok=True)
+        linked = self.__transfer(source_path, destination_path, directory)
+        self.__remember_link(destination_path, os.stat(source_path) if linked else None)
+        for sidecar_path in video.path.sidecar_paths():
+            extension = sidecar_path[len(source_path) :]
+            self.__transfer(sidecar_path, destination_path + extension, directory)
+        self.__fsync_directory(directory)
+        return destination_path
+
+    def __transfer(self, source_path: str, destination_path: str, directory: str) -> bool:
+        """Enlaza o copia el archivo al destino. Devuelve True si se enlazó"""
+        temporary_path = os.path.join(
+            directory,
+            f".{os.path.basename(destination_path)}.{uuid.uuid4().hex}{self.TEMPORARY_SUFFIX}",
+        )
+        try:
+            linked = self.__try_link(source_path, temporary_path)
+            if not linked:
+                self.__copy(source_path, temporary_path)
+            os.replace(temporary_path, destination_path)
+        except BaseException:
+            self.__remove_quietly(temporary_path)
+            raise
+        return linked
+
+    def __remember_link(self, destination_path: str, source_stat: Optional[os.stat_result]) -> None:
+        with self.__linked_lock:
+            self.__linked_sources.pop(destination_path, None)
+            if source_stat is None:
+                return
+            self.__linked_sources[destination_path] = source_stat
+            if len(self.__linked_sources) > self.MAX_REMEMBERED_LINKS:
+                self.__linked_sources.popitem(last=False)
+
+    @override
+    def content_hash(self, upload_result: str) -> Optional[str]:
+        with self.__linked_lock:
+            source_stat = self.__linked_sources.pop(upload_result, None)
+        if source_stat is not None and os.path.samestat(source_stat, os.stat(upload_result)):
+            self._logger.debug(f"Video enlazado, no hay copia que verificar: {upload_result}")
+            return None
+        return ChunkedContentHasher.hash_file(upload_result)
+
+    def __try_link(self, source_path: str, temporary_path: str) -> bool:
+        try:
+            os.link(source_path, temporary_path)
+        except OSError as e:
+            if e.errno not in self.__UNSUPPORTED_ERRNOS:
+                raise
+            return False
+        self._logger.debug(f"Archivo enlazado sin copiar: {source_path}")
+        return True
+
+    def __copy(self, source_path: str, temporary_path: str) -> None:
+        with open(source_path, "rb") as source, open(temporary_path, "wb") as target:
+            size = os.fstat(source.fileno()).st_size
+            copied = self.__copy_in_kernel(source.fileno(), target.fileno(), size)
+            if copied < size:
+                # Sin copia en el kernel: se copia lo que falte desde la posición alcanzada
+                source.seek(copied)
+                target.seek(copied)
+                shutil.copyfileobj(source, target, self.CHUNK_SIZE)
+            target.flush()
+            os.fsync(target.fileno())
+        shutil.copystat(source_path, temporary_path)
+
+    def __copy_in_kernel(self, source_fd: int, target_fd: int, size: int) -> int:
+        """Copia con copy_file_range o sendfile y devuelve los bytes copiados"""
+        copied = 0
+        for method in (self.__copy_file_range, self.__sendfile):
+            try:
+                while copied < size:
+                    count = method(
+                        source_fd, target_fd, copied, min(self.CHUNK_SIZE, size - copied)
+                    )
+                    if count == 0:
+                        break
+                    copied += count
+            except OSError as e:
+                if e.errno not in self.__UNSUPPORTED_ERRNOS:
+                    raise
+            if copied == size:
+                break
+        return copied
+
+    def __copy_file_range(self, source_fd: int, target_fd: int, offset: int, count: int) -> int:
+        if not hasattr(os, "copy_file_range"):
+            raise OSError(errno.ENOSYS, "copy_file_range no está disponible")
+        return os.copy_file_range(source_fd, target_fd, count, offset, offset)
+
+    def __sendfile(self, source_fd: int, target_fd: int, offset: int, count: int) -> int:
+        if not hasattr(os, "sendfile"):
+            raise OSError(errno.ENOSYS, "sendfile no está disponible")
+        os.lseek(target_fd, offset, os.SEEK_SET)
+        return os.sendfile(target_fd, source_fd, offset, count)
+
+    def __fsync_directory(self, directory: str) -> None:
+        # Persiste la entrada del directorio creada por el rename
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def __remove_quietly(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
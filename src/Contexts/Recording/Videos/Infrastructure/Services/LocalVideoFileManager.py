@@ -33,12 +33,23 @@ class LocalVideoFileManager(VideoFileManager):
                 return False
 
             self._logger.info(f"Archivo eliminado exitosamente: {file_path}")
+            self._delete_sidecars(video)
             return True
 
         except Exception as e:
             self._logger.error(f"Error al eliminar archivo {video.path.value}: {str(e)}")
             return False
 
+    def _delete_sidecars(self, video: Video) -> None:
+        """Elimina los archivos auxiliares del video; sin el video no tienen uso"""
+        for sidecar_path in video.path.sidecar_paths():
+            try:
+                os.remove(sidecar_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._logger.warn(f"No se pudo eliminar {sidecar_path}: {str(e)}")
+
     def exists(self, video: Video) -> bool:
         """
         Verifica si el archivo de video existe en el sistema de archivos
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from typing_extensions import override
+
+from src.Contexts.SharedKernel.Domain.UuidGenerator import UuidGenerator
+from ...Domain.Contracts.VideoRepository import VideoRepository
+from ...Domain.Entities.Video import Video
+from ...Domain.ValueObjects.VideoExtension import VideoExtension
+from .InotifyDirectoryWatcher import InotifyDirectoryWatcher
+
+
+class _DirectoryListing:
+    """Nombres de los videos de un directorio según su última lectura"""
+
+    def __init__(self, mtime_ns: int, names: Set[str], is_trusted: bool, is_watched: bool):
+        self.mtime_ns = mtime_ns
+        self.names = names
+        self.is_trusted = is_trusted
+        self.is_watched = is_watched
+
+
+class LocalVideoRepository(VideoRepository):
+    """
+    Implementación de VideoRepository sobre el sistema de archivos local.
+
+    Cada directorio se lee una vez con `os.scandir`, que informa si una entrada es un archivo
+    sin hacer stat de cada una, y su listado se guarda en memoria. Mientras el mtime del
+    directorio no cambie, las búsquedas se responden desde el listado con un único stat del
+    directorio. Un listado leído menos de `RACY_SECONDS` después de la última modificación
+    del directorio no se da por válido, porque un archivo creado en el mismo instante no
+    cambiaría el mtime.
+
+    Con `use_inotify` (solo Linux) los directorios leídos además se observan con inotify y el
+    listado se actualiza con cada archivo creado o eliminado, sin siquiera el stat del
+    directorio. Si inotify no está disponible, o se alcanzó el límite de watches, se usa el
+    mtime.
+    """
+
+    RACY_SECONDS = 1.0
+
+    def __init__(self, uuid_generator: UuidGenerator, use_inotify: bool = False):
+        self._uuid_generator = uuid_generator
+        self.__listings: Dict[str, _DirectoryListing] = {}
+        self.__lock = threading.Lock()
+        self.__watcher: Optional[InotifyDirectoryWatcher] = None
+        if use_inotify and InotifyDirectoryWatcher.is_supported():
+            self.__watcher = InotifyDirectoryWatcher()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.__watcher is not None
+
+    @override
+    def find_videos_in_directory(self, directory_path: str) -> List[Video]:
+        directory = os.path.abspath(directory_path)
+        with self.__lock:
+            listing = self.__listing(directory)
+            names = sorted(listing.names) if listing is not None else []
+        videos = []
+        for name in names:
+            try:
+                videos.append(self.__create_video(os.path.join(directory, name)))
+            except ValueError:
+                # Un archivo con un nombre que no es válido para un Video no es una grabación
+                continue
+        return videos
+
+    @override
+    def find_by_path(self, video_path: str) -> Optional[Video]:
+        path = os.path.abspath(video_path)
+        directory, name = os.path.split(path)
+        if not self.__is_video_name(name):
+            return None
+        with self.__lock:
+            listing = self.__listing(directory)
+            exists = listing is not None and name in listing.names
+        return self.__create_video(path) if exists else None
+
+    def invalidate(self, directory_path: Optional[str] = None) -> None:
+        """Descarta el listado de un directorio, o de todos, para que se vuelva a leer"""
+        with self.__lock:
+            directories = (
+                [os.path.abspath(directory_path)]
+                if directory_path is not None
+                else list(self.__listings)
+            )
+            for directory in directories:
+                self.__forget(directory)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__listings.clear()
+            watcher, self.__watcher = self.__watcher, None
+            if watcher is not None:
+                watcher.close()
+
+    def __listing(self, directory: str) -> Optional[_DirectoryListing]:
+        self.__apply_watcher_changes()
+        listing = self.__listings.get(directory)
+        if listing is not None and listing.is_watched:
+            return listing
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self.__forget(directory)
+            return None
+        if listing is not None and listing.is_trusted and listing.mtime_ns == mtime_ns:
+            return listing
+        return self.__scan(directory, mtime_ns)
+
+    def __scan(self, directory: str, mtime_ns: int) -> Optional[_DirectoryListing]:
+        # El watch se crea antes de leer: un archivo creado durante la lectura no se pierde
+        is_watched = self.__watcher is not None and self.__watcher.watch(directory)
+        try:
+            with os.scandir(directory) as entries:
+                names = {
+                    entry.name
+                    for entry in entries
+                    if self.__is_video_name(entry.name) and entry.is_file()
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            self.__forget(directory)
+            return None
+        is_trusted = time.time_ns() - mtime_ns > self.RACY_SECONDS * 1e9
+        listing = _DirectoryListing(mtime_ns, names, is_trusted, is_watched)
+        self.__listings[directory] = listing
+        return listing
+
+    def __apply_watcher_changes(self) -> None:
+        if self.__watcher is None:
+            return
+        changes, invalidated = self.__watcher.read_changes()
+        for directory, name, exists in changes:
+            listing = self.__listings.get(directory)
+            if listing is None or not self.__is_video_name(name):
+                continue
+            if exists:
+                listing.names.add(name)
+            else:
+                listing.names.discard(name)
+        for directory in invalidated:
+            self.__listings.pop(directory, None)
+
+    def __forget(self, directory: str) -> None:
+        self.__listings.pop(directory, None)
+        if self.__watcher is not None:
+            self.__watcher.unwatch(directory)
+
+    def __is_video_name(self, name: str) -> bool:
+        return os.path.splitext(name)[1].lower() in VideoExtension.SUPPORTED_EXTENSIONS
+
+    def __create_video(self, path: str) -> Video:
+        return Video.create_from_file_path(self._uuid_generator.generate(), path)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from typing import List, Optional
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Application.UseCases.MoveVideoUseCase import MoveVideoUseCase
+from ...Domain.Contracts.MoveJobQueue import MoveJobQueue
+from ...Domain.Exceptions.VideoNotFoundException import VideoNotFoundException
+from ...Domain.Exceptions.VideoUploadBusyException import VideoUploadBusyException
+from ...Domain.ValueObjects.MoveJob import MoveJob
+from ...Domain.ValueObjects.MoveWorkerPoolMetrics import MoveWorkerPoolMetrics
+
+
+class MoveVideoWorkerPool:
+    """
+    Pool de threads dedicados que toman movimientos de la MoveJobQueue y los ejecutan con
+    MoveVideoUseCase, fuera de los threads de grabación.
+
+    Un movimiento fallido se reintenta con la espera de `backoff` hasta agotar sus intentos;
+    luego se abandona. Si el video ya no existe se da por completado: con entrega "al menos
+    una vez", un movimiento que terminó sin llegar a confirmarse se vuelve a ejecutar tras un
+    reinicio y encuentra el archivo ya eliminado.
+
+    La cantidad de workers fija cuántos videos se mueven a la vez; para limitar además la
+    concurrencia por destino se usa un ConcurrencyLimitedVideoUploader. Un movimiento cuyo
+    destino está saturado se pospone `busy_retry_seconds` sin consumir intentos y el worker
+    toma el siguiente.
+    """
+
+    def __init__(
+        self,
+        move_job_queue: MoveJobQueue,
+        move_video_use_case: MoveVideoUseCase,
+        logger: LoggerInterface,
+        workers: int = 4,
+        backoff: Optional[ExponentialBackoff] = None,
+        poll_seconds: float = 1.0,
+        busy_retry_seconds: float = 1.0,
+    ):
+        if workers <= 0:
+            raise ValueError("El pool de movimientos necesita al menos un worker")
+        self.__queue = move_job_queue
+        self.__move_video_use_case = move_video_use_case
+        self.__logger = logger
+        self.__workers = workers
+        self.__backoff = backoff or ExponentialBackoff(
+            base_delay_seconds=5.0, max_delay_seconds=600.0, max_attempts=10
+        )
+        self.__poll_seconds = poll_seconds
+        self.__busy_retry_seconds = busy_retry_seconds
+        self.__stopped = threading.Event()
+        self.__threads: List[threading.Thread] = []
+        self.__counters_lock = threading.Lock()
+        self.__busy_workers = 0
+        self.__completed = 0
+        self.__retried = 0
+        self.__abandoned = 0
+
+    def start(self) -> None:
+        """Recupera los movimientos que quedaron en curso y arranca los workers"""
+        if self.__threads:
+            return
+        recovered = self.__queue.recover()
+        if recovered:
+            self.__logger.info(f"Movimientos de videos recuperados tras un reinicio: {recovered}")
+        self.__stopped.clear()
+        for index in range(self.__workers):
+            thread = threading.Thread(target=self.__run, name=f"move-video-{index}", daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+
+    def metrics(self) -> MoveWorkerPoolMetrics:
+        queue = self.__queue.stats()
+        with self.__counters_lock:
+            return MoveWorkerPoolMetrics(
+                queue=queue,
+                workers=len(self.__threads),
+                busy_workers=self.__busy_workers,
+                completed=self.__completed,
+                retried=self.__retried,
+                abandoned=self.__abandoned,
+            )
+
+    def stop(self, timeout_seconds: Optional[float] = None) -> None:
+        """
+        Detiene los workers tras su movimiento en curso. Uno que no termina a tiempo queda
+        tomado en la cola y se recupera cuando el proceso cierra la cola o termina
+        """
+        self.__stopped.set()
+        threads, self.__threads = self.__threads, []
+        for thread in threads:
+            thread.join(timeout_seconds)
+
+    def __run(self) -> None:
+        while not self.__stopped.is_set():
+            try:
+                job = self.__queue.claim(self.__poll_seconds)
+            except Exception as e:
+                self.__logger.error(f"Error al tomar un movimiento de la cola: {e}")
+                self.__stopped.wait(self.__poll_seconds)
+                continue
+            if job is None:
+                continue
+            self.__count_busy(1)
+            try:
+                self.__process(job)
+            finally:
+                self.__count_busy(-1)
+
+    def __count_busy(self, delta: int) -> None:
+        with self.__counters_lock:
+            self.__busy_workers += delta
+
+    def __process(self, job: MoveJob) -> None:
+        try:
+            self.__move_video_use_case.execute(job.video_path, job.content_hash)
+        except VideoNotFoundException:
+            self.__logger.info(f"El video ya no existe, movimiento completado: {job.video_path}")
+        except VideoUploadBusyException as e:
+            self.__logger.debug(f"Se pospone el movimiento de {job.video_path}: {e}")
+            self.__queue.postpone(job, self.__busy_retry_seconds)
+            return
+        except Exception as e:
+            self.__handle_failure(job, e)
+            return
+        self.__queue.complete(job)
+        with self.__counters_lock:
+            self.__completed += 1
+
+    def __handle_failure(self, job: MoveJob, error: Exception) -> None:
+        if not self.__backoff.allows(job.attempts):
+            self.__logger.error(
+                f"Se abandona el movimiento de {job.video_path} tras {job.attempts} intentos: "
+                f"{error}"
+            )
+            self.__queue.abandon(job, str(error))
+            with self.__counters_lock:
+                self.__abandoned += 1
+            return
+        delay = self.__backoff.delay_for(job.attempts - 1)
+        self.__logger.error(
+            f"Error al mover {job.video_path} (intento {job.attempts}), "
+            f"se reintenta en {delay:.1f}s: {error}"
+        )
+        self.__queue.retry(job, delay, str(error))
+        with self.__counters_lock:
+            self.__retried += 1
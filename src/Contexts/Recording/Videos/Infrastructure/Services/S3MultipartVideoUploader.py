@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set, Tuple
+
+from typing_extensions import override
+
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from ...Domain.Contracts.VideoUploader import VideoUploader
+from ...Domain.Entities.Video import Video
+from ...Domain.Exceptions.VideoUploadFailedException import VideoUploadFailedException
+
+
+class _PartReader(io.RawIOBase):
+    """Lectura de una parte del archivo mapeado en memoria, sin copiarla entera"""
+
+    def __init__(self, view: memoryview):
+        self.__view = view
+        self.__position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = min(len(buffer), len(self.__view) - self.__position)
+        buffer[:count] = self.__view[self.__position : self.__position + count]
+        self.__position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.__position, io.SEEK_END: len(self.__view)}
+        self.__position = min(max(0, base[whence] + offset), len(self.__view))
+        return self.__position
+
+    def tell(self) -> int:
+        return self.__position
+
+    def __len__(self) -> int:
+        return len(self.__view)
+
+
+class _UploadState:
+    """
+    Estado persistido de una subida multipart: permite retomarla tras un corte mientras el
+    archivo de origen no cambie (mismo tamaño y mtime)
+    """
+
+    def __init__(self, path: str, data: Dict[str, Any]):
+        self.__path = path
+        self.__data = data
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, source: Dict[str, Any]) -> Optional[_UploadState]:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get("source") != source:
+            return None
+        return cls(path, data)
+
+    @classmethod
+    def create(cls, path: str, source: Dict[str, Any], upload_id: str) -> _UploadState:
+        state = cls(path, {"source": source, "upload_id": upload_id, "parts": {}})
+        state.save()
+        return state
+
+    @property
+    def upload_id(self) -> str:
+        return self.__data["upload_id"]
+
+    def parts(self) -> Dict[int, Tuple[str, str]]:
+        """ETag y MD5 de cada parte subida, por número de parte"""
+        with self.__lock:
+            return {
+                int(number): (part["etag"], part["md5"])
+                for number, part in self.__data["parts"].items()
+            }
+
+    def keep_only(self, part_numbers: Set[int]) -> None:
+        with self.__lock:
+            self.__data["parts"] = {
+                number: part
+                for number, part in self.__data["parts"].items()
+                if int(number) in part_numbers
+            }
+        self.save()
+
+    def add_part(self, part_number: int, etag: str, md5: str) -> None:
+        with self.__lock:
+            self.__data["parts"][str(part_number)] = {"etag": etag, "md5": md5}
+        self.save()
+
+    def save(self) -> None:
+        with self.__lock:
+            temporary_path = f"{self.__path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(self.__data, file)
+            os.replace(temporary_path, self.__path)
+
+    def delete(self) -> None:
+        try:
+            os.remove(self.__path)
+        except FileNotFoundError:
+            pass
+
+
+class S3MultipartVideoUploader(VideoUploader):
+    """
+    VideoUploader hacia un almacenamiento de objetos compatible con S3 (AWS, MinIO, Ceph...)
+    con subidas multipart que se retoman tras un corte.
+
+    El archivo se mapea en memoria y se sube en partes de `part_size` bytes, hasta
+    `max_concurrent_parts` a la vez. Cada parte se lee del mapeo a medida que se envía, por
+    lo que la memoria de una subida no depende del tamaño del video. El MD5 de cada parte se
+    envía como Content-MD5 para que el servidor verifique lo recibido; por eso no se
+    implementa `content_hash`, que obligaría a descargar el objeto para verificarlo.
+
+    El upload id y el ETag y MD5 de cada parte confirmada se guardan en `state_directory`.
+    Si la subida se corta, el próximo intento del mismo archivo (mismo tamaño y mtime)
+    consulta las partes que el servidor ya tiene y sube solo las que faltan. Una subida sin
+    terminar no se aborta, justamente para poder retomarla; conviene configurar en el bucket
+    una regla de ciclo de vida que limpie las subidas multipart abandonadas.
+
+    Los archivos auxiliares del video (ver VideoPath.SIDECAR_EXTENSIONS) se suben con un
+    `put_object` a la clave del video con la misma extensión agregada.
+
+    Requiere boto3 (dependencia opcional, grupo `storage`) salvo que se pase `client`.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+    MAX_PARTS = 10000
+
+    def __init__(
+        self,
+        bucket: str,
+        state_directory: str,
+        logger: LoggerInterface,
+        client: Optional[Any] = None,
+        endpoint_url: Optional[str] = None,
+        part_size: int = 64 * 1024 * 1024,
+        max_concurrent_parts: int = 4,
+    ):
+        if part_size < self.MIN_PART_SIZE:
+            raise ValueError(
+                f"Las partes de la subida multipart deben ser de {self.MIN_PART_SIZE} bytes o más"
+            )
+        if max_concurrent_parts <= 0:
+            raise ValueError("La subida multipart necesita al menos una parte en curso")
+        self.__bucket = bucket
+        self.__state_directory = state_directory
+        self.__logger = logger
+        self.__client = client if client is not None else self.__create_client(endpoint_url)
+        self.__part_size = part_size
+        self.__max_concurrent_parts = max_concurrent_parts
+        os.makedirs(state_directory, exist_ok=True)
+
+    def __create_client(self, endpoint_url: Optional[str]) -> Any:
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImportError(
+                "S3MultipartVideoUploader requiere boto3: pip install neuralcam[storage]"
+            ) from e
+        return boto3.client("s3", endpoint_url=endpoint_url)
+
+    @override
+    def upload_overwrite(self, video: Video, destination_path: str) -> str:
+        key = self.__key_for(destination_path)
+        try:
+            self.__upload(video.path.value, key)
+            for sidecar_path in video.path.sidecar_paths():
+                self.__upload_small(sidecar_path, key + sidecar_path[len(video.path.value) :])
+        except Exception as e:
+            raise VideoUploadFailedException(
+                f"Error al subir {video.path.value} a s3://{self.__bucket}/{key}: {e}", e
+            )
+        return f"s3://{self.__bucket}/{key}"
+
+    def __key_for(self, destination_path: str) -> str:
+        prefix = f"s3://{self.__bucket}/"
+        if destination_path.startswith(prefix):
+            return destination_path[len(prefix) :]
+        return destination_path.lstrip("/")
+
+    def __upload_small(self, source_path: str, key: str) -> None:
+        """Sube en una sola petición un archivo auxiliar del video, que ocupa poco"""
+        with open(source_path, "rb") as file:
+            self.__client.put_object(Bucket=self.__bucket, Key=key, Body=file.read())
+
+    def __upload(self, source_path: str, key: str) -> None:
+        with open(source_path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_size == 0:
+                self.__client.put_object(Bucket=self.__bucket, Key=key, Body=b"")
+                return
+            part_size = self.__part_size_for(stat.st_size)
+            source = {
+                "bucket": self.__bucket,
+                "key": key,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "part_size": part_size,
+            }
+            state = self.__resume_or_create(source)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.__upload_missing_parts(mapped, part_size, key, state)
+                parts = state.parts()
+        self.__client.complete_multipart_upload(
+            Bucket=self.__bucket,
+            Key=key,
+            UploadId=state.upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": number, "ETag": parts[number][0]} for number in sorted(parts)
+                ]
+            },
+        )
+        state.delete()
+
+    def __part_size_for(self, size: int) -> int:
+        # Un archivo que superaría el máximo de partes usa partes más grandes, en MiB enteros
+        minimum = -(-size // self.MAX_PARTS)
+        if minimum <= self.__part_size:
+            return self.__part_size
+        mebibyte = 1024 * 1024
+        return -(-minimum // mebibyte) * mebibyte
+
+    def __state_path(self, source: Dict[str, Any]) -> str:
+        name = hashlib.sha1(f"{source['bucket']}/{source['key']}".encode()).hexdigest()
+        return os.path.join(self.__state_directory, f"{name}.json")
+
+    def __resume_or_create(self, source: Dict[str, Any]) -> _UploadState:
+        path = self.__state_path(source)
+        state = _UploadState.load(path, source)
+        if state is not None:
+            server_parts = self.__server_parts(source["key"], state.upload_id)
+            if server_parts is not None:
+                # Se conservan solo las partes confirmadas que el servidor tiene con el mismo ETag
+                state.keep_only(
+                    {
+                        number
+                        for number, (etag, _) in state.parts().items()
+                        if server_parts.get(number) == etag
+                    }
+                )
+                self.__logger.info(
+                    f"Se retoma la subida de {source['key']} con {len(state.parts())} partes"
+                )
+                return state
+        response = self.__client.create_multipart_upload(Bucket=self.__bucket, Key=source["key"])
+        return _UploadState.create(path, source, response["UploadId"])
+
+    def __server_parts(self, key: str, upload_id: str) -> Optional[Dict[int, str]]:
+        """ETags de las partes que el servidor tiene, o None si la subida ya no existe"""
+        parts: Dict[int, str] = {}
+        marker = 0
+        while True:
+            try:
+                response = self.__client.list_parts(
+                    Bucket=self.__bucket, Key=key, UploadId=upload_id, PartNumberMarker=marker
+                )
+            except Exception as e:
+                self.__logger.info(f"No se puede retomar la subida de {key}: {e}")
+                return None
+            for part in response.get("Parts", []):
+                parts[part["PartNumber"]] = part["ETag"]
+            if not response.get("IsTruncated"):
+                return parts
+            marker = response["NextPartNumberMarker"]
+
+    def __upload_missing_parts(
+        self, mapped: mmap.mmap, part_size: int, key: str, state: _UploadState
+    ) -> None:
+        uploaded = state.parts()
+        part_count = -(-len(mapped) // part_size)
+        missing = [number for number in range(1, part_count + 1) if number not in uploaded]
+        executor = ThreadPoolExecutor(max_workers=self.__max_concurrent_parts)
+        try:
+            futures = [
+                executor.submit(self.__upload_part, mapped, part_size, number, key, state)
+                for number in missing
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            # Ante un error no se empiezan las partes pendientes: se retoman en otro intento
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __upload_part(
+        self, mapped: mmap.mmap, part_size: int, part_number: int, key: str, state: _UploadState
+    ) -> None:
+        start = (part_number - 1) * part_size
+        # La vista se libera al terminar: el mapeo no puede cerrarse mientras haya vistas
+        with memoryview(mapped)[start : start + part_size] as view:
+            md5 = hashlib.md5(view)
+            response = self.__client.upload_part(
+                Bucket=self.__bucket,
+                Key=key,
+                UploadId=state.upload_id,
+                PartNumber=part_number,
+                Body=_PartReader(view),
+                ContentLength=len(view),
+                ContentMD5=base64.b64encode(md5.digest()).decode("ascii"),
+            )
+        state.add_part(part_number, response["ETag"], md5.hexdigest())
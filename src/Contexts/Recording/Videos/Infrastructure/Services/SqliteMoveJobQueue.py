@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Iterable, Mapping, Optional
+
+from typing_extensions import override
+
+from ...Domain.Contracts.MoveJobQueue import MoveJobQueue
+from ...Domain.ValueObjects.MoveJob import MoveJob
+from ...Domain.ValueObjects.MoveJobQueueStats import MoveJobQueueStats
+
+
+class SqliteMoveJobQueue(MoveJobQueue):
+    """
+    Cola de movimientos en SQLite. Cada movimiento pasa por los estados `pending` (esperando,
+    desde `available_at`), `running` (tomado por un worker) y `failed` (abandonado); al
+    completarse se elimina. Los instantes son de reloj de pared para que los reintentos
+    programados sobrevivan a un reinicio.
+
+    `claim` toma el movimiento dentro de una transacción `BEGIN IMMEDIATE`, por lo que varios
+    procesos pueden compartir la base. Dentro del proceso, los workers que esperan trabajo se
+    despiertan al encolar o reintentar, sin consultar la base periódicamente.
+
+    Cada instancia se registra como dueña de los movimientos que toma y renueva su registro
+    cada `lease_seconds / 3` desde un thread propio, independientemente de cuánto dure cada
+    subida. `recover` solo devuelve a la cola los movimientos de dueños que cerraron la cola
+    o que no renovaron su registro en `lease_seconds` (el proceso terminó), nunca los que
+    otro proceso vivo está subiendo.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+    __SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS move_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            video_path TEXT NOT NULL,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            enqueued_at REAL NOT NULL,
+            available_at REAL NOT NULL,
+            last_error TEXT,
+            content_hash TEXT,
+            claimed_by TEXT
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS move_jobs_available
+            ON move_jobs (state, available_at)
+        """,
+        # Un video pendiente o en curso no se encola dos veces
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS move_jobs_active_path
+            ON move_jobs (video_path) WHERE state != 'failed'
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS move_job_owners (
+            owner TEXT PRIMARY KEY,
+            heartbeat_at REAL NOT NULL
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def __init__(self, database_path: str, lease_seconds: float = 60.0):
+        if lease_seconds <= 0:
+            raise ValueError("La duración del registro de los dueños de la cola debe ser mayor a 0")
+        if database_path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(database_path))
+            os.makedirs(directory, exist_ok=True)
+        self.__condition = threading.Condition()
+        # Sin transacciones implícitas: cada operación abre la suya
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False, isolation_level=None
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA busy_timeout=5000")
+        with self.__transaction():
+            for statement in self.__SCHEMA:
+                self.__connection.execute(statement)
+            self.__add_missing_columns()
+        self.__lease_seconds = lease_seconds
+        self.__owner = uuid.uuid4().hex
+        self.__closed = threading.Event()
+        self.__renew_ownership()
+        self.__heartbeat = threading.Thread(
+            target=self.__run_heartbeat, name="move-job-queue-heartbeat", daemon=True
+        )
+        self.__heartbeat.start()
+
+    def __add_missing_columns(self) -> None:
+        # Bases creadas antes de registrar los dueños de los movimientos
+        columns = {row[1] for row in self.__connection.execute("PRAGMA table_info(move_jobs)")}
+        if "claimed_by" not in columns:
+            self.__connection.execute("ALTER TABLE move_jobs ADD COLUMN claimed_by TEXT")
+
+    def __run_heartbeat(self) -> None:
+        while not self.__closed.wait(self.__lease_seconds / 3):
+            try:
+                self.__renew_ownership()
+            except sqlite3.Error:
+                # Base ocupada o cerrada: se reintenta en la próxima renovación
+                pass
+
+    def __renew_ownership(self) -> None:
+        with self.__condition, self.__transaction():
+            self.__connection.execute(
+                """
+                INSERT INTO move_job_owners (owner, heartbeat_at) VALUES (?, ?)
+                ON CONFLICT (owner) DO UPDATE SET heartbeat_at = excluded.heartbeat_at
+                """,
+                (self.__owner, time.time()),
+            )
+
+    @override
+    def enqueue(
+        self, video_paths: Iterable[str], content_hashes: Optional[Mapping[str, str]] = None
+    ) -> None:
+        now = time.time()
+        hashes = content_hashes or {}
+        rows = [(path, self.PENDING, now, now, hashes.get(path)) for path in video_paths]
+        with self.__condition:
+            with self.__transaction():
+                self.__connection.executemany(
+                    """
+                    INSERT OR IGNORE INTO move_jobs
+                        (video_path, state, enqueued_at, available_at, content_hash)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+            self.__condition.notify_all()
+
+    @override
+    def claim(self, timeout_seconds: float) -> Optional[MoveJob]:
+        deadline = time.monotonic() + timeout_seconds
+        with self.__condition:
+            while True:
+                job = self.__claim_available()
+                if job is not None:
+                    return job
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                next_available = self.__seconds_until_next_available()
+                if next_available is not None:
+                    remaining = min(remaining, next_available)
+                self.__condition.wait(remaining)
+
+    def __claim_available(self) -> Optional[MoveJob]:
+        with self.__transaction(immediate=True):
+            row = self.__connection.execute(
+                """
+                SELECT id, video_path, attempts, content_hash FROM move_jobs
+                WHERE state = ? AND available_at <= ?
+                ORDER BY available_at, id LIMIT 1
+                """,
+                (self.PENDING, time.time()),
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, video_path, attempts, content_hash = row
+            self.__connection.execute(
+                "UPDATE move_jobs SET state = ?, attempts = ?, claimed_by = ? WHERE id = ?",
+                (self.RUNNING, attempts + 1, self.__owner, job_id),
+            )
+        return MoveJob(
+            job_id=job_id,
+            video_path=video_path,
+            attempts=attempts + 1,
+            content_hash=content_hash,
+        )
+
+    def __seconds_until_next_available(self) -> Optional[float]:
+        row = self.__connection.execute(
+            "SELECT min(available_at) FROM move_jobs WHERE state = ?", (self.PENDING,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    @override
+    def complete(self, job: MoveJob) -> None:
+        with self.__condition, self.__transaction():
+            self.__connection.execute("DELETE FROM move_jobs WHERE id = ?", (job.job_id,))
+
+    @override
+    def retry(self, job: MoveJob, delay_seconds: float, error: str) -> None:
+        with self.__condition:
+            with self.__transaction():
+                self.__connection.execute(
+                    """
+                    UPDATE move_jobs SET state = ?, available_at = ?, last_error = ?,
+                        claimed_by = NULL
+                    WHERE id = ?
+                    """,
+                    (self.PENDING, time.time() + delay_seconds, error, job.job_id),
+                )
+            self.__condition.notify_all()
+
+    @override
+    def postpone(self, job: MoveJob, delay_seconds: float) -> None:
+        with self.__condition:
+            with self.__transaction():
+                self.__connection.execute(
+                    """
+                    UPDATE move_jobs SET state = ?, available_at = ?, attempts = attempts - 1,
+                        claimed_by = NULL
+                    WHERE id = ?
+                    """,
+                    (self.PENDING, time.time() + delay_seconds, job.job_id),
+                )
+            self.__condition.notify_all()
+
+    @override
+    def abandon(self, job: MoveJob, error: str) -> None:
+        with self.__condition, self.__transaction():
+            self.__connection.execute(
+                "UPDATE move_jobs SET state = ?, last_error = ?, claimed_by = NULL WHERE id = ?",
+                (self.FAILED, error, job.job_id),
+            )
+
+    @override
+    def recover(self) -> int:
+        with self.__condition:
+            with self.__transaction(immediate=True):
+                self.__connection.execute(
+                    "DELETE FROM move_job_owners WHERE heartbeat_at < ?",
+                    (time.time() - self.__lease_seconds,),
+                )
+                cursor = self.__connection.execute(
+                    """
+                    UPDATE move_jobs SET state = ?, claimed_by = NULL
+                    WHERE state = ? AND (
+                        claimed_by IS NULL
+                        OR claimed_by NOT IN (SELECT owner FROM move_job_owners)
+                    )
+                    """,
+                    (self.PENDING, self.RUNNING),
+                )
+            self.__condition.notify_all()
+            return cursor.rowcount
+
+    @override
+    def stats(self) -> MoveJobQueueStats:
+        with self.__condition:
+            rows = self.__connection.execute(
+                "SELECT state, count(*), min(enqueued_at) FROM move_jobs GROUP BY state"
+            ).fetchall()
+        counts = {state: count for state, count, _ in rows}
+        oldest = min(
+            (enqueued_at for state, _, enqueued_at in rows if state != self.FAILED),
+            default=None,
+        )
+        return MoveJobQueueStats(
+            pending=counts.get(self.PENDING, 0),
+            running=counts.get(self.RUNNING, 0),
+            failed=counts.get(self.FAILED, 0),
+            oldest_job_age_seconds=max(0.0, time.time() - oldest) if oldest is not None else 0.0,
+        )
+
+    def close(self) -> None:
+        """
+        Cierra la cola. Los movimientos que esta instancia deja tomados se recuperan en el
+        próximo `recover`, sin esperar a que venza su registro
+        """
+        self.__closed.set()
+        self.__heartbeat.join()
+        with self.__condition:
+            with self.__transaction():
+                self.__connection.execute(
+                    "DELETE FROM move_job_owners WHERE owner = ?", (self.__owner,)
+                )
+            self.__connection.close()
+
+    def __transaction(self, immediate: bool = False) -> _Transaction:
+        return _Transaction(self.__connection, immediate)
+
+
+class _Transaction:
+    """Transacción explícita sobre una conexión sin transacciones implícitas"""
+
+    def __init__(self, connection: sqlite3.Connection, immediate: bool):
+        self.__connection = connection
+        self.__immediate = immediate
+
+    def __enter__(self) -> None:
+        self.__connection.execute("BEGIN IMMEDIATE" if self.__immediate else "BEGIN")
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.__connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
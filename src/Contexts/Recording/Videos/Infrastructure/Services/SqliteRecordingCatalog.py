@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+
+from typing_extensions import override
+
+from ...Domain.Contracts.RecordingCatalog import RecordingCatalog
+from ...Domain.ValueObjects.RecordingCatalogEntry import RecordingCatalogEntry
+from ...Domain.ValueObjects.StorageLocation import StorageLocation
+
+
+class SqliteRecordingCatalog(RecordingCatalog):
+    """
+    Catálogo de grabaciones en SQLite. Los instantes se guardan como microsegundos enteros
+    (exactos, a diferencia de REAL); las fechas con zona horaria se convierten a UTC y las
+    fechas sin zona se guardan tal cual, como las usa el resto del sistema.
+
+    Una consulta de intervalo "inicio < T2 y fin > T1" no puede recorrer un índice B-tree por
+    las dos columnas a la vez. Por eso se guarda, por perfil, la duración del segmento más
+    largo registrado: un segmento que cubre T1 empezó como mucho esa duración antes, y la
+    consulta se reduce a un rango acotado del índice (perfil, inicio) en lugar de recorrer
+    todo el historial del perfil. Como los segmentos de un perfil duran lo mismo, el rango
+    leído es apenas mayor que el resultado.
+    """
+
+    __EPOCH = datetime(1970, 1, 1)
+    __MICROSECOND = timedelta(microseconds=1)
+    __SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS recordings (
+            id INTEGER PRIMARY KEY,
+            profile TEXT NOT NULL,
+            start_us INTEGER NOT NULL,
+            end_us INTEGER NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            path TEXT NOT NULL UNIQUE,
+            location TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS recordings_profile_start
+            ON recordings (profile, start_us, end_us)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS profile_spans (
+            profile TEXT PRIMARY KEY,
+            max_duration_us INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """,
+    )
+    __FIND_BETWEEN = """
+        SELECT profile, start_us, end_us, size_bytes, path, location
+        FROM recordings
+        WHERE profile = ? AND start_us >= ? AND start_us < ? AND end_us > ?
+        ORDER BY start_us
+    """
+
+    def __init__(self, database_path: str):
+        if database_path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(database_path))
+            os.makedirs(directory, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(database_path, check_same_thread=False)
+        # WAL permite leer mientras se registran segmentos nuevos
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        with self.__connection:
+            for statement in self.__SCHEMA:
+                self.__connection.execute(statement)
+
+    @override
+    def add(self, entries: Iterable[RecordingCatalogEntry]) -> None:
+        rows = [
+            (
+                entry.profile_name,
+                self.__to_microseconds(entry.start_date),
+                self.__to_microseconds(entry.end_date),
+                entry.size_bytes,
+                entry.path,
+                entry.location.value,
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return
+        spans: Dict[str, int] = {}
+        for profile, start_us, end_us, *_ in rows:
+            spans[profile] = max(spans.get(profile, 0), end_us - start_us)
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                """
+                INSERT INTO recordings (profile, start_us, end_us, size_bytes, path, location)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    profile = excluded.profile,
+                    start_us = excluded.start_us,
+                    end_us = excluded.end_us,
+                    size_bytes = excluded.size_bytes,
+                    location = excluded.location
+                """,
+                rows,
+            )
+            self.__connection.executemany(
+                """
+                INSERT INTO profile_spans (profile, max_duration_us) VALUES (?, ?)
+                ON CONFLICT (profile) DO UPDATE SET
+                    max_duration_us = max(max_duration_us, excluded.max_duration_us)
+                """,
+                spans.items(),
+            )
+
+    @override
+    def find_between(
+        self, profile_name: str, start: datetime, end: datetime
+    ) -> List[RecordingCatalogEntry]:
+        start_us = self.__to_microseconds(start)
+        end_us = self.__to_microseconds(end)
+        if end_us <= start_us:
+            return []
+        with self.__lock:
+            span = self.__connection.execute(
+                "SELECT max_duration_us FROM profile_spans WHERE profile = ?", (profile_name,)
+            ).fetchone()
+            if span is None:
+                return []
+            rows = self.__connection.execute(
+                self.__FIND_BETWEEN, (profile_name, start_us - span[0], end_us, start_us)
+            ).fetchall()
+        return [
+            RecordingCatalogEntry(
+                profile_name=profile,
+                start_date=self.__from_microseconds(row_start_us),
+                end_date=self.__from_microseconds(row_end_us),
+                size_bytes=size_bytes,
+                path=path,
+                location=StorageLocation(location),
+            )
+            for profile, row_start_us, row_end_us, size_bytes, path, location in rows
+        ]
+
+    @override
+    def relocate(self, path: str, new_path: str, location: StorageLocation) -> bool:
+        with self.__lock, self.__connection:
+            cursor = self.__connection.execute(
+                "UPDATE OR REPLACE recordings SET path = ?, location = ? WHERE path = ?",
+                (new_path, location.value, path),
+            )
+            return cursor.rowcount > 0
+
+    def query_plan(self, profile_name: str, start: datetime, end: datetime) -> List[str]:
+        """Plan de SQLite para `find_between`, para verificar que use el índice"""
+        start_us = self.__to_microseconds(start)
+        with self.__lock:
+            rows = self.__connection.execute(
+                f"EXPLAIN QUERY PLAN {self.__FIND_BETWEEN}",
+                (profile_name, start_us, self.__to_microseconds(end), start_us),
+            ).fetchall()
+        return [row[-1] for row in rows]
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    def __to_microseconds(self, date: datetime) -> int:
+        if date.tzinfo is not None:
+            date = date.astimezone(timezone.utc).replace(tzinfo=None)
+        return (date - self.__EPOCH) // self.__MICROSECOND
+
+    def __from_microseconds(self, microseconds: int) -> datetime:
+        return self.__EPOCH + microseconds * self.__MICROSECOND
@@ -0,0 +1,10 @@
+class TaskRejectedException(Exception):
+    """Excepción lanzada cuando el TaskManager no admite más tareas (cola llena)."""
+
+    def __init__(self, task_name: str, queued_tasks: int):
+        super().__init__(
+            f"La tarea '{task_name}' fue rechazada: la cola de tareas está llena "
+            f"({queued_tasks} en espera)"
+        )
+        self.task_name = task_name
+        self.queued_tasks = queued_tasks
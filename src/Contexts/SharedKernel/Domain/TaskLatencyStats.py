@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TaskLatencyStats:
+    """Latencias acumuladas de las tareas terminadas con un mismo nombre"""
+
+    name: str
+    completed: int
+    failed: int
+    cancelled: int
+    mean_start_latency_seconds: float
+    max_start_latency_seconds: float
+    mean_run_seconds: float
+    max_run_seconds: float
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    """Estado de una tarea en segundo plano en un instante dado"""
+
+    task_id: int
+    name: str
+    is_running: bool
+    age_seconds: float
+    queued_seconds: float
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from src.Contexts.SharedKernel.Domain.ValueObjects.StringValueObject import StringValueObject
+
+
+@dataclass(frozen=True)
+class QueueFullPolicy(StringValueObject):
+    """Qué hacer con una tarea nueva cuando la cola de un TaskManager está llena"""
+
+    REJECT = "reject"
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+
+    def __ensure_is_supported_policy(self) -> None:
+        if self.value not in (self.REJECT, self.BLOCK, self.DROP_OLDEST):
+            raise ValueError(
+                f"Política de cola no válida: {self.value}. "
+                f"Políticas permitidas: {self.REJECT}, {self.BLOCK}, {self.DROP_OLDEST}"
+            )
+
+    def __post_init__(self):
+        self.__ensure_is_supported_policy()
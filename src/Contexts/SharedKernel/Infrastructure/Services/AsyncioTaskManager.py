@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.TaskManager import Emit, TaskManager
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from src.Contexts.SharedKernel.Infrastructure.Services.AsyncioTaskRunner import AsyncioTaskRunner
+from src.Contexts.SharedKernel.Infrastructure.Services.CredentialsRedactor import (
+    CredentialsRedactor,
+)
+
+
+class AsyncioTaskManager(TaskManager):
+    """
+    Implementación del TaskManager sobre AsyncioTaskRunner. Cada tarea se supervisa como una
+    corutina del event loop y los valores emitidos se entregan a `on_result` dentro del loop, de
+    modo que la publicación de eventos ocurre en el thread del event loop y no en el de la
+    grabación. Las tareas de `run_sharded` (grabaciones que duran lo que el proceso) corren en
+    un thread propio; las de `fire_and_forget`, en el executor acotado del runner.
+    """
+
+    def __init__(self, logger: LoggerInterface, runner: AsyncioTaskRunner):
+        self.logger = logger
+        self.__runner = runner
+
+    def fire_and_forget(self, callback: Callable[[], None]) -> None:
+        """
+        Ejecuta una tarea bloqueante en el executor del runner sin esperar el resultado.
+
+        Args:
+            callback: Función a ejecutar en background
+        """
+
+        async def supervise() -> None:
+            await self.__runner.run_blocking(callback)
+
+        self.__runner.run(supervise, name=getattr(callback, "__qualname__", None))
+
+    def run_sharded(
+        self,
+        shard_key: str,
+        task: Callable[[Emit], None],
+        on_result: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Ejecuta la tarea en un thread propio; cada valor emitido se entrega a `on_result`
+        como callback del event loop.
+
+        Args:
+            shard_key: Clave de la tarea, usada sin credenciales como nombre para sus latencias
+            task: Tarea a ejecutar
+            on_result: Callback que recibe cada valor emitido por la tarea
+        """
+        loop = self.__runner.loop
+        name = CredentialsRedactor.redact(shard_key)
+
+        def deliver(value: Any) -> None:
+            if on_result is None:
+                return
+            try:
+                on_result(value)
+            except Exception as e:
+                self.logger.error(f"Error procesando el resultado de la tarea {name}: {e}")
+
+        def emit(value: Any) -> None:
+            loop.call_soon_threadsafe(deliver, value)
+
+        async def supervise() -> None:
+            await self.__runner.run_in_thread(task, emit, name=f"asyncio-task-{name}")
+
+        self.__runner.run(supervise, name=name)
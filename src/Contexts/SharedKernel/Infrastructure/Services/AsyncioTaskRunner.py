@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import signal
+import threading
+import time
+from collections.abc import Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+from src.Contexts.SharedKernel.Domain.TaskLatencyStats import TaskLatencyStats
+from src.Contexts.SharedKernel.Domain.TaskRunnerInterface import TaskRunnerInterface
+from src.Contexts.SharedKernel.Domain.TaskSnapshot import TaskSnapshot
+
+T = TypeVar("T")
+
+
+@dataclass
+class _TaskLatencies:
+    # Solo acumuladores: el runner corre durante toda la vida del proceso
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    total_start_latency: float = 0.0
+    max_start_latency: float = 0.0
+    total_run_seconds: float = 0.0
+    max_run_seconds: float = 0.0
+
+    @property
+    def mean_start_latency(self) -> float:
+        return self.total_start_latency / self.__finished() if self.__finished() else 0.0
+
+    @property
+    def mean_run_seconds(self) -> float:
+        return self.total_run_seconds / self.__finished() if self.__finished() else 0.0
+
+    def __finished(self) -> int:
+        return self.completed + self.failed + self.cancelled
+
+    def add(self, start_latency: float, run_seconds: float) -> None:
+        self.total_start_latency += start_latency
+        self.max_start_latency = max(self.max_start_latency, start_latency)
+        self.total_run_seconds += run_seconds
+        self.max_run_seconds = max(self.max_run_seconds, run_seconds)
+
+
+@dataclass
+class _RunningTask:
+    task_id: int
+    name: str
+    submitted_at: float
+    started_at: Optional[float] = None
+    task: Optional[asyncio.Task] = None
+
+
+class AsyncioTaskRunner(TaskRunnerInterface):
+    """
+    Implementación del TaskRunnerInterface sobre un event loop de asyncio que corre en un
+    thread propio. Se usa una única instancia por proceso (`for_current_process`).
+
+    Las corutinas que necesitan llamar código bloqueante deben delegarlo con `run_blocking`,
+    que usa un executor acotado a `max_blocking_workers` threads para que el loop nunca se
+    bloquee; si están todos ocupados la llamada espera su turno y se registra un aviso. El
+    código bloqueante que dura tanto como el proceso (por ejemplo una grabación con PyAV) se
+    delega con `run_in_thread`, en un thread propio, para no ocupar el executor de forma
+    permanente y dejar en espera a las tareas siguientes.
+
+    Por cada nombre de tarea se registra la latencia entre `run` y el inicio de la corutina y
+    su duración. `shutdown` (o SIGTERM, con `install_signal_handlers`) deja de aceptar tareas,
+    espera a las activas hasta `drain_timeout_seconds` y cancela las restantes.
+
+    Cancelar una corutina no interrumpe el código bloqueante que espera en otro thread: las
+    grabaciones seguirían corriendo y el proceso no terminaría. Quien ejecuta código bloqueante
+    de larga duración registra con `add_shutdown_hook` cómo detenerlo (por ejemplo
+    `PyAvVideoRecorder.stop_all`), y `shutdown` invoca esos hooks antes de esperar a las tareas.
+    """
+
+    __instances: Dict[int, AsyncioTaskRunner] = {}
+    __instances_lock = threading.Lock()
+
+    def __init__(self, logger: LoggerInterface, max_blocking_workers: int = 32):
+        self.__logger = logger
+        self.__max_blocking_workers = max_blocking_workers
+        self.__blocking_calls = 0
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_blocking_workers, thread_name_prefix="asyncio-blocking"
+        )
+        self.__loop = asyncio.new_event_loop()
+        self.__loop.set_default_executor(self.__executor)
+        self.__thread = threading.Thread(
+            target=self.__run_loop, name="asyncio-task-runner", daemon=True
+        )
+        self.__tasks: Dict[int, _RunningTask] = {}
+        self.__latencies: Dict[str, _TaskLatencies] = {}
+        self.__shutdown_hooks: List[Callable[[], None]] = []
+        self.__task_ids = itertools.count()
+        self.__lock = threading.Lock()
+        self.__is_shutdown = False
+        self.__thread.start()
+
+    @classmethod
+    def for_current_process(cls, logger: LoggerInterface) -> AsyncioTaskRunner:
+        """Devuelve el runner del proceso actual, creándolo la primera vez"""
+        with cls.__instances_lock:
+            runner = cls.__instances.get(os.getpid())
+            if runner is None or runner.__is_shutdown:
+                runner = cls(logger)
+                cls.__instances[os.getpid()] = runner
+            return runner
+
+    @classmethod
+    def of_current_process(cls) -> Optional[AsyncioTaskRunner]:
+        """Devuelve el runner activo del proceso actual, sin crearlo si no existe"""
+        with cls.__instances_lock:
+            runner = cls.__instances.get(os.getpid())
+            if runner is None or runner.__is_shutdown:
+                return None
+            return runner
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.__loop
+
+    def __run_loop(self) -> None:
+        asyncio.set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    def run(
+        self, task: Callable[[], Coroutine[Any, Any, None]], name: Optional[str] = None
+    ) -> None:
+        """
+        Programa una corutina en el event loop sin esperar su resultado.
+
+        Args:
+            task: Función que devuelve la corutina a ejecutar
+            name: Nombre con el que se agrupan sus latencias (por defecto, el de la función)
+        """
+        task_name = name or getattr(task, "__qualname__", type(task).__name__)
+        with self.__lock:
+            if self.__is_shutdown:
+                raise RuntimeError(f"El runner está detenido: no se acepta la tarea {task_name}")
+            running = _RunningTask(next(self.__task_ids), task_name, time.monotonic())
+            self.__tasks[running.task_id] = running
+        self.__loop.call_soon_threadsafe(self.__start, running, task)
+
+    async def run_blocking(self, function: Callable[..., T], *args: Any) -> T:
+        """Ejecuta código bloqueante en el executor acotado, sin bloquear el event loop"""
+        with self.__lock:
+            self.__blocking_calls += 1
+            blocking_calls = self.__blocking_calls
+        if blocking_calls > self.__max_blocking_workers:
+            self.__logger.warn(
+                f"Executor saturado: {blocking_calls} llamadas bloqueantes para "
+                f"{self.__max_blocking_workers} threads, las restantes esperan turno"
+            )
+        try:
+            return await self.__loop.run_in_executor(self.__executor, function, *args)
+        finally:
+            with self.__lock:
+                self.__blocking_calls -= 1
+
+    async def run_in_thread(self, function: Callable[..., T], *args: Any, name: str) -> T:
+        """
+        Ejecuta código bloqueante de larga duración en un thread propio, fuera del executor,
+        sin bloquear el event loop.
+
+        Args:
+            function: Función bloqueante a ejecutar
+            name: Nombre del thread
+        """
+        future: Future = Future()
+
+        def target() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=target, name=name, daemon=True).start()
+        return await asyncio.wrap_future(future, loop=self.__loop)
+
+    def __start(self, running: _RunningTask, task: Callable[[], Coroutine[Any, Any, None]]):
+        running.started_at = time.monotonic()
+        running.task = self.__loop.create_task(self.__execute(running, task), name=running.name)
+
+    async def __execute(self, running: _RunningTask, task: Callable[[], Coroutine]) -> None:
+        outcome = "completed"
+        try:
+            await task()
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            outcome = "failed"
+            self.__logger.error(f"Error ejecutando tarea asíncrona {running.name}: {e}")
+        finally:
+            self.__account(running, outcome)
+
+    def __account(self, running: _RunningTask, outcome: str) -> None:
+        finished_at = time.monotonic()
+        with self.__lock:
+            self.__tasks.pop(running.task_id, None)
+            latencies = self.__latencies.setdefault(running.name, _TaskLatencies())
+            setattr(latencies, outcome, getattr(latencies, outcome) + 1)
+            started_at = running.started_at or finished_at
+            latencies.add(started_at - running.submitted_at, finished_at - started_at)
+
+    def active_tasks(self) -> int:
+        with self.__lock:
+            return len(self.__tasks)
+
+    def snapshot(self) -> List[TaskSnapshot]:
+        """Estado de las tareas pendientes, con su antigüedad y su latencia de inicio"""
+        now = time.monotonic()
+        with self.__lock:
+            tasks = list(self.__tasks.values())
+        return [
+            TaskSnapshot(
+                task_id=task.task_id,
+                name=task.name,
+                is_running=task.started_at is not None,
+                age_seconds=now - task.submitted_at,
+                queued_seconds=(task.started_at or now) - task.submitted_at,
+            )
+            for task in tasks
+        ]
+
+    def latency_stats(self) -> List[TaskLatencyStats]:
+        """Latencias de inicio y duración de las tareas terminadas, agrupadas por nombre"""
+        with self.__lock:
+            items = list(self.__latencies.items())
+        return [
+            TaskLatencyStats(
+                name=name,
+                completed=latencies.completed,
+                failed=latencies.failed,
+                cancelled=latencies.cancelled,
+                mean_start_latency_seconds=latencies.mean_start_latency,
+                max_start_latency_seconds=latencies.max_start_latency,
+                mean_run_seconds=latencies.mean_run_seconds,
+                max_run_seconds=latencies.max_run_seconds,
+            )
+            for name, latencies in items
+        ]
+
+    def add_shutdown_hook(self, hook: Callable[[], None]) -> None:
+        """Registra una función que `shutdown` invoca para detener el código bloqueante"""
+        with self.__lock:
+            self.__shutdown_hooks.append(hook)
+
+    def cancel_all(self) -> None:
+        """Cancela todas las tareas en curso"""
+        self.__loop.call_soon_threadsafe(self.__cancel_pending)
+
+    def __cancel_pending(self) -> None:
+        with self.__lock:
+            tasks = [running.task for running in self.__tasks.values() if running.task]
+        for task in tasks:
+            task.cancel()
+
+    def shutdown(self, drain_timeout_seconds: float = 30.0) -> None:
+        """
+        Detiene el runner: deja de aceptar tareas, invoca los hooks de shutdown, espera a las
+        activas hasta `drain_timeout_seconds`, cancela las restantes y cierra el loop y el
+        executor.
+        """
+        with self.__lock:
+            if self.__is_shutdown:
+                return
+            self.__is_shutdown = True
+            hooks = list(self.__shutdown_hooks)
+        self.__run_shutdown_hooks(hooks)
+        drain = asyncio.run_coroutine_threadsafe(self.__drain(drain_timeout_seconds), self.__loop)
+        drain.result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+        # Los threads bloqueados en código de terceros no se pueden interrumpir: no se esperan
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __run_shutdown_hooks(self, hooks: List[Callable[[], None]]) -> None:
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                self.__logger.error(f"Error en un hook de shutdown: {e}")
+
+    async def __drain(self, timeout_seconds: float) -> None:
+        # Las tareas programadas con call_soon_threadsafe todavía pueden estar por crearse
+        await asyncio.sleep(0)
+        with self.__lock:
+            tasks = [running.task for running in self.__tasks.values() if running.task]
+        if not tasks:
+            return
+        self.__logger.info(f"Esperando a {len(tasks)} tareas asíncronas antes de detener el loop")
+        _, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.__logger.warn(f"Se cancelaron {len(pending)} tareas que no terminaron a tiempo")
+            await asyncio.wait(pending)
+
+    def install_signal_handlers(self, drain_timeout_seconds: float = 30.0) -> None:
+        """
+        Ejecuta `shutdown` al recibir SIGTERM o SIGINT.
+        Debe llamarse desde el thread principal del proceso.
+        """
+
+        def handle(signum, _frame) -> None:
+            self.__logger.info(f"Señal {signal.Signals(signum).name} recibida, deteniendo tareas")
+            threading.Thread(target=self.shutdown, args=(drain_timeout_seconds,)).start()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+
+class ChunkedContentHasher:
+    """
+    Hash del contenido de un archivo calculado por bloques: BLAKE2b del concatenado de los
+    BLAKE2b de cada bloque de `CHUNK_SIZE` bytes. Al hashear cada bloque por separado, quien
+    escribe un archivo puede calcularlo mientras lo escribe aunque luego reescriba algunos
+    bytes ya escritos (como hacen los muxers al cerrar): solo se vuelven a leer los bloques
+    modificados.
+
+    El resultado lleva el nombre del algoritmo como prefijo (`blake2b-1m:<hex>`).
+    """
+
+    ALGORITHM = "blake2b-1m"
+    CHUNK_SIZE = 1024 * 1024
+    DIGEST_SIZE = 32
+
+    def __init__(self):
+        self.__digests = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        self.__chunk = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        self.__chunk_size = 0
+
+    @classmethod
+    def chunk_digest(cls, data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=cls.DIGEST_SIZE).digest()
+
+    @classmethod
+    def combine(cls, chunk_digests: Iterable[bytes]) -> str:
+        """Hash de un archivo a partir de los digests de sus bloques, en orden"""
+        digests = hashlib.blake2b(digest_size=cls.DIGEST_SIZE)
+        for digest in chunk_digests:
+            digests.update(digest)
+        return f"{cls.ALGORITHM}:{digests.hexdigest()}"
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        """Hash de un archivo completo, leído en una sola pasada"""
+        hasher = cls()
+        buffer = bytearray(cls.CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as file:
+            while count := file.readinto(buffer):
+                hasher.update(view[:count])
+        return hasher.hexdigest()
+
+    def update(self, data: bytes | memoryview) -> None:
+        """Agrega bytes consecutivos al contenido hasheado"""
+        view = memoryview(data)
+        while len(view):
+            count = min(len(view), self.CHUNK_SIZE - self.__chunk_size)
+            self.__chunk.update(view[:count])
+            self.__chunk_size += count
+            view = view[count:]
+            if self.__chunk_size == self.CHUNK_SIZE:
+                self.__digests.update(self.__chunk.digest())
+                self.__chunk = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+                self.__chunk_size = 0
+
+    def hexdigest(self) -> str:
+        digests = self.__digests.copy()
+        if self.__chunk_size:
+            digests.update(self.__chunk.digest())
+        return f"{self.ALGORITHM}:{digests.hexdigest()}"
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import zlib
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.TaskManager import Emit, TaskManager
+from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
+
+_RESULT = "result"
+_DONE = "done"
+
+
+def _ignore_emit(callback: Callable[[], None], emit: Emit) -> None:
+    callback()
+
+
+def _run_task(task_id: int, task: Callable[[Emit], None], outbox) -> None:
+    def emit(value: Any) -> None:
+        outbox.put((task_id, _RESULT, value))
+
+    error = None
+    try:
+        task(emit)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    outbox.put((task_id, _DONE, error))
+
+
+def _worker_main(inbox, outbox) -> None:
+    """Proceso worker: ejecuta cada tarea recibida en un thread propio hasta recibir None"""
+    while True:
+        message = inbox.get()
+        if message is None:
+            return
+        task_id, task = message
+        threading.Thread(target=_run_task, args=(task_id, task, outbox), daemon=True).start()
+
+
+@dataclass
+class _SubmittedTask:
+    shard: int
+    task: Callable[[Emit], None]
+    on_result: Optional[Callable[[Any], None]]
+    restarts: int = 0
+
+
+class ProcessPoolTaskManager(TaskManager):
+    """
+    Implementación del TaskManager que reparte las tareas entre N procesos worker (uno por core
+    por defecto), evitando que cientos de grabaciones compitan por el GIL de un único intérprete.
+
+    Cada `shard_key` se asigna siempre al mismo worker. Los valores emitidos por las tareas
+    vuelven al proceso padre, donde se invoca `on_result`, de modo que los callbacks (y la
+    publicación de eventos) ocurren en el proceso que envió la tarea. Si un worker muere se
+    reinicia y sus tareas en curso se reenvían, hasta `max_task_restarts` veces por tarea: una
+    tarea reenviada vuelve a ejecutarse desde el principio, por lo que no debe reutilizar
+    archivos de la ejecución anterior.
+
+    Cada worker devuelve sus resultados por una cola propia, leída por un thread propio: un
+    worker que muere a mitad de un `put` solo deja inutilizable su cola, que se reemplaza al
+    reiniciarlo, sin demorar los resultados de los demás.
+
+    Las tareas se serializan con pickle, por lo que deben llevar la configuración de lo que
+    necesitan y no objetos con threads o conexiones: las de grabación llevan un
+    VideoRecorderFactory y el grabador se construye en el worker.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerInterface,
+        workers: Optional[int] = None,
+        max_task_restarts: int = 3,
+        monitor_interval_seconds: float = 1.0,
+        start_method: str = "spawn",
+    ):
+        self._logger = logger
+        # Todos los contextos exponen Process, aunque los stubs solo lo declaran en los concretos
+        self.__context = cast(SpawnContext, multiprocessing.get_context(start_method))
+        self.__workers_count = workers or os.cpu_count() or 1
+        self.__max_task_restarts = max_task_restarts
+        self.__monitor_interval_seconds = monitor_interval_seconds
+        self.__inboxes: List[Any] = []
+        self.__outboxes: List[Any] = []
+        self.__processes: List[BaseProcess] = []
+        self.__tasks: Dict[int, _SubmittedTask] = {}
+        self.__task_ids = itertools.count()
+        self.__round_robin = itertools.count()
+        self.__lock = threading.RLock()
+        self.__stopped = threading.Event()
+        self.__monitor: Optional[threading.Thread] = None
+        self.__collectors: List[threading.Thread] = []
+
+    @property
+    def workers(self) -> int:
+        return self.__workers_count
+
+    def pending_tasks(self) -> int:
+        """Cantidad de tareas enviadas que todavía no terminaron"""
+        with self.__lock:
+            return len(self.__tasks)
+
+    def shard_for(self, shard_key: str) -> int:
+        """Índice del worker asignado a una clave; estable entre reinicios del proceso"""
+        return zlib.crc32(shard_key.encode()) % self.__workers_count
+
+    def fire_and_forget(self, callback: Callable[[], None]) -> None:
+        """
+        Ejecuta una tarea en algún worker sin esperar el resultado.
+
+        Args:
+            callback: Función serializable a ejecutar en background
+        """
+        shard = next(self.__round_robin) % self.__workers_count
+        self.__submit(shard, partial(_ignore_emit, callback), None)
+
+    def run_sharded(
+        self,
+        shard_key: str,
+        task: Callable[[Emit], None],
+        on_result: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Ejecuta la tarea en el worker asignado a `shard_key`.
+
+        Args:
+            shard_key: Clave estable de la tarea (por ejemplo la URI de la cámara)
+            task: Tarea serializable a ejecutar
+            on_result: Callback que recibe, en este proceso, cada valor emitido por la tarea
+        """
+        self.__submit(self.shard_for(shard_key), task, on_result)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Detiene los workers. Las tareas en curso se interrumpen al terminar cada proceso"""
+        self.__stopped.set()
+        with self.__lock:
+            for inbox in self.__inboxes:
+                inbox.put(None)
+            processes = list(self.__processes)
+            collectors = list(self.__collectors)
+        for process in processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        if self.__monitor is not None:
+            self.__monitor.join(timeout)
+        for collector in collectors:
+            collector.join(timeout)
+
+    def __submit(
+        self, shard: int, task: Callable[[Emit], None], on_result: Optional[Callable[[Any], None]]
+    ) -> None:
+        self.__ensure_started()
+        task_id = next(self.__task_ids)
+        with self.__lock:
+            self.__tasks[task_id] = _SubmittedTask(shard, task, on_result)
+            self.__inboxes[shard].put((task_id, task))
+
+    def __ensure_started(self) -> None:
+        with self.__lock:
+            if self.__processes:
+                return
+            for shard in range(self.__workers_count):
+                self.__inboxes.append(None)
+                self.__outboxes.append(None)
+                self.__processes.append(self.__start_worker(shard))
+            self.__monitor = threading.Thread(
+                target=self.__monitor_workers, name="process-pool-monitor", daemon=True
+            )
+            self.__monitor.start()
+
+    def __start_worker(self, shard: int) -> BaseProcess:
+        # Las colas de un worker muerto pueden haber quedado corruptas: cada worker usa nuevas
+        inbox, outbox = self.__context.Queue(), self.__context.Queue()
+        self.__inboxes[shard] = inbox
+        self.__outboxes[shard] = outbox
+        process = self.__context.Process(
+            target=_worker_main,
+            args=(inbox, outbox),
+            name=f"task-worker-{shard}",
+            daemon=True,
+        )
+        process.start()
+        collector = threading.Thread(
+            target=self.__collect_results,
+            args=(shard, outbox),
+            name=f"process-pool-collector-{shard}",
+            daemon=True,
+        )
+        collector.start()
+        self.__collectors = [thread for thread in self.__collectors if thread.is_alive()]
+        self.__collectors.append(collector)
+        return process
+
+    def __monitor_workers(self) -> None:
+        while not self.__stopped.wait(self.__monitor_interval_seconds):
+            self.__restart_dead_workers()
+
+    def __collect_results(self, shard: int, outbox) -> None:
+        while not self.__stopped.is_set():
+            try:
+                task_id, kind, value = outbox.get(timeout=self.__monitor_interval_seconds)
+            except queue.Empty:
+                # Tras reiniciar el worker se terminan de leer los resultados de su cola vieja
+                if self.__outboxes[shard] is not outbox:
+                    return
+                continue
+            self.__dispatch(task_id, kind, value)
+
+    def __dispatch(self, task_id: int, kind: str, value: Any) -> None:
+        with self.__lock:
+            submitted = self.__tasks.get(task_id)
+            if kind == _DONE:
+                self.__tasks.pop(task_id, None)
+        if submitted is None:
+            return
+        if kind == _DONE:
+            if value is not None:
+                self._logger.error(f"Error ejecutando tarea en background: {value}")
+            return
+        if submitted.on_result is None:
+            return
+        try:
+            submitted.on_result(value)
+        except Exception as e:
+            self._logger.error(f"Error procesando el resultado de una tarea: {e}")
+
+    def __restart_dead_workers(self) -> None:
+        with self.__lock:
+            if self.__stopped.is_set():
+                return
+            for shard, process in enumerate(self.__processes):
+                if process.is_alive():
+                    continue
+                self._logger.error(
+                    f"El worker {shard} terminó inesperadamente (código {process.exitcode}), "
+                    "reiniciando"
+                )
+                self.__processes[shard] = self.__start_worker(shard)
+                self.__resubmit_tasks_of(shard)
+
+    def __resubmit_tasks_of(self, shard: int) -> None:
+        for task_id, submitted in list(self.__tasks.items()):
+            if submitted.shard != shard:
+                continue
+            if submitted.restarts >= self.__max_task_restarts:
+                self._logger.error(
+                    f"Tarea {task_id} descartada tras {submitted.restarts} reinicios del worker"
+                )
+                del self.__tasks[task_id]
+                continue
+            submitted.restarts += 1
+            self.__inboxes[shard].put((task_id, submitted.task))
@@ -1,29 +1,204 @@
 from __future__ import annotations
 
+import itertools
 import threading
-from typing import Callable
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
 
+from src.Contexts.SharedKernel.Domain.Exceptions.TaskRejectedException import (
+    TaskRejectedException,
+)
 from src.Contexts.SharedKernel.Domain.LoggerInterface import LoggerInterface
-from src.Contexts.Recording.RecordingSessions.Domain.Contracts.TaskManager import TaskManager
+from src.Contexts.SharedKernel.Domain.TaskSnapshot import TaskSnapshot
+from src.Contexts.SharedKernel.Domain.ValueObjects.QueueFullPolicy import QueueFullPolicy
+from src.Contexts.SharedKernel.Infrastructure.Services.CredentialsRedactor import (
+    CredentialsRedactor,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.TaskManager import Emit, TaskManager
+
+
+@dataclass
+class _Task:
+    task_id: int
+    name: str
+    callback: Callable[[], None]
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
 
 
 class ThreadTaskManager(TaskManager):
     """
-    Implementación del TaskManager usando threads para ejecutar tareas en segundo plano.
+    Implementación del TaskManager usando un pool acotado de threads para ejecutar tareas en
+    segundo plano.
+
+    Se ejecutan como máximo `max_workers` tareas a la vez; el resto espera en una cola de
+    `max_queue_size` lugares. Con la cola llena se aplica `queue_full_policy`: rechazar la tarea
+    nueva (TaskRejectedException), bloquear a quien la envía hasta que haya lugar, o descartar
+    la tarea más antigua en espera. Los workers se crean a demanda y terminan tras
+    `idle_timeout_seconds` sin tareas o al llamar a `shutdown`.
     """
 
-    def __init__(self, logger: LoggerInterface):
+    def __init__(
+        self,
+        logger: LoggerInterface,
+        max_workers: int = 256,
+        max_queue_size: int = 1024,
+        queue_full_policy: str = QueueFullPolicy.REJECT,
+        block_timeout_seconds: Optional[float] = None,
+        idle_timeout_seconds: float = 10.0,
+    ):
+        self.__ensure_positive("max_workers", max_workers)
+        self.__ensure_positive("max_queue_size", max_queue_size)
         self.logger = logger
+        self.__max_workers = max_workers
+        self.__max_queue_size = max_queue_size
+        self.__queue_full_policy = QueueFullPolicy(queue_full_policy)
+        self.__block_timeout_seconds = block_timeout_seconds
+        self.__idle_timeout_seconds = idle_timeout_seconds
+        self.__queue: Deque[_Task] = deque()
+        self.__running: Dict[int, _Task] = {}
+        self.__workers = 0
+        self.__idle_workers = 0
+        self.__task_ids = itertools.count()
+        self.__worker_ids = itertools.count()
+        self.__condition = threading.Condition()
+        self.__is_shutdown = False
 
-    def fire_and_forget(self, callback: Callable[[], None], daemon: bool = False) -> None:
+    def __ensure_positive(self, name: str, value: int) -> None:
+        if value <= 0:
+            raise ValueError(f"El parámetro {name} del TaskManager debe ser mayor a 0")
+
+    def fire_and_forget(self, callback: Callable[[], None]) -> None:
         """
-        Ejecuta una tarea en un thread separado sin esperar el resultado.
+        Encola una tarea para ejecutarla en un thread del pool sin esperar el resultado.
 
         Args:
             callback: Función a ejecutar en background
+
+        Raises:
+            TaskRejectedException: Si la cola está llena y la política es `reject`, o si con
+                                   la política `block` se agota `block_timeout_seconds`
+        """
+        self.__enqueue(getattr(callback, "__qualname__", type(callback).__name__), callback)
+
+    def __enqueue(self, name: str, callback: Callable[[], None]) -> None:
+        with self.__condition:
+            if self.__is_shutdown:
+                raise TaskRejectedException(name, len(self.__queue))
+            if self.__waiting_tasks() >= self.__max_queue_size:
+                self.__make_room(name)
+            self.__queue.append(_Task(next(self.__task_ids), name, callback))
+            if self.__waiting_tasks() > 0 and self.__workers < self.__max_workers:
+                self.__start_worker()
+            self.__condition.notify_all()
+
+    def __waiting_tasks(self) -> int:
+        # Las primeras tareas de la cola ya tienen asignado un worker ocioso que aún no despertó
+        return max(0, len(self.__queue) - self.__idle_workers)
+
+    def run_sharded(
+        self,
+        shard_key: str,
+        task: Callable[[Emit], None],
+        on_result: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Ejecuta la tarea en un thread del pool; los valores emitidos se entregan a `on_result`
+        directamente desde ese thread.
+
+        Args:
+            shard_key: Clave de la tarea, usada sin credenciales como su nombre (los threads
+                       no se comparten, por lo que no elige un worker)
+            task: Tarea a ejecutar
+            on_result: Callback que recibe cada valor emitido por la tarea
+        """
+        name = CredentialsRedactor.redact(shard_key)
+        self.__enqueue(name, lambda: task(on_result or (lambda _: None)))
+
+    def active_tasks(self) -> int:
+        """Cantidad de tareas ejecutándose"""
+        with self.__condition:
+            return len(self.__running)
+
+    def queued_tasks(self) -> int:
+        """Cantidad de tareas esperando un thread libre"""
+        with self.__condition:
+            return len(self.__queue)
+
+    def snapshot(self) -> List[TaskSnapshot]:
+        """Estado de las tareas en ejecución y en espera, con su antigüedad y tiempo en cola"""
+        now = time.monotonic()
+        with self.__condition:
+            tasks = list(self.__running.values()) + list(self.__queue)
+        return [
+            TaskSnapshot(
+                task_id=task.task_id,
+                name=task.name,
+                is_running=task.started_at is not None,
+                age_seconds=now - task.submitted_at,
+                queued_seconds=(task.started_at or now) - task.submitted_at,
+            )
+            for task in tasks
+        ]
+
+    def shutdown(self) -> None:
         """
-        thread = threading.Thread(target=self._safe_execute, args=(callback,), daemon=daemon)
-        thread.start()
+        Deja de aceptar tareas. Las tareas encoladas y en ejecución terminan normalmente y
+        los workers ociosos finalizan sin esperar `idle_timeout_seconds`.
+        """
+        with self.__condition:
+            self.__is_shutdown = True
+            self.__condition.notify_all()
+
+    def __make_room(self, name: str) -> None:
+        if self.__queue_full_policy.value == QueueFullPolicy.DROP_OLDEST:
+            dropped = self.__queue[self.__idle_workers]
+            del self.__queue[self.__idle_workers]
+            self.logger.warn(f"Cola de tareas llena: se descarta la tarea en espera {dropped.name}")
+            return
+        if self.__queue_full_policy.value == QueueFullPolicy.BLOCK:
+            has_room = self.__condition.wait_for(
+                lambda: self.__waiting_tasks() < self.__max_queue_size, self.__block_timeout_seconds
+            )
+            if has_room:
+                return
+        raise TaskRejectedException(name, len(self.__queue))
+
+    def __start_worker(self) -> None:
+        # El worker nuevo cuenta como ocioso desde ya, para no crear uno por cada tarea encolada
+        self.__workers += 1
+        self.__idle_workers += 1
+        threading.Thread(
+            target=self.__run_worker, name=f"task-worker-{next(self.__worker_ids)}"
+        ).start()
+
+    def __run_worker(self) -> None:
+        while True:
+            task = self.__next_task()
+            if task is None:
+                return
+            self._safe_execute(task.callback)
+            with self.__condition:
+                del self.__running[task.task_id]
+                self.__idle_workers += 1
+                # Libera a quien esté bloqueado esperando lugar en la cola
+                self.__condition.notify_all()
+
+    def __next_task(self) -> Optional[_Task]:
+        with self.__condition:
+            self.__condition.wait_for(
+                lambda: self.__queue or self.__is_shutdown, self.__idle_timeout_seconds
+            )
+            self.__idle_workers -= 1
+            if not self.__queue:
+                self.__workers -= 1
+                return None
+            task = self.__queue.popleft()
+            task.started_at = time.monotonic()
+            self.__running[task.task_id] = task
+            return task
 
     def _safe_execute(self, callback: Callable[[], None]) -> None:
         """
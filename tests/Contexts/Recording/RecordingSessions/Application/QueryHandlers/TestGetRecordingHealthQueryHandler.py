@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+from src.Contexts.Recording.RecordingSessions.Application.Queries.GetRecordingHealthQuery import (
+    GetRecordingHealthQuery,
+)
+from src.Contexts.Recording.RecordingSessions.Application.QueryHandlers.GetRecordingHealthQueryHandler import (
+    GetRecordingHealthQueryHandler,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingHealth import (
+    RecordingHealth,
+)
+
+
+def given_recording_health(source: str, is_stalled: bool) -> RecordingHealth:
+    return RecordingHealth(
+        source=source,
+        last_packet_age_seconds=2.5 if is_stalled else 0.04,
+        packets_per_second=0.0 if is_stalled else 25.0,
+        bytes_per_second=0.0 if is_stalled else 120000.0,
+        is_stalled=is_stalled,
+        is_reconnecting=False,
+        restarts=1 if is_stalled else 0,
+    )
+
+
+def test_should_answer_health_of_active_recordings():
+    # Given
+    get_recording_health_use_case = Mock()
+    get_recording_health_use_case.execute.return_value = [
+        given_recording_health("rtsp://camera-1/stream", is_stalled=False),
+        given_recording_health("rtsp://camera-2/stream", is_stalled=True),
+    ]
+    handler = GetRecordingHealthQueryHandler(get_recording_health_use_case)
+
+    # When
+    response = handler.handle(GetRecordingHealthQuery())
+
+    # Then
+    assert [recording.source for recording in response.recordings] == [
+        "rtsp://camera-1/stream",
+        "rtsp://camera-2/stream",
+    ]
+    assert [recording.source for recording in response.stalled] == ["rtsp://camera-2/stream"]
+    assert response.recordings[0].packets_per_second == 25.0
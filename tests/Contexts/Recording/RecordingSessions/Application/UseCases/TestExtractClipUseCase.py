@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Application.UseCases.ExtractClipUseCase import (
+    ExtractClipUseCase,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.Exceptions.ClipNotAvailableException import (
+    ClipNotAvailableException,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ExtractedClip import (
+    ExtractedClip,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSegment import (
+    RecordingSegment,
+)
+
+START = datetime(2024, 5, 10, 14, 3, 10)
+END = datetime(2024, 5, 10, 14, 5, 40)
+
+
+def given_use_case(segments) -> ExtractClipUseCase:
+    segment_repository = Mock()
+    segment_repository.find_overlapping.return_value = segments
+    clip_extractor = Mock()
+    clip_extractor.extract.return_value = ExtractedClip(
+        output_path="/clips/clip.mkv",
+        media_duration_seconds=150.0,
+        segment_paths=tuple(segment.path for segment in segments),
+    )
+    return ExtractClipUseCase(segment_repository, clip_extractor, Mock())
+
+
+def test_should_extract_clip_from_overlapping_segments():
+    # Given
+    segments = [
+        RecordingSegment(
+            path=f"/recordings/camera__{index}.mkv", start_date=START + timedelta(minutes=index)
+        )
+        for index in range(3)
+    ]
+    use_case = given_use_case(segments)
+
+    # When
+    clip = use_case.execute("camera", START, END, "/clips/clip.mkv")
+
+    # Then
+    assert clip.segment_paths == tuple(segment.path for segment in segments)
+
+
+def test_should_fail_when_there_are_no_recordings_in_range():
+    # Given
+    use_case = given_use_case([])
+
+    # When / Then
+    with pytest.raises(ClipNotAvailableException):
+        use_case.execute("camera", START, END, "/clips/clip.mkv")
+
+
+def test_should_reject_clip_that_ends_before_it_starts():
+    # Given
+    use_case = given_use_case([])
+
+    # When / Then
+    with pytest.raises(ValueError):
+        use_case.execute("camera", END, START, "/clips/clip.mkv")
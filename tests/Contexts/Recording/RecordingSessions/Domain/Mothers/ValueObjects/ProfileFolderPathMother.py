@@ -0,0 +1,15 @@
+import random
+from typing import Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileFolderPath import (
+    ProfileFolderPath,
+)
+
+
+class ProfileFolderPathMother:
+
+    @staticmethod
+    def create(value: Optional[str] = None) -> ProfileFolderPath:
+        if value is None:
+            value = f"/recordings/profile_{random.randint(1000, 9999)}"
+        return ProfileFolderPath(value)
@@ -0,0 +1,13 @@
+import random
+from typing import Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileName import ProfileName
+
+
+class ProfileNameMother:
+
+    @staticmethod
+    def create(value: Optional[str] = None) -> ProfileName:
+        if value is None:
+            value = f"camara_{random.randint(1000, 9999)}"
+        return ProfileName(value)
@@ -0,0 +1,24 @@
+import random
+from typing import Optional
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingResult import (
+    RecordingResult,
+)
+
+
+class RecordingResultMother:
+
+    @staticmethod
+    def create(
+        output_path: Optional[str] = None,
+        media_duration_seconds: Optional[float] = None,
+        wall_clock_duration_seconds: Optional[float] = None,
+    ) -> RecordingResult:
+        if output_path is None:
+            output_path = f"/recordings/camara__{random.randint(1000, 9999)}.mkv"
+        if media_duration_seconds is None:
+            media_duration_seconds = float(random.randint(60, 7200))
+        if wall_clock_duration_seconds is None:
+            # Drift aleatorio de hasta ±1 segundo respecto al reloj del stream
+            wall_clock_duration_seconds = media_duration_seconds + random.uniform(-1, 1)
+        return RecordingResult(output_path, media_duration_seconds, wall_clock_duration_seconds)
@@ -0,0 +1,268 @@
+import uuid
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.Events import (
+    CreatedRecordingSessionDomainEvent as created_event_module,
+    FinishedRecordingSessionDomainEvent as finished_event_module,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.Services.RecordingService import (
+    RecordingService,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.MotionTrigger import (
+    MotionTrigger,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from tests.Contexts.Recording.RecordingSessions.Domain.Mothers.ValueObjects import (
+    ProfileFolderPathMother as profile_folder_path_mother_module,
+    ProfileIdMother as profile_id_mother_module,
+    ProfileNameMother as profile_name_mother_module,
+    RecordingResultMother as result_mother_module,
+    RecordingSessionDurationMother as duration_mother_module,
+)
+from tests.Contexts.Recording.RecordingSessions.Domain.Mothers.ValueObjects.UriMother import (
+    UriMother,
+)
+
+CreatedRecordingSessionDomainEvent = created_event_module.CreatedRecordingSessionDomainEvent
+FinishedRecordingSessionDomainEvent = finished_event_module.FinishedRecordingSessionDomainEvent
+ProfileFolderPathMother = profile_folder_path_mother_module.ProfileFolderPathMother
+ProfileIdMother = profile_id_mother_module.ProfileIdMother
+ProfileNameMother = profile_name_mother_module.ProfileNameMother
+RecordingResultMother = result_mother_module.RecordingResultMother
+RecordingSessionDurationMother = duration_mother_module.RecordingSessionDurationMother
+
+
+@pytest.fixture
+def task_manager_mock():
+    mock = Mock()
+    # Ejecuta la tarea en el mismo thread para poder verificar el resultado
+    mock.fire_and_forget.side_effect = lambda callback: callback()
+    mock.run_sharded.side_effect = lambda shard_key, task, on_result: task(on_result)
+    return mock
+
+
+@pytest.fixture
+def video_recorder_mock():
+    return Mock()
+
+
+@pytest.fixture
+def path_ensurer_mock():
+    return Mock()
+
+
+@pytest.fixture
+def event_bus_mock():
+    return Mock()
+
+
+@pytest.fixture
+def logger_mock():
+    return Mock()
+
+
+@pytest.fixture
+def uuid_generator_mock():
+    mock = Mock()
+    mock.generate.side_effect = lambda: str(uuid.uuid4())
+    return mock
+
+
+@pytest.fixture
+def recording_service(
+    task_manager_mock,
+    video_recorder_mock,
+    path_ensurer_mock,
+    event_bus_mock,
+    uuid_generator_mock,
+    logger_mock,
+):
+    return RecordingService(
+        task_manager=task_manager_mock,
+        video_recorder_factory=Mock(create=Mock(return_value=video_recorder_mock)),
+        path_ensurer=path_ensurer_mock,
+        logger=logger_mock,
+        uuid_generator=uuid_generator_mock,
+        event_bus=event_bus_mock,
+    )
+
+
+def given_recorder_closes_segments(video_recorder_mock, segments: int) -> List[OutputPath]:
+    """Simula un grabador continuo que abre y cierra `segments` segmentos"""
+    opened_paths: List[OutputPath] = []
+
+    def record_continuous(
+        uri,
+        segment_duration,
+        output_path_factory,
+        on_segment_finished,
+        connection_timeout=None,
+        stream_selection=None,
+        analysis_uri=None,
+    ):
+        for _ in range(segments):
+            output_path = output_path_factory()
+            opened_paths.append(output_path)
+            on_segment_finished(RecordingResultMother.create(output_path=output_path.value))
+
+    video_recorder_mock.record_continuous.side_effect = record_continuous
+    return opened_paths
+
+
+def then_events_should_have_been_published_per_segment(event_bus_mock, opened_paths, profile_id):
+    published = [call.args[0] for call in event_bus_mock.publish.call_args_list]
+    assert len(published) == len(opened_paths)
+    for events, output_path in zip(published, opened_paths):
+        created, finished = events
+        assert isinstance(created, CreatedRecordingSessionDomainEvent)
+        assert isinstance(finished, FinishedRecordingSessionDomainEvent)
+        assert finished.recording_session_id == created.recording_session_id
+        assert finished.profile_id == profile_id.value
+        assert finished.output_path == output_path.value
+
+
+def then_each_segment_should_have_its_own_session(event_bus_mock):
+    session_ids = [
+        call.args[0][1].recording_session_id for call in event_bus_mock.publish.call_args_list
+    ]
+    assert len(set(session_ids)) == len(session_ids)
+
+
+def test_should_publish_finished_event_per_closed_segment(
+    recording_service, video_recorder_mock, event_bus_mock, path_ensurer_mock
+):
+    # Given
+    profile_id = ProfileIdMother.create()
+    opened_paths = given_recorder_closes_segments(video_recorder_mock, segments=3)
+
+    # When
+    recording_service.start_continuous_recording(
+        uri=UriMother.create("rtsp://camera.local/stream"),
+        segment_duration=RecordingSessionDurationMother.create(60),
+        profile_name=ProfileNameMother.create(),
+        profile_id=profile_id,
+        profile_folder_path=ProfileFolderPathMother.create(),
+    )
+
+    # Then
+    assert path_ensurer_mock.ensure_path.call_count == 3
+    then_events_should_have_been_published_per_segment(event_bus_mock, opened_paths, profile_id)
+    then_each_segment_should_have_its_own_session(event_bus_mock)
+
+
+def test_should_not_publish_events_when_no_segment_was_closed(
+    recording_service, video_recorder_mock, event_bus_mock
+):
+    # Given
+    given_recorder_closes_segments(video_recorder_mock, segments=0)
+
+    # When
+    recording_service.start_continuous_recording(
+        uri=UriMother.create("rtsp://camera.local/stream"),
+        segment_duration=RecordingSessionDurationMother.create(),
+        profile_name=ProfileNameMother.create(),
+        profile_id=ProfileIdMother.create(),
+        profile_folder_path=ProfileFolderPathMother.create(),
+    )
+
+    # Then
+    event_bus_mock.publish.assert_not_called()
+
+
+def test_should_record_on_motion_when_motion_trigger_is_given(
+    recording_service, video_recorder_mock
+):
+    # Given
+    motion_trigger = MotionTrigger(
+        pre_roll_seconds=5, post_roll_seconds=10, min_changed_fraction=0.01
+    )
+
+    # When
+    recording_service.start_continuous_recording(
+        uri=UriMother.create("rtsp://camera.local/stream"),
+        segment_duration=RecordingSessionDurationMother.create(),
+        profile_name=ProfileNameMother.create(),
+        profile_id=ProfileIdMother.create(),
+        profile_folder_path=ProfileFolderPathMother.create(),
+        motion_trigger=motion_trigger,
+    )
+
+    # Then
+    video_recorder_mock.record_continuous.assert_not_called()
+    video_recorder_mock.record_on_motion.assert_called_once()
+    assert video_recorder_mock.record_on_motion.call_args.args[4] == motion_trigger
+
+
+def test_should_finish_sessions_left_open_by_a_restarted_recording(
+    recording_service, video_recorder_mock, event_bus_mock, logger_mock
+):
+    # Given
+    profile_id = ProfileIdMother.create()
+    opened_paths: List[OutputPath] = []
+
+    def record_restarted_after_a_crash(
+        uri, segment_duration, output_path_factory, on_segment_finished, **kwargs
+    ):
+        # El primer segmento nunca se cierra: el proceso murió y la tarea se reinició
+        opened_paths.append(output_path_factory())
+        opened_paths.append(output_path_factory())
+        on_segment_finished(RecordingResultMother.create(output_path=opened_paths[1].value))
+
+    video_recorder_mock.record_continuous.side_effect = record_restarted_after_a_crash
+
+    # When
+    recording_service.start_continuous_recording(
+        uri=UriMother.create("rtsp://camera.local/stream"),
+        segment_duration=RecordingSessionDurationMother.create(60),
+        profile_name=ProfileNameMother.create(),
+        profile_id=profile_id,
+        profile_folder_path=ProfileFolderPathMother.create(),
+    )
+
+    # Then
+    then_events_should_have_been_published_per_segment(event_bus_mock, opened_paths, profile_id)
+    then_each_segment_should_have_its_own_session(event_bus_mock)
+    logger_mock.warn.assert_called_once()
+    assert opened_paths[0].value in logger_mock.warn.call_args.args[0]
+
+
+def test_should_keep_the_partial_file_of_a_restarted_recording_session(
+    recording_service, task_manager_mock, video_recorder_mock, event_bus_mock
+):
+    # Given: el proceso muere durante la primera ejecución y la tarea se reenvía
+    recorded_paths: List[str] = []
+
+    def record(uri, output_path, duration_seconds, on_finished, **kwargs):
+        recorded_paths.append(output_path.value)
+        if len(recorded_paths) == 2:
+            on_finished(RecordingResultMother.create(output_path=output_path.value))
+
+    def run_twice(shard_key, task, on_result):
+        task(on_result)
+        task(on_result)
+
+    video_recorder_mock.record.side_effect = record
+    task_manager_mock.run_sharded.side_effect = run_twice
+
+    # When
+    recording_service.start_recording_session(
+        uri=UriMother.create("rtsp://camera.local/stream"),
+        duration_seconds=RecordingSessionDurationMother.create(60),
+        profile_name=ProfileNameMother.create(),
+        profile_id=ProfileIdMother.create(),
+        profile_folder_path=ProfileFolderPathMother.create(),
+    )
+
+    # Then: cada ejecución grabó en su propio archivo y la sesión incluye ambos
+    assert len(set(recorded_paths)) == 2
+    (finished,) = [
+        event
+        for call in event_bus_mock.publish.call_args_list
+        for event in call.args[0]
+        if isinstance(event, FinishedRecordingSessionDomainEvent)
+    ]
+    assert finished.output_path == recorded_paths[0]
+    assert tuple(finished.part_paths) == tuple(recorded_paths)
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ClipRange import ClipRange
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileName import ProfileName
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    CatalogRecordingSegmentRepository as catalog_repository_module,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.RecordingCatalogEntry import (
+    RecordingCatalogEntry,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.StorageLocation import StorageLocation
+from src.Contexts.Recording.Videos.Infrastructure.Services.SqliteRecordingCatalog import (
+    SqliteRecordingCatalog,
+)
+
+CatalogRecordingSegmentRepository = catalog_repository_module.CatalogRecordingSegmentRepository
+
+DAY = datetime(2025, 3, 1)
+SEGMENT = timedelta(minutes=10)
+
+
+@pytest.fixture
+def catalog():
+    catalog = SqliteRecordingCatalog(":memory:")
+    catalog.add(
+        RecordingCatalogEntry(
+            profile_name=profile_name,
+            start_date=DAY + i * SEGMENT,
+            end_date=DAY + (i + 1) * SEGMENT,
+            size_bytes=1000,
+            path=f"/recordings/{profile_name}/{profile_name}__{i}.mkv",
+            location=StorageLocation(StorageLocation.LOCAL),
+        )
+        for profile_name in ("garage", "entrance")
+        for i in range(6)
+    )
+    yield catalog
+    catalog.close()
+
+
+@pytest.mark.integration
+def test_should_find_the_segments_overlapping_the_clip(catalog):
+    # Given
+    repository = CatalogRecordingSegmentRepository(catalog)
+
+    # When
+    segments = repository.find_overlapping(
+        ProfileName("garage"), ClipRange(start=DAY + 2.5 * SEGMENT, end=DAY + 4 * SEGMENT)
+    )
+
+    # Then
+    assert [segment.path for segment in segments] == [
+        "/recordings/garage/garage__2.mkv",
+        "/recordings/garage/garage__3.mkv",
+    ]
+    assert segments[0].start_date == DAY + 2 * SEGMENT
+
+
+@pytest.mark.integration
+def test_should_find_moved_segments_at_their_new_path(catalog):
+    # Given
+    catalog.relocate(
+        "/recordings/garage/garage__3.mkv",
+        "/storage/garage/garage__3.mkv",
+        StorageLocation(StorageLocation.REMOTE),
+    )
+    repository = CatalogRecordingSegmentRepository(catalog)
+
+    # When
+    segments = repository.find_overlapping(
+        ProfileName("garage"), ClipRange(start=DAY + 3 * SEGMENT, end=DAY + 3.5 * SEGMENT)
+    )
+
+    # Then
+    assert [segment.path for segment in segments] == ["/storage/garage/garage__3.mkv"]
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+
+
+@pytest.mark.integration
+def test_should_double_delay_up_to_max_delay_with_jitter():
+    # Given
+    backoff = ExponentialBackoff(base_delay_seconds=1, max_delay_seconds=8, rng=random.Random(42))
+
+    # When
+    delays = [backoff.delay_for(attempt) for attempt in range(6)]
+
+    # Then: cada espera está entre la mitad y el total de min(8, 2^intento)
+    for attempt, delay in enumerate(delays):
+        cap = min(8, 2**attempt)
+        assert cap / 2 <= delay <= cap
+
+
+@pytest.mark.integration
+def test_should_limit_attempts_when_max_attempts_is_set():
+    # Given
+    backoff = ExponentialBackoff(max_attempts=2)
+
+    # Then
+    assert backoff.allows(0)
+    assert backoff.allows(1)
+    assert not backoff.allows(2)
+
+
+@pytest.mark.integration
+def test_should_reject_base_delay_greater_than_max_delay():
+    with pytest.raises(ValueError):
+        ExponentialBackoff(base_delay_seconds=10, max_delay_seconds=1)
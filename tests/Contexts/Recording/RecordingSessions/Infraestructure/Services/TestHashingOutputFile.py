@@ -0,0 +1,96 @@
+import itertools
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.HashingOutputFile import (
+    HashingOutputFile,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.ChunkedContentHasher import (
+    ChunkedContentHasher,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+CHUNK_SIZE = ChunkedContentHasher.CHUNK_SIZE
+
+
+def given_written_file(path: str, writes) -> HashingOutputFile:
+    file = HashingOutputFile(path)
+    for offset, data in writes:
+        if offset is not None:
+            file.seek(offset)
+        file.write(data)
+    file.close()
+    return file
+
+
+@pytest.mark.integration
+def test_should_hash_appended_bytes_like_a_full_read(tmp_path: Path):
+    # Given
+    path = str(tmp_path / "video.mkv")
+    data = os.urandom(2 * CHUNK_SIZE + 1234)
+
+    # When
+    file = given_written_file(path, [(None, data[:1000]), (None, data[1000:])])
+
+    # Then
+    assert file.content_hash == ChunkedContentHasher.hash_file(path)
+
+
+@pytest.mark.integration
+def test_should_rehash_chunks_rewritten_after_being_hashed(tmp_path: Path):
+    # Given
+    path = str(tmp_path / "video.mkv")
+    data = os.urandom(3 * CHUNK_SIZE + 10)
+
+    # When
+    file = given_written_file(
+        path,
+        [(None, data), (44, b"header"), (CHUNK_SIZE - 2, b"across"), (3 * CHUNK_SIZE + 4, b"x")],
+    )
+
+    # Then
+    assert file.content_hash == ChunkedContentHasher.hash_file(path)
+
+
+@pytest.mark.integration
+def test_should_hash_the_whole_file_when_writes_leave_a_gap(tmp_path: Path):
+    # Given
+    path = str(tmp_path / "video.mkv")
+
+    # When
+    file = given_written_file(path, [(None, b"start"), (CHUNK_SIZE, b"after a gap")])
+
+    # Then
+    assert file.content_hash == ChunkedContentHasher.hash_file(path)
+
+
+@pytest.mark.integration
+def test_should_report_the_content_hash_of_each_recorded_segment(tmp_path: Path):
+    # Given
+    results = []
+    counter = itertools.count()
+    job = PyAvRecordingJob(
+        source=SOURCE,
+        segment_duration=RecordingSessionDuration(2),
+        output_path_factory=lambda: OutputPath(str(tmp_path / f"segment{next(counter)}.mkv")),
+        on_segment_finished=results.append,
+        logger=Mock(),
+    )
+
+    # When
+    job.run()
+
+    # Then
+    assert results
+    for result in results:
+        assert result.content_hashes == (ChunkedContentHasher.hash_file(result.output_path),)
@@ -0,0 +1,126 @@
+import threading
+from typing import List
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.Detector import Detector
+from src.Contexts.Recording.RecordingSessions.Domain.Events.ObjectsDetectedDomainEvent import (
+    ObjectsDetectedDomainEvent,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.Detection import Detection
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.FrameBatch import FrameBatch
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    MicroBatchingDetectionScheduler as scheduler_module,
+    NumpyReferenceDetector as detector_module,
+)
+
+MicroBatchingDetectionScheduler = scheduler_module.MicroBatchingDetectionScheduler
+NumpyReferenceDetector = detector_module.NumpyReferenceDetector
+
+
+class CountingDetector(Detector):
+    """Envuelve al detector de referencia registrando el tamaño de cada invocación"""
+
+    def __init__(self):
+        self.batch_sizes: List[int] = []
+        self.__detector = NumpyReferenceDetector()
+
+    def detect(self, frames: np.ndarray) -> List[List[Detection]]:
+        self.batch_sizes.append(len(frames))
+        return self.__detector.detect(frames)
+
+
+def given_frame_batch(source: str, frames: int, bright: bool = False) -> FrameBatch:
+    pixels = np.zeros((frames, 36, 64, 3), dtype=np.uint8)
+    if bright:
+        # Objeto brillante en el cuadrante superior izquierdo
+        pixels[:, 0:18, 0:32] = 255
+    return FrameBatch(pixels, (source,) * frames, tuple(index / 25 for index in range(frames)))
+
+
+def then_published_events(event_bus: Mock) -> List[ObjectsDetectedDomainEvent]:
+    return [event for call in event_bus.publish.call_args_list for event in call.args[0]]
+
+
+@pytest.mark.integration
+def test_should_batch_frames_from_many_cameras_into_one_inference_call():
+    # Given
+    detector = CountingDetector()
+    event_bus = Mock()
+    scheduler = MicroBatchingDetectionScheduler(
+        detector, event_bus, Mock(), max_batch_size=16, max_wait_seconds=10
+    )
+
+    # When: 8 cámaras entregan 2 frames cada una
+    cameras = [
+        threading.Thread(
+            target=scheduler.consume, args=(given_frame_batch(f"cam{index}", 2, bright=True),)
+        )
+        for index in range(8)
+    ]
+    for camera in cameras:
+        camera.start()
+    for camera in cameras:
+        camera.join()
+    scheduler.stop()
+
+    # Then
+    assert detector.batch_sizes == [16]
+    events = then_published_events(event_bus)
+    assert {event.source for event in events} == {f"cam{index}" for index in range(8)}
+    detection = events[0].detections[0]
+    assert (detection.x, detection.y, detection.width, detection.height) == (0, 0, 0.5, 0.5)
+
+
+@pytest.mark.integration
+def test_should_infer_partial_batch_after_max_wait():
+    # Given
+    detector = CountingDetector()
+    scheduler = MicroBatchingDetectionScheduler(
+        detector, Mock(), Mock(), max_batch_size=16, max_wait_seconds=0.05
+    )
+
+    # When
+    scheduler.consume(given_frame_batch("cam1", 3))
+    finished = threading.Event()
+    threading.Timer(1.0, finished.set).start()
+    while not detector.batch_sizes and not finished.is_set():
+        finished.wait(0.01)
+
+    # Then
+    assert detector.batch_sizes == [3]
+    scheduler.stop()
+
+
+@pytest.mark.integration
+def test_should_split_large_batches_and_publish_only_frames_with_detections():
+    # Given
+    detector = CountingDetector()
+    event_bus = Mock()
+    scheduler = MicroBatchingDetectionScheduler(
+        detector, event_bus, Mock(), max_batch_size=4, max_wait_seconds=10
+    )
+
+    # When
+    scheduler.consume(given_frame_batch("dark", 6))
+    scheduler.consume(given_frame_batch("bright", 2, bright=True))
+    scheduler.stop()
+
+    # Then
+    assert detector.batch_sizes == [4, 4]
+    assert scheduler.frames_inferred == 8
+    assert [event.source for event in then_published_events(event_bus)] == ["bright", "bright"]
+
+
+@pytest.mark.integration
+def test_should_reject_frames_of_different_size():
+    # Given
+    scheduler = MicroBatchingDetectionScheduler(CountingDetector(), Mock(), Mock())
+    scheduler.consume(given_frame_batch("cam1", 1))
+
+    # When/Then
+    with pytest.raises(ValueError):
+        scheduler.consume(FrameBatch(np.zeros((1, 10, 10, 3), dtype=np.uint8), ("cam2",), (0.0,)))
+    scheduler.stop()
@@ -0,0 +1,73 @@
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamMetrics import (
+    StreamMetrics,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    PrometheusMetricsExporter as exporter_module,
+)
+
+PrometheusMetricsExporter = exporter_module.PrometheusMetricsExporter
+
+
+def given_engine_with_one_recording() -> Mock:
+    engine = Mock()
+    engine.metrics.return_value = {
+        0: [
+            StreamMetrics(
+                source="rtsp://camera/stream",
+                packets_per_stream=((0, 250), (1, 40)),
+                bytes_per_stream=((0, 500000), (1, 8000)),
+                keyframes=5,
+                mean_keyframe_interval_seconds=2.0,
+                dts_gap_frames=3,
+                out_of_order_packets=0,
+                mux_latency_buckets=((0.00001, 2), (0.0001, 1), (float("inf"), 0)),
+                mux_latency_sum_seconds=0.00012,
+                mux_latency_count=3,
+            )
+        ],
+        1: [],
+    }
+    return engine
+
+
+@pytest.mark.integration
+def test_should_render_metrics_in_prometheus_text_format():
+    # Given
+    exporter = PrometheusMetricsExporter(given_engine_with_one_recording(), Mock())
+
+    # When
+    text = exporter.render()
+
+    # Then
+    labels = 'worker="0",source="rtsp://camera/stream"'
+    assert "# TYPE neuralcam_recording_packets_total counter" in text
+    assert f'neuralcam_recording_packets_total{{{labels},stream_index="1"}} 40' in text
+    assert f"neuralcam_recording_dts_gap_frames_total{{{labels}}} 3" in text
+    assert f'neuralcam_recording_mux_latency_seconds_bucket{{{labels},le="0.0001"}} 3' in text
+    assert f'neuralcam_recording_mux_latency_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"neuralcam_recording_mux_latency_seconds_count{{{labels}}} 3" in text
+
+
+@pytest.mark.integration
+def test_should_serve_metrics_over_http():
+    # Given
+    exporter = PrometheusMetricsExporter(
+        given_engine_with_one_recording(), Mock(), host="127.0.0.1", port=0
+    )
+    exporter.start()
+
+    try:
+        # When
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics") as response:
+            body = response.read().decode()
+
+        # Then
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert "neuralcam_recording_keyframes_total" in body
+    finally:
+        exporter.stop()
@@ -0,0 +1,114 @@
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import Mock
+
+import av
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvAnalysisJob import (
+    PyAvAnalysisJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+class CollectingFrameConsumer(PyAvFrameConsumer):
+    def __init__(self):
+        self.frames: List[Tuple[str, int, int]] = []
+
+    def consume(self, source: str, frame: av.VideoFrame) -> None:
+        self.frames.append((source, frame.width, frame.height))
+
+
+def given_analysis_job(
+    consumer: PyAvFrameConsumer, stop_when=None, source: str = SOURCE
+) -> PyAvAnalysisJob:
+    return PyAvAnalysisJob(
+        source=source,
+        consumer=consumer,
+        logger=Mock(),
+        stop_when=stop_when,
+        backoff=ExponentialBackoff(base_delay_seconds=0.001, max_delay_seconds=0.001),
+    )
+
+
+@pytest.mark.integration
+def test_should_deliver_every_decoded_frame_until_stream_ends():
+    # Given
+    consumer = CollectingFrameConsumer()
+    job = given_analysis_job(consumer)
+
+    # When
+    job.run()
+
+    # Then
+    assert job.is_finished
+    assert job.frames_decoded > 0
+    assert len(consumer.frames) == job.frames_decoded
+    assert {source for source, _, _ in consumer.frames} == {SOURCE}
+
+
+@pytest.mark.integration
+def test_should_stop_when_associated_recording_finishes():
+    # Given
+    consumer = CollectingFrameConsumer()
+    recording_finished = []
+    job = given_analysis_job(consumer, stop_when=lambda: bool(recording_finished))
+    job.open()
+
+    # When
+    alive = job.step(max_packets=100, max_milliseconds=200)
+
+    # Then: 25 fps => 5 paquetes en 200 ms
+    assert alive
+    assert job.frames_decoded <= 5
+
+    # When
+    recording_finished.append(True)
+
+    # Then
+    assert not job.step(max_packets=100)
+    assert job.is_finished
+
+
+@pytest.mark.integration
+def test_should_retry_opening_while_associated_recording_continues(tmp_path: Path):
+    # Given
+    consumer = CollectingFrameConsumer()
+    job = given_analysis_job(
+        consumer, stop_when=lambda: False, source=str(tmp_path / "missing.mp4")
+    )
+
+    # When
+    job.open()
+
+    # Then
+    assert job.is_reconnecting
+    assert not job.is_finished
+
+
+@pytest.mark.integration
+def test_should_reconnect_when_stream_ends_while_associated_recording_continues():
+    # Given
+    consumer = CollectingFrameConsumer()
+    recording_finished = []
+    job = given_analysis_job(consumer, stop_when=lambda: bool(recording_finished))
+    job.open()
+
+    # When
+    while not job.is_reconnecting:
+        assert job.step(max_packets=64)
+    frames_of_first_connection = job.frames_decoded
+    while job.frames_decoded == frames_of_first_connection:
+        assert job.step(max_packets=64)
+    recording_finished.append(True)
+
+    # Then
+    assert not job.step(max_packets=64)
+    assert job.frames_decoded > frames_of_first_connection
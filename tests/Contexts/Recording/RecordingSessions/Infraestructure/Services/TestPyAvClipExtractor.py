@@ -0,0 +1,166 @@
+import itertools
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+import av
+import numpy as np
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ClipRange import ClipRange
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.ProfileName import ProfileName
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    CatalogRecordingSegmentRepository as catalog_repository_module,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvClipExtractor import (
+    PyAvClipExtractor,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.RecordingCatalogEntry import (
+    RecordingCatalogEntry,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.StorageLocation import StorageLocation
+from src.Contexts.Recording.Videos.Infrastructure.Services.SqliteRecordingCatalog import (
+    SqliteRecordingCatalog,
+)
+
+CatalogRecordingSegmentRepository = catalog_repository_module.CatalogRecordingSegmentRepository
+
+PROFILE = "camera"
+RECORDING_START = datetime(2024, 5, 10, 14, 3, 0)
+
+
+@pytest.fixture
+def camera_source(tmp_path: Path) -> str:
+    """Video H.264 de 6 s a 25 fps con un keyframe por segundo"""
+    path = tmp_path / "camera.mp4"
+    output = av.open(str(path), mode="w")
+    video = output.add_stream("libx264", rate=25)
+    video.width, video.height, video.pix_fmt = 64, 64, "yuv420p"
+    video.codec_context.gop_size = 25
+    # Sin keyframes por cambio de escena: los segmentos duran exactamente lo que indica su nombre
+    video.codec_context.options = {"sc_threshold": "0"}
+    for index in range(6 * 25):
+        pixels = np.full((64, 64, 3), index, dtype=np.uint8)
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+        frame.pts = index
+        output.mux(video.encode(frame))
+    output.mux(video.encode(None))
+    output.close()
+    return str(path)
+
+
+@pytest.fixture
+def recordings_folder(tmp_path: Path, camera_source: str) -> Path:
+    """Graba la cámara en segmentos de 2 s nombrados como los de RecordingService"""
+    folder = tmp_path / "recordings"
+    folder.mkdir()
+    starts = (RECORDING_START + timedelta(seconds=2 * index) for index in itertools.count())
+    job = PyAvRecordingJob(
+        source=camera_source,
+        segment_duration=RecordingSessionDuration(2),
+        output_path_factory=lambda: OutputPath(
+            str(folder / f"{PROFILE}__{next(starts).strftime(OutputPath.DATE_FORMAT)}.mkv")
+        ),
+        on_segment_finished=None,
+        logger=Mock(),
+        continuous=True,
+    )
+    job.run()
+    return folder
+
+
+def given_clip_range(start_second: float, end_second: float) -> ClipRange:
+    return ClipRange(
+        start=RECORDING_START + timedelta(seconds=start_second),
+        end=RECORDING_START + timedelta(seconds=end_second),
+    )
+
+
+def given_segments(folder: Path, clip_range: ClipRange):
+    catalog = SqliteRecordingCatalog(":memory:")
+    catalog.add(
+        RecordingCatalogEntry(
+            profile_name=PROFILE,
+            start_date=RECORDING_START + timedelta(seconds=2 * index),
+            end_date=RECORDING_START + timedelta(seconds=2 * (index + 1)),
+            size_bytes=path.stat().st_size,
+            path=str(path),
+            location=StorageLocation(StorageLocation.LOCAL),
+        )
+        for index, path in enumerate(sorted(folder.glob(f"{PROFILE}__*.mkv")))
+    )
+    try:
+        return CatalogRecordingSegmentRepository(catalog).find_overlapping(
+            ProfileName(PROFILE), clip_range
+        )
+    finally:
+        catalog.close()
+
+
+def then_clip_packets(path: str) -> List[av.Packet]:
+    container = av.open(path)
+    try:
+        return [packet for packet in container.demux(video=0) if packet.size > 0]
+    finally:
+        container.close()
+
+
+@pytest.mark.integration
+def test_should_find_only_segments_overlapping_the_clip(recordings_folder: Path):
+    # When
+    segments = given_segments(recordings_folder, given_clip_range(2.5, 4.5))
+
+    # Then
+    assert [segment.start_date.second for segment in segments] == [2, 4]
+
+
+@pytest.mark.integration
+def test_should_extract_clip_across_segments_without_reencoding(
+    tmp_path: Path, recordings_folder: Path
+):
+    # Given
+    clip_range = given_clip_range(1.5, 4.5)
+    segments = given_segments(recordings_folder, clip_range)
+    output_path = str(tmp_path / "clip.mkv")
+
+    # When
+    clip = PyAvClipExtractor(Mock()).extract(segments, clip_range, output_path)
+
+    # Then: desde el keyframe de 1 s hasta el fin del clip, sin saltos entre segmentos
+    assert len(clip.segment_paths) == 3
+    packets = then_clip_packets(output_path)
+    assert packets[0].is_keyframe
+    assert 3.3 <= clip.media_duration_seconds <= 3.6
+    assert abs(len(packets) - 3.5 * 25) <= 2
+    keyframe_seconds = [
+        float(packet.pts * packet.time_base)
+        for packet in packets
+        if packet.is_keyframe and packet.pts is not None
+    ]
+    assert keyframe_seconds == pytest.approx([0.0, 1.0, 2.0, 3.0], abs=0.005)
+
+
+@pytest.mark.integration
+def test_should_stream_the_same_clip_as_bytes(tmp_path: Path, recordings_folder: Path):
+    # Given
+    clip_range = given_clip_range(1.5, 4.5)
+    segments = given_segments(recordings_folder, clip_range)
+    extractor = PyAvClipExtractor(Mock())
+    extracted = extractor.extract(segments, clip_range, str(tmp_path / "clip.mkv"))
+
+    # When
+    streamed_path = tmp_path / "streamed.mkv"
+    streamed_path.write_bytes(b"".join(extractor.stream(segments, clip_range)))
+
+    # Then
+    assert len(then_clip_packets(str(streamed_path))) == len(
+        then_clip_packets(extracted.output_path)
+    )
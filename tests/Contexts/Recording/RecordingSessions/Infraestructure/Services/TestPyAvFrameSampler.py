@@ -0,0 +1,135 @@
+import threading
+from fractions import Fraction
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import Mock
+
+import av
+import numpy as np
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.Contracts.FrameBatchConsumer import (
+    FrameBatchConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.FrameBatch import FrameBatch
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvAnalysisJob import (
+    PyAvAnalysisJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameSampler import (
+    PyAvFrameSampler,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+class CollectingBatchConsumer(FrameBatchConsumer):
+    def __init__(self, release: Optional[threading.Event] = None):
+        self.batches: List[FrameBatch] = []
+        self.buffers = set()
+        self.__release = release
+
+    def consume(self, batch: FrameBatch) -> None:
+        if self.__release is not None:
+            self.__release.wait()
+        self.buffers.add(id(batch.frames.base))
+        # El buffer se reutiliza: se copia para inspeccionarlo después
+        self.batches.append(FrameBatch(batch.frames.copy(), batch.sources, batch.timestamps))
+
+
+def given_frame(index: int, value: int = 0, fps: int = 25) -> av.VideoFrame:
+    frame = av.VideoFrame.from_ndarray(np.full((72, 128, 3), value, dtype=np.uint8), "rgb24")
+    frame.pts = index
+    frame.time_base = Fraction(1, fps)
+    return frame
+
+
+def when_frames_are_consumed(sampler: PyAvFrameSampler, source: str, frames) -> None:
+    for frame in frames:
+        sampler.consume(source, frame)
+    sampler.stop()
+
+
+def then_timestamps_should_be(consumer: CollectingBatchConsumer, expected) -> None:
+    timestamps = [timestamp for batch in consumer.batches for timestamp in batch.timestamps]
+    assert timestamps == pytest.approx(expected)
+
+
+@pytest.mark.integration
+def test_should_deliver_downscaled_frames_in_batches():
+    # Given
+    consumer = CollectingBatchConsumer()
+    sampler = PyAvFrameSampler(consumer, Mock(), width=64, height=36, batch_size=4)
+    frames = [given_frame(index, value=index * 10) for index in range(6)]
+
+    # When
+    when_frames_are_consumed(sampler, "cam1", frames)
+
+    # Then
+    assert [batch.frames.shape for batch in consumer.batches] == [(4, 36, 64, 3), (2, 36, 64, 3)]
+    assert consumer.batches[0].sources == ("cam1",) * 4
+    assert int(consumer.batches[1].frames[1].mean()) == pytest.approx(50, abs=2)
+    then_timestamps_should_be(consumer, [index / 25 for index in range(6)])
+    assert sampler.delivered_frames == 6
+
+
+@pytest.mark.integration
+def test_should_sample_every_nth_frame_at_target_fps():
+    # Given: 25 fps, uno de cada dos frames y como máximo 5 por segundo
+    consumer = CollectingBatchConsumer()
+    sampler = PyAvFrameSampler(
+        consumer, Mock(), width=32, height=18, batch_size=16, every_nth=2, target_fps=5
+    )
+
+    # When
+    when_frames_are_consumed(sampler, "cam1", [given_frame(index) for index in range(50)])
+
+    # Then
+    then_timestamps_should_be(consumer, [0.0, 0.24, 0.4, 0.64, 0.8, 1.04, 1.2, 1.44, 1.6, 1.84])
+
+
+@pytest.mark.integration
+def test_should_drop_oldest_batches_instead_of_blocking_when_consumer_is_slow():
+    # Given
+    release = threading.Event()
+    consumer = CollectingBatchConsumer(release)
+    sampler = PyAvFrameSampler(consumer, Mock(), width=32, height=18, batch_size=1, queue_size=2)
+
+    # When: el consumidor está bloqueado mientras se muestrean 20 frames
+    for index in range(20):
+        sampler.consume("cam1", given_frame(index))
+    release.set()
+    sampler.stop()
+
+    # Then
+    assert sampler.dropped_frames > 0
+    assert sampler.delivered_frames + sampler.dropped_frames == 20
+    assert len(consumer.buffers) <= 4
+    delivered = [batch.timestamps[0] for batch in consumer.batches]
+    assert delivered[-1] == pytest.approx(19 / 25)
+
+
+@pytest.mark.integration
+def test_should_decode_only_keyframes_of_analysis_stream():
+    # Given
+    consumer = CollectingBatchConsumer()
+    sampler = PyAvFrameSampler(consumer, Mock(), keyframes_only=True)
+    job = PyAvAnalysisJob(source=SOURCE, consumer=sampler, logger=Mock())
+    container = av.open(SOURCE)
+    keyframes = sum(packet.is_keyframe for packet in container.demux(video=0))
+    container.close()
+
+    # When
+    job.run()
+    sampler.stop()
+
+    # Then
+    assert job.frames_decoded == keyframes
+    assert sampler.delivered_frames == keyframes
+    assert consumer.batches[0].frames.shape[1:] == (180, 320, 3)
+
+
+@pytest.mark.integration
+def test_should_reject_unsupported_pixel_format():
+    # When/Then
+    with pytest.raises(ValueError):
+        PyAvFrameSampler(CollectingBatchConsumer(), Mock(), pixel_format="yuv420p")
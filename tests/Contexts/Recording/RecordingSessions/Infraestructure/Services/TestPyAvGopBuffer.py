@@ -0,0 +1,129 @@
+from fractions import Fraction
+
+import av
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvGopBuffer import (
+    PyAvGopBuffer,
+)
+
+
+def given_packet(dts: int, size: int = 100, is_keyframe: bool = False) -> av.Packet:
+    packet = av.Packet(bytes(size))
+    packet.time_base = Fraction(1, 90000)
+    packet.dts = dts
+    packet.pts = dts
+    packet.is_keyframe = is_keyframe
+    return packet
+
+
+def when_packets_are_pushed(gop_buffer: PyAvGopBuffer, packets) -> None:
+    for packet in packets:
+        gop_buffer.push(packet)
+
+
+def then_buffer_should_contain_dts(gop_buffer: PyAvGopBuffer, expected_dts) -> None:
+    assert [packet.dts for packet in gop_buffer.replay()] == expected_dts
+
+
+@pytest.mark.integration
+def test_should_ignore_packets_before_first_keyframe():
+    # Given
+    gop_buffer = PyAvGopBuffer(max_bytes=10_000)
+
+    # When
+    when_packets_are_pushed(gop_buffer, [given_packet(0), given_packet(3600)])
+
+    # Then
+    assert not gop_buffer.has_complete_gop()
+    assert gop_buffer.size_bytes == 0
+
+
+@pytest.mark.integration
+def test_should_keep_only_current_gop():
+    # Given
+    gop_buffer = PyAvGopBuffer(max_bytes=10_000)
+    packets = [
+        given_packet(0, is_keyframe=True),
+        given_packet(3600),
+        given_packet(7200, is_keyframe=True),
+        given_packet(10800),
+    ]
+
+    # When
+    when_packets_are_pushed(gop_buffer, packets)
+
+    # Then
+    assert gop_buffer.has_complete_gop()
+    assert gop_buffer.size_bytes == 200
+    then_buffer_should_contain_dts(gop_buffer, [7200, 10800])
+
+
+@pytest.mark.integration
+def test_should_drop_gop_when_it_exceeds_max_bytes_until_next_keyframe():
+    # Given
+    gop_buffer = PyAvGopBuffer(max_bytes=250)
+    packets = [given_packet(dts * 3600, is_keyframe=dts == 0) for dts in range(4)]
+
+    # When
+    when_packets_are_pushed(gop_buffer, packets)
+
+    # Then
+    assert not gop_buffer.has_complete_gop()
+    assert gop_buffer.size_bytes == 0
+
+    # When
+    when_packets_are_pushed(gop_buffer, [given_packet(14400, is_keyframe=True)])
+
+    # Then
+    then_buffer_should_contain_dts(gop_buffer, [14400])
+
+
+@pytest.mark.integration
+def test_should_keep_secondary_stream_packets_without_starting_a_gop():
+    # Given: los paquetes de audio suelen marcarse todos como keyframe
+    gop_buffer = PyAvGopBuffer(max_bytes=10_000)
+    gop_buffer.push(given_packet(0, is_keyframe=True), is_video=False)
+    gop_buffer.push(given_packet(3600, is_keyframe=True))
+
+    # When
+    gop_buffer.push(given_packet(5400, is_keyframe=True), is_video=False)
+    gop_buffer.push(given_packet(7200))
+
+    # Then
+    then_buffer_should_contain_dts(gop_buffer, [3600, 5400, 7200])
+
+
+@pytest.mark.integration
+def test_should_reject_non_positive_max_bytes():
+    # When/Then
+    with pytest.raises(ValueError):
+        PyAvGopBuffer(max_bytes=0)
+
+
+@pytest.mark.integration
+def test_should_keep_gops_covering_pre_roll():
+    # Given
+    gop_buffer = PyAvGopBuffer(max_bytes=10_000, pre_roll_seconds=2)
+    # Un keyframe por segundo (time base 1/90000)
+    packets = [given_packet(second * 90000, is_keyframe=True) for second in range(5)]
+
+    # When
+    when_packets_are_pushed(gop_buffer, packets)
+
+    # Then
+    then_buffer_should_contain_dts(gop_buffer, [180000, 270000, 360000])
+
+
+@pytest.mark.integration
+def test_should_drop_oldest_pre_roll_gops_when_exceeding_max_bytes():
+    # Given
+    gop_buffer = PyAvGopBuffer(max_bytes=250, pre_roll_seconds=10)
+    packets = [given_packet(second * 90000, is_keyframe=True) for second in range(5)]
+
+    # When
+    when_packets_are_pushed(gop_buffer, packets)
+
+    # Then
+    assert gop_buffer.size_bytes == 200
+    then_buffer_should_contain_dts(gop_buffer, [270000, 360000])
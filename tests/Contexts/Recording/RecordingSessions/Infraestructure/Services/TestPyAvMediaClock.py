@@ -0,0 +1,139 @@
+from fractions import Fraction
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMediaClock import (
+    PyAvMediaClock,
+)
+
+
+def when_dts_are_registered(clock: PyAvMediaClock, dts_values) -> int:
+    elapsed_ticks = 0
+    for dts in dts_values:
+        elapsed_ticks = clock.update(dts)
+    return elapsed_ticks
+
+
+@pytest.mark.integration
+def test_should_convert_seconds_using_stream_time_base():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+
+    # When/Then
+    assert clock.ticks_for_seconds(3) == 270000
+
+
+@pytest.mark.integration
+def test_should_default_to_milliseconds_when_time_base_is_unknown():
+    # Given
+    clock = PyAvMediaClock(None)
+
+    # When/Then
+    assert clock.ticks_for_seconds(3) == 3000
+
+
+@pytest.mark.integration
+def test_should_measure_from_first_dts_when_stream_does_not_start_at_zero():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+
+    # When
+    elapsed_ticks = when_dts_are_registered(clock, [900000, 903600, 990000])
+
+    # Then
+    assert elapsed_ticks == 90000
+    assert clock.media_seconds() == 1.0
+
+
+@pytest.mark.integration
+def test_should_unwrap_32_bit_rtp_timestamps():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+    before_wrap = 2**32 - 45000
+
+    # When
+    elapsed_ticks = when_dts_are_registered(clock, [before_wrap, 2**32 - 3600, 45000])
+
+    # Then
+    assert elapsed_ticks == 90000
+
+
+@pytest.mark.integration
+def test_should_unwrap_33_bit_mpegts_timestamps():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+
+    # When
+    elapsed_ticks = when_dts_are_registered(clock, [2**33 - 45000, 45000])
+
+    # Then
+    assert elapsed_ticks == 90000
+
+
+@pytest.mark.integration
+def test_should_not_treat_small_backward_jumps_as_wraparound():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 1000))
+
+    # When
+    elapsed_ticks = when_dts_are_registered(clock, [5000, 5040, 5000])
+
+    # Then
+    assert elapsed_ticks == 0
+
+
+@pytest.mark.integration
+def test_should_measure_segment_from_restart_point():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+    when_dts_are_registered(clock, [0, 270000])
+
+    # When
+    clock.restart()
+    elapsed_ticks = when_dts_are_registered(clock, [360000])
+
+    # Then
+    assert elapsed_ticks == 90000
+    assert clock.media_seconds() == 1.0
+
+
+@pytest.mark.integration
+def test_should_count_out_of_order_packets_that_are_not_a_wraparound():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+
+    # When: un paquete llega con DTS anterior al último, sin llegar a ser un wraparound
+    when_dts_are_registered(clock, [0, 3600, 7200, 3600, 10800])
+
+    # Then
+    assert clock.out_of_order_packets == 1
+
+
+@pytest.mark.integration
+def test_should_keep_counting_when_the_encoder_restarts_its_timestamps():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 90000))
+    when_dts_are_registered(clock, [2700000, 2790000, 2880000])
+
+    # When: el encoder vuelve a empezar en 0 sin cortar la conexión
+    elapsed_ticks = when_dts_are_registered(clock, [0, 90000])
+
+    # Then
+    assert elapsed_ticks == 270000
+    assert clock.discontinuities == 1
+    assert clock.out_of_order_packets == 0
+
+
+@pytest.mark.integration
+def test_should_cut_continuous_segments_after_an_encoder_restart():
+    # Given
+    clock = PyAvMediaClock(Fraction(1, 1000))
+    when_dts_are_registered(clock, [60000, 61000, 62000])
+    clock.restart()
+
+    # When
+    elapsed_ticks = when_dts_are_registered(clock, [1000, 2000, 3000])
+
+    # Then
+    assert elapsed_ticks == 2000
+    assert clock.media_seconds() == 2.0
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import av
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMotionDetector import (
+    PyAvMotionDetector,
+)
+
+
+def given_frame(brightness: int, square: bool = False) -> av.VideoFrame:
+    pixels = np.full((180, 320, 3), brightness, dtype=np.uint8)
+    if square:
+        pixels[40:120, 100:200] = 255
+    return av.VideoFrame.from_ndarray(pixels, format="rgb24")
+
+
+@pytest.mark.integration
+def test_should_not_detect_motion_in_static_scene():
+    # Given
+    detector = PyAvMotionDetector(min_changed_fraction=0.01)
+
+    # When
+    for _ in range(3):
+        detector.consume("camera", given_frame(60))
+
+    # Then
+    assert detector.last_motion_at is None
+    assert detector.seconds_since_motion() == float("inf")
+
+
+@pytest.mark.integration
+def test_should_detect_motion_when_enough_pixels_change():
+    # Given
+    detector = PyAvMotionDetector(min_changed_fraction=0.01)
+    detector.consume("camera", given_frame(60))
+
+    # When
+    detector.consume("camera", given_frame(60, square=True))
+
+    # Then
+    assert detector.last_motion_at is not None
+    assert detector.seconds_since_motion() < 1
+
+
+@pytest.mark.integration
+def test_should_ignore_changes_below_pixel_threshold():
+    # Given
+    detector = PyAvMotionDetector(min_changed_fraction=0.01, pixel_threshold=25)
+    detector.consume("camera", given_frame(60))
+
+    # When
+    detector.consume("camera", given_frame(70))
+
+    # Then
+    assert detector.last_motion_at is None
+
+
+@pytest.mark.integration
+def test_should_ignore_changes_smaller_than_min_changed_fraction():
+    # Given
+    detector = PyAvMotionDetector(min_changed_fraction=0.5)
+    detector.consume("camera", given_frame(60))
+
+    # When
+    detector.consume("camera", given_frame(60, square=True))
+
+    # Then
+    assert detector.last_motion_at is None
@@ -0,0 +1,202 @@
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from unittest.mock import Mock
+
+import av
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvJob import PyAvJob
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingEngine import (
+    PyAvRecordingEngine,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+class FakeCameraJob(PyAvJob):
+    """Cámara cuya lectura tarda `read_seconds` por turno, como una cámara lenta"""
+
+    def __init__(self, source: str, read_seconds: float = 0):
+        self.__source = source
+        self.__read_seconds = read_seconds
+        self.steps = 0
+        self.is_finished = False
+
+    @property
+    def source(self) -> str:
+        return self.__source
+
+    def seconds_until_ready(self) -> float:
+        return 0
+
+    def step(self, max_packets: int, max_milliseconds: Optional[int] = None) -> bool:
+        time.sleep(self.__read_seconds)
+        self.steps += 1
+        return not self.is_finished
+
+    def finish(self) -> None:
+        self.is_finished = True
+
+
+@pytest.fixture
+def engine():
+    engine = PyAvRecordingEngine(Mock(), workers=2, packets_per_turn=8)
+    yield engine
+    engine.stop(timeout=5)
+
+
+def given_opened_job(
+    tmp_path: Path,
+    camera: int,
+    results: list,
+    seconds: int = 2,
+    backoff: Optional[ExponentialBackoff] = None,
+):
+    job = PyAvRecordingJob(
+        source=SOURCE,
+        segment_duration=RecordingSessionDuration(seconds),
+        output_path_factory=lambda: OutputPath(str(tmp_path / f"camera{camera}.mkv")),
+        on_segment_finished=results.append,
+        logger=Mock(),
+        backoff=backoff,
+    )
+    job.open()
+    return job
+
+
+def given_cameras_that_block_on_connect(monkeypatch):
+    """Las conexiones nuevas bloquean hasta que se habilitan, como una cámara que no responde"""
+    real_open = av.open
+    connecting = threading.Event()
+    can_connect = threading.Event()
+
+    def open_camera(*args, **kwargs):
+        connecting.set()
+        can_connect.wait(5)
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(av, "open", open_camera)
+    return connecting, can_connect
+
+
+def when_engine_is_idle(engine: PyAvRecordingEngine, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while sum(engine.jobs_per_worker()) > 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.mark.integration
+def test_should_record_all_submitted_cameras(engine: PyAvRecordingEngine, tmp_path: Path):
+    # Given
+    results = []
+    jobs = [given_opened_job(tmp_path, camera, results) for camera in range(4)]
+
+    # When
+    for job in jobs:
+        engine.submit(job)
+    when_engine_is_idle(engine)
+
+    # Then
+    assert len(results) == 4
+    assert all(job.is_finished for job in jobs)
+    assert sorted(Path(result.output_path).name for result in results) == [
+        f"camera{camera}.mkv" for camera in range(4)
+    ]
+
+
+@pytest.mark.integration
+def test_should_finish_pending_recordings_on_stop(engine: PyAvRecordingEngine, tmp_path: Path):
+    # Given
+    results = []
+    engine.submit(given_opened_job(tmp_path, 0, results, seconds=60))
+
+    # When
+    engine.stop(timeout=5)
+
+    # Then
+    assert len(results) == 1
+    assert engine.jobs_per_worker() == [0, 0]
+
+
+@pytest.mark.integration
+def test_should_assign_same_source_to_same_worker(engine: PyAvRecordingEngine):
+    # When
+    shards = {engine.shard_for(f"rtsp://camera{index}/stream") for index in range(50)}
+
+    # Then
+    assert shards == {0, 1}
+    assert engine.shard_for("rtsp://camera1/stream") == engine.shard_for("rtsp://camera1/stream")
+
+
+def test_should_keep_stepping_other_cameras_while_one_is_slow():
+    # Given
+    engine = PyAvRecordingEngine(Mock(), workers=1, slow_turn_seconds=0.1)
+    slow_camera = FakeCameraJob("rtsp://slow/stream", read_seconds=0.3)
+    fast_camera = FakeCameraJob("rtsp://fast/stream", read_seconds=0.001)
+
+    # When
+    engine.submit(slow_camera)
+    engine.submit(fast_camera)
+    time.sleep(1.5)
+    engine.stop(timeout=5)
+
+    # Then
+    assert fast_camera.steps > 10 * slow_camera.steps
+    assert slow_camera.is_finished and fast_camera.is_finished
+    assert engine.slow_lane_jobs() == 0
+    assert engine.jobs_per_worker() == [0]
+
+
+def test_should_move_slow_cameras_to_the_slow_lane():
+    # Given
+    engine = PyAvRecordingEngine(Mock(), workers=1, slow_turn_seconds=0.1)
+    slow_camera = FakeCameraJob("rtsp://slow/stream", read_seconds=0.3)
+
+    # When
+    engine.submit(slow_camera)
+    time.sleep(0.5)
+
+    # Then
+    assert engine.slow_lane_jobs() == 1
+    assert engine.jobs_per_worker() == [1]
+    engine.stop(timeout=5)
+
+
+@pytest.mark.integration
+def test_should_keep_stepping_other_cameras_while_one_reconnects(tmp_path: Path, monkeypatch):
+    # Given
+    engine = PyAvRecordingEngine(Mock(), workers=1)
+    results = []
+    backoff = ExponentialBackoff(base_delay_seconds=0.01)
+    reconnecting_camera = given_opened_job(tmp_path, 0, results, seconds=60, backoff=backoff)
+    other_camera = FakeCameraJob("rtsp://other/stream", read_seconds=0.001)
+    connecting, can_connect = given_cameras_that_block_on_connect(monkeypatch)
+    reconnecting_camera.request_restart("prueba de reconexión")
+
+    # When
+    engine.submit(reconnecting_camera)
+    engine.submit(other_camera)
+    assert connecting.wait(5)
+    steps_when_connecting = other_camera.steps
+    time.sleep(0.3)
+    steps_while_connecting = other_camera.steps - steps_when_connecting
+    can_connect.set()
+    engine.stop(timeout=5)
+
+    # Then
+    assert steps_while_connecting > 10
+    assert len(results) == 1
+    assert results[0].gaps
+    assert engine.jobs_per_worker() == [0]
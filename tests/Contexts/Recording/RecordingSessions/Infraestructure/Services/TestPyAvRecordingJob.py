@@ -0,0 +1,475 @@
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from unittest.mock import Mock
+
+import av
+import numpy as np
+import pytest
+from av.error import HTTPBadRequestError
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.StreamSelection import (
+    StreamSelection,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvFrameConsumer import (
+    PyAvFrameConsumer,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvMotionDetector import (
+    PyAvMotionDetector,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+class FlakyContainer:
+    """Contenedor que falla con `error` después de entregar `packets_before_failure` paquetes"""
+
+    def __init__(self, container, packets_before_failure: int, error: Exception):
+        self.streams = container.streams
+        self.__container = container
+        self.__packets_before_failure = packets_before_failure
+        self.__error = error
+
+    def demux(self, *streams):
+        packets = self.__container.demux(*streams)
+        for _ in range(self.__packets_before_failure):
+            yield next(packets)
+        raise self.__error
+
+    def close(self):
+        self.__container.close()
+
+
+def given_camera_that_disconnects_once(
+    monkeypatch, packets_before_failure: int, error: Optional[Exception] = None
+) -> None:
+    real_open = av.open
+    connections = itertools.count()
+    error = error or ConnectionResetError("Connection reset by peer")
+
+    def open_camera(*args, **kwargs):
+        container = real_open(*args, **kwargs)
+        if next(connections) == 0:
+            return FlakyContainer(container, packets_before_failure, error)
+        return container
+
+    monkeypatch.setattr(av, "open", open_camera)
+
+
+class FrameCollector(PyAvFrameConsumer):
+    """Guarda los frames recibidos y los pasa a otro consumidor"""
+
+    def __init__(self, consumer: PyAvFrameConsumer):
+        self.frames = []
+        self.__consumer = consumer
+
+    def prepare(self, stream) -> None:
+        self.__consumer.prepare(stream)
+
+    def consume(self, source: str, frame) -> None:
+        self.frames.append(frame)
+        self.__consumer.consume(source, frame)
+
+
+def given_job(
+    tmp_path: Path,
+    results: list,
+    seconds: int,
+    continuous: bool,
+    backoff: Optional[ExponentialBackoff] = None,
+    source: str = SOURCE,
+    stream_selection: Optional[StreamSelection] = None,
+    is_motion_active=None,
+    pre_roll_seconds: float = 0,
+    keyframe_consumer=None,
+) -> PyAvRecordingJob:
+    counter = itertools.count()
+    return PyAvRecordingJob(
+        source=source,
+        segment_duration=RecordingSessionDuration(seconds),
+        output_path_factory=lambda: OutputPath(str(tmp_path / f"segment{next(counter)}.mkv")),
+        on_segment_finished=results.append,
+        logger=Mock(),
+        continuous=continuous,
+        backoff=backoff,
+        stream_selection=stream_selection,
+        is_motion_active=is_motion_active,
+        pre_roll_seconds=pre_roll_seconds,
+        keyframe_consumer=keyframe_consumer,
+    )
+
+
+def given_motion_between(job_ref: list, start_packet: int, end_packet: int):
+    """Movimiento simulado entre dos posiciones del stream, medidas en paquetes de video"""
+    return lambda: start_packet <= job_ref[0].packets_processed < end_packet
+
+
+@pytest.fixture
+def audio_video_source(tmp_path: Path) -> str:
+    """Video H.264 a 25 fps (time base 1/12800) con una pista AAC a 8 kHz (time base 1/8000)"""
+    return given_audio_video_file(tmp_path / "audio_video.mp4", gop_size=25)
+
+
+def given_audio_video_file(path: Path, gop_size: int) -> str:
+    output = av.open(str(path), mode="w")
+    video = output.add_stream("libx264", rate=25)
+    video.width, video.height, video.pix_fmt = 64, 64, "yuv420p"
+    video.codec_context.gop_size = gop_size
+    audio = output.add_stream("aac", rate=8000)
+    audio.layout = "mono"
+    seconds = 4
+    for index in range(seconds * 25):
+        frame = av.VideoFrame.from_ndarray(np.zeros((64, 64, 3), dtype=np.uint8), format="rgb24")
+        frame.pts = index
+        output.mux(video.encode(frame))
+    for index in range(seconds * 8000 // 1024):
+        frame = av.AudioFrame.from_ndarray(
+            np.zeros((1, 1024), dtype=np.float32), format="fltp", layout="mono"
+        )
+        frame.sample_rate = 8000
+        frame.pts = index * 1024
+        output.mux(audio.encode(frame))
+    output.mux(video.encode(None))
+    output.mux(audio.encode(None))
+    output.close()
+    return str(path)
+
+
+def then_recording_should_have_streams(output_path: str, expected_types) -> None:
+    container = av.open(output_path)
+    try:
+        assert [stream.type for stream in container.streams] == expected_types
+        packet_types = {packet.stream.type for packet in container.demux() if packet.size > 0}
+        assert packet_types == set(expected_types)
+    finally:
+        container.close()
+
+
+def then_streams_should_start_together(output_path: str) -> None:
+    container = av.open(output_path)
+    try:
+        first_seconds = {}
+        for packet in container.demux():
+            if packet.dts is not None and packet.stream.type not in first_seconds:
+                first_seconds[packet.stream.type] = float(packet.dts * packet.time_base)
+        assert set(first_seconds) == {"video", "audio"}
+        assert abs(first_seconds["video"] - first_seconds["audio"]) < 0.2
+    finally:
+        container.close()
+
+
+def video_dts_of(output_path: str) -> list:
+    container = av.open(output_path)
+    try:
+        return [packet.dts for packet in container.demux(video=0) if packet.size > 0]
+    finally:
+        container.close()
+
+
+def then_video_starts_with_keyframe(output_path: str) -> None:
+    container = av.open(output_path)
+    try:
+        packets = [packet for packet in container.demux(video=0) if packet.size > 0]
+        assert packets and packets[0].is_keyframe
+    finally:
+        container.close()
+
+
+@pytest.mark.integration
+def test_should_stop_session_when_duration_is_reached(tmp_path: Path):
+    # Given
+    results = []
+    job = given_job(tmp_path, results, seconds=2, continuous=False)
+
+    # When
+    job.run()
+
+    # Then
+    assert job.is_finished
+    assert len(results) == 1
+    assert results[0].media_duration_seconds == 2.0
+    then_video_starts_with_keyframe(results[0].output_path)
+    metrics = job.metrics_snapshot()
+    assert metrics is not None
+    assert metrics.packets_per_stream == ((0, job.packets_processed),)
+    assert metrics.keyframes == 1
+    assert metrics.dts_gap_frames == 0
+    assert metrics.mux_latency_count > 0
+
+
+@pytest.mark.integration
+def test_should_advance_only_one_turn_per_step(tmp_path: Path):
+    # Given
+    results = []
+    job = given_job(tmp_path, results, seconds=60, continuous=True)
+    job.open()
+
+    # When
+    alive = job.step(max_packets=10)
+
+    # Then
+    assert alive
+    assert job.packets_processed == 10
+    assert results == []
+
+    # When: el turno también se limita por tiempo de media (25 fps => 5 paquetes en 200 ms)
+    job.step(max_packets=100, max_milliseconds=200)
+
+    # Then
+    assert job.packets_processed == 15
+
+    # When
+    job.finish()
+
+    # Then
+    assert len(results) == 1
+    assert os.path.getsize(results[0].output_path) > 0
+
+
+@pytest.mark.integration
+def test_should_continue_session_in_new_part_after_reconnecting(tmp_path: Path, monkeypatch):
+    # Given
+    results = []
+    given_camera_that_disconnects_once(monkeypatch, packets_before_failure=20)
+    backoff = ExponentialBackoff(base_delay_seconds=0.01, max_delay_seconds=0.01)
+    job = given_job(tmp_path, results, seconds=3, continuous=False, backoff=backoff)
+
+    # When
+    job.run()
+
+    # Then
+    assert len(results) == 1
+    result = results[0]
+    assert result.output_path == str(tmp_path / "segment0.mkv")
+    assert result.part_paths == (str(tmp_path / "segment0__part2.mkv"),)
+    assert len(result.gaps) == 1
+    assert "Connection reset" in result.gaps[0].reason
+    for path in result.all_paths:
+        then_video_starts_with_keyframe(path)
+
+
+@pytest.mark.integration
+def test_should_finish_session_when_reconnect_attempts_are_exhausted(tmp_path: Path, monkeypatch):
+    # Given
+    results = []
+    given_camera_that_disconnects_once(monkeypatch, packets_before_failure=20)
+    backoff = ExponentialBackoff(base_delay_seconds=0.01, max_attempts=0)
+    job = given_job(tmp_path, results, seconds=3, continuous=False, backoff=backoff)
+
+    # When
+    job.run()
+
+    # Then
+    assert job.is_finished
+    assert len(results) == 1
+    assert results[0].part_paths == ()
+    assert len(results[0].gaps) == 1
+
+
+@pytest.mark.integration
+def test_should_stop_waiting_to_reconnect_when_a_stop_is_requested(tmp_path: Path, monkeypatch):
+    # Given
+    results = []
+    given_camera_that_disconnects_once(monkeypatch, packets_before_failure=20)
+    backoff = ExponentialBackoff(base_delay_seconds=30, max_delay_seconds=30)
+    job = given_job(tmp_path, results, seconds=60, continuous=True, backoff=backoff)
+    thread = threading.Thread(target=job.run)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not job.is_reconnecting and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # When
+    job.request_stop()
+    thread.join(timeout=5)
+
+    # Then
+    assert not thread.is_alive()
+    assert job.is_finished
+    assert len(results) == 1
+
+
+@pytest.mark.integration
+def test_should_notify_the_segment_in_progress_when_an_error_ends_the_recording(
+    tmp_path: Path, monkeypatch
+):
+    # Given
+    results = []
+    error = HTTPBadRequestError(1094795585, "Server returned 400 Bad Request")
+    given_camera_that_disconnects_once(monkeypatch, packets_before_failure=40, error=error)
+    job = given_job(tmp_path, results, seconds=60, continuous=True)
+
+    # When
+    with pytest.raises(HTTPBadRequestError):
+        job.run()
+
+    # Then
+    assert job.is_finished
+    assert [result.output_path for result in results] == [str(tmp_path / "segment0.mkv")]
+    assert results[0].media_duration_seconds > 0
+    then_video_starts_with_keyframe(results[0].output_path)
+
+
+@pytest.mark.integration
+def test_should_record_only_main_video_by_default(tmp_path: Path, audio_video_source: str):
+    # Given
+    results = []
+    job = given_job(tmp_path, results, seconds=2, continuous=False, source=audio_video_source)
+
+    # When
+    job.run()
+
+    # Then
+    then_recording_should_have_streams(results[0].output_path, ["video"])
+    metrics = job.metrics_snapshot()
+    assert metrics is not None
+    assert dict(metrics.packets_per_stream)[1] > 0
+
+
+@pytest.mark.integration
+def test_should_remux_audio_from_the_same_connection(tmp_path: Path, audio_video_source: str):
+    # Given
+    results = []
+    job = given_job(
+        tmp_path,
+        results,
+        seconds=2,
+        continuous=False,
+        source=audio_video_source,
+        stream_selection=StreamSelection(StreamSelection.VIDEO_AUDIO),
+    )
+
+    # When
+    job.run()
+
+    # Then
+    then_recording_should_have_streams(results[0].output_path, ["video", "audio"])
+    then_streams_should_start_together(results[0].output_path)
+
+
+@pytest.mark.integration
+def test_should_keep_audio_in_every_continuous_segment(tmp_path: Path, audio_video_source: str):
+    # Given
+    results = []
+    job = given_job(
+        tmp_path,
+        results,
+        seconds=1,
+        continuous=True,
+        source=audio_video_source,
+        stream_selection=StreamSelection(StreamSelection.ALL),
+    )
+
+    # When
+    job.run()
+
+    # Then
+    assert len(results) >= 3
+    for result in results:
+        then_recording_should_have_streams(result.output_path, ["video", "audio"])
+        then_video_starts_with_keyframe(result.output_path)
+
+
+@pytest.mark.integration
+def test_should_not_repeat_packets_across_continuous_segments(tmp_path: Path):
+    # Given: 4 s a 25 fps con un keyframe cada 2 s, más largo que cada segmento
+    results = []
+    source = given_audio_video_file(tmp_path / "long_gop.mp4", gop_size=50)
+    job = given_job(tmp_path, results, seconds=1, continuous=True, source=source)
+
+    # When
+    job.run()
+
+    # Then: los segmentos se cortan en los keyframes y cubren el video una sola vez
+    assert [len(video_dts_of(result.output_path)) for result in results] == [50, 50]
+    for result in results:
+        then_video_starts_with_keyframe(result.output_path)
+
+
+@pytest.mark.integration
+def test_should_record_only_while_motion_is_active(tmp_path: Path, audio_video_source: str):
+    # Given: 4 s a 25 fps con un keyframe por segundo, movimiento entre 2.4 s y 2.8 s
+    results, job_ref = [], []
+    job = given_job(
+        tmp_path,
+        results,
+        seconds=10,
+        continuous=True,
+        source=audio_video_source,
+        is_motion_active=given_motion_between(job_ref, 60, 70),
+        pre_roll_seconds=1,
+    )
+    job_ref.append(job)
+
+    # When
+    job.run()
+
+    # Then: un único segmento desde el keyframe de 1 s (pre-roll) hasta el keyframe de 3 s,
+    # el primero después del fin del movimiento
+    assert len(results) == 1
+    then_video_starts_with_keyframe(results[0].output_path)
+    assert len(video_dts_of(results[0].output_path)) == 50
+
+
+@pytest.mark.integration
+def test_should_open_a_segment_per_motion_event(tmp_path: Path, audio_video_source: str):
+    # Given
+    results, job_ref = [], []
+    first_motion = given_motion_between(job_ref, 10, 20)
+    second_motion = given_motion_between(job_ref, 70, 80)
+    job = given_job(
+        tmp_path,
+        results,
+        seconds=10,
+        continuous=True,
+        source=audio_video_source,
+        is_motion_active=lambda: first_motion() or second_motion(),
+    )
+    job_ref.append(job)
+
+    # When
+    job.run()
+
+    # Then
+    assert len(results) == 2
+    for result in results:
+        then_video_starts_with_keyframe(result.output_path)
+
+
+@pytest.mark.integration
+def test_should_pass_the_keyframes_it_records_to_the_keyframe_consumer(
+    tmp_path: Path, audio_video_source: str
+):
+    # Given
+    results = []
+    keyframe_consumer = FrameCollector(PyAvMotionDetector(0.01, keyframes_only=True))
+    job = given_job(
+        tmp_path,
+        results,
+        seconds=60,
+        continuous=True,
+        source=audio_video_source,
+        keyframe_consumer=keyframe_consumer,
+    )
+
+    # When
+    job.run()
+
+    # Then
+    assert [frame.pts for frame in keyframe_consumer.frames] == [0, 12800, 25600, 38400]
+    assert all(frame.key_frame for frame in keyframe_consumer.frames)
+    assert len(results) == 1
+    then_video_starts_with_keyframe(results[0].output_path)
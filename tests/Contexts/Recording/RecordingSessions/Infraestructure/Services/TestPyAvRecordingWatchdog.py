@@ -0,0 +1,103 @@
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingWatchdog import (
+    PyAvRecordingWatchdog,
+)
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+@pytest.fixture
+def watchdog():
+    watchdog = PyAvRecordingWatchdog(Mock(), stall_timeout_seconds=0.3, check_interval_seconds=0.02)
+    yield watchdog
+    watchdog.stop()
+
+
+def given_open_job(tmp_path: Path) -> PyAvRecordingJob:
+    job = PyAvRecordingJob(
+        source=SOURCE,
+        segment_duration=RecordingSessionDuration(60),
+        output_path_factory=lambda: OutputPath(str(tmp_path / "segment.mkv")),
+        on_segment_finished=None,
+        logger=Mock(),
+        continuous=True,
+        backoff=ExponentialBackoff(base_delay_seconds=10, max_delay_seconds=10),
+    )
+    job.open()
+    return job
+
+
+def wait_for_check(seconds: float = 0.1) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.integration
+def test_should_report_packet_rates_of_active_recording(tmp_path: Path, watchdog):
+    # Given
+    job = given_open_job(tmp_path)
+    watchdog.watch(job)
+
+    # When
+    for _ in range(3):
+        job.step(max_packets=10)
+        wait_for_check()
+
+    # Then
+    [health] = watchdog.health()
+    assert health.source == SOURCE
+    assert health.packets_per_second > 0
+    assert health.bytes_per_second > 0
+    assert health.is_healthy
+    job.finish()
+
+
+@pytest.mark.integration
+def test_should_restart_stalled_recording(tmp_path: Path, watchdog):
+    # Given
+    job = given_open_job(tmp_path)
+    watchdog.watch(job)
+
+    # When: la cámara no entrega paquetes durante más que el timeout
+    wait_for_check(0.5)
+
+    # Then
+    [health] = watchdog.health()
+    assert health.is_stalled
+
+    # When: el job recupera el control y atiende el pedido de reinicio
+    job.step(max_packets=10)
+
+    # Then
+    assert job.is_reconnecting
+    assert job.restarts == 1
+    job.finish()
+
+
+@pytest.mark.integration
+def test_should_forget_finished_recordings(tmp_path: Path, watchdog):
+    # Given
+    job = given_open_job(tmp_path)
+    watchdog.watch(job)
+    wait_for_check()
+
+    # When
+    job.finish()
+    wait_for_check()
+
+    # Then
+    assert watchdog.health() == []
@@ -0,0 +1,67 @@
+from fractions import Fraction
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvStreamMetrics import (
+    PyAvStreamMetrics,
+)
+
+FRAME_TICKS = 3600  # 25 fps en time base 1/90000
+
+
+def given_metrics() -> PyAvStreamMetrics:
+    metrics = PyAvStreamMetrics("rtsp://camera/stream")
+    metrics.reset_stream(Fraction(1, 90000), Fraction(25))
+    return metrics
+
+
+@pytest.mark.integration
+def test_should_count_missing_frames_when_dts_advances_more_than_packets_received():
+    # Given
+    metrics = given_metrics()
+
+    # When: en el segundo turno el DTS avanzó 10 frames pero llegaron 7 paquetes
+    metrics.observe_turn(packets=10, dts_advance_ticks=10 * FRAME_TICKS, out_of_order=0)
+    metrics.observe_turn(packets=7, dts_advance_ticks=10 * FRAME_TICKS, out_of_order=1)
+
+    # Then
+    snapshot = metrics.snapshot(video_index=0, video_packets=17, video_bytes=1700)
+    assert snapshot.dts_gap_frames == 3
+    assert snapshot.out_of_order_packets == 1
+
+
+@pytest.mark.integration
+def test_should_measure_keyframe_interval_and_count_packets_per_stream():
+    # Given
+    metrics = given_metrics()
+
+    # When
+    for dts in (0, 50 * FRAME_TICKS, 100 * FRAME_TICKS):
+        metrics.observe_keyframe(dts)
+    metrics.observe_other_packet(stream_index=1, size=200)
+
+    # Then
+    snapshot = metrics.snapshot(video_index=0, video_packets=100, video_bytes=10000)
+    assert snapshot.keyframes == 3
+    assert snapshot.mean_keyframe_interval_seconds == 2.0
+    assert snapshot.packets_per_stream == ((0, 100), (1, 1))
+    assert snapshot.bytes_per_stream == ((0, 10000), (1, 200))
+
+
+@pytest.mark.integration
+def test_should_place_mux_latencies_in_histogram_buckets():
+    # Given
+    metrics = given_metrics()
+
+    # When
+    metrics.observe_mux(5_000)  # 5 µs
+    metrics.observe_mux(300_000)  # 300 µs
+    metrics.observe_mux(50_000_000)  # 50 ms
+
+    # Then
+    snapshot = metrics.snapshot(video_index=0, video_packets=3, video_bytes=300)
+    buckets = dict(snapshot.mux_latency_buckets)
+    assert buckets[0.00001] == 1
+    assert buckets[0.0005] == 1
+    assert buckets[float("inf")] == 1
+    assert snapshot.mux_latency_count == 3
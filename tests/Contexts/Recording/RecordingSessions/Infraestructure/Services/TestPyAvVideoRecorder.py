@@ -3,6 +3,7 @@ import os
 import subprocess
 import time
 import av
+from av.error import HTTPNotFoundError
 from testcontainers.core.container import DockerContainer
 from src.Contexts.SharedKernel.Infrastructure.Services.ConsoleLogger import ConsoleLogger
 import pytest
@@ -13,6 +14,9 @@ from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessi
     RecordingSessionDuration,
 )
 from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.Uri import Uri
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingWatchdog import (
+    PyAvRecordingWatchdog,
+)
 from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvVideoRecorder import (
     PyAvVideoRecorder,
 )
@@ -88,3 +92,28 @@ def test_should_throw_exception_when_rtsp_uri_not_found(recorder: PyAvVideoRecor
     # Then
     with pytest.raises(av.ConnectionRefusedError):
         recorder.record(uri, output_path, duration)
+
+
+@pytest.mark.integration
+def test_should_interrupt_reads_after_the_watchdog_stall_timeout(tmp_path, monkeypatch):
+    # Given
+    timeouts = []
+
+    def open_camera(*args, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        raise HTTPNotFoundError(1, "Server returned 404 Not Found")
+
+    monkeypatch.setattr(av, "open", open_camera)
+    watchdog = PyAvRecordingWatchdog(ConsoleLogger(), stall_timeout_seconds=0.5)
+    recorder = PyAvVideoRecorder(ConsoleLogger(), watchdog=watchdog)
+
+    # When
+    with pytest.raises(HTTPNotFoundError):
+        recorder.record(
+            Uri("rtsp://camera.local/stream"),
+            OutputPath(str(tmp_path / "test.mkv")),
+            RecordingSessionDuration(3),
+        )
+
+    # Then
+    assert timeouts == [(30, 0.5)]
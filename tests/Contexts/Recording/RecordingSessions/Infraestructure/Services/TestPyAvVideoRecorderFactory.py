@@ -0,0 +1,76 @@
+import pickle
+import threading
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvVideoRecorder import (
+    PyAvVideoRecorder,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    PyAvVideoRecorderFactory as factory_module,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.AsyncioTaskRunner import AsyncioTaskRunner
+from src.Contexts.SharedKernel.Infrastructure.Services.ProcessPoolTaskManager import (
+    ProcessPoolTaskManager,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.ConsoleLogger import ConsoleLogger
+
+PyAvVideoRecorderFactory = factory_module.PyAvVideoRecorderFactory
+
+
+# Se ejecuta en el proceso worker: debe ser una función de módulo serializable
+def emit_created_recorder(factory: PyAvVideoRecorderFactory, emit) -> None:
+    recorder = factory.create()
+    emit((type(recorder).__name__, recorder is factory.create()))
+
+
+def test_should_reuse_the_recorder_of_the_process_for_the_same_configuration():
+    # Given
+    factory = PyAvVideoRecorderFactory(engine_workers=1, stall_timeout_seconds=10)
+
+    # When
+    recorder = factory.create()
+
+    # Then
+    assert isinstance(recorder, PyAvVideoRecorder)
+    assert pickle.loads(pickle.dumps(factory)).create() is recorder
+    assert PyAvVideoRecorderFactory(engine_workers=2).create() is not recorder
+
+
+def test_should_stop_recordings_when_the_runner_of_the_process_shuts_down(monkeypatch):
+    # Given
+    stop_all = Mock()
+    monkeypatch.setattr(PyAvVideoRecorder, "stop_all", stop_all)
+    runner = AsyncioTaskRunner.for_current_process(Mock())
+    PyAvVideoRecorderFactory(engine_workers=3, stall_timeout_seconds=5).create()
+
+    # When
+    runner.shutdown(drain_timeout_seconds=1)
+
+    # Then
+    stop_all.assert_called_once()
+
+
+@pytest.mark.integration
+def test_should_build_the_recorder_inside_the_worker_process():
+    # Given
+    task_manager = ProcessPoolTaskManager(ConsoleLogger(), workers=1)
+    factory = PyAvVideoRecorderFactory(engine_workers=1, stall_timeout_seconds=10)
+    results = []
+    received = threading.Event()
+
+    def on_result(value):
+        results.append(value)
+        received.set()
+
+    # When
+    task_manager.run_sharded(
+        "rtsp://camera1/stream", partial(emit_created_recorder, factory), on_result
+    )
+    received.wait(30)
+    task_manager.shutdown(timeout=5)
+
+    # Then
+    assert results == [("PyAvVideoRecorder", True)]
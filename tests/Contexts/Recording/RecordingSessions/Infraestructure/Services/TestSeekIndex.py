@@ -0,0 +1,110 @@
+import itertools
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import av
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.OutputPath import OutputPath
+from src.Contexts.Recording.RecordingSessions.Domain.ValueObjects.RecordingSessionDuration import (
+    RecordingSessionDuration,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.PyAvRecordingJob import (
+    PyAvRecordingJob,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SeekIndex import SeekIndex
+
+SOURCE = str(Path(__file__).resolve().parent.parent / "Resources" / "rtsp_test.mp4")
+
+
+def given_recording(tmp_path: Path, seconds: int) -> str:
+    results = []
+    counter = itertools.count()
+    job = PyAvRecordingJob(
+        source=SOURCE,
+        segment_duration=RecordingSessionDuration(seconds),
+        output_path_factory=lambda: OutputPath(str(tmp_path / f"segment{next(counter)}.mkv")),
+        on_segment_finished=results.append,
+        logger=Mock(),
+    )
+    job.run()
+    return results[0].output_path
+
+
+def then_video_should_start_at_keyframe(video_path: str, seconds: float) -> None:
+    container = av.open(video_path)
+    try:
+        stream = container.streams.video[0]
+        assert stream.time_base is not None
+        container.seek(round(seconds / stream.time_base), stream=stream)
+        packet = next(packet for packet in container.demux(stream) if packet.size > 0)
+        assert packet.is_keyframe and packet.pts is not None
+        assert abs(float(packet.pts * packet.time_base) - seconds) < 0.002
+    finally:
+        container.close()
+
+
+@pytest.mark.integration
+def test_should_write_a_sidecar_entry_per_video_packet(tmp_path: Path):
+    # Given
+    video_path = given_recording(tmp_path, seconds=4)
+
+    # When
+    index = SeekIndex.for_video(video_path)
+
+    # Then
+    container = av.open(video_path)
+    try:
+        packets = [packet for packet in container.demux(video=0) if packet.size > 0]
+    finally:
+        container.close()
+    assert len(index) == len(packets)
+    keyframe_seconds = [
+        index.entry(position).seconds
+        for position in range(len(index))
+        if index.entry(position).is_keyframe
+    ]
+    expected_seconds = [
+        float(packet.pts * packet.time_base)
+        for packet in packets
+        if packet.is_keyframe and packet.pts is not None
+    ]
+    assert keyframe_seconds == pytest.approx(expected_seconds, abs=0.001)
+
+
+@pytest.mark.integration
+def test_should_find_the_keyframe_before_a_timestamp(tmp_path: Path):
+    # Given
+    video_path = given_recording(tmp_path, seconds=4)
+    index = SeekIndex.for_video(video_path)
+
+    # When
+    entry = index.keyframe_before(3.5)
+
+    # Then
+    assert entry is not None and entry.is_keyframe
+    assert entry.seconds <= 3.5
+    next_keyframes = [
+        index.entry(position).seconds
+        for position in range(len(index))
+        if index.entry(position).is_keyframe and index.entry(position).seconds > entry.seconds
+    ]
+    assert all(seconds > 3.5 for seconds in next_keyframes)
+    then_video_should_start_at_keyframe(video_path, entry.seconds)
+
+
+@pytest.mark.integration
+def test_should_ignore_a_truncated_trailing_record(tmp_path: Path):
+    # Given
+    video_path = given_recording(tmp_path, seconds=2)
+    sidecar_path = SeekIndex.sidecar_path(video_path)
+    entries = len(SeekIndex.load(sidecar_path))
+    with open(sidecar_path, "r+b") as sidecar:
+        sidecar.truncate(os.path.getsize(sidecar_path) - 5)
+
+    # When
+    index = SeekIndex.load(sidecar_path)
+
+    # Then
+    assert len(index) == entries - 1
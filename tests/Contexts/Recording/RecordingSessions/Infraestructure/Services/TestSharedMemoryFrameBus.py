@@ -0,0 +1,146 @@
+import uuid
+from fractions import Fraction
+
+import av
+import numpy as np
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.SharedMemoryFrame import (
+    SharedMemoryFrame,
+)
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services import (
+    SharedMemoryFramePublisher as publisher_module,
+    SharedMemoryFrameReader as reader_module,
+)
+
+SharedMemoryFramePublisher = publisher_module.SharedMemoryFramePublisher
+SharedMemoryFrameReader = reader_module.SharedMemoryFrameReader
+
+SOURCE = "rtsp://camera.local/sub"
+
+
+@pytest.fixture
+def name_prefix() -> str:
+    return f"test_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def publisher(name_prefix: str):
+    publisher = SharedMemoryFramePublisher(
+        name_prefix=name_prefix, width=32, height=16, slot_count=4
+    )
+    yield publisher
+    publisher.close()
+
+
+def given_frame(brightness: int, seconds: float) -> av.VideoFrame:
+    frame = av.VideoFrame.from_ndarray(
+        np.full((64, 128, 3), brightness, dtype=np.uint8), format="rgb24"
+    )
+    frame.time_base = Fraction(1, 1000)
+    frame.pts = round(seconds * 1000)
+    return frame
+
+
+def given_reader(name_prefix: str) -> SharedMemoryFrameReader:
+    return SharedMemoryFrameReader(SharedMemoryFramePublisher.segment_name(name_prefix, SOURCE))
+
+
+def when_frames_are_published(publisher: SharedMemoryFramePublisher, brightnesses) -> None:
+    for brightness in brightnesses:
+        publisher.consume(SOURCE, given_frame(brightness, seconds=brightness / 10))
+
+
+def when_frame_is_read(reader: SharedMemoryFrameReader) -> SharedMemoryFrame:
+    frame = reader.read(timeout_seconds=0)
+    assert frame is not None
+    return frame
+
+
+@pytest.mark.integration
+def test_should_read_published_frames_in_order(publisher, name_prefix: str):
+    # Given
+    when_frames_are_published(publisher, [10])
+    reader = given_reader(name_prefix)
+
+    # When
+    when_frames_are_published(publisher, [20, 30])
+    frames = [when_frame_is_read(reader) for _ in range(3)]
+
+    # Then
+    assert [frame.sequence for frame in frames] == [1, 2, 3]
+    assert [frame.timestamp for frame in frames] == [1.0, 2.0, 3.0]
+    assert frames[1].pixels.shape == (16, 32, 3)
+    assert np.all(frames[1].pixels == 20)
+    assert not frames[1].pixels.flags.writeable
+    del frames
+    reader.close()
+
+
+@pytest.mark.integration
+def test_should_return_none_when_no_frame_is_published_before_timeout(publisher, name_prefix: str):
+    # Given
+    when_frames_are_published(publisher, [10])
+    reader = given_reader(name_prefix)
+    reader.read(timeout_seconds=0)
+
+    # When
+    frame = reader.read(timeout_seconds=0.01)
+
+    # Then
+    assert frame is None
+    reader.close()
+
+
+@pytest.mark.integration
+def test_should_skip_to_latest_frame_when_reader_is_overrun(publisher, name_prefix: str):
+    # Given
+    when_frames_are_published(publisher, [10])
+    reader = given_reader(name_prefix)
+
+    # When: el ring de 4 slots da la vuelta antes de que el lector lea
+    when_frames_are_published(publisher, [20, 30, 40, 50, 60])
+    frame = when_frame_is_read(reader)
+
+    # Then
+    assert frame.sequence == 6
+    assert np.all(frame.pixels == 60)
+    assert reader.overruns == 1
+    assert reader.skipped_frames == 5
+    del frame
+    reader.close()
+
+
+@pytest.mark.integration
+def test_should_invalidate_frame_once_the_writer_overwrites_it(publisher, name_prefix: str):
+    # Given
+    when_frames_are_published(publisher, [10])
+    reader = given_reader(name_prefix)
+    frame = when_frame_is_read(reader)
+
+    # When
+    when_frames_are_published(publisher, [20, 30, 40, 50])
+
+    # Then
+    assert not reader.is_valid(frame)
+    del frame
+    reader.close()
+
+
+@pytest.mark.integration
+def test_should_share_frames_between_multiple_readers(publisher, name_prefix: str):
+    # Given
+    when_frames_are_published(publisher, [10])
+    first_reader, second_reader = given_reader(name_prefix), given_reader(name_prefix)
+
+    # When
+    first = when_frame_is_read(first_reader)
+    second = when_frame_is_read(second_reader)
+
+    # Then
+    assert first.sequence == second.sequence == 1
+    assert np.array_equal(first.pixels, second.pixels)
+    assert first_reader.is_valid(first) and second_reader.is_valid(second)
+    del first, second
+    first_reader.close()
+    second_reader.close()
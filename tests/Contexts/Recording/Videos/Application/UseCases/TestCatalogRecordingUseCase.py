@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.Videos.Application.UseCases.CatalogRecordingUseCase import (
+    CatalogRecordingUseCase,
+)
+from src.Contexts.Recording.Videos.Domain.Events.RecordingsCatalogedDomainEvent import (
+    RecordingsCatalogedDomainEvent,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.StorageLocation import StorageLocation
+
+START = datetime(2025, 3, 1, 10, 0, 0)
+END = START + timedelta(minutes=10)
+
+
+@pytest.fixture
+def mock_manager():
+    """Mock manager central para rastrear el orden de las operaciones"""
+    return Mock()
+
+
+@pytest.fixture
+def recording_catalog_mock(mock_manager):
+    mock = Mock()
+    recorded = []
+    mock.add.side_effect = lambda entries: recorded.extend(entries)
+    mock.recorded = recorded
+    mock_manager.attach_mock(mock.add, "add")
+    return mock
+
+
+@pytest.fixture
+def event_bus_mock(mock_manager):
+    mock = Mock()
+    mock_manager.attach_mock(mock.publish, "publish")
+    return mock
+
+
+def test_should_catalog_the_videos_before_announcing_them(
+    tmp_path, mock_manager, recording_catalog_mock, event_bus_mock
+):
+    # Given
+    paths = [tmp_path / "garage__part1.mkv", tmp_path / "garage__part2.mkv"]
+    paths[0].write_bytes(b"x" * 10)
+    paths[1].write_bytes(b"x" * 20)
+    use_case = CatalogRecordingUseCase(recording_catalog_mock, event_bus_mock, Mock())
+
+    # When
+    use_case.execute("garage", START, END, [str(path) for path in paths], ("h1", "h2"))
+
+    # Then
+    assert [name for name, _, _ in mock_manager.mock_calls] == ["add", "publish"]
+    entries = recording_catalog_mock.recorded
+    assert [(entry.path, entry.size_bytes) for entry in entries] == [
+        (str(paths[0]), 10),
+        (str(paths[1]), 20),
+    ]
+    assert all(entry.start_date == START and entry.end_date == END for entry in entries)
+    assert all(entry.location == StorageLocation(StorageLocation.LOCAL) for entry in entries)
+    event_bus_mock.publish.assert_called_once_with(
+        [
+            RecordingsCatalogedDomainEvent(
+                profile_name="garage",
+                video_paths=tuple(str(path) for path in paths),
+                content_hashes=("h1", "h2"),
+            )
+        ]
+    )
+
+
+def test_should_still_announce_the_videos_when_the_catalog_fails(
+    tmp_path, recording_catalog_mock, event_bus_mock
+):
+    # Given
+    recording_catalog_mock.add.side_effect = OSError("database is locked")
+    logger = Mock()
+    use_case = CatalogRecordingUseCase(recording_catalog_mock, event_bus_mock, logger)
+
+    # When
+    use_case.execute("garage", START, END, [str(tmp_path / "garage.mkv")])
+
+    # Then
+    logger.error.assert_called_once()
+    event_bus_mock.publish.assert_called_once()
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import Mock
+
+from src.Contexts.Recording.Videos.Domain.Services.VideoMover import VideoMover
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoFileOperationException import (
+    VideoFileOperationException,
+)
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoUploadBusyException import (
+    VideoUploadBusyException,
+)
+from tests.Contexts.Recording.Videos.Domain.Mothers.VideoMother import VideoMother
+
+DESTINATION = "/storage/videos/test.mkv"
+RECORDED_HASH = "blake2b-1m:recorded"
+
+
+@pytest.fixture
+def video_file_manager_mock():
+    manager = Mock()
+    manager.exists.return_value = True
+    return manager
+
+
+@pytest.fixture
+def video_uploader_mock():
+    uploader = Mock()
+    uploader.upload_overwrite.return_value = DESTINATION
+    return uploader
+
+
+@pytest.fixture
+def video_mover(video_file_manager_mock, video_uploader_mock):
+    return VideoMover(video_file_manager_mock, video_uploader_mock, Mock())
+
+
+def test_should_delete_the_original_when_the_upload_matches_the_recording(
+    video_mover, video_file_manager_mock, video_uploader_mock
+):
+    # Given
+    video = VideoMother.create()
+    video_uploader_mock.content_hash.return_value = RECORDED_HASH
+
+    # When
+    result = video_mover.move(video, DESTINATION, RECORDED_HASH)
+
+    # Then
+    assert result == DESTINATION
+    video_uploader_mock.content_hash.assert_called_once_with(DESTINATION)
+    video_file_manager_mock.delete.assert_called_once_with(video)
+
+
+def test_should_keep_the_original_when_the_upload_does_not_match(
+    video_mover, video_file_manager_mock, video_uploader_mock
+):
+    # Given
+    video = VideoMother.create()
+    video_uploader_mock.content_hash.return_value = "blake2b-1m:corrupted"
+
+    # When/Then
+    with pytest.raises(VideoFileOperationException, match="no coincide con el grabado"):
+        video_mover.move(video, DESTINATION, RECORDED_HASH)
+
+    video_file_manager_mock.delete.assert_not_called()
+
+
+def test_should_not_verify_when_the_destination_cannot_be_hashed(
+    video_mover, video_file_manager_mock, video_uploader_mock
+):
+    # Given
+    video = VideoMother.create()
+    video_uploader_mock.content_hash.return_value = None
+
+    # When
+    video_mover.move(video, DESTINATION, RECORDED_HASH)
+
+    # Then
+    video_file_manager_mock.delete.assert_called_once_with(video)
+
+
+def test_should_let_a_busy_destination_through_so_the_move_is_postponed(
+    video_mover, video_file_manager_mock, video_uploader_mock
+):
+    # Given
+    video = VideoMother.create()
+    video_uploader_mock.upload_overwrite.side_effect = VideoUploadBusyException("s3://videos")
+
+    # When/Then
+    with pytest.raises(VideoUploadBusyException):
+        video_mover.move(video, DESTINATION, RECORDED_HASH)
+
+    video_file_manager_mock.delete.assert_not_called()
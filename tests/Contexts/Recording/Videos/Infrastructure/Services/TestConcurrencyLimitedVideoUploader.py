@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.Videos.Domain.Contracts.VideoUploader import VideoUploader
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoUploadBusyException import (
+    VideoUploadBusyException,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.ConcurrencyLimitedVideoUploader import (
+    ConcurrencyLimitedVideoUploader,
+)
+
+
+class SlowUploader(VideoUploader):
+    """Uploader que registra la mayor cantidad de subidas simultáneas, en total y por destino"""
+
+    def __init__(self, seconds: float):
+        self.__seconds = seconds
+        self.__lock = threading.Lock()
+        self.__current: Counter = Counter()
+        self.max_total = 0
+        self.max_per_destination: Counter = Counter()
+
+    def upload_overwrite(self, video, destination_path: str) -> str:
+        destination = destination_path.split("/")[2]
+        with self.__lock:
+            self.__current[destination] += 1
+            self.max_total = max(self.max_total, sum(self.__current.values()))
+            self.max_per_destination[destination] = max(
+                self.max_per_destination[destination], self.__current[destination]
+            )
+        time.sleep(self.__seconds)
+        with self.__lock:
+            self.__current[destination] -= 1
+        return destination_path
+
+
+def upload_when_possible(uploader, destination_path: str) -> None:
+    """Reintenta la subida como lo hace el pool al posponer el movimiento"""
+    while True:
+        try:
+            uploader.upload_overwrite(Mock(), destination_path)
+            return
+        except VideoUploadBusyException:
+            time.sleep(0.005)
+
+
+def when_uploading_concurrently(uploader, destination_paths) -> None:
+    threads = [
+        threading.Thread(target=upload_when_possible, args=(uploader, path))
+        for path in destination_paths
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.integration
+def test_should_limit_uploads_in_total_and_per_destination():
+    # Given
+    slow_uploader = SlowUploader(seconds=0.02)
+    uploader = ConcurrencyLimitedVideoUploader(
+        slow_uploader,
+        max_uploads=3,
+        max_uploads_per_destination=2,
+        destination_limits={"s3://archive": 1},
+    )
+    paths = [
+        f"s3://{bucket}/video_{i}.mkv" for bucket in ("fast", "slow", "archive") for i in range(6)
+    ]
+
+    # When
+    when_uploading_concurrently(uploader, paths)
+
+    # Then
+    assert slow_uploader.max_total <= 3
+    assert slow_uploader.max_per_destination["fast"] <= 2
+    assert slow_uploader.max_per_destination["slow"] <= 2
+    assert slow_uploader.max_per_destination["archive"] == 1
+    assert uploader.in_flight() == {}
+
+
+@pytest.mark.integration
+def test_should_reject_an_upload_to_a_saturated_destination_without_waiting():
+    # Given
+    slow_uploader = SlowUploader(seconds=0.2)
+    uploader = ConcurrencyLimitedVideoUploader(slow_uploader, max_uploads_per_destination=1)
+    running = threading.Thread(
+        target=uploader.upload_overwrite, args=(Mock(), "s3://slow/video_0.mkv")
+    )
+    running.start()
+    while not uploader.in_flight():
+        time.sleep(0.001)
+
+    # When
+    started = time.monotonic()
+    with pytest.raises(VideoUploadBusyException) as error:
+        uploader.upload_overwrite(Mock(), "s3://slow/video_1.mkv")
+    elapsed = time.monotonic() - started
+    result = uploader.upload_overwrite(Mock(), "s3://fast/video_0.mkv")
+
+    # Then
+    assert error.value.destination == "s3://slow"
+    assert elapsed < 0.1
+    assert result == "s3://fast/video_0.mkv"
+    running.join()
+    assert uploader.in_flight() == {}
+
+
+@pytest.mark.integration
+def test_should_group_local_destinations_by_mount_point(tmp_path):
+    # Given
+    uploader = ConcurrencyLimitedVideoUploader(Mock())
+
+    # When
+    first = uploader.destination_of(str(tmp_path / "a" / "video.mkv"))
+    second = uploader.destination_of(str(tmp_path / "b" / "video.mkv"))
+    remote = uploader.destination_of("https://storage.local:9000/bucket/video.mkv")
+
+    # Then
+    assert first == second
+    assert remote == "https://storage.local:9000"
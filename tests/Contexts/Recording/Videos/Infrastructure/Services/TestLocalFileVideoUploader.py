@@ -0,0 +1,158 @@
+import errno
+import os
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.Videos.Domain.Entities.Video import Video
+from src.Contexts.Recording.Videos.Infrastructure.Services.LocalFileVideoUploader import (
+    LocalFileVideoUploader,
+)
+from src.Contexts.SharedKernel.Infrastructure.Services.ChunkedContentHasher import (
+    ChunkedContentHasher,
+)
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+
+
+@pytest.fixture
+def uploader(monkeypatch) -> LocalFileVideoUploader:
+    monkeypatch.setattr(LocalFileVideoUploader, "CHUNK_SIZE", 1024 * 1024)
+    return LocalFileVideoUploader(Mock())
+
+
+@pytest.fixture
+def video(tmp_path) -> Video:
+    path = tmp_path / "recordings" / "camera__2025-03-01_10-00-00.mkv"
+    path.parent.mkdir()
+    path.write_bytes(CONTENT)
+    return Video.create_from_file_path(str(uuid.uuid4()), str(path))
+
+
+def given_link_is_not_supported(monkeypatch) -> None:
+    def link(source, destination):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", link)
+
+
+def then_destination_holds_the_video(destination) -> None:
+    assert destination.read_bytes() == CONTENT
+    assert [path.name for path in destination.parent.iterdir()] == [destination.name]
+
+
+@pytest.mark.integration
+def test_should_link_video_on_the_same_filesystem(uploader, video, tmp_path):
+    # Given
+    destination = tmp_path / "storage" / "camera" / video.path.filename
+
+    # When
+    result = uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    assert result == str(destination)
+    assert os.path.samefile(video.path.value, destination)
+    then_destination_holds_the_video(destination)
+
+
+@pytest.mark.integration
+def test_should_copy_in_kernel_and_overwrite_across_filesystems(
+    uploader, video, tmp_path, monkeypatch
+):
+    # Given
+    given_link_is_not_supported(monkeypatch)
+    destination = tmp_path / "storage" / video.path.filename
+    destination.parent.mkdir()
+    destination.write_bytes(b"previous upload")
+
+    # When
+    uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    assert not os.path.samefile(video.path.value, destination)
+    then_destination_holds_the_video(destination)
+
+
+@pytest.mark.integration
+def test_should_copy_with_sendfile_or_python_when_copy_file_range_is_unavailable(
+    uploader, video, tmp_path, monkeypatch
+):
+    # Given
+    given_link_is_not_supported(monkeypatch)
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    destination = tmp_path / "storage" / video.path.filename
+
+    # When
+    uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    then_destination_holds_the_video(destination)
+
+
+@pytest.mark.integration
+def test_should_not_leave_partial_files_when_copy_fails(uploader, video, tmp_path, monkeypatch):
+    # Given
+    given_link_is_not_supported(monkeypatch)
+
+    def failing_replace(source, destination):
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    destination = tmp_path / "storage" / video.path.filename
+
+    # When
+    with pytest.raises(OSError):
+        uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    assert list(destination.parent.iterdir()) == []
+
+
+@pytest.mark.integration
+def test_should_not_hash_a_linked_video(uploader, video, tmp_path, monkeypatch):
+    # Given
+    destination = tmp_path / "storage" / video.path.filename
+    result = uploader.upload_overwrite(video, str(destination))
+    hash_file = Mock()
+    monkeypatch.setattr(ChunkedContentHasher, "hash_file", hash_file)
+
+    # When
+    content_hash = uploader.content_hash(result)
+
+    # Then
+    assert content_hash is None
+    hash_file.assert_not_called()
+
+
+@pytest.mark.integration
+def test_should_hash_the_uploaded_video_like_the_recorded_one(
+    uploader, video, tmp_path, monkeypatch
+):
+    # Given
+    given_link_is_not_supported(monkeypatch)
+    destination = tmp_path / "storage" / video.path.filename
+    expected_hash = ChunkedContentHasher.hash_file(video.path.value)
+
+    # When
+    result = uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    assert uploader.content_hash(result) == expected_hash
+
+
+@pytest.mark.integration
+def test_should_upload_the_seek_index_next_to_the_video(uploader, video, tmp_path, monkeypatch):
+    # Given
+    given_link_is_not_supported(monkeypatch)
+    sidecar = tmp_path / "recordings" / (video.path.filename + ".idx")
+    sidecar.write_bytes(b"seek index")
+    destination = tmp_path / "storage" / video.path.filename
+
+    # When
+    uploader.upload_overwrite(video, str(destination))
+
+    # Then
+    assert destination.read_bytes() == CONTENT
+    assert (tmp_path / "storage" / sidecar.name).read_bytes() == b"seek index"
+    assert len(list(destination.parent.iterdir())) == 2
@@ -0,0 +1,118 @@
+import os
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.Videos.Infrastructure.Services.InotifyDirectoryWatcher import (
+    InotifyDirectoryWatcher,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.LocalVideoRepository import (
+    LocalVideoRepository,
+)
+
+
+@pytest.fixture
+def uuid_generator_mock():
+    mock = Mock()
+    mock.generate.side_effect = lambda: str(uuid.uuid4())
+    return mock
+
+
+@pytest.fixture
+def scandir_calls(monkeypatch):
+    calls = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    return calls
+
+
+def given_files(directory, names) -> None:
+    for name in names:
+        (directory / name).write_bytes(b"video")
+
+
+def given_directory_modified_long_ago(directory) -> None:
+    # Un mtime viejo evita que el listado se descarte por haberse leído en el mismo instante
+    past_ns = 1_000_000_000_000_000_000
+    os.utime(directory, ns=(past_ns, past_ns))
+
+
+@pytest.mark.integration
+def test_should_find_only_video_files_in_directory(tmp_path, uuid_generator_mock):
+    # Given
+    given_files(tmp_path, ["b.mkv", "a.MP4", "notes.txt", "b.mkv.idx"])
+    (tmp_path / "folder.mkv").mkdir()
+    repository = LocalVideoRepository(uuid_generator_mock)
+
+    # When
+    videos = repository.find_videos_in_directory(str(tmp_path))
+
+    # Then
+    assert [video.path.filename for video in videos] == ["a.MP4", "b.mkv"]
+    assert repository.find_by_path(str(tmp_path / "notes.txt")) is None
+    assert repository.find_by_path(str(tmp_path / "folder.mkv")) is None
+
+
+@pytest.mark.integration
+def test_should_answer_repeated_lookups_without_reading_directory_again(
+    tmp_path, uuid_generator_mock, scandir_calls
+):
+    # Given
+    given_files(tmp_path, ["a.mkv", "b.mkv"])
+    given_directory_modified_long_ago(tmp_path)
+    repository = LocalVideoRepository(uuid_generator_mock)
+
+    # When
+    first = repository.find_by_path(str(tmp_path / "a.mkv"))
+    second = repository.find_by_path(str(tmp_path / "b.mkv"))
+    missing = repository.find_by_path(str(tmp_path / "c.mkv"))
+    videos = repository.find_videos_in_directory(str(tmp_path))
+
+    # Then
+    assert first is not None and second is not None and missing is None
+    assert len(videos) == 2
+    assert len(scandir_calls) == 1
+
+
+@pytest.mark.integration
+def test_should_read_directory_again_when_it_changes(tmp_path, uuid_generator_mock):
+    # Given
+    given_files(tmp_path, ["a.mkv"])
+    repository = LocalVideoRepository(uuid_generator_mock)
+    repository.find_videos_in_directory(str(tmp_path))
+
+    # When
+    given_files(tmp_path, ["b.mkv"])
+    os.remove(tmp_path / "a.mkv")
+    videos = repository.find_videos_in_directory(str(tmp_path))
+
+    # Then
+    assert [video.path.filename for video in videos] == ["b.mkv"]
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not InotifyDirectoryWatcher.is_supported(), reason="requiere inotify")
+def test_should_update_listing_from_inotify_without_reading_directory_again(
+    tmp_path, uuid_generator_mock, scandir_calls
+):
+    # Given
+    given_files(tmp_path, ["a.mkv"])
+    repository = LocalVideoRepository(uuid_generator_mock, use_inotify=True)
+    repository.find_videos_in_directory(str(tmp_path))
+
+    # When
+    given_files(tmp_path, ["b.mkv"])
+    os.rename(tmp_path / "a.mkv", tmp_path / "c.mkv")
+    videos = repository.find_videos_in_directory(str(tmp_path))
+
+    # Then
+    assert repository.uses_inotify
+    assert [video.path.filename for video in videos] == ["b.mkv", "c.mkv"]
+    assert len(scandir_calls) == 1
+    repository.close()
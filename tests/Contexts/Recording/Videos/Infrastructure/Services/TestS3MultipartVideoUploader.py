@@ -0,0 +1,171 @@
+import base64
+import hashlib
+import os
+import threading
+import uuid
+from typing import Dict, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.Videos.Domain.Entities.Video import Video
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoUploadFailedException import (
+    VideoUploadFailedException,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.S3MultipartVideoUploader import (
+    S3MultipartVideoUploader,
+)
+
+PART_SIZE = S3MultipartVideoUploader.MIN_PART_SIZE
+BUCKET = "recordings"
+
+
+class InMemoryObjectStorage:
+    """Almacenamiento compatible con la API multipart de S3 que usa el uploader"""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self.uploaded_parts = []
+        self.fail_on_part: Optional[int] = None
+        self.__uploads: Dict[str, Dict[int, bytes]] = {}
+        self.__lock = threading.Lock()
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = uuid.uuid4().hex
+        self.__uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, ContentLength, ContentMD5):
+        if PartNumber == self.fail_on_part:
+            raise ConnectionError("connection reset")
+        data = Body.read()
+        digest = hashlib.md5(data).digest()
+        assert len(data) == ContentLength
+        assert base64.b64encode(digest).decode() == ContentMD5
+        with self.__lock:
+            self.__uploads[UploadId][PartNumber] = data
+            self.uploaded_parts.append(PartNumber)
+        return {"ETag": f'"{digest.hex()}"'}
+
+    def list_parts(self, Bucket, Key, UploadId, PartNumberMarker=0):
+        parts = self.__uploads[UploadId]
+        return {
+            "Parts": [
+                {"PartNumber": number, "ETag": f'"{hashlib.md5(data).hexdigest()}"'}
+                for number, data in sorted(parts.items())
+                if number > PartNumberMarker
+            ],
+            "IsTruncated": False,
+        }
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.__uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+
+@pytest.fixture
+def storage() -> InMemoryObjectStorage:
+    return InMemoryObjectStorage()
+
+
+@pytest.fixture
+def state_directory(tmp_path) -> str:
+    return str(tmp_path / "upload-state")
+
+
+def given_uploader(storage, state_directory) -> S3MultipartVideoUploader:
+    return S3MultipartVideoUploader(
+        bucket=BUCKET,
+        state_directory=state_directory,
+        logger=Mock(),
+        client=storage,
+        part_size=PART_SIZE,
+        max_concurrent_parts=2,
+    )
+
+
+def given_video(tmp_path, size: int) -> Video:
+    path = tmp_path / "camera__2025-03-01_10-00-00.mkv"
+    path.write_bytes(os.urandom(size))
+    return Video.create_from_file_path(str(uuid.uuid4()), str(path))
+
+
+@pytest.mark.integration
+def test_should_upload_video_in_parts(storage, state_directory, tmp_path):
+    # Given
+    video = given_video(tmp_path, size=2 * PART_SIZE + 123)
+    uploader = given_uploader(storage, state_directory)
+
+    # When
+    result = uploader.upload_overwrite(video, "/storage/videos/camera.mkv")
+
+    # Then
+    assert result == f"s3://{BUCKET}/storage/videos/camera.mkv"
+    with open(video.path.value, "rb") as file:
+        assert storage.objects["storage/videos/camera.mkv"] == file.read()
+    assert sorted(storage.uploaded_parts) == [1, 2, 3]
+    assert os.listdir(state_directory) == []
+
+
+@pytest.mark.integration
+def test_should_upload_the_seek_index_next_to_the_video(storage, state_directory, tmp_path):
+    # Given
+    video = given_video(tmp_path, size=PART_SIZE + 1)
+    with open(video.path.value + ".idx", "wb") as file:
+        file.write(b"seek index")
+    uploader = given_uploader(storage, state_directory)
+
+    # When
+    uploader.upload_overwrite(video, "/storage/videos/camera.mkv")
+
+    # Then
+    assert storage.objects["storage/videos/camera.mkv.idx"] == b"seek index"
+
+
+@pytest.mark.integration
+def test_should_resume_interrupted_upload_without_resending_confirmed_parts(
+    storage, state_directory, tmp_path
+):
+    # Given
+    video = given_video(tmp_path, size=3 * PART_SIZE + 1)
+    storage.fail_on_part = 3
+    with pytest.raises(VideoUploadFailedException):
+        given_uploader(storage, state_directory).upload_overwrite(video, "camera.mkv")
+    confirmed = set(storage.uploaded_parts)
+
+    # When: el proceso se reinicia y se reintenta el movimiento
+    storage.fail_on_part = None
+    storage.uploaded_parts.clear()
+    given_uploader(storage, state_directory).upload_overwrite(video, "camera.mkv")
+
+    # Then
+    with open(video.path.value, "rb") as file:
+        assert storage.objects["camera.mkv"] == file.read()
+    assert 3 not in confirmed
+    assert sorted(storage.uploaded_parts) == sorted({1, 2, 3, 4} - confirmed)
+
+
+@pytest.mark.integration
+def test_should_restart_upload_when_source_changed(storage, state_directory, tmp_path):
+    # Given
+    video = given_video(tmp_path, size=2 * PART_SIZE)
+    storage.fail_on_part = 2
+    with pytest.raises(VideoUploadFailedException):
+        given_uploader(storage, state_directory).upload_overwrite(video, "camera.mkv")
+
+    # When
+    with open(video.path.value, "ab") as file:
+        file.write(b"more data")
+    storage.fail_on_part = None
+    storage.uploaded_parts.clear()
+    given_uploader(storage, state_directory).upload_overwrite(video, "camera.mkv")
+
+    # Then
+    assert sorted(storage.uploaded_parts) == [1, 2, 3]
+    with open(video.path.value, "rb") as file:
+        assert storage.objects["camera.mkv"] == file.read()
@@ -0,0 +1,243 @@
+import sqlite3
+import time
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.Recording.RecordingSessions.Infrastructure.Services.ExponentialBackoff import (
+    ExponentialBackoff,
+)
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoNotFoundException import (
+    VideoNotFoundException,
+)
+from src.Contexts.Recording.Videos.Domain.Exceptions.VideoUploadBusyException import (
+    VideoUploadBusyException,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.MoveVideoWorkerPool import (
+    MoveVideoWorkerPool,
+)
+from src.Contexts.Recording.Videos.Infrastructure.Services.SqliteMoveJobQueue import (
+    SqliteMoveJobQueue,
+)
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    return str(tmp_path / "queue" / "moves.db")
+
+
+@pytest.fixture
+def queue(database_path):
+    queue = SqliteMoveJobQueue(database_path)
+    yield queue
+    queue.close()
+
+
+def given_worker_pool(queue, move_video_use_case, max_attempts: int) -> MoveVideoWorkerPool:
+    return MoveVideoWorkerPool(
+        move_job_queue=queue,
+        move_video_use_case=move_video_use_case,
+        logger=Mock(),
+        workers=2,
+        backoff=ExponentialBackoff(
+            base_delay_seconds=0.01, max_delay_seconds=0.01, max_attempts=max_attempts
+        ),
+        poll_seconds=0.01,
+        busy_retry_seconds=0.01,
+    )
+
+
+def when_queue_drains(queue, pool: MoveVideoWorkerPool, timeout_seconds: float = 5.0) -> None:
+    pool.start()
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if queue.stats().depth == 0:
+            break
+        time.sleep(0.01)
+    pool.stop()
+
+
+@pytest.mark.integration
+def test_should_claim_each_video_once_until_completed(queue):
+    # Given
+    queue.enqueue(["/videos/a.mkv", "/videos/b.mkv"])
+    queue.enqueue(["/videos/a.mkv"])
+
+    # When
+    first = queue.claim(timeout_seconds=0)
+    second = queue.claim(timeout_seconds=0)
+    third = queue.claim(timeout_seconds=0)
+    queue.complete(first)
+
+    # Then
+    assert [first.video_path, second.video_path] == ["/videos/a.mkv", "/videos/b.mkv"]
+    assert first.attempts == 1
+    assert third is None
+    assert queue.stats().running == 1
+
+
+@pytest.mark.integration
+def test_should_keep_the_recorded_content_hash_with_the_job(queue):
+    # Given
+    queue.enqueue(["/videos/a.mkv", "/videos/b.mkv"], {"/videos/a.mkv": "blake2b-1m:abc"})
+
+    # When
+    first = queue.claim(timeout_seconds=0)
+    second = queue.claim(timeout_seconds=0)
+
+    # Then
+    assert first.content_hash == "blake2b-1m:abc"
+    assert second.content_hash is None
+
+
+@pytest.mark.integration
+def test_should_recover_claimed_jobs_after_a_crash(database_path):
+    # Given: el proceso termina con un movimiento tomado y sin confirmar
+    crashed = SqliteMoveJobQueue(database_path)
+    crashed.enqueue(["/videos/a.mkv"])
+    crashed.claim(timeout_seconds=0)
+    crashed.close()
+
+    # When
+    restarted = SqliteMoveJobQueue(database_path)
+    recovered = restarted.recover()
+    job = restarted.claim(timeout_seconds=0)
+
+    # Then
+    assert recovered == 1
+    assert job is not None
+    assert job.video_path == "/videos/a.mkv"
+    assert job.attempts == 2
+    restarted.close()
+
+
+@pytest.mark.integration
+def test_should_not_recover_jobs_claimed_by_a_live_process(database_path):
+    # Given: otro proceso, vivo, está subiendo un movimiento
+    running = SqliteMoveJobQueue(database_path)
+    running.enqueue(["/videos/a.mkv"])
+    running.claim(timeout_seconds=0)
+
+    # When
+    starting = SqliteMoveJobQueue(database_path)
+    recovered = starting.recover()
+
+    # Then
+    assert recovered == 0
+    assert starting.claim(timeout_seconds=0) is None
+    running.close()
+    assert starting.recover() == 1
+    starting.close()
+
+
+@pytest.mark.integration
+def test_should_recover_jobs_of_a_process_that_stopped_renewing_its_lease(database_path):
+    # Given: un proceso colgado, cuyo último registro venció hace rato
+    hung = SqliteMoveJobQueue(database_path)
+    hung.enqueue(["/videos/a.mkv"])
+    hung.claim(timeout_seconds=0)
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("UPDATE move_job_owners SET heartbeat_at = 0")
+    starting = SqliteMoveJobQueue(database_path)
+
+    # When
+    recovered = starting.recover()
+
+    # Then
+    assert recovered == 1
+    job = starting.claim(timeout_seconds=0)
+    assert job is not None
+    assert job.video_path == "/videos/a.mkv"
+    hung.close()
+    starting.close()
+
+
+@pytest.mark.integration
+def test_should_not_claim_a_retried_job_before_its_delay(queue):
+    # Given
+    queue.enqueue(["/videos/a.mkv"])
+    job = queue.claim(timeout_seconds=0)
+
+    # When
+    queue.retry(job, delay_seconds=60, error="timeout")
+
+    # Then
+    assert queue.claim(timeout_seconds=0.01) is None
+    assert queue.stats().pending == 1
+
+
+@pytest.mark.integration
+def test_should_report_depth_and_oldest_job_age(queue):
+    # Given
+    queue.enqueue(["/videos/a.mkv"])
+    time.sleep(0.05)
+    queue.enqueue(["/videos/b.mkv", "/videos/c.mkv"])
+
+    # When
+    queue.claim(timeout_seconds=0)
+    stats = queue.stats()
+
+    # Then
+    assert (stats.pending, stats.running, stats.depth) == (2, 1, 3)
+    assert stats.oldest_job_age_seconds >= 0.05
+
+
+@pytest.mark.integration
+def test_should_retry_failed_moves_until_they_succeed(queue):
+    # Given
+    move_video_use_case = Mock()
+    move_video_use_case.execute.side_effect = [Exception("upload failed"), None, None]
+    queue.enqueue(["/videos/a.mkv", "/videos/b.mkv"])
+    pool = given_worker_pool(queue, move_video_use_case, max_attempts=3)
+
+    # When
+    when_queue_drains(queue, pool)
+
+    # Then
+    metrics = pool.metrics()
+    assert move_video_use_case.execute.call_count == 3
+    assert (metrics.completed, metrics.retried, metrics.abandoned) == (2, 1, 0)
+    assert metrics.queue.depth == 0 and metrics.queue.failed == 0
+
+
+@pytest.mark.integration
+def test_should_abandon_move_after_max_attempts_and_complete_missing_videos(queue):
+    # Given
+    def execute(video_path: str, content_hash: Optional[str]) -> None:
+        if video_path == "/videos/missing.mkv":
+            raise VideoNotFoundException()
+        raise Exception("upload failed")
+
+    move_video_use_case = Mock()
+    move_video_use_case.execute.side_effect = execute
+    queue.enqueue(["/videos/a.mkv", "/videos/missing.mkv"])
+    pool = given_worker_pool(queue, move_video_use_case, max_attempts=2)
+
+    # When
+    when_queue_drains(queue, pool)
+
+    # Then
+    assert move_video_use_case.execute.call_count == 3
+    assert queue.stats().failed == 1
+
+
+@pytest.mark.integration
+def test_should_postpone_moves_to_a_busy_destination_without_consuming_attempts(queue):
+    # Given
+    move_video_use_case = Mock()
+    move_video_use_case.execute.side_effect = [
+        VideoUploadBusyException("s3://slow"),
+        VideoUploadBusyException("s3://slow"),
+        None,
+    ]
+    queue.enqueue(["/videos/a.mkv"])
+    pool = given_worker_pool(queue, move_video_use_case, max_attempts=1)
+
+    # When
+    when_queue_drains(queue, pool)
+
+    # Then
+    metrics = pool.metrics()
+    assert move_video_use_case.execute.call_count == 3
+    assert (metrics.completed, metrics.retried, metrics.abandoned) == (1, 0, 0)
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.Contexts.Recording.Videos.Domain.ValueObjects.RecordingCatalogEntry import (
+    RecordingCatalogEntry,
+)
+from src.Contexts.Recording.Videos.Domain.ValueObjects.StorageLocation import StorageLocation
+from src.Contexts.Recording.Videos.Infrastructure.Services.SqliteRecordingCatalog import (
+    SqliteRecordingCatalog,
+)
+
+DAY = datetime(2025, 3, 1)
+SEGMENT = timedelta(minutes=10)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = SqliteRecordingCatalog(str(tmp_path / "catalog" / "recordings.db"))
+    yield catalog
+    catalog.close()
+
+
+def given_segments(
+    catalog: SqliteRecordingCatalog, profile_name: str, count: int
+) -> List[RecordingCatalogEntry]:
+    entries = [
+        RecordingCatalogEntry(
+            profile_name=profile_name,
+            start_date=DAY + i * SEGMENT,
+            end_date=DAY + (i + 1) * SEGMENT,
+            size_bytes=1000 + i,
+            path=f"/recordings/{profile_name}/{profile_name}__{i}.mkv",
+            location=StorageLocation(StorageLocation.LOCAL),
+        )
+        for i in range(count)
+    ]
+    catalog.add(entries)
+    return entries
+
+
+@pytest.mark.integration
+def test_should_find_segments_overlapping_the_interval(catalog):
+    # Given
+    entries = given_segments(catalog, "garage", count=12)
+    given_segments(catalog, "entrance", count=12)
+
+    # When: desde la mitad del segmento 2 hasta justo el inicio del segmento 5
+    found = catalog.find_between("garage", DAY + 2.5 * SEGMENT, DAY + 5 * SEGMENT)
+
+    # Then
+    assert found == entries[2:5]
+
+
+@pytest.mark.integration
+def test_should_find_long_segments_that_started_before_the_interval(catalog):
+    # Given
+    entries = given_segments(catalog, "garage", count=6)
+    long_entry = RecordingCatalogEntry(
+        profile_name="garage",
+        start_date=DAY - timedelta(hours=3),
+        end_date=DAY + timedelta(minutes=30),
+        size_bytes=5000,
+        path="/recordings/garage/long.mkv",
+        location=StorageLocation(StorageLocation.LOCAL),
+    )
+    catalog.add([long_entry])
+
+    # When
+    found = catalog.find_between("garage", DAY + 2 * SEGMENT, DAY + 3 * SEGMENT)
+
+    # Then
+    assert found == [long_entry, entries[2]]
+
+
+@pytest.mark.integration
+def test_should_relocate_moved_segment(catalog):
+    # Given
+    entries = given_segments(catalog, "garage", count=3)
+
+    # When
+    relocated = catalog.relocate(
+        entries[1].path, "s3://bucket/garage__1.mkv", StorageLocation(StorageLocation.REMOTE)
+    )
+    missing = catalog.relocate("/not/cataloged.mkv", "x", StorageLocation(StorageLocation.REMOTE))
+
+    # Then
+    found = catalog.find_between("garage", entries[1].start_date, entries[1].end_date)
+    assert relocated and not missing
+    assert [entry.path for entry in found] == ["s3://bucket/garage__1.mkv"]
+    assert not found[0].location.is_local()
+
+
+@pytest.mark.integration
+def test_should_answer_interval_queries_with_the_profile_index(catalog):
+    # Given
+    given_segments(catalog, "garage", count=3)
+
+    # When
+    plan = catalog.query_plan("garage", DAY, DAY + SEGMENT)
+
+    # Then
+    assert any("recordings_profile_start" in step for step in plan)
+    assert not any(step.startswith("SCAN") for step in plan)
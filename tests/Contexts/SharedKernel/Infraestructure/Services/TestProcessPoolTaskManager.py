@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.Contexts.SharedKernel.Infrastructure.Services.ProcessPoolTaskManager import (
+    ProcessPoolTaskManager,
+)
+
+
+# Las tareas se ejecutan en otro proceso: deben ser funciones de módulo serializables
+def emit_values(values, emit) -> None:
+    for value in values:
+        emit(value)
+
+
+def emit_worker_pid(emit) -> None:
+    emit(os.getpid())
+
+
+def crash_once(marker: str, emit) -> None:
+    if not os.path.exists(marker):
+        Path(marker).touch()
+        os._exit(1)
+    emit("recovered")
+
+
+@pytest.fixture
+def task_manager():
+    task_manager = ProcessPoolTaskManager(Mock(), workers=2, monitor_interval_seconds=0.1)
+    yield task_manager
+    task_manager.shutdown(timeout=5)
+
+
+def when_results_are_collected(task_manager, shard_key, task, expected: int, timeout=30):
+    results = []
+    received = threading.Event()
+
+    def on_result(value):
+        results.append(value)
+        if len(results) >= expected:
+            received.set()
+
+    task_manager.run_sharded(shard_key, task, on_result)
+    received.wait(timeout)
+    return results
+
+
+@pytest.mark.integration
+def test_should_return_emitted_values_to_parent_process(task_manager: ProcessPoolTaskManager):
+    # When
+    results = when_results_are_collected(
+        task_manager, "rtsp://camera1/stream", partial(emit_values, [1, 2, 3]), expected=3
+    )
+
+    # Then
+    assert results == [1, 2, 3]
+
+
+@pytest.mark.integration
+def test_should_pin_each_shard_key_to_the_same_worker(task_manager: ProcessPoolTaskManager):
+    # When
+    first = when_results_are_collected(task_manager, "rtsp://camera1/stream", emit_worker_pid, 1)
+    second = when_results_are_collected(task_manager, "rtsp://camera1/stream", emit_worker_pid, 1)
+
+    # Then
+    assert first == second
+    assert first[0] != os.getpid()
+
+
+@pytest.mark.integration
+def test_should_restart_crashed_worker_and_resubmit_its_tasks(
+    task_manager: ProcessPoolTaskManager, tmp_path: Path
+):
+    # Given
+    marker = str(tmp_path / "crashed")
+
+    # When
+    results = when_results_are_collected(
+        task_manager, "rtsp://camera1/stream", partial(crash_once, marker), expected=1
+    )
+
+    # Then
+    assert results == ["recovered"]
+    deadline = time.monotonic() + 5
+    while task_manager.pending_tasks() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert task_manager.pending_tasks() == 0